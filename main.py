@@ -7,11 +7,10 @@ Flutter 애플리케이션 생성 API 서버를 시작하거나 CLI 클라이언
 import argparse
 import sys
 import asyncio
-from src.api.app import start_server
 from src.utils.logger import setup_logger
-from src.cli.client import (
-    get_server_status, list_jobs, show_job, create_app, download_app
-)
+
+# 서버(FastAPI)와 CLI 클라이언트 모듈은 실행할 명령에 필요한 것만 가져옵니다.
+# CLI 명령은 httpx와 클라이언트 모듈만 사용합니다.
 
 # 메인 로거 설정
 logger = setup_logger("main")
@@ -39,8 +38,17 @@ def main():
     )
 
     # 'list' 명령
-    subparsers.add_parser(
-        "list", help="모든 작업 목록 조회"
+    list_parser = subparsers.add_parser(
+        "list", help="작업 목록 조회"
+    )
+    list_parser.add_argument(
+        "--status",
+        help="작업 상태 필터 (pending, running, completed, partial, failed, cancelled)"
+    )
+    list_parser.add_argument("--app-name", help="앱 이름 필터")
+    list_parser.add_argument(
+        "--page-size", "-n", type=int, default=50,
+        help="한 번에 조회할 작업 수 (기본값: 50)"
     )
 
     # 'show' 명령
@@ -60,6 +68,10 @@ def main():
         "--spec", "-s", required=True,
         help="앱 명세 JSON 파일 경로"
     )
+    create_parser.add_argument(
+        "--priority", choices=["interactive", "batch"], default="interactive",
+        help="작업 큐 우선순위 (기본값: interactive)"
+    )
 
     # 'download' 명령
     download_parser = subparsers.add_parser(
@@ -74,6 +86,20 @@ def main():
         help="출력 디렉토리 (기본값: ./output)"
     )
 
+    # 'cancel' 명령
+    cancel_parser = subparsers.add_parser(
+        "cancel", help="작업 취소"
+    )
+    cancel_target = cancel_parser.add_mutually_exclusive_group(required=True)
+    cancel_target.add_argument(
+        "--job-id", "-j", nargs="+", dest="job_ids",
+        help="취소할 작업 ID (여러 개 지정 가능)"
+    )
+    cancel_target.add_argument(
+        "--batch-id", "-b",
+        help="끝나지 않은 작업을 모두 취소할 배치 ID"
+    )
+
     # 이전 형식의 인자도 지원
     parser.add_argument(
         "--server", action="store_true",
@@ -82,22 +108,29 @@ def main():
 
     args = parser.parse_args()
 
-    if args.command == "server" or args.server:
-        logger.info("API 서버 모드로 시작합니다.")
-        start_server()
-    elif args.command == "status":
-        asyncio.run(get_server_status())
-    elif args.command == "list":
-        asyncio.run(list_jobs())
-    elif args.command == "show":
-        asyncio.run(show_job(args.job_id))
-    elif args.command == "create":
-        asyncio.run(create_app(args.spec))
-    elif args.command == "download":
-        asyncio.run(download_app(args.job_id, args.output))
+    if args.command in ("status", "list", "show", "create", "download", "cancel"):
+        from src.cli import client
+
+        if args.command == "status":
+            asyncio.run(client.get_server_status())
+        elif args.command == "list":
+            asyncio.run(client.list_jobs(args.status, args.app_name, args.page_size))
+        elif args.command == "show":
+            asyncio.run(client.show_job(args.job_id))
+        elif args.command == "create":
+            asyncio.run(client.create_app(args.spec, args.priority))
+        elif args.command == "cancel":
+            asyncio.run(client.cancel_jobs(args.job_ids or [], args.batch_id))
+        else:
+            asyncio.run(client.download_app(args.job_id, args.output))
     else:
-        # 기본적으로 서버 시작
-        logger.info("기본 모드로 API 서버를 시작합니다.")
+        from src.api.app import start_server
+
+        if args.command == "server" or args.server:
+            logger.info("API 서버 모드로 시작합니다.")
+        else:
+            # 기본적으로 서버 시작
+            logger.info("기본 모드로 API 서버를 시작합니다.")
         start_server()
 
     return 0
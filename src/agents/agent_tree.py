@@ -0,0 +1,121 @@
+"""
+에이전트 트리 캐시 구현.
+
+이 모듈은 앱 명세의 구조(shape)별로 만들어 둔 오케스트레이터 에이전트
+트리를 재사용하는 AgentTreeCache를 제공합니다.
+
+에이전트 트리는 어떤 그룹과 엔티티 에이전트가 필요한지에만 의존하고, 앱
+이름이나 모델 필드 같은 작업별 데이터는 세션 상태(app_spec)와 첫 메시지로
+전달됩니다. 따라서 명세 구조가 같은 작업은 같은 트리를 함께 사용할 수
+있습니다. 에이전트는 실행 중 상태를 갖지 않고 실행 상태는 호출
+컨텍스트와 세션에 저장되므로, 여러 작업이 한 트리를 동시에 실행해도
+안전합니다.
+
+ADK 에이전트는 부모를 하나만 가질 수 있으므로, 모듈 수준에서 정의한 하위
+에이전트로 새 그룹을 만들 때는 detached_agent()로 부모가 없는 사본을
+사용합니다. 사본은 원본의 도구(FunctionTool) 인스턴스를 그대로 공유합니다.
+"""
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from google.adk.agents import BaseAgent
+
+from src.utils.logger import logger
+
+# 에이전트 트리 구성에 영향을 주는 명세 항목 (각 그룹의 register_*_agents가
+# 항목이 있는지에 따라 엔티티 에이전트를 추가)
+STRUCTURAL_KEYS = (
+    "models", "pages", "controllers", "api_endpoints", "tests", "security_checks",
+)
+
+
+def detached_agent(agent: BaseAgent) -> BaseAgent:
+    """
+    부모 에이전트가 없는 하위 에이전트 사본을 반환합니다.
+
+    하위 에이전트가 없는 에이전트(엔티티 에이전트)에 사용합니다.
+
+    Args:
+        agent: 모듈 수준에서 정의한 에이전트
+
+    Returns:
+        새 그룹에 추가할 수 있는 얕은 사본
+    """
+    return agent.model_copy(update={"parent_agent": None})
+
+
+def agent_tree_shape(app_spec: Dict[str, Any]) -> Tuple[str, ...]:
+    """
+    에이전트 트리 캐시 키로 사용할 명세 구조를 계산합니다.
+
+    Args:
+        app_spec: 앱 명세 딕셔너리
+
+    Returns:
+        명세에 있는 구조 항목 이름 튜플
+    """
+    return tuple(key for key in STRUCTURAL_KEYS if key in app_spec)
+
+
+class AgentTreeCache:
+    """명세 구조별 오케스트레이터 에이전트 트리 LRU 캐시"""
+
+    def __init__(
+        self, build: Callable[[Dict[str, Any]], BaseAgent], max_entries: int = 16
+    ):
+        """
+        Args:
+            build: 앱 명세로 에이전트 트리를 만드는 함수
+            max_entries: 보관할 최대 트리 수
+        """
+        self.build = build
+        self.max_entries = max(1, max_entries)
+        self._trees: "OrderedDict[Tuple[str, ...], BaseAgent]" = OrderedDict()
+        # 작업 실행기 스레드에서 동시에 호출될 수 있음
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, app_spec: Dict[str, Any]) -> BaseAgent:
+        """
+        명세 구조에 맞는 에이전트 트리를 반환합니다.
+
+        캐시에 없으면 트리를 만들어 저장하고, 가장 오래 사용되지 않은 트리부터
+        제거합니다. 같은 구조의 트리를 동시에 만들면 먼저 저장된 트리를
+        사용합니다.
+
+        Args:
+            app_spec: 앱 명세 딕셔너리
+
+        Returns:
+            오케스트레이터 에이전트 트리
+        """
+        shape = agent_tree_shape(app_spec)
+        with self._lock:
+            tree = self._trees.get(shape)
+            if tree is not None:
+                self._trees.move_to_end(shape)
+                self.hits += 1
+                return tree
+            self.misses += 1
+
+        # 트리 생성은 잠금 밖에서 실행 (다른 구조의 조회를 막지 않음)
+        tree = self.build(app_spec)
+        with self._lock:
+            tree = self._trees.setdefault(shape, tree)
+            self._trees.move_to_end(shape)
+            while len(self._trees) > self.max_entries:
+                self._trees.popitem(last=False)
+        logger.info(f"에이전트 트리 생성: {shape or '(기본)'}")
+        return tree
+
+    def clear(self):
+        """캐시된 트리를 모두 제거합니다."""
+        with self._lock:
+            self._trees.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 크기와 적중/실패 수를 반환합니다."""
+        with self._lock:
+            return {"size": len(self._trees), "hits": self.hits, "misses": self.misses}
@@ -7,6 +7,7 @@ from google.adk import Agent
 from google.adk.tools import FunctionTool
 from google.genai.types import Part
 
+from src.agents.agent_tree import detached_agent
 from src.utils.logger import logger
 
 
@@ -500,12 +501,14 @@ def register_android_agents(app_spec):
     try:
         # 기본 안드로이드 에이전트 목록
         agents = [
-            android_build_gradle_agent,
-            android_app_build_gradle_agent,
-            android_settings_gradle_agent,
-            android_main_activity_agent,
-            android_manifest_agent,
-            android_strings_agent
+            detached_agent(agent) for agent in (
+                android_build_gradle_agent,
+                android_app_build_gradle_agent,
+                android_settings_gradle_agent,
+                android_main_activity_agent,
+                android_manifest_agent,
+                android_strings_agent
+            )
         ]
 
         # 업데이트된 에이전트 목록으로 Agent 생성
@@ -3,22 +3,31 @@ APIGroupAgent: API 파일 생성을 조정하는 그룹 에이전트.
 
 이 에이전트는 여러 API 파일 생성 에이전트의 실행을 조정하고 관리합니다.
 """
-from google.adk.agents import ParallelAgent
+from src.agents.parallel_agent import CancellableParallelAgent
 
 from src.agents.api_group.user_api_routes_agent import (
-    user_api_routes_agent
+    user_api_routes_agent,
+    create_default_user_api_routes
 )
+from src.agents.agent_tree import detached_agent
 from src.utils.logger import logger
 
 
+# 제한 시간을 넘긴 하위 에이전트 대신 템플릿으로 파일을 생성할 함수
+api_agent_fallbacks = {
+    user_api_routes_agent.name: create_default_user_api_routes,
+}
+
+
 # API 그룹 에이전트 정의
-api_group_agent = ParallelAgent(
+api_group_agent = CancellableParallelAgent(
     name="APIGroupAgent",
     description="API 파일 생성 작업을 병렬로 수행하는 에이전트 그룹",
     sub_agents=[
         user_api_routes_agent,
         # product_api_routes_agent와 같은 다른 API 에이전트를 추가
-    ]
+    ],
+    fallbacks=api_agent_fallbacks
 )
 
 
@@ -30,11 +39,11 @@ def register_api_agents(app_spec):
         app_spec (dict): 애플리케이션 명세
 
     Returns:
-        ParallelAgent: 업데이트된 API 그룹 에이전트
+        CancellableParallelAgent: 업데이트된 API 그룹 에이전트
     """
     try:
         # 기본 API 에이전트 목록 (항상 포함)
-        agents = [user_api_routes_agent]
+        agents = [detached_agent(user_api_routes_agent)]
 
         # 앱 명세에 따라 추가 API 에이전트 등록
         if "api_endpoints" in app_spec:
@@ -42,11 +51,12 @@ def register_api_agents(app_spec):
             # 예: ProductAPI, OrderAPI 등
             pass
 
-        # 업데이트된 에이전트 목록으로 ParallelAgent 생성
-        updated_api_group_agent = ParallelAgent(
+        # 업데이트된 에이전트 목록으로 CancellableParallelAgent 생성
+        updated_api_group_agent = CancellableParallelAgent(
             name="APIGroupAgent",
             description="API 파일 생성 작업을 병렬로 수행하는 에이전트 그룹",
-            sub_agents=agents
+            sub_agents=agents,
+            fallbacks=api_agent_fallbacks
         )
 
         return updated_api_group_agent
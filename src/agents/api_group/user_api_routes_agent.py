@@ -7,6 +7,7 @@ from google.adk.agents import LlmAgent
 
 from src.config.settings import get_agent_config
 from src.tools.code_generation import (
+    generate_python_file,
     generate_python_file_tool,
     direct_code_generation_tool
 )
@@ -40,7 +41,7 @@ user_api_routes_agent = LlmAgent(
 )
 
 
-def create_default_user_api_routes(tool_context) -> None:
+async def create_default_user_api_routes(tool_context) -> None:
     """
     기본 사용자 API 라우트를 생성합니다.
 
@@ -93,7 +94,7 @@ def create_default_user_api_routes(tool_context) -> None:
     }
 
     # 파일 생성 (템플릿 기반)
-    generate_python_file_tool(
+    await generate_python_file(
         template_name="fastapi_routes.py.j2",
         output_filename="app/api/routes/user_routes.py",
         context=user_api_context,
@@ -8,6 +8,7 @@ from google.adk import Agent
 from src.agents.controller_group.user_controller_agent import (
     user_controller_agent
 )
+from src.agents.agent_tree import detached_agent
 from src.utils.logger import logger
 
 
@@ -34,7 +35,7 @@ def register_controller_agents(app_spec):
     """
     try:
         # 기본 컨트롤러 에이전트 목록 (항상 포함)
-        agents = [user_controller_agent]
+        agents = [detached_agent(user_controller_agent)]
 
         # 앱 명세에 따라 추가 컨트롤러 에이전트 등록
         if "controllers" in app_spec:
@@ -21,7 +21,8 @@ from src.agents.security_group.security_group_agent import security_group_agent,
     register_security_agents
 from src.agents.android_group.android_group_agent import android_group_agent, \
     register_android_agents
-from src.config.settings import get_agent_config
+from src.agents.agent_tree import AgentTreeCache
+from src.config.settings import AGENT_TREE_CACHE_SIZE, get_agent_config
 from src.utils.logger import logger
 
 
@@ -593,10 +594,84 @@ main_orchestrator_agent = Agent(
 )
 
 
+def build_orchestrator_agent(app_spec):
+    """
+    앱 명세 구조에 맞는 새 오케스트레이터 에이전트 트리를 만듭니다.
+
+    트리는 명세 구조(agent_tree_shape)에만 의존해야 합니다. 작업별 데이터는
+    세션 상태와 첫 메시지로 전달하고 에이전트 객체에 넣지 않습니다.
+
+    Args:
+        app_spec: 애플리케이션 명세
+
+    Returns:
+        새 메인 오케스트레이터 에이전트
+    """
+    # 각 그룹별 에이전트 등록
+    updated_model_group_agent = register_model_agents(app_spec)
+    updated_api_group_agent = register_api_agents(app_spec)
+    updated_controller_group_agent = register_controller_agents(app_spec)
+    updated_webview_group_agent = register_webview_agents(app_spec)
+    updated_tdd_group_agent = register_tdd_agents(app_spec)
+    updated_security_group_agent = register_security_agents(app_spec)
+    updated_android_group_agent = register_android_agents(app_spec)
+
+    # 업데이트된 에이전트 목록으로 Agent 생성
+    updated_main_orchestrator_agent = Agent(
+        name="MainOrchestratorAgent",
+        description="전체 Flutter 앱 생성 프로세스를 조율하는 에이전트",
+        instruction="이 에이전트는 Flutter 애플리케이션 생성 전체 프로세스를 관리합니다.",
+        sub_agents=[
+            # 프로젝트 초기화를 담당하는 에이전트
+            Agent(
+                name="ProjectScaffoldingAgent",
+                description="Flutter 프로젝트 기본 구조를 초기화하는 에이전트",
+                instruction="""
+                Flutter 프로젝트의 기본 구조를 초기화합니다.
+                제공된 앱 명세를 확인하고, initialize_project_tool을 호출하여
+                pubspec.yaml, analysis_options.yaml 등의 기본 파일을 생성합니다.
+                """,
+                model=get_agent_config(agent_type="model_agent")["model"],
+                tools=[initialize_project_tool]
+            ),
+
+            # 업데이트된 그룹 에이전트들
+            updated_model_group_agent,
+            updated_api_group_agent,
+            updated_controller_group_agent,
+            updated_webview_group_agent,
+            updated_tdd_group_agent,
+            updated_security_group_agent,
+            updated_android_group_agent,
+
+            # 최종 프로젝트 조립을 담당하는 에이전트
+            Agent(
+                name="ProjectAssemblyAgent",
+                description="생성된 모든 파일을 최종 Flutter 프로젝트로 조립하는 에이전트",
+                instruction="""
+                모든 파일 생성 작업이 완료된 후, 파일들을 최종 Flutter 프로젝트 구조로 조립합니다.
+                assemble_flutter_project_tool을 호출하여 필요한 추가 파일(예: main.dart)을 생성하고
+                Flutter 프로젝트의 최종 형태를 완성합니다.
+                """,
+                model=get_agent_config(agent_type="model_agent")["model"],
+                tools=[assemble_flutter_project_tool]
+            )
+        ]
+    )
+
+    return updated_main_orchestrator_agent
+
+
+# 명세 구조별 오케스트레이터 트리 캐시 (작업마다 트리를 다시 만들지 않음)
+agent_trees = AgentTreeCache(build_orchestrator_agent, AGENT_TREE_CACHE_SIZE)
+
+
 def register_agents(app_spec):
     """
     앱 명세에 따라 필요한 모든 에이전트를 등록합니다.
 
+    명세 구조가 같은 이전 작업의 트리가 캐시에 있으면 그 트리를 반환합니다.
+
     Args:
         app_spec: 애플리케이션 명세
 
@@ -604,59 +679,7 @@ def register_agents(app_spec):
         업데이트된 메인 오케스트레이터 에이전트
     """
     try:
-        # 각 그룹별 에이전트 등록
-        updated_model_group_agent = register_model_agents(app_spec)
-        updated_api_group_agent = register_api_agents(app_spec)
-        updated_controller_group_agent = register_controller_agents(app_spec)
-        updated_webview_group_agent = register_webview_agents(app_spec)
-        updated_tdd_group_agent = register_tdd_agents(app_spec)
-        updated_security_group_agent = register_security_agents(app_spec)
-        updated_android_group_agent = register_android_agents(app_spec)
-
-        # 업데이트된 에이전트 목록으로 Agent 생성
-        updated_main_orchestrator_agent = Agent(
-            name="MainOrchestratorAgent",
-            description="전체 Flutter 앱 생성 프로세스를 조율하는 에이전트",
-            instruction="이 에이전트는 Flutter 애플리케이션 생성 전체 프로세스를 관리합니다.",
-            sub_agents=[
-                # 프로젝트 초기화를 담당하는 에이전트
-                Agent(
-                    name="ProjectScaffoldingAgent",
-                    description="Flutter 프로젝트 기본 구조를 초기화하는 에이전트",
-                    instruction="""
-                    Flutter 프로젝트의 기본 구조를 초기화합니다.
-                    제공된 앱 명세를 확인하고, initialize_project_tool을 호출하여
-                    pubspec.yaml, analysis_options.yaml 등의 기본 파일을 생성합니다.
-                    """,
-                    model=get_agent_config(agent_type="model_agent")["model"],
-                    tools=[initialize_project_tool]
-                ),
-
-                # 업데이트된 그룹 에이전트들
-                updated_model_group_agent,
-                updated_api_group_agent,
-                updated_controller_group_agent,
-                updated_webview_group_agent,
-                updated_tdd_group_agent,
-                updated_security_group_agent,
-                updated_android_group_agent,
-
-                # 최종 프로젝트 조립을 담당하는 에이전트
-                Agent(
-                    name="ProjectAssemblyAgent",
-                    description="생성된 모든 파일을 최종 Flutter 프로젝트로 조립하는 에이전트",
-                    instruction="""
-                    모든 파일 생성 작업이 완료된 후, 파일들을 최종 Flutter 프로젝트 구조로 조립합니다.
-                    assemble_flutter_project_tool을 호출하여 필요한 추가 파일(예: main.dart)을 생성하고
-                    Flutter 프로젝트의 최종 형태를 완성합니다.
-                    """,
-                    model=get_agent_config(agent_type="model_agent")["model"],
-                    tools=[assemble_flutter_project_tool]
-                )
-            ]
-        )
-
-        return updated_main_orchestrator_agent
+        return agent_trees.get(app_spec)
 
     except Exception as e:
         logger.error(f"에이전트 등록 중 오류 발생: {str(e)}")
@@ -6,7 +6,11 @@ UserModelAgent: User 모델 파일을 생성하는 에이전트.
 from google.adk.agents import LlmAgent
 
 from src.config.settings import get_agent_config
-from src.tools.code_generation import generate_dart_file_tool, direct_code_generation_tool
+from src.tools.code_generation import (
+    generate_dart_file,
+    generate_dart_file_tool,
+    direct_code_generation_tool
+)
 
 
 # 사용자 모델 에이전트 정의
@@ -41,7 +45,7 @@ user_model_agent = LlmAgent(
 )
 
 
-def create_default_user_model(tool_context) -> None:
+async def create_default_user_model(tool_context) -> None:
     """
     기본 User 모델을 생성합니다.
 
@@ -65,7 +69,7 @@ def create_default_user_model(tool_context) -> None:
     }
 
     # 파일 생성 (템플릿 기반)
-    generate_dart_file_tool(
+    await generate_dart_file(
         template_name="model.dart.j2",
         output_filename="lib/models/user_model.dart",
         context=user_model_context,
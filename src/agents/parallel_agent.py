@@ -0,0 +1,180 @@
+"""
+CancellableParallelAgent: 취소할 수 있는 병렬 그룹 에이전트.
+
+ADK의 ParallelAgent는 하위 에이전트마다 태스크를 만들어 이벤트를 합치지만,
+러너를 실행하던 작업이 취소되어도 이 태스크들은 취소하지 않습니다. 그래서
+작업을 취소한 뒤에도 하위 에이전트가 LLM 호출과 도구 실행을 계속합니다.
+
+이 에이전트는 같은 방식으로 이벤트를 합치되, 취소되거나 중간에 종료되면
+남은 하위 에이전트 태스크를 모두 취소하고 종료될 때까지 기다립니다.
+
+또한 그룹과 하위 에이전트마다 제한 시간을 적용합니다. 제한 시간을 넘긴
+하위 에이전트는 취소하고, fallbacks에 기본 파일 생성 함수가 있으면 그
+함수로 템플릿 기반 파일을 대신 생성합니다. 기본 함수가 없으면 작업은
+partial 상태로 끝납니다.
+"""
+import asyncio
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List
+
+from google.adk.agents import BaseAgent, ParallelAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.tools import ToolContext
+from google.genai import types
+from pydantic import Field
+
+from src.config.settings import AGENT_DEADLINE
+from src.utils import deadlines
+from src.utils.logger import logger
+
+
+async def _merge_agent_runs(
+    agent_runs: List[AsyncGenerator[Event, None]],
+) -> AsyncGenerator[Event, None]:
+    """
+    하위 에이전트 이벤트 생성기를 하나로 합칩니다.
+
+    각 하위 에이전트는 낸 이벤트가 상위에서 처리될 때까지 다음 이벤트로
+    진행하지 않습니다.
+
+    Args:
+        agent_runs: 하위 에이전트별 이벤트 생성기
+
+    Yields:
+        먼저 도착한 하위 에이전트 이벤트
+    """
+    tasks = [asyncio.ensure_future(run.__anext__()) for run in agent_runs]
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                try:
+                    event = task.result()
+                except StopAsyncIteration:
+                    continue
+                yield event
+
+                # 이벤트를 낸 하위 에이전트를 다음 이벤트로 진행
+                index = tasks.index(task)
+                tasks[index] = asyncio.ensure_future(agent_runs[index].__anext__())
+                pending.add(tasks[index])
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        for run in agent_runs:
+            await run.aclose()
+
+
+async def _run_with_deadline(
+    agent: BaseAgent, ctx: InvocationContext, deadline: deadlines.Deadline
+) -> AsyncGenerator[Event, None]:
+    """
+    하위 에이전트를 실행하되, 제한 시간이 지나면 실행을 취소하고 종료합니다.
+
+    Args:
+        agent: 하위 에이전트
+        ctx: 그룹 에이전트의 호출 컨텍스트
+        deadline: 하위 에이전트 데드라인
+
+    Yields:
+        제한 시간 전에 하위 에이전트가 낸 이벤트
+
+    Raises:
+        DeadlineExceededError: 제한 시간 안에 끝나지 않은 경우
+    """
+    if deadline.expired():
+        raise deadlines.DeadlineExceededError(agent.name)
+    run = agent.run_async(ctx)
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(run.__anext__(), deadline.remaining())
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError:
+                raise deadlines.DeadlineExceededError(agent.name) from None
+            yield event
+    finally:
+        await run.aclose()
+
+
+class CancellableParallelAgent(ParallelAgent):
+    """취소되면 하위 에이전트 태스크도 함께 취소하는 ParallelAgent"""
+
+    fallbacks: Dict[str, Callable[[ToolContext], Awaitable[Any]]] = Field(
+        default_factory=dict
+    )
+    """하위 에이전트 이름별 기본 파일 생성 함수 (제한 시간을 넘기면 대신 실행)"""
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        ctx.branch = f"{ctx.branch}.{self.name}" if ctx.branch else self.name
+        group_deadline = deadlines.Deadline(
+            self.name, deadlines.step_timeout(self.name, 0),
+            deadlines.current_deadline()
+        )
+        agent_runs = [
+            self._run_sub_agent(agent, ctx, group_deadline)
+            for agent in self.sub_agents
+        ]
+        async for event in _merge_agent_runs(agent_runs):
+            yield event
+
+    async def _run_sub_agent(
+        self,
+        agent: BaseAgent,
+        ctx: InvocationContext,
+        group_deadline: deadlines.Deadline,
+    ) -> AsyncGenerator[Event, None]:
+        """
+        하위 에이전트를 제한 시간 안에 실행하고, 넘기면 기본 파일 생성 함수로 대체합니다.
+
+        Args:
+            agent: 하위 에이전트
+            ctx: 그룹 에이전트의 호출 컨텍스트
+            group_deadline: 그룹 데드라인
+
+        Yields:
+            하위 에이전트 이벤트 또는 기본 파일 생성 결과 이벤트
+        """
+        deadline = deadlines.Deadline(
+            agent.name, deadlines.step_timeout(agent.name, AGENT_DEADLINE),
+            group_deadline
+        )
+        try:
+            async for event in _run_with_deadline(agent, ctx, deadline):
+                yield event
+            return
+        except deadlines.DeadlineExceededError:
+            pass
+
+        fallback = self.fallbacks.get(agent.name)
+        deadlines.record_timeout(agent.name, fallback=fallback is not None)
+        if fallback is None:
+            return
+
+        # 하위 에이전트가 호출한 도구와 같은 컨텍스트로 기본 파일을 생성하고,
+        # 상태와 아티팩트 변경을 하위 에이전트 이벤트로 기록
+        agent_ctx = agent._create_invocation_context(ctx)
+        tool_context = ToolContext(agent_ctx)
+        try:
+            await fallback(tool_context)
+        except Exception as e:
+            logger.error(f"기본 파일 생성 실패: {agent.name}, 오류: {str(e)}")
+            deadlines.record_timeout(agent.name)
+            return
+        yield Event(
+            invocation_id=agent_ctx.invocation_id,
+            author=agent.name,
+            branch=agent_ctx.branch,
+            actions=tool_context.actions,
+            content=types.Content(role="model", parts=[types.Part(
+                text="제한 시간을 넘겨 기본 템플릿으로 파일을 생성했습니다."
+            )])
+        )
@@ -4,8 +4,8 @@ DartStaticAnalysisAgent: Dart 코드 정적 분석을 수행하는 에이전트.
 이 에이전트는 Dart 코드의 정적 분석을 수행하여 잠재적인 문제를 찾아냅니다.
 """
 import json
-import subprocess
 import tempfile
+import time
 from pathlib import Path
 from typing import Any, Dict
 
@@ -13,10 +13,11 @@ from google.adk import Agent
 from google.adk.tools import FunctionTool
 from google.genai.types import Part
 
+from src.utils import job_processes, metrics
 from src.utils.logger import logger
 
 
-def run_dart_analyze(
+async def run_dart_analyze(
     file_content: str,
     filename: str,
     tool_context: Any
@@ -24,6 +25,9 @@ def run_dart_analyze(
     """
     Dart 파일의 정적 분석을 수행합니다.
 
+    dart analyze는 작업에 연결된 하위 프로세스로 실행하므로 이벤트 루프를
+    막지 않고, 작업을 취소하면 함께 종료됩니다.
+
     Args:
         file_content (str): 분석할 Dart 파일의 내용
         filename (str): 분석할 파일의 이름
@@ -68,17 +72,13 @@ linter:
 
             # dart analyze 명령 실행
             cmd = ["dart", "analyze", str(file_path)]
-            process = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=False
+            started = time.perf_counter()
+            exit_code, output, error_output = await job_processes.run_process(
+                *cmd
             )
-
-            # 분석 결과 파싱
-            output = process.stdout
-            error_output = process.stderr
-            exit_code = process.returncode
+            metrics.dart_analyze_seconds.labels(
+                "clean" if exit_code == 0 else "issues"
+            ).observe(time.perf_counter() - started)
 
             # 결과 구성
             issues = []
@@ -144,7 +144,7 @@ linter:
         }
 
 
-def analyze_dart_files(tool_context) -> Dict[str, Any]:
+async def analyze_dart_files(tool_context) -> Dict[str, Any]:
     """
     모든 Dart 파일에 대한 정적 분석을 수행합니다.
 
@@ -182,7 +182,7 @@ def analyze_dart_files(tool_context) -> Dict[str, Any]:
                 continue
 
             # 파일 분석
-            analysis_result = run_dart_analyze(
+            analysis_result = await run_dart_analyze(
                 file_content=file_content,
                 filename=dart_file,
                 tool_context=tool_context
@@ -8,6 +8,7 @@ from google.adk import Agent
 from src.agents.security_group.dart_static_analysis_agent import (
     dart_static_analysis_agent
 )
+from src.agents.agent_tree import detached_agent
 from src.utils.logger import logger
 
 
@@ -34,7 +35,7 @@ def register_security_agents(app_spec):
     """
     try:
         # 기본 보안 에이전트 목록 (항상 포함)
-        agents = [dart_static_analysis_agent]
+        agents = [detached_agent(dart_static_analysis_agent)]
 
         # 앱 명세에 따라 추가 보안 에이전트 등록
         if "security_checks" in app_spec:
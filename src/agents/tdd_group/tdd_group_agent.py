@@ -7,6 +7,7 @@ from google.adk import Agent
 
 from src.agents.tdd_group.model_test_case_agent import model_test_case_agent
 from src.agents.tdd_group.android_test_agent import android_test_agent
+from src.agents.agent_tree import detached_agent
 from src.utils.logger import logger
 
 
@@ -33,7 +34,10 @@ def register_tdd_agents(app_spec):
     """
     try:
         # 기본 TDD 에이전트 목록 (항상 포함)
-        agents = [model_test_case_agent, android_test_agent]
+        agents = [
+            detached_agent(model_test_case_agent),
+            detached_agent(android_test_agent)
+        ]
 
         # 앱 명세에 따라 추가 TDD 에이전트 등록
         if "tests" in app_spec:
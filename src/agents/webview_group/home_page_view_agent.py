@@ -7,6 +7,7 @@ from google.adk.agents import LlmAgent
 
 from src.config.settings import get_agent_config
 from src.tools.code_generation import (
+    generate_dart_file,
     generate_dart_file_tool,
     direct_code_generation_tool
 )
@@ -40,7 +41,7 @@ home_page_view_agent = LlmAgent(
 )
 
 
-def create_default_home_page(tool_context) -> None:
+async def create_default_home_page(tool_context) -> None:
     """
     기본 홈 페이지 위젯을 생성합니다.
 
@@ -64,7 +65,7 @@ def create_default_home_page(tool_context) -> None:
     }
 
     # 파일 생성 (템플릿 기반)
-    generate_dart_file_tool(
+    await generate_dart_file(
         template_name="page_view.dart.j2",
         output_filename="lib/pages/home_page.dart",
         context=home_page_context,
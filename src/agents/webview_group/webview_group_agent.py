@@ -3,22 +3,31 @@ WebviewGroupAgent: 웹뷰 파일 생성을 조정하는 그룹 에이전트.
 
 이 에이전트는 여러 웹뷰 파일 생성 에이전트의 실행을 조정하고 관리합니다.
 """
-from google.adk.agents import ParallelAgent
+from src.agents.parallel_agent import CancellableParallelAgent
 
 from src.agents.webview_group.home_page_view_agent import (
-    home_page_view_agent
+    home_page_view_agent,
+    create_default_home_page
 )
+from src.agents.agent_tree import detached_agent
 from src.utils.logger import logger
 
 
+# 제한 시간을 넘긴 하위 에이전트 대신 템플릿으로 파일을 생성할 함수
+webview_agent_fallbacks = {
+    home_page_view_agent.name: create_default_home_page,
+}
+
+
 # 웹뷰 그룹 에이전트 정의
-webview_group_agent = ParallelAgent(
+webview_group_agent = CancellableParallelAgent(
     name="WebviewGroupAgent",
     description="웹뷰 파일 생성 작업을 병렬로 수행하는 에이전트 그룹",
     sub_agents=[
         home_page_view_agent,
         # login_page_view_agent와 같은 다른 뷰 에이전트를 추가
-    ]
+    ],
+    fallbacks=webview_agent_fallbacks
 )
 
 
@@ -30,11 +39,11 @@ def register_webview_agents(app_spec):
         app_spec (dict): 애플리케이션 명세
 
     Returns:
-        ParallelAgent: 업데이트된 웹뷰 그룹 에이전트
+        CancellableParallelAgent: 업데이트된 웹뷰 그룹 에이전트
     """
     try:
         # 기본 웹뷰 에이전트 목록 (항상 포함)
-        agents = [home_page_view_agent]
+        agents = [detached_agent(home_page_view_agent)]
 
         # 앱 명세에 따라 추가 웹뷰 에이전트 등록
         if "pages" in app_spec:
@@ -42,11 +51,12 @@ def register_webview_agents(app_spec):
             # 예: LoginPage, ProductDetailPage 등
             pass
 
-        # 업데이트된 에이전트 목록으로 ParallelAgent 생성
-        updated_webview_group_agent = ParallelAgent(
+        # 업데이트된 에이전트 목록으로 CancellableParallelAgent 생성
+        updated_webview_group_agent = CancellableParallelAgent(
             name="WebviewGroupAgent",
             description="웹뷰 파일 생성 작업을 병렬로 수행하는 에이전트 그룹",
-            sub_agents=agents
+            sub_agents=agents,
+            fallbacks=webview_agent_fallbacks
         )
 
         return updated_webview_group_agent
@@ -0,0 +1,189 @@
+"""
+에이전트 작업 세션 수명 관리.
+
+이 모듈은 에이전트 작업마다 만드는 ADK 세션과 그 세션의 아티팩트를 작업이
+끝난 뒤 정리하는 AgentSessions를 제공합니다.
+
+작업이 끝나면 세션을 닫힌 것으로 표시하고, 다운로드 유예 시간(grace)이
+지나면 세션 서비스에서 세션(상태와 이벤트 기록)을, 아티팩트 서비스에서 그
+세션의 아티팩트를 삭제합니다. 작업 디렉토리에 기록되지 않은 아티팩트는
+유예 시간 동안만 다운로드할 수 있습니다.
+
+세션과 아티팩트 서비스는 처음 필요할 때 만들어지므로 생성자에는 서비스를
+반환하는 함수를 전달합니다.
+"""
+import asyncio
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+# 세션 수명 관리 로거 설정
+sessions_logger = setup_logger("agent_sessions")
+
+
+class AgentSessions:
+    """작업별 ADK 세션을 추적하고 작업이 끝나면 유예 시간 후 삭제하는 관리자"""
+
+    def __init__(
+        self,
+        app_name: str,
+        session_service: Callable[[], Any],
+        artifact_service: Callable[[], Any],
+        grace: float = 600,
+        interval: float = 60,
+    ):
+        """
+        Args:
+            app_name: ADK 앱 이름
+            session_service: ADK 세션 서비스를 반환하는 함수
+            artifact_service: ADK 아티팩트 서비스를 반환하는 함수
+            grace: 작업이 끝난 뒤 세션을 삭제하기 전 대기 시간(초, 0이면 즉시 삭제)
+            interval: 유예 시간이 지난 세션을 확인하는 주기(초)
+        """
+        self.app_name = app_name
+        self.session_service = session_service
+        self.artifact_service = artifact_service
+        self.grace = grace
+        self.interval = interval
+
+        # 세션 ID -> (작업 ID, 사용자 ID, 닫힌 시각 또는 None)
+        self._sessions: Dict[str, Tuple[str, str, Optional[float]]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.evicted = 0
+
+    def open(self, job_id: str, user_id: str, session_id: str):
+        """
+        작업의 세션을 등록합니다.
+
+        Args:
+            job_id: 작업 ID
+            user_id: 세션 사용자 ID
+            session_id: 세션 ID
+        """
+        self._sessions[session_id] = (job_id, user_id, None)
+
+    async def close(
+        self, job_info: Dict[str, Any], closed_at: Optional[float] = None
+    ) -> int:
+        """
+        끝난 작업의 세션을 닫습니다.
+
+        유예 시간이 0이면 바로 삭제하고, 아니면 유예 시간 후 collect()가
+        삭제합니다. 등록되지 않은 세션(재시작 전에 만든 세션 등)도 작업
+        레코드의 user_id, session_id로 닫을 수 있습니다.
+
+        Args:
+            job_info: 작업 레코드
+            closed_at: 닫힌 시각 (기본값: 현재 시각)
+
+        Returns:
+            닫은 세션 수
+        """
+        job_id = job_info["job_id"]
+        closed_at = time.time() if closed_at is None else closed_at
+        closing = [
+            session_id for session_id, (owner, _, closed) in self._sessions.items()
+            if owner == job_id and closed is None
+        ]
+        for session_id in closing:
+            _, owner_id, _ = self._sessions[session_id]
+            self._sessions[session_id] = (job_id, owner_id, closed_at)
+
+        user_id, session_id = job_info.get("user_id"), job_info.get("session_id")
+        if user_id and session_id and session_id not in self._sessions:
+            self._sessions[session_id] = (job_id, user_id, closed_at)
+            closing.append(session_id)
+
+        if self.grace <= 0:
+            for session_id in closing:
+                await self.evict(session_id)
+        return len(closing)
+
+    async def evict(self, session_id: str) -> bool:
+        """
+        세션과 세션 아티팩트를 바로 삭제합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            삭제할 세션이 있었는지 여부
+        """
+        entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return False
+        job_id, user_id, _ = entry
+        scope = {"app_name": self.app_name, "user_id": user_id, "session_id": session_id}
+
+        try:
+            artifacts = self.artifact_service()
+            for filename in await artifacts.list_artifact_keys(**scope):
+                await artifacts.delete_artifact(**scope, filename=filename)
+
+            sessions = self.session_service()
+            sessions.delete_session(**scope)
+            # InMemorySessionService는 세션을 지워도 빈 사용자 항목을 남김
+            # (작업마다 사용자 ID가 새로 만들어지므로 직접 정리)
+            by_user = getattr(sessions, "sessions", {}).get(self.app_name)
+            if isinstance(by_user, dict) and not by_user.get(user_id, True):
+                by_user.pop(user_id, None)
+        except Exception as e:
+            sessions_logger.error(f"세션 삭제 실패: job_id={job_id}, {str(e)}")
+            return False
+
+        self.evicted += 1
+        return True
+
+    async def collect(self, now: Optional[float] = None) -> int:
+        """
+        유예 시간이 지난 닫힌 세션을 삭제합니다.
+
+        Args:
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            삭제한 세션 수
+        """
+        now = time.time() if now is None else now
+        expired = [
+            session_id for session_id, (_, _, closed_at) in self._sessions.items()
+            if closed_at is not None and now - closed_at >= self.grace
+        ]
+        evicted = 0
+        for session_id in expired:
+            evicted += await self.evict(session_id)
+        if evicted:
+            sessions_logger.info(f"끝난 작업 세션 {evicted}개 삭제")
+        return evicted
+
+    def start(self):
+        """백그라운드 세션 정리 작업을 시작합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="agent-sessions")
+
+    async def stop(self):
+        """백그라운드 세션 정리 작업을 중단합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.collect()
+            except Exception as e:
+                sessions_logger.error(f"세션 정리 중 오류 발생: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        """열린 세션, 유예 중인 세션, 삭제한 세션 수를 반환합니다."""
+        closing = sum(
+            1 for _, _, closed_at in self._sessions.values() if closed_at is not None
+        )
+        return {
+            "open_sessions": len(self._sessions) - closing,
+            "closing_sessions": closing,
+            "evicted_sessions": self.evicted,
+        }
@@ -5,31 +5,78 @@ FastAPI 서버 구현.
 """
 import asyncio
 import json
+import socket
 import time
 import uuid
-import io
 import os
-import zipfile
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Any, List, Optional, Set, Tuple, Union
 from datetime import datetime
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import (
+    FileResponse, JSONResponse, Response, StreamingResponse
+)
 from pydantic import BaseModel, Field
 
-from google.adk import Runner
 from src.utils.logger import setup_logger
 
-from google.adk.artifacts import InMemoryArtifactService
-from google.adk.sessions import InMemorySessionService
-
 from src.config.settings import (
-    API_HOST, API_PORT, API_DEBUG, FLUTTER_OUTPUT_DIR
+    API_HOST, API_PORT, API_DEBUG, FLUTTER_OUTPUT_DIR, FLUTTER_ARCHIVES_DIR,
+    JOB_QUEUE_MAX_SIZE, JOB_WORKER_COUNT, JOB_QUEUE_RETRY_AFTER,
+    JOB_STORE_BACKEND, JOB_STORE_PREFIX, REDIS_URL, JOB_DRAIN_TIMEOUT,
+    JOB_STATES_DIR, JOB_JOURNAL_ENABLED, JOB_JOURNAL_COMPACT_EVERY,
+    JOB_JOURNAL_FSYNC, JOB_RECOVERY_MODE, JOB_EVENTS_HEARTBEAT,
+    JOB_EVENTS_QUEUE_SIZE, JOBS_PAGE_DEFAULT_LIMIT, JOBS_PAGE_MAX_LIMIT,
+    RETENTION_MAX_AGE, RETENTION_MAX_JOBS, RETENTION_MAX_DISK_BYTES,
+    RETENTION_ORPHAN_GRACE, RETENTION_INTERVAL, ARCHIVE_WORKERS,
+    BLOB_STORE_ENABLED, BLOB_STORE_DIR, BLOB_GC_GRACE,
+    RESULT_CACHE_ENABLED, RESULT_CACHE_SIZE, TEMPLATES_DIR,
+    IDEMPOTENCY_KEY_TTL, IDEMPOTENCY_MAX_KEYS, BATCH_MAX_SIZE,
+    BATCH_DEFAULT_CONCURRENCY, BATCH_MAX_CONCURRENCY, BATCH_MAX_KEEP,
+    GENERATION_MODE, GENERATION_PROCESSES, GENERATION_MAX_TASKS_PER_PROCESS,
+    GENERATION_MEMORY_LIMIT, GENERATION_CPU_LIMIT, RATE_LIMIT_ENABLED,
+    API_KEY_HEADER, RATE_LIMIT_RATE, RATE_LIMIT_BURST,
+    CLIENT_MAX_CONCURRENT_JOBS, RATE_LIMIT_MAX_CLIENTS, METRICS_ENABLED,
+    TRACE_ENABLED, TRACE_MAX_JOBS, TRACE_MAX_SPANS, JOB_CANCEL_TIMEOUT,
+    JOB_DEADLINE, PHASE_DEADLINE, SCHEDULER_BATCH_PENALTY, SCHEDULER_AGING_RATE,
+    SCHEDULER_DEFAULT_UNIT_SECONDS, SESSION_BACKEND, SESSION_DB_PATH, SESSION_GRACE,
+    SESSION_GC_INTERVAL, JOB_CANCEL_POLL_INTERVAL, ARTIFACT_BACKEND, ARTIFACT_DB_PATH, ARTIFACT_BLOB_DIR,
+    ARTIFACT_MAX_VERSIONS
+)
+from src.api.job_queue import (
+    BATCH, INTERACTIVE, JobQueue, QueueClosedError, QueueFullError
+)
+from src.api.job_costs import CostEstimator, phase_units
+from src.api.job_journal import JobJournal
+from src.api.job_events import (
+    RESULT_STATUSES, TERMINAL_STATUSES, JobEventBroker, format_sse, status_event,
+    summary_event
 )
-from src.agents.main_orchestrator_agent import (
-    main_orchestrator_agent, register_agents
+from src.api.job_store import (
+    JobStore, InvalidCursorError, JobStatusConflictError, create_job_store
 )
+from src.api.retention import JobReaper, RetentionPolicy
+from src.api.archive import ArchiveCache, etag_matches
+from src.api.blob_store import BlobStore
+from src.api.result_cache import (
+    ResultCache, generator_fingerprint, normalize_app_spec, spec_digest
+)
+from src.api.job_dedup import IdempotencyConflictError, JobDeduplicator
+from src.api.job_batches import BatchRegistry, JobBatch
+from src.api.process_pool import ProcessWorkerPool
+from src.api.client_quotas import ClientQuotas, client_key
+from src.api.app_files import (
+    GENERATION_PHASES, GENERATOR_SOURCES, GENERATOR_VERSION, PHASE_LABELS,
+    artifact_content_type, clone_output, generate_app_output, io_executor,
+    order_artifacts, prepare_output_dir, release_output_dir, reserve_output_dir,
+    retire_output_dir, run_phase
+)
+from src.api.agent_sessions import AgentSessions
+from src.api.build_graph import compile_graph, merge_patch, plan_rebuild
+from src.api.http_metrics import HttpMetricsMiddleware
+from src.utils import deadlines, job_processes, metrics, tracing
 
 # API 로거 설정
 api_logger = setup_logger("api")
@@ -50,24 +97,213 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# ADK 서비스 및 실행기 초기화
-artifact_service = InMemoryArtifactService()
-session_service = InMemorySessionService()
+# 엔드포인트별 요청 수와 처리 시간 메트릭
+if METRICS_ENABLED:
+    app.add_middleware(HttpMetricsMiddleware)
+
+# ADK 앱 이름 (세션과 아티팩트의 네임스페이스)
+ADK_APP_NAME = "AgentOfFlutter"
+
+# ADK 서비스 및 실행기 (google.adk와 에이전트 트리는 가져오는 데 수 초가 걸리므로
+# 서버 시작 시가 아니라 처음 필요할 때 get_*() 함수로 생성)
+artifact_service = None
+session_service = None
+runner = None
+
+
+def get_artifact_service():
+    """
+    ADK 아티팩트 서비스를 반환합니다 (처음 호출할 때 생성).
+
+    ARTIFACT_BACKEND가 sqlite이면 아티팩트를 메모리가 아니라 ARTIFACT_DB_PATH의
+    SQLite 색인과 ARTIFACT_BLOB_DIR에 저장하고 최근 ARTIFACT_MAX_VERSIONS개
+    버전만 보관합니다.
+    """
+    global artifact_service
+    if artifact_service is None:
+        if ARTIFACT_BACKEND == "sqlite":
+            from src.api.sqlite_artifacts import SqliteArtifactService
+
+            artifact_service = SqliteArtifactService(
+                ARTIFACT_DB_PATH, ARTIFACT_BLOB_DIR or None,
+                max_versions=ARTIFACT_MAX_VERSIONS
+            )
+        else:
+            from google.adk.artifacts import InMemoryArtifactService
+            artifact_service = InMemoryArtifactService()
+    return artifact_service
+
+
+def get_session_service():
+    """
+    ADK 세션 서비스를 반환합니다 (처음 호출할 때 생성).
+
+    SESSION_BACKEND가 sqlite이면 세션 상태와 이벤트 기록을 메모리가 아니라
+    SESSION_DB_PATH의 SQLite 파일에 저장합니다.
+    """
+    global session_service
+    if session_service is None:
+        if SESSION_BACKEND == "sqlite":
+            from google.adk.sessions import DatabaseSessionService
+
+            os.makedirs(os.path.dirname(SESSION_DB_PATH) or ".", exist_ok=True)
+            session_service = DatabaseSessionService(f"sqlite:///{SESSION_DB_PATH}")
+        else:
+            from google.adk.sessions import InMemorySessionService
+            session_service = InMemorySessionService()
+    return session_service
+
+
+def get_runner(agent=None):
+    """
+    ADK 실행기를 반환합니다.
+
+    agent가 없으면 메인 오케스트레이터 에이전트를 사용하는 기본 실행기를
+    반환하며, 처음 호출할 때 google.adk와 에이전트 모듈을 가져와 생성합니다.
+    agent가 있으면 그 에이전트 트리를 실행하는 새 실행기를 반환합니다.
+    실행기는 에이전트와 서비스를 참조할 뿐이므로 작업마다 만들어도 됩니다.
+
+    Args:
+        agent: 실행할 에이전트 트리 (register_agents()의 반환값)
+
+    Returns:
+        ADK 실행기
+    """
+    global runner
+    if agent is not None:
+        from google.adk import Runner
+
+        return Runner(
+            app_name=ADK_APP_NAME,
+            agent=agent,
+            artifact_service=get_artifact_service(),
+            session_service=get_session_service(),
+        )
+    if runner is None:
+        from google.adk import Runner
+        from src.agents.main_orchestrator_agent import main_orchestrator_agent
+
+        runner = Runner(
+            app_name=ADK_APP_NAME,
+            agent=main_orchestrator_agent,
+            artifact_service=get_artifact_service(),
+            session_service=get_session_service(),
+        )
+        api_logger.info("ADK 실행기 초기화 완료")
+    return runner
+
+
+def register_agents(app_spec: dict):
+    """
+    앱 명세에 따라 오케스트레이터의 에이전트를 등록합니다.
+
+    에이전트 모듈은 처음 호출할 때 가져옵니다. 명세 구조가 같은 작업은
+    캐시된 에이전트 트리를 함께 사용합니다.
+
+    Args:
+        app_spec: 앱 명세 딕셔너리
+
+    Returns:
+        업데이트된 메인 오케스트레이터 에이전트
+    """
+    from src.agents.main_orchestrator_agent import register_agents as register
+    return register(app_spec)
+
+
+# 에이전트 작업 세션 수명 관리 (작업이 끝나면 SESSION_GRACE초 후 세션과
+# 세션 아티팩트 삭제)
+agent_sessions = AgentSessions(
+    ADK_APP_NAME, get_session_service, get_artifact_service,
+    grace=SESSION_GRACE, interval=SESSION_GC_INTERVAL,
+)
+
+# 이 서버 프로세스의 식별자. 작업 레코드의 worker_id로 작업을 실행하는 워커를
+# 기록하여, 다른 워커가 받은 취소 요청을 실행 중인 워커에 전달함
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+# 작업 상태 저장소 (memory 또는 redis)
+job_store: JobStore = create_job_store(
+    JOB_STORE_BACKEND, REDIS_URL, JOB_STORE_PREFIX
+)
+
+# 작업 상태 전이 저널 (재시작 시 작업 테이블 복원용)
+job_journal: Optional[JobJournal] = (
+    JobJournal(
+        JOB_STATES_DIR,
+        compact_every=JOB_JOURNAL_COMPACT_EVERY,
+        executor=io_executor,
+        fsync=JOB_JOURNAL_FSYNC,
+    )
+    if JOB_JOURNAL_ENABLED else None
+)
+
+# 생성 파일 블롭 저장소 (작업 간 같은 내용의 파일을 하드링크로 공유)
+blob_store: Optional[BlobStore] = (
+    BlobStore(BLOB_STORE_DIR) if BLOB_STORE_ENABLED else None
+)
+
+# 생성 결과에 영향을 주는 템플릿/생성기 지문 (명세 키에 포함)
+GENERATOR_FINGERPRINT = generator_fingerprint(
+    str(TEMPLATES_DIR), GENERATOR_SOURCES, GENERATOR_VERSION
+)
+
+# 같은 앱 명세의 생성 결과 캐시 (템플릿/생성기 지문이 바뀌면 무효화)
+result_cache: Optional[ResultCache] = (
+    ResultCache(GENERATOR_FINGERPRINT, max_entries=RESULT_CACHE_SIZE)
+    if RESULT_CACHE_ENABLED else None
+)
+
+# Idempotency-Key 및 진행 중인 같은 명세의 중복 요청 제거
+job_dedup = JobDeduplicator(
+    key_ttl=IDEMPOTENCY_KEY_TTL, max_keys=IDEMPOTENCY_MAX_KEYS
+)
+
+# 클라이언트별 요청 속도 및 동시 작업 수 한도
+client_quotas: Optional[ClientQuotas] = (
+    ClientQuotas(
+        rate=RATE_LIMIT_RATE,
+        burst=RATE_LIMIT_BURST,
+        max_concurrent_jobs=CLIENT_MAX_CONCURRENT_JOBS,
+        max_clients=RATE_LIMIT_MAX_CLIENTS,
+    )
+    if RATE_LIMIT_ENABLED else None
+)
+
+# 앱 생성과 ZIP 압축을 실행할 워커 프로세스 풀 (GENERATION_MODE=process)
+generation_pool: Optional[ProcessWorkerPool] = (
+    ProcessWorkerPool(
+        max_workers=GENERATION_PROCESSES,
+        max_tasks_per_worker=GENERATION_MAX_TASKS_PER_PROCESS,
+        memory_limit=GENERATION_MEMORY_LIMIT,
+        cpu_limit=GENERATION_CPU_LIMIT,
+    )
+    if GENERATION_MODE == "process" else None
+)
 
-# 메인 오케스트레이터 에이전트를 사용한 ADK 실행기 생성
-runner = Runner(
-    app_name="AgentOfFlutter",
-    agent=main_orchestrator_agent,
-    artifact_service=artifact_service,
-    session_service=session_service,
+# 내용 해시 기반 ZIP 아카이브 캐시 (압축은 전용 실행기 또는 워커 프로세스에서 수행)
+archive_cache = ArchiveCache(
+    FLUTTER_ARCHIVES_DIR,
+    compress_executor=ThreadPoolExecutor(
+        max_workers=ARCHIVE_WORKERS, thread_name_prefix="archive"
+    ),
+    io_executor=io_executor,
+    process_pool=generation_pool,
 )
 
-# 진행 중인 작업 상태 저장
-active_jobs: Dict[str, Dict[str, Any]] = {}
+# 작업 진행 이벤트 브로커 (SSE 스트림용)
+job_events = JobEventBroker(queue_size=JOB_EVENTS_QUEUE_SIZE)
 
-# 사용자 ID에서 세션 객체로의 매핑을 저장 (Session 객체는 해시 불가능)
-session_id_maps: Dict[str, Any] = {}
-session_runners: Dict[str, Any] = {}  # 사용자 ID별 러너 객체 저장
+# 작업별 트레이스 스팬 (에이전트, 도구 호출, I/O 단계의 벽시계/CPU 시간)
+job_traces: Optional[tracing.TraceStore] = (
+    tracing.TraceStore(max_jobs=TRACE_MAX_JOBS, max_spans=TRACE_MAX_SPANS)
+    if TRACE_ENABLED else None
+)
+if TRACE_ENABLED:
+    # ADK의 에이전트/도구/LLM 호출 스팬을 작업 트레이스로 옮겨 기록
+    tracing.install_adk_bridge()
+
+# status 이벤트를 발행할 필드
+STATUS_EVENT_FIELDS = ("status", "progress", "message", "queue_position")
 
 
 # 앱 명세 모델
@@ -95,6 +331,21 @@ class JobStatus(BaseModel):
     progress: Optional[int] = None
     message: Optional[str] = None
     artifacts: Optional[list] = None
+    queue_position: Optional[int] = None
+    queue_wait: Optional[float] = None
+    timed_out: Optional[List[str]] = None
+    fallbacks: Optional[List[str]] = None
+    priority: Optional[str] = None
+    estimated_cost: Optional[float] = None
+    expected_start: Optional[float] = None
+    expected_finish: Optional[float] = None
+    version: Optional[int] = None
+    cancel_requested: Optional[bool] = None
+
+
+# 여러 작업 상태 조회 요청 모델
+class JobStatusBatchRequest(BaseModel):
+    job_ids: List[str] = Field(..., description="조회할 작업 ID 목록")
 
 
 # 서버 상태 모델
@@ -105,6 +356,156 @@ class ServerStatus(BaseModel):
     completed_jobs: int
     failed_jobs: int
     uptime: str
+    queued_jobs: int = 0
+    running_jobs: int = 0
+    queue_capacity: int = 0
+    worker_count: int = 0
+    avg_queue_wait: float = 0.0
+    total_jobs: int = 0
+    evicted_jobs: int = 0
+    reclaimed_bytes: int = 0
+    result_cache_hits: int = 0
+    result_cache_misses: int = 0
+    idempotent_replays: int = 0
+    coalesced_requests: int = 0
+    generation_mode: str = "thread"
+    worker_crashes: int = 0
+    rate_limited_requests: int = 0
+    open_sessions: int = 0
+    closing_sessions: int = 0
+    evicted_sessions: int = 0
+
+
+def job_status_dict(job_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    작업 레코드에서 JobStatus 필드만 추린 딕셔너리를 만듭니다.
+
+    작업 목록 응답에서는 작업마다 pydantic 객체를 만들지 않고 이 함수로
+    필요한 필드만 복사합니다.
+
+    Args:
+        job_info: 작업 레코드
+
+    Returns:
+        JobStatus와 같은 필드를 가진 딕셔너리
+    """
+    return {field: job_info.get(field) for field in JobStatus.model_fields}
+
+
+def apply_schedule(
+    status: Dict[str, Any], plan: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    작업 상태에 작업 큐가 계산한 현재 대기 순번과 예상 시작/완료 시각을 채웁니다.
+
+    Args:
+        status: JobStatus 필드를 가진 딕셔너리
+        plan: job_queue.schedule() 결과
+
+    Returns:
+        같은 딕셔너리
+    """
+    entry = plan.get(status["job_id"])
+    if entry is not None and status.get("status") in ("pending", "running"):
+        status.update(entry)
+    return status
+
+
+async def update_job(job_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+    """
+    작업 레코드를 갱신합니다. 모든 작업 상태 변경은 이 함수를 거칩니다.
+
+    Args:
+        job_id: 작업 ID
+        **fields: 갱신할 필드
+
+    Returns:
+        갱신된 작업 레코드 또는 작업이 없거나 이미 취소된 작업의 상태를 바꾸려
+        해서 갱신하지 않았으면 None
+    """
+    if fields.get("status") in TERMINAL_STATUSES:
+        fields.setdefault("end_time", time.time())
+
+    try:
+        job_info = await job_store.update(job_id, **fields)
+    except JobStatusConflictError as e:
+        # 취소된 뒤 늦게 끝난 워커의 상태 기록
+        api_logger.info(f"작업 상태 변경 무시: {str(e)}")
+        return None
+    if job_info is None:
+        return None
+
+    if job_journal is not None:
+        job_journal.record_set(job_id, fields)
+    if any(field in fields for field in STATUS_EVENT_FIELDS):
+        job_events.publish(job_id, "status", status_event(job_info))
+    if fields.get("status") in TERMINAL_STATUSES:
+        job_events.publish(job_id, "summary", summary_event(job_info))
+        metrics.jobs_finished.labels(fields["status"]).inc()
+        # 이후 같은 명세는 이 작업에 합류하지 않음
+        if job_info.get("spec_key"):
+            job_dedup.finish(job_info["spec_key"], job_id)
+        # 배치 작업이면 배치의 다음 작업이 시작되도록 알림
+        if job_info.get("batch_id"):
+            job_batches.job_finished(job_info["batch_id"], job_id)
+        # 클라이언트의 동시 작업 자리 반환
+        if client_quotas is not None:
+            client_quotas.release(job_id)
+        # 다운로드 유예 시간 후 에이전트 세션 정리
+        await agent_sessions.close(job_info)
+    return job_info
+
+
+async def create_job(job_info: Dict[str, Any]):
+    """
+    새 작업 레코드를 저장하고 저널에 기록합니다.
+
+    Args:
+        job_info: 작업 레코드
+    """
+    job_info.setdefault("worker_id", WORKER_ID)
+    await job_store.create(job_info)
+    if job_journal is not None:
+        job_journal.record_set(job_info["job_id"], job_info)
+
+
+async def delete_job(job_id: str) -> bool:
+    """
+    작업 레코드를 삭제하고 저널에 기록합니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        삭제 여부
+    """
+    deleted = await job_store.delete(job_id)
+    if deleted and job_journal is not None:
+        job_journal.record_delete(job_id)
+    if deleted and client_quotas is not None:
+        client_quotas.release(job_id)
+    if deleted and job_traces is not None:
+        job_traces.discard(job_id)
+    return deleted
+
+
+async def get_job_or_404(job_id: str) -> Dict[str, Any]:
+    """
+    작업 레코드를 조회하고, 없으면 404 예외를 발생시킵니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        작업 레코드
+    """
+    job_info = await job_store.get(job_id)
+    if job_info is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"작업 ID {job_id}를 찾을 수 없습니다."
+        )
+    return job_info
 
 
 # 파일 시스템에 아티팩트를 저장하는 함수 추가
@@ -136,8 +537,7 @@ async def save_artifacts_to_filesystem(job_id: str, artifacts: Dict[str, Any]):
             api_logger.info(f"아티팩트 저장됨: {file_path}")
         
         # 아티팩트 목록 업데이트
-        if job_id in active_jobs:
-            active_jobs[job_id]["artifacts"] = list(artifacts.keys())
+        if await update_job(job_id, artifacts=list(artifacts.keys())):
             api_logger.info(f"작업 {job_id}의 아티팩트 목록이 업데이트되었습니다.")
         
         return True
@@ -150,87 +550,125 @@ async def handle_app_generation(job_id: str, app_spec: dict):
     """
     앱 생성 작업을 비동기로 처리합니다.
 
+    에이전트 실행, 도구 호출, LLM 호출은 작업 트레이스에 스팬으로 기록됩니다.
+    러너 실행에는 JOB_DEADLINE이, 병렬 그룹의 하위 에이전트에는 AGENT_DEADLINE이
+    적용됩니다 (CancellableParallelAgent 참고).
+
+    Args:
+        job_id: 작업 ID
+        app_spec: 앱 명세 딕셔너리
+    """
+    with trace_job(job_id, "agent_generation"), \
+            deadlines.deadline_scope(new_job_deadline()):
+        await run_agent_generation(job_id, app_spec)
+
+
+async def run_agent_generation(job_id: str, app_spec: dict):
+    """
+    ADK 러너로 앱을 생성하고 생성된 아티팩트를 저장합니다.
+
     Args:
         job_id: 작업 ID
         app_spec: 앱 명세 딕셔너리
     """
     try:
         # 작업 상태 업데이트
-        active_jobs[job_id]["status"] = "running"
-        active_jobs[job_id]["progress"] = 10
-        active_jobs[job_id]["message"] = "Runner 초기화 중..."
+        await update_job(
+            job_id, status="running", progress=10,
+            message="Runner 초기화 중..."
+        )
 
         api_logger.info(f"작업 시작: {job_id}")
 
-        # 앱 명세에 따라 에이전트 등록
-        updated_agent = register_agents(app_spec)
+        # 앱 명세 구조에 맞는 에이전트 트리 가져오기 (캐시에 없으면 새로 만들고,
+        # 첫 작업이면 ADK 모듈도 이때 가져오므로 이벤트 루프 밖에서 실행)
+        loop = asyncio.get_running_loop()
+        updated_agent = await loop.run_in_executor(
+            io_executor, register_agents, app_spec
+        )
         api_logger.info(f"에이전트 등록 완료: {type(updated_agent).__name__}")
+        adk_runner = get_runner(updated_agent)
+        adk_artifacts = get_artifact_service()
 
         # 세션 생성
         user_id = str(uuid.uuid4())
         api_logger.info(f"생성된 사용자 ID: {user_id}")
 
-        session_id = session_service.create_session(
-            app_name="AgentOfFlutter",
-            user_id=user_id
+        # 작업별 데이터는 에이전트 트리가 아니라 세션 상태로 전달
+        session = get_session_service().create_session(
+            app_name=ADK_APP_NAME,
+            user_id=user_id,
+            state={
+                "job_id": job_id,
+                "app_spec": app_spec,
+                "app_name": app_spec.get("app_name", "flutter_app"),
+            }
         )
-        type_name = type(session_id).__name__
-        api_logger.info(f"세션 생성 완료: {type_name}, 값: {session_id}")
-
-        # 세션 ID를 사용자 ID에 매핑
-        session_id_str = str(session_id)
-        api_logger.info(f"세션 ID 문자열: {session_id_str}")
-        session_id_maps[user_id] = session_id
-        session_runners[user_id] = runner
-
-        api_logger.info("Runner 초기화 완료: Runner")
-
-        # 메시지 내용 구성 - Content 클래스 우회
-        initial_message = (
-            f"안녕하세요! Flutter 앱을 생성해 주세요. 다음은 앱 명세입니다: "
-            f"{json.dumps(app_spec, ensure_ascii=False)}"
+        session_id = session.id
+        agent_sessions.open(job_id, user_id, session_id)
+        api_logger.info(f"세션 생성 완료: {session_id}")
+
+        # 메시지 내용 구성
+        from google.genai import types
+
+        initial_message = types.Content(
+            role="user",
+            parts=[types.Part(text=(
+                f"안녕하세요! Flutter 앱을 생성해 주세요. 다음은 앱 명세입니다: "
+                f"{json.dumps(app_spec, ensure_ascii=False)}"
+            ))]
         )
-        api_logger.info("초기 메시지 구성 완료: 문자열 사용")
-
-        # 작업 ID와 사용자 ID 연결
-        active_jobs[job_id]["user_id"] = user_id
-        active_jobs[job_id]["runner"] = runner
-        active_jobs[job_id]["session_id"] = session_id_str
 
-        # 세션 ID와 사용자 ID 기록
-        api_logger.info(f"세션 ID: {session_id_str}, 사용자 ID: {user_id}")
+        # 작업 ID와 사용자/세션 ID 연결 (세션 객체는 프로세스 로컬이므로 ID만 저장)
+        await update_job(job_id, user_id=user_id, session_id=session_id)
+        api_logger.info(f"세션 ID: {session_id}, 사용자 ID: {user_id}")
+
+        async def consume_events():
+            # 러너 실행 - 모든 이벤트를 소비할 때까지 대기
+            # 직전 이벤트 이후 걸린 시간을 이벤트를 낸 에이전트의 턴 시간으로 기록
+            turn_started = time.perf_counter()
+            async for event in adk_runner.run_async(
+                user_id=user_id,
+                session_id=session_id,
+                new_message=initial_message
+            ):
+                now = time.perf_counter()
+                metrics.agent_turn_seconds.labels(
+                    getattr(event, "author", None) or "unknown"
+                ).observe(now - turn_started)
+                turn_started = now
 
-        # 러너 실행 - 비동기 함수로 실행
-        api_logger.info(
-            f"run_async 호출 전 - 세션 ID 유형: {type(session_id).__name__}"
-        )
-
-        # 비동기 작업으로 실행 (여기서 initial_message 문자열 사용)
         try:
-            run_task = asyncio.create_task(
-                runner.run_async(
-                    user_id=user_id,
-                    session_id=session_id,
-                    new_message=initial_message  # 문자열 전달
+            # 작업 제한 시간이 지나면 러너를 취소하고 그때까지 저장된 아티팩트로 끝냄
+            job_deadline = deadlines.current_deadline()
+            try:
+                await asyncio.wait_for(
+                    consume_events(),
+                    job_deadline.remaining() if job_deadline else None
                 )
-            )
-            api_logger.info("앱 생성 작업 시작됨")
-            
-            # 작업이 완료될 때까지 대기
-            await run_task
-            
+                api_logger.info("앱 생성 에이전트 실행 완료")
+            except asyncio.TimeoutError:
+                deadlines.record_timeout("job")
+                api_logger.warning(f"작업 제한 시간 초과로 러너 중단: {job_id}")
+
             # 작업이 완료되면 아티팩트 가져오기
             artifacts = {}
-            for artifact_id in artifact_service.list_artifacts(session_id):
-                artifact_data = artifact_service.get_artifact(
-                    session_id, artifact_id
+            artifact_keys = await adk_artifacts.list_artifact_keys(
+                app_name=ADK_APP_NAME, user_id=user_id,
+                session_id=session_id
+            )
+            for artifact_id in artifact_keys:
+                artifact_data = await adk_artifacts.load_artifact(
+                    app_name=ADK_APP_NAME, user_id=user_id,
+                    session_id=session_id, filename=artifact_id
                 )
-                if artifact_data and artifact_data.data:
-                    artifacts[artifact_id] = artifact_data.data
+                if artifact_data and artifact_data.inline_data:
+                    artifacts[artifact_id] = artifact_data.inline_data.data
             
             # 비동기 작업 실행 후 아티팩트 저장 로그
             if artifacts:
-                await save_artifacts_to_filesystem(job_id, artifacts)
+                with tracing.span("save_artifacts", "io", measure_cpu=False):
+                    await save_artifacts_to_filesystem(job_id, artifacts)
                 api_logger.info(
                     f"작업 {job_id}의 아티팩트가 저장되었습니다."
                 )
@@ -239,61 +677,289 @@ async def handle_app_generation(job_id: str, app_spec: dict):
             api_logger.error(f"러너 실행 실패: {str(e)}")
             raise
 
-        # 작업 완료 표시
-        active_jobs[job_id]["status"] = "completed"
-        active_jobs[job_id]["progress"] = 100
-        active_jobs[job_id]["message"] = "앱 생성 완료"
+        # 작업 완료 표시 (제한 시간을 넘긴 단계가 있으면 partial)
+        await update_job(
+            job_id,
+            **finished_job_fields(deadlines.current_scope(), "앱 생성 완료")
+        )
 
     except Exception as e:
         api_logger.error(f"작업 실패: {job_id}, 오류: {str(e)}")
 
         # 작업 실패 표시
-        if job_id in active_jobs:
-            active_jobs[job_id]["status"] = "failed"
-            active_jobs[job_id]["message"] = f"앱 생성 중 오류 발생: {str(e)}"
+        await update_job(
+            job_id, status="failed", message=f"앱 생성 중 오류 발생: {str(e)}"
+        )
+
+
+def request_client_id(request: Request) -> str:
+    """요청의 API 키 헤더 또는 클라이언트 IP로 클라이언트 식별자를 만듭니다."""
+    return client_key(
+        request.headers.get(API_KEY_HEADER),
+        request.client.host if request.client else None
+    )
+
+
+def admit_request(request: Request) -> Tuple[str, Optional[JSONResponse]]:
+    """
+    생성 요청에 클라이언트별 요청 한도를 적용합니다. 명세를 읽기 전에 호출합니다.
+
+    허용된 요청은 작업을 만들면 client_quotas.bind(), 만들지 않으면
+    release_admission()을 호출해야 합니다.
+
+    Args:
+        request: 요청 객체
+
+    Returns:
+        (클라이언트 식별자, 거절 시 429 응답 또는 None)
+    """
+    client_id = request_client_id(request)
+    if client_quotas is None:
+        return client_id, None
+
+    rejection = client_quotas.admit(client_id)
+    if rejection is None:
+        return client_id, None
+
+    reason, retry_after = rejection
+    if reason == "concurrency":
+        error = (
+            f"동시에 실행할 수 있는 작업 수({client_quotas.max_concurrent_jobs}개)를 "
+            "초과했습니다. 진행 중인 작업이 끝난 후 다시 시도하세요."
+        )
+    else:
+        error = "요청 속도 제한을 초과했습니다. 잠시 후 다시 시도하세요."
+    return client_id, JSONResponse(
+        status_code=429,
+        content={"error": error, "reason": reason},
+        headers={"Retry-After": str(max(1, int(retry_after + 0.999)))}
+    )
+
+
+def release_admission(client_id: str):
+    """admit_request()로 허용되었지만 작업을 만들지 않은 요청의 자리를 반환합니다."""
+    if client_quotas is not None:
+        client_quotas.cancel(client_id)
+
+
+def queue_full_response(retry_after: int) -> JSONResponse:
+    """작업 큐가 가득 찼을 때의 429 응답을 생성합니다."""
+    api_logger.warning(f"작업 큐가 가득 차 요청 거절: 대기 {job_queue.depth}개")
+    return JSONResponse(
+        status_code=429,
+        content={"error": "작업 큐가 가득 찼습니다. 잠시 후 다시 시도하세요."},
+        headers={"Retry-After": str(retry_after)}
+    )
+
+
+def server_draining_response() -> JSONResponse:
+    """서버 종료 중일 때의 503 응답을 생성합니다."""
+    return JSONResponse(
+        status_code=503,
+        content={"error": "서버가 종료 중입니다. 잠시 후 다시 시도하세요."},
+        headers={"Retry-After": str(JOB_QUEUE_RETRY_AFTER)}
+    )
+
+
+async def new_job_record(
+    job_id: str, app_spec: Dict[str, Any], spec_key: str, **fields: Any
+) -> Dict[str, Any]:
+    """
+    새 작업의 출력 폴더를 예약하고 대기 상태의 작업 레코드를 만듭니다.
+
+    레코드는 저장하지 않으므로 호출자가 create_job()으로 저장해야 합니다.
+
+    Args:
+        job_id: 작업 ID
+        app_spec: 정규화된 앱 명세
+        spec_key: 정규화된 명세 키
+        **fields: 추가하거나 덮어쓸 레코드 필드
+
+    Returns:
+        작업 레코드
+    """
+    # 앱 이름 및 버전 정보 생성 (같은 이름의 폴더가 있으면 접미사 추가)
+    app_name = app_spec.get("app_name", "flutter_app")
+    app_version = f"v{int(time.time()) % 10000}"
+    loop = asyncio.get_running_loop()
+    folder_name = await loop.run_in_executor(
+        io_executor, reserve_output_dir,
+        FLUTTER_OUTPUT_DIR, f"App_{app_name}_{app_version}"
+    )
+
+    # 작업 상태 초기화 - job_id 필드 추가
+    job_info = {
+        "job_id": job_id,  # job_id 필드 명시적 추가
+        "folder_name": folder_name,  # 폴더명 저장
+        "app_spec": app_spec,  # 앱 명세 저장
+        "spec_key": spec_key,  # 정규화된 명세 키
+        "status": "pending",
+        "progress": 0,
+        "message": "작업 대기 중",
+        "artifacts": [],
+        "start_time": time.time(),
+        "queue_position": 0,
+        "version": 1
+    }
+    job_info.update(fields)
+    return job_info
+
+
+def generation_response(job_info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    앱 생성 요청 응답 본문을 만듭니다.
+
+    Args:
+        job_info: 작업 레코드
+
+    Returns:
+        작업 ID, 폴더명, 현재 상태를 포함하는 딕셔너리
+    """
+    return {
+        "job_id": job_info["job_id"],
+        "folder_name": job_info.get("folder_name"),
+        "status": job_info["status"],
+        "progress": job_info.get("progress"),
+        "message": job_info.get("message"),
+        "artifacts": job_info.get("artifacts", []),
+        "queue_position": job_info.get("queue_position", 0)
+    }
 
 
 @app.post("/generate_app")
-async def start_flutter_app_creation(request: Request):
+async def start_flutter_app_creation(
+    request: Request,
+    priority: str = Query(
+        INTERACTIVE, description="우선순위 등급 (interactive 또는 batch)"
+    ),
+):
     """
     Flutter 앱 생성 작업을 시작합니다.
 
-    Request body는 앱 명세를 포함해야 합니다.
+    Request body는 앱 명세를 포함해야 합니다. Idempotency-Key 헤더로 다시
+    제출된 요청은 처음 만든 작업을 반환하고, 같은 명세로 대기 중이거나 실행
+    중인 작업이 있으면 새 작업을 만들지 않고 그 작업을 반환합니다.
+    클라이언트별 요청 한도를 넘으면 명세를 읽기 전에 429로 거절합니다.
+    작업 큐는 우선순위 등급과 명세로 추정한 처리 시간 순으로 작업을 시작합니다.
     """
+    client_id, rejection = admit_request(request)
+    if rejection is not None:
+        return rejection
+    admitted = True
+
     try:
-        app_spec = await request.json()
-        
-        # 앱 이름 및 버전 정보 생성
-        app_name = app_spec.get("app_name", "flutter_app")
-        app_version = f"v{int(time.time()) % 10000}"
-        folder_name = f"App_{app_name}_{app_version}"
-        
-        # 고유 작업 ID 생성
-        job_id = str(uuid.uuid4())
+        idempotency_key = request.headers.get("idempotency-key")
+        if idempotency_key is not None and not 0 < len(idempotency_key) <= 255:
+            return JSONResponse(
+                status_code=400,
+                content={"error": "Idempotency-Key는 1~255자여야 합니다."}
+            )
+        if priority not in job_queue.priority_penalties:
+            return JSONResponse(
+                status_code=400,
+                content={"error": f"알 수 없는 우선순위입니다: {priority}"}
+            )
 
-        # 작업 상태 초기화 - job_id 필드 추가
-        active_jobs[job_id] = {
-            "job_id": job_id,  # job_id 필드 명시적 추가
-            "folder_name": folder_name,  # 폴더명 저장
-            "app_spec": app_spec,  # 앱 명세 저장
-            "status": "pending",
-            "progress": 0,
-            "message": "작업 초기화 중...",
-            "artifacts": [],
-            "start_time": time.time()
-        }
+        # 종료 중이거나 큐가 가득 찬 경우 명세를 읽기 전에 거절
+        # (Idempotency-Key 재시도는 기존 작업을 반환할 수 있으므로 명세를 확인)
+        if job_queue.closed:
+            return server_draining_response()
+        if job_queue.full and idempotency_key is None:
+            return queue_full_response(job_queue.retry_after())
 
-        # 백그라운드 작업으로 앱 생성 실행
-        asyncio.create_task(start_app_creation(job_id, app_spec))
+        # 같은 명세가 같은 키를 갖도록 정규화
+        app_spec = normalize_app_spec(await request.json())
+        spec_key = spec_digest(app_spec, GENERATOR_FINGERPRINT)
 
-        return {
-            "job_id": job_id,
-            "folder_name": folder_name,
-            "status": active_jobs[job_id]["status"],
-            "progress": active_jobs[job_id]["progress"],
-            "message": active_jobs[job_id]["message"],
-            "artifacts": active_jobs[job_id]["artifacts"]
-        }
+        # 같은 Idempotency-Key 또는 같은 명세로 진행 중인 작업이 있으면 합류
+        while True:
+            try:
+                flight = job_dedup.find(spec_key, idempotency_key)
+            except IdempotencyConflictError as e:
+                return JSONResponse(status_code=422, content={"error": str(e)})
+            if flight is None:
+                break
+            await flight.ready.wait()
+            existing = await job_store.get(flight.job_id)
+            if existing is None:
+                # 작업 생성이 실패했거나 작업이 정리된 경우 새로 시작
+                job_dedup.abandon(flight)
+                continue
+            if idempotency_key is not None:
+                job_dedup.remember_key(idempotency_key, flight)
+            return JSONResponse(
+                content=generation_response(existing),
+                headers={"Idempotent-Replayed": "true"}
+            )
+
+        if job_queue.full:
+            return queue_full_response(job_queue.retry_after())
+
+        # 고유 작업 ID 생성 후 다른 요청이 합류할 수 있도록 바로 등록
+        job_id = str(uuid.uuid4())
+        flight = job_dedup.begin(job_id, spec_key, idempotency_key)
+        created = False
+        try:
+            queue_position = job_queue.depth + 1
+            estimated_cost = job_costs.estimate(app_spec)
+            job_info = await new_job_record(
+                job_id, app_spec, spec_key,
+                message=f"작업 대기 중 (대기 순번: {queue_position})",
+                queue_position=queue_position,
+                client_id=client_id,
+                priority=priority,
+                estimated_cost=estimated_cost
+            )
+            folder_name = job_info["folder_name"]
+            if idempotency_key is not None:
+                job_info["idempotency_key"] = idempotency_key
+
+            # 같은 명세로 완료된 작업이 있으면 출력 트리를 재사용하여 즉시 완료
+            if result_cache is not None:
+                cached = await result_cache.lookup(
+                    spec_key,
+                    lambda source_id: reuse_job_result(source_id, job_info)
+                )
+                if cached is not None:
+                    created = True
+                    job_dedup.created(flight)
+                    job_dedup.finish(spec_key, job_id)
+                    return generation_response(cached)
+
+            await create_job(job_info)
+
+            # 작업 큐에 추가 (큐가 가득 찬 경우 429, 종료 중인 경우 503 응답)
+            try:
+                position = job_queue.submit(
+                    job_id, app_spec, priority, estimated_cost
+                )
+            except (QueueFullError, QueueClosedError) as e:
+                await delete_job(job_id)
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(
+                    io_executor, release_output_dir, FLUTTER_OUTPUT_DIR, folder_name
+                )
+                if isinstance(e, QueueFullError):
+                    return queue_full_response(e.retry_after)
+                return server_draining_response()
+            if position != queue_position:
+                # 더 짧거나 우선순위가 높은 작업이 앞에 있음
+                job_info = await update_job(
+                    job_id,
+                    queue_position=position,
+                    message=f"작업 대기 중 (대기 순번: {position})"
+                ) or job_info
+
+            # 예약한 동시 작업 자리를 새 작업에 연결 (작업이 끝나면 반환)
+            if client_quotas is not None:
+                client_quotas.bind(client_id, job_id)
+            admitted = False
+            created = True
+            job_dedup.created(flight)
+            return generation_response(job_info)
+        finally:
+            if not created:
+                job_dedup.abandon(flight)
 
     except Exception as e:
         api_logger.error(f"앱 생성 요청 처리 중 오류 발생: {str(e)}")
@@ -301,788 +967,1700 @@ async def start_flutter_app_creation(request: Request):
             status_code=500,
             content={"error": f"앱 생성 시작 중 오류 발생: {str(e)}"}
         )
+    finally:
+        if admitted:
+            release_admission(client_id)
 
 
-async def start_app_creation(job_id: str, app_spec: dict):
+async def reuse_job_result(
+    source_id: str, job_info: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
     """
-    Flutter 앱 생성 프로세스를 시작합니다.
+    같은 명세로 완료된 작업의 출력 트리를 새 작업에 배치하고 완료 상태로 등록합니다.
 
     Args:
-        job_id: 작업 ID
-        app_spec: 앱 명세 딕셔너리
+        source_id: 결과 캐시에 기록된 원본 작업 ID
+        job_info: 새 작업 레코드 (spec_key 포함)
+
+    Returns:
+        등록된 작업 레코드 또는 원본을 재사용할 수 없으면 None
     """
+    source = await job_store.get(source_id)
+    if (
+        source is None
+        or source.get("status") != "completed"
+        or source.get("spec_key") != job_info["spec_key"]
+        or not source.get("manifest")
+    ):
+        return None
+
+    source_dir = os.path.join(FLUTTER_OUTPUT_DIR, source["folder_name"])
+    output_dir = os.path.join(FLUTTER_OUTPUT_DIR, job_info["folder_name"])
+    loop = asyncio.get_running_loop()
     try:
-        # 디버그: 함수 시작 로그
-        api_logger.info(f"앱 생성 시작: job_id={job_id}")
-        api_logger.info(f"앱 명세: {json.dumps(app_spec, ensure_ascii=False)}")
-        
-        # ADK 문제를 우회하기 위해 직접 파일 생성 방식 사용
-        api_logger.info("앱 생성 시작: 단순 파일 생성 방식")
-        
-        # 앱 이름 가져오기
-        app_name = app_spec.get("app_name", "flutter_app")
-        app_description = app_spec.get("description", "Flutter application")
-        api_logger.info(f"앱 정보: 이름={app_name}, 설명={app_description}")
+        await loop.run_in_executor(
+            io_executor, clone_output,
+            source_dir, output_dir, source["manifest"], blob_store
+        )
+    except OSError as e:
+        api_logger.warning(f"캐시된 출력 재사용 실패: {source_id}, {str(e)}")
+        return None
+
+    job_info.update(
+        status="completed",
+        progress=100,
+        message="이전 생성 결과 재사용 완료",
+        artifacts=list(source.get("artifacts") or []),
+        manifest=source["manifest"],
+        build_graph=source.get("build_graph"),
+        queue_position=0,
+        end_time=time.time(),
+        cached_from=source_id
+    )
+    await create_job(job_info)
+    api_logger.info(f"결과 캐시 적중: job_id={job_info['job_id']}, 원본={source_id}")
+    return job_info
 
-        # 이미 저장된 폴더명 사용
-        folder_name = active_jobs[job_id].get("folder_name", job_id)
-        
-        # 작업별 출력 디렉토리 생성
-        job_output_dir = os.path.join(FLUTTER_OUTPUT_DIR, folder_name)
-        # 디버그: 디렉토리 생성
-        api_logger.info(f"작업 디렉토리 경로: {job_output_dir}")
-        os.makedirs(job_output_dir, exist_ok=True)
-        api_logger.info(f"작업 디렉토리 생성 완료: {os.path.exists(job_output_dir)}")
-        
-        # 기본 디렉토리 구조 생성
-        lib_dir = os.path.join(job_output_dir, "lib")
-        models_dir = os.path.join(lib_dir, "models")
-        pages_dir = os.path.join(lib_dir, "pages")
-        
-        # 디버그: 하위 디렉토리 생성
-        api_logger.info(f"하위 디렉토리 생성: lib={lib_dir}")
-        os.makedirs(lib_dir, exist_ok=True)
-        api_logger.info(f"하위 디렉토리 생성: models={models_dir}")
-        os.makedirs(models_dir, exist_ok=True)
-        api_logger.info(f"하위 디렉토리 생성: pages={pages_dir}")
-        os.makedirs(pages_dir, exist_ok=True)
-        
-        # 디버그: 디렉토리 생성 확인
-        api_logger.info(f"lib 디렉토리 존재 여부: {os.path.exists(lib_dir)}")
-        api_logger.info(f"models 디렉토리 존재 여부: {os.path.exists(models_dir)}")
-        api_logger.info(f"pages 디렉토리 존재 여부: {os.path.exists(pages_dir)}")
-        
-        # 모델 파일 생성
-        models = app_spec.get("models", [])
-        model_files = []
-        
-        api_logger.info(f"모델 개수: {len(models)}")
-        
-        for model in models:
-            model_name = model.get("name", "Unknown")
-            model_file_path = os.path.join(
-                models_dir, f"{model_name.lower()}.dart"
+
+async def run_queued_job(job_id: str, app_spec: dict, queue_wait: float):
+    """
+    작업 큐 워커가 꺼낸 작업을 실행합니다.
+
+    Args:
+        job_id: 작업 ID
+        app_spec: 앱 명세 딕셔너리
+        queue_wait: 큐에서 대기한 시간(초)
+    """
+    # 큐에서 기다리는 동안 취소된 작업은 시작하지 않음
+    job_info = await job_store.get(job_id)
+    if job_info is None or job_info.get("status") in TERMINAL_STATUSES:
+        return
+    if job_info.get("cancel_requested"):
+        await mark_cancelled(job_id, "queued")
+        return
+
+    job_info = await update_job(
+        job_id,
+        queue_position=0,
+        queue_wait=round(queue_wait, 3),
+        status="running",
+        message="앱 생성 중..."
+    )
+    if job_info is None:
+        return
+    metrics.queue_wait_seconds.observe(queue_wait)
+
+    with job_processes.job_scope(job_id), \
+            deadlines.deadline_scope(new_job_deadline()), \
+            trace_job(job_id, "job", app_name=app_spec.get("app_name")) as root:
+        trace = tracing.current_trace()
+        if trace is not None:
+            trace.add(
+                "queue_wait", "queue", root.start - queue_wait, queue_wait,
+                parent=root
             )
-            api_logger.info(f"모델 파일 생성: {model_file_path}")
-            
-            fields = model.get("fields", [])
-            field_definitions = []
-            constructor_params = []
-            
-            for field in fields:
-                field_name = field.get("name", "unknown")
-                field_type = field.get("type", "String")
-                nullable = field.get("nullable", True)
-                
-                if nullable:
-                    field_type = f"{field_type}?"
-                    field_definitions.append(f"  {field_type} {field_name};")
-                else:
-                    field_definitions.append(
-                        f"  final {field_type} {field_name};"
-                    )
-                
-                constructor_params.append(f"    this.{field_name},")
-            
-            model_content = f"""
-class {model_name} {{
-{chr(10).join(field_definitions)}
-
-  {model_name}({{
-{chr(10).join(constructor_params)}
-  }});
-
-  factory {model_name}.fromJson(Map<String, dynamic> json) {{
-    return {model_name}(
-      // TODO: 구현
-    );
-  }}
-
-  Map<String, dynamic> toJson() {{
-    return {{
-      // TODO: 구현
-    }};
-  }}
-}}
-"""
-            
-            # 디버그: 파일 쓰기 시도
+        await start_app_creation(job_id, app_spec)
+
+
+def new_job_deadline() -> deadlines.Deadline:
+    """JOB_DEADLINE으로 작업 전체 데드라인을 만듭니다. (0이면 제한 없음)"""
+    return deadlines.Deadline("job", JOB_DEADLINE or None)
+
+
+def trace_job(job_id: str, name: str, **attrs: Any):
+    """
+    작업 트레이스에 루트 스팬을 시작하고 현재 컨텍스트에 설정합니다.
+
+    트레이스를 비활성화했으면 아무것도 기록하지 않습니다.
+
+    Args:
+        job_id: 작업 ID
+        name: 루트 스팬 이름
+        **attrs: 스팬 속성
+
+    Returns:
+        루트 스팬(또는 None)을 내주는 컨텍스트 관리자
+    """
+    trace = job_traces.start(job_id) if job_traces is not None else None
+    return tracing.activate(trace, name, "job", job_id=job_id, **attrs)
+
+
+# 앱 생성 작업 큐 및 워커 풀
+job_queue = JobQueue(
+    handler=run_queued_job,
+    max_size=JOB_QUEUE_MAX_SIZE,
+    worker_count=JOB_WORKER_COUNT,
+    default_retry_after=JOB_QUEUE_RETRY_AFTER,
+    priority_penalties={INTERACTIVE: 0.0, BATCH: SCHEDULER_BATCH_PENALTY},
+    aging_rate=SCHEDULER_AGING_RATE,
+)
+
+# 명세 크기와 단계별 처리 시간 기록으로 작업 처리 시간 추정
+job_costs = CostEstimator(SCHEDULER_DEFAULT_UNIT_SECONDS)
+
+
+async def submit_batch_job(job_id: str) -> bool:
+    """
+    배치 작업을 작업 큐에 넣습니다. 큐가 가득 차 있으면 자리가 날 때까지 기다립니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        작업 큐에 넣었으면 True, 정리되었거나 이미 시작된 작업이면 False
+
+    Raises:
+        QueueClosedError: 서버가 종료 중인 경우
+    """
+    job_info = await job_store.get(job_id)
+    if job_info is None or job_info.get("status") != "pending":
+        return False
+    if job_info.get("cancel_requested"):
+        # 다른 워커가 받은 취소 요청
+        await mark_cancelled(job_id, None)
+        return False
+
+    # 클라이언트의 동시 작업 자리가 날 때까지 대기
+    if client_quotas is not None and job_info.get("client_id"):
+        await client_quotas.acquire(job_info["client_id"], job_id)
+        # 자리를 기다리는 동안 취소된 작업
+        current = await job_store.get(job_id)
+        if current is None or current.get("status") != "pending":
+            client_quotas.release(job_id)
+            return False
+
+    priority = job_info.get("priority") or BATCH
+    estimated_cost = job_costs.estimate(job_info["app_spec"])
+    while True:
+        try:
+            queue_position = job_queue.submit(
+                job_id, job_info["app_spec"], priority, estimated_cost
+            )
+            break
+        except QueueFullError as e:
+            await asyncio.sleep(e.retry_after)
+        except QueueClosedError:
+            if client_quotas is not None:
+                client_quotas.release(job_id)
+            raise
+
+    await update_job(
+        job_id,
+        queue_position=queue_position,
+        estimated_cost=estimated_cost,
+        message=f"작업 대기 중 (대기 순번: {queue_position})"
+    )
+    return True
+
+
+# 일괄 생성 배치 목록 (배치별 동시 실행 한도 안에서 작업 큐에 공급)
+job_batches = BatchRegistry(submit_batch_job, max_batches=BATCH_MAX_KEEP)
+
+
+def job_paths(job_info: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    작업이 사용하는 디스크 경로를 반환합니다.
+
+    Args:
+        job_info: 작업 레코드
+
+    Returns:
+        output(출력 디렉토리)과 archive(ZIP 파일) 경로
+    """
+    folder_name = job_info.get("folder_name")
+    return {
+        "output": (
+            os.path.join(FLUTTER_OUTPUT_DIR, folder_name) if folder_name else None
+        ),
+        "archive": job_info.get("archive_path"),
+    }
+
+
+async def cancel_job(job_id: str) -> Optional[Dict[str, Any]]:
+    """
+    작업을 취소하고 부분 출력을 정리합니다.
+
+    대기 중인 작업은 큐에서 빼고, 실행 중인 작업은 태스크를 취소한 뒤
+    작업이 띄운 하위 프로세스(dart analyze 등)를 종료합니다. 작업이 실제로
+    중단되면 "cancelled" 상태로 바꾸고(큐/클라이언트/배치 자리 반환) 출력
+    디렉토리를 삭제합니다. 취소가 반영되기 전에 끝난 작업은 그대로 둡니다.
+
+    작업이 다른 워커 프로세스에서 실행 중이거나 JOB_CANCEL_TIMEOUT 안에
+    중단되지 않으면 상태와 출력은 그대로 두고 cancel_requested만 기록합니다.
+    다른 워커의 작업은 그 워커가 이 표시를 확인하여(poll_cancel_requests)
+    취소하고, 늦게 중단된 작업은 태스크가 끝날 때 취소를 마칩니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        갱신된 작업 레코드 (이미 끝난 작업이면 기존 레코드) 또는 작업이 없으면 None
+    """
+    job_info = await job_store.get(job_id)
+    if job_info is None or job_info.get("status") in TERMINAL_STATUSES:
+        return job_info
+
+    task = job_queue.task(job_id)
+    where = job_queue.cancel(job_id)
+    job_processes.kill_job_processes(job_id)
+    stopped = True
+    if task is not None:
+        _, pending = await asyncio.wait({task}, timeout=JOB_CANCEL_TIMEOUT)
+        if pending:
+            api_logger.warning(
+                f"작업이 제한 시간 안에 중단되지 않았습니다: {job_id}"
+            )
+            finish_cancel_when_stopped(job_id, task)
+            stopped = False
+    elif where is None and job_info.get("worker_id") not in (None, WORKER_ID):
+        # 다른 워커의 큐에 있거나 다른 워커에서 실행 중인 작업
+        stopped = False
+
+    if not stopped:
+        return await update_job(
+            job_id,
+            cancel_requested=True,
+            message="작업 취소를 요청했습니다."
+        ) or await job_store.get(job_id)
+    return await mark_cancelled(job_id, where)
+
+
+async def mark_cancelled(
+    job_id: str, where: Optional[str]
+) -> Optional[Dict[str, Any]]:
+    """
+    중단된 작업을 cancelled 상태로 바꾸고 출력 디렉토리를 삭제합니다.
+
+    작업 태스크가 실행 중이 아닐 때만 호출합니다.
+
+    Args:
+        job_id: 작업 ID
+        where: 취소 시점 ("queued", "running" 또는 None, 로그용)
+
+    Returns:
+        갱신된 작업 레코드 (취소가 반영되기 전에 끝난 작업이면 기존 레코드)
+        또는 작업이 없으면 None
+    """
+    # 취소가 반영되기 전에 끝난 작업
+    current = await job_store.get(job_id)
+    if current is None or current.get("status") in TERMINAL_STATUSES:
+        return current
+
+    job_info = await update_job(
+        job_id,
+        status="cancelled",
+        queue_position=0,
+        message="작업이 취소되었습니다."
+    )
+    if job_info is None:
+        # 상태를 확인한 뒤 다른 상태로 끝난 작업
+        return await job_store.get(job_id)
+    if job_info.get("folder_name"):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            io_executor, release_output_dir,
+            FLUTTER_OUTPUT_DIR, job_info["folder_name"]
+        )
+    api_logger.info(f"작업 취소: job_id={job_id}, 취소 시점={where or 'pending'}")
+    return job_info
+
+
+# 제한 시간 안에 중단되지 않은 작업의 취소를 마무리하는 태스크
+cancel_finishers: Set[asyncio.Task] = set()
+
+
+def finish_cancel_when_stopped(job_id: str, task: asyncio.Task):
+    """
+    작업 태스크가 끝나면 취소를 마무리합니다. 그 전에 다른 상태로 끝난 작업은 그대로 둡니다.
+
+    Args:
+        job_id: 작업 ID
+        task: 취소했지만 아직 실행 중인 작업 태스크
+    """
+    def on_done(_):
+        finisher = asyncio.ensure_future(mark_cancelled(job_id, "running"))
+        cancel_finishers.add(finisher)
+        finisher.add_done_callback(cancel_finishers.discard)
+
+    task.add_done_callback(on_done)
+
+
+async def poll_cancel_requests() -> int:
+    """
+    이 워커의 큐에 있거나 실행 중인 작업 중 취소가 요청된 작업을 취소합니다.
+
+    Returns:
+        취소를 시도한 작업 수
+    """
+    job_ids = job_queue.job_ids()
+    if not job_ids:
+        return 0
+    records = await job_store.get_many(job_ids)
+    requested = [
+        job_id for job_id, job_info in records.items()
+        if job_info.get("cancel_requested")
+        and job_info.get("status") not in TERMINAL_STATUSES
+    ]
+    await asyncio.gather(*(cancel_job(job_id) for job_id in requested))
+    return len(requested)
+
+
+async def watch_cancel_requests():
+    """JOB_CANCEL_POLL_INTERVAL초마다 취소 요청을 확인하는 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(JOB_CANCEL_POLL_INTERVAL)
+        try:
+            await poll_cancel_requests()
+        except Exception as e:
+            api_logger.error(f"작업 취소 요청 확인 중 오류 발생: {str(e)}")
+
+
+# 취소 요청 확인 작업 (서버 시작 시 생성)
+cancel_watcher: Optional[asyncio.Task] = None
+
+
+# 작업 보존 정책에 따른 백그라운드 정리기
+job_reaper = JobReaper(
+    store=job_store,
+    policy=RetentionPolicy(
+        max_age=RETENTION_MAX_AGE,
+        max_jobs=RETENTION_MAX_JOBS,
+        max_disk_bytes=RETENTION_MAX_DISK_BYTES,
+        orphan_grace=RETENTION_ORPHAN_GRACE,
+    ),
+    job_paths=job_paths,
+    delete_job=delete_job,
+    update_job=update_job,
+    orphan_dirs=lambda: [FLUTTER_OUTPUT_DIR, FLUTTER_ARCHIVES_DIR],
+    executor=io_executor,
+    interval=RETENTION_INTERVAL,
+    blob_store=blob_store,
+    blob_grace=BLOB_GC_GRACE,
+)
+
+
+async def recover_jobs() -> Dict[str, int]:
+    """
+    작업 저널을 재생하여 이전 실행의 작업 테이블을 복원합니다.
+
+    대기 중이던 작업은 다시 큐에 넣고, 실행 중이던 작업은 JOB_RECOVERY_MODE에
+    따라 다시 큐에 넣거나 "interrupted" 상태로 표시합니다. 저장소에 이미 있는
+    작업(예: Redis 저장소)은 건너뜁니다.
+
+    Returns:
+        복원 결과별 작업 수
+    """
+    summary = {"restored": 0, "requeued": 0, "interrupted": 0}
+    if job_journal is None:
+        return summary
+
+    # 배치 ID -> 배치 작업 레코드, 배치 한도 안에서 다시 큐에 넣을 작업 ID
+    batches: Dict[str, List[Dict[str, Any]]] = {}
+    batch_pending: Dict[str, List[str]] = {}
+
+    loop = asyncio.get_running_loop()
+    records = await loop.run_in_executor(io_executor, job_journal.load)
+    ordered = sorted(records.values(), key=lambda r: r.get("start_time", 0))
+
+    for job_info in ordered:
+        job_id = job_info.get("job_id")
+        if not job_id or await job_store.exists(job_id):
+            continue
+        await job_store.create(job_info)
+        summary["restored"] += 1
+
+        # 이전 실행의 세션은 유예 시간 후 정리 (SQLite 세션 저장소에는 재시작
+        # 후에도 남아 있음, 다시 실행하는 작업은 새 세션을 만듦)
+        if job_info.get("session_id"):
+            await agent_sessions.close(job_info, job_info.get("end_time"))
+
+        if (
+            result_cache is not None
+            and job_info.get("status") == "completed"
+            and job_info.get("spec_key")
+        ):
+            result_cache.put(job_info["spec_key"], job_id)
+
+        # Idempotency-Key와 진행 중인 명세 복원
+        if job_info.get("spec_key"):
+            flight = job_dedup.begin(
+                job_id, job_info["spec_key"], job_info.get("idempotency_key"),
+                created=job_info.get("start_time")
+            )
+            job_dedup.created(flight)
+            if job_info.get("status") in TERMINAL_STATUSES:
+                job_dedup.finish(job_info["spec_key"], job_id)
+
+        status = job_info.get("status")
+        requeue = status == "pending" or (
+            status == "running" and JOB_RECOVERY_MODE == "requeue"
+        )
+        batch_id = job_info.get("batch_id")
+        if batch_id:
+            batches.setdefault(batch_id, []).append(job_info)
+            if requeue:
+                # 배치 작업은 배치의 동시 실행 한도 안에서 다시 큐에 넣음
+                await update_job(
+                    job_id,
+                    status="pending",
+                    progress=0,
+                    artifacts=[],
+                    queue_position=0,
+                    worker_id=WORKER_ID,
+                    message="서버 재시작 후 배치 대기 중"
+                )
+                batch_pending.setdefault(batch_id, []).append(job_id)
+                summary["requeued"] += 1
+                continue
+
+        if requeue:
+            estimated_cost = job_costs.estimate(job_info["app_spec"])
             try:
-                with open(model_file_path, 'w') as f:
-                    f.write(model_content)
-                api_logger.info(f"모델 파일 쓰기 성공: {model_file_path}")
-            except Exception as e:
-                api_logger.error(
-                    f"모델 파일 쓰기 실패: {model_file_path}, 오류: {str(e)}"
+                queue_position = job_queue.submit(
+                    job_id, job_info["app_spec"],
+                    job_info.get("priority") or INTERACTIVE, estimated_cost
                 )
-                raise
-            
-            model_files.append(f"models/{model_name.lower()}.dart")
-        
-        # 페이지 파일 생성
-        pages = app_spec.get("pages", [])
-        page_files = []
-        
-        api_logger.info(f"페이지 개수: {len(pages)}")
-        
-        for page_name in pages:
-            page_file_path = os.path.join(
-                pages_dir, f"{page_name.lower()}.dart"
+            except QueueFullError:
+                queue_position = None
+            if queue_position is not None:
+                if client_quotas is not None and job_info.get("client_id"):
+                    client_quotas.track(job_info["client_id"], job_id)
+                await update_job(
+                    job_id,
+                    status="pending",
+                    progress=0,
+                    artifacts=[],
+                    queue_position=queue_position,
+                    estimated_cost=estimated_cost,
+                    worker_id=WORKER_ID,
+                    message=f"서버 재시작 후 작업 재대기 중 (대기 순번: {queue_position})"
+                )
+                summary["requeued"] += 1
+                continue
+
+        if status in ("pending", "running"):
+            await update_job(
+                job_id,
+                status="interrupted",
+                queue_position=0,
+                message="서버 재시작으로 작업이 중단되었습니다."
             )
-            api_logger.info(f"페이지 파일 생성: {page_file_path}")
-            
-            page_content = f"""
-import 'package:flutter/material.dart';
-
-class {page_name} extends StatelessWidget {{
-  const {page_name}({{Key? key}}) : super(key: key);
-
-  @override
-  Widget build(BuildContext context) {{
-    return Scaffold(
-      appBar: AppBar(
-        title: const Text('{page_name}'),
-      ),
-      body: const Center(
-        child: Text('This is the {page_name}'),
-      ),
-    );
-  }}
-}}
-"""
-            
-            # 디버그: 파일 쓰기 시도
-            try:
-                with open(page_file_path, 'w') as f:
-                    f.write(page_content)
-                api_logger.info(f"페이지 파일 쓰기 성공: {page_file_path}")
-            except Exception as e:
-                api_logger.error(
-                    f"페이지 파일 쓰기 실패: {page_file_path}, 오류: {str(e)}"
+            summary["interrupted"] += 1
+
+    for batch_id, infos in batches.items():
+        infos.sort(key=lambda r: r.get("batch_index", 0))
+        pending_ids = set(batch_pending.get(batch_id, ()))
+        job_batches.create(
+            batch_id,
+            [info["job_id"] for info in infos],
+            [info["job_id"] for info in infos if info["job_id"] in pending_ids],
+            infos[0].get("batch_concurrency", BATCH_DEFAULT_CONCURRENCY),
+            created=min(info.get("start_time", time.time()) for info in infos)
+        )
+
+    # 복원 결과를 스냅샷으로 압축하여 다음 재시작 시 재생 시간을 줄임
+    await job_journal.compact()
+    api_logger.info(
+        f"작업 저널 복원 완료: 복원 {summary['restored']}개, "
+        f"재대기 {summary['requeued']}개, 중단 {summary['interrupted']}개"
+    )
+    return summary
+
+
+@app.on_event("startup")
+async def start_job_workers():
+    """서버 시작 시 저널에서 작업을 복원하고 작업 큐 워커를 시작합니다."""
+    global cancel_watcher
+    await recover_jobs()
+    job_queue.start()
+    job_reaper.start()
+    agent_sessions.start()
+    cancel_watcher = asyncio.create_task(
+        watch_cancel_requests(), name="cancel-watcher"
+    )
+
+
+@app.on_event("shutdown")
+async def stop_job_workers():
+    """
+    서버 종료(SIGTERM) 시 새 작업 접수를 중단하고 처리 중인 작업을 마무리합니다.
+
+    처리 중인 작업은 JOB_DRAIN_TIMEOUT까지 기다린 후 중단하며, 시작되지 못한
+    작업은 저널에 대기 상태로 남아 다음 시작 시 다시 큐에 들어갑니다.
+    """
+    global cancel_watcher
+    await job_reaper.stop()
+    await agent_sessions.stop()
+    if cancel_watcher is not None:
+        cancel_watcher.cancel()
+        await asyncio.gather(cancel_watcher, return_exceptions=True)
+        cancel_watcher = None
+    await job_batches.stop()
+    left_over = await job_queue.drain(JOB_DRAIN_TIMEOUT)
+    if left_over:
+        api_logger.info(f"대기 중인 작업 {len(left_over)}개는 재시작 시 다시 실행됩니다.")
+    if generation_pool is not None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, generation_pool.shutdown
+        )
+    if job_journal is not None:
+        await job_journal.close()
+    await job_store.close()
+
+
+def artifact_event_callback(
+    loop: asyncio.AbstractEventLoop, job_id: str, phase: str
+):
+    """
+    I/O 실행기에서 파일을 기록할 때마다 artifact 이벤트를 발행하는 함수를 만듭니다.
+
+    Args:
+        loop: 이벤트를 발행할 이벤트 루프
+        job_id: 작업 ID
+        phase: 생성 단계
+
+    Returns:
+        상대 경로를 받는 콜백 함수 또는 구독자가 없으면 None
+    """
+    if not job_events.subscriber_count(job_id):
+        return None
+
+    def on_written(path: str):
+        loop.call_soon_threadsafe(
+            job_events.publish, job_id, "artifact",
+            {"job_id": job_id, "phase": phase, "path": path}
+        )
+
+    return on_written
+
+
+async def finish_blocking(future: asyncio.Future) -> Any:
+    """
+    실행기 future의 결과를 기다립니다.
+
+    스레드에서 실행 중인 파일 기록은 중단할 수 없으므로, 기다리던 코루틴이
+    취소되면 실행기 작업이 끝난 뒤에 취소를 전파합니다. 취소 후 출력
+    디렉토리를 정리할 때 기록 중이던 파일이 뒤늦게 생기지 않습니다.
+
+    Args:
+        future: run_in_executor()가 반환한 future
+
+    Returns:
+        실행기 작업의 반환값
+    """
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        await asyncio.wait({future})
+        raise
+
+
+async def generate_in_threads(
+    job_id: str, job_output_dir: str, app_spec: dict,
+    only: Optional[Dict[str, List[str]]] = None
+) -> Tuple[Dict[str, list], Dict[str, Dict[str, Any]]]:
+    """
+    단계별로 I/O 실행기에서 파일을 렌더링하고 기록합니다. (GENERATION_MODE=thread)
+
+    각 단계는 단계 제한 시간과 현재 작업 데드라인 중 먼저 오는 시각까지 실행됩니다.
+
+    Args:
+        job_id: 작업 ID
+        job_output_dir: 앱 출력 디렉토리
+        app_spec: 앱 명세 딕셔너리
+        only: 지정하면 단계별로 이 파일만 생성 (증분 재생성, 없는 단계는 건너뜀)
+
+    Returns:
+        (단계별 기록된 파일 목록, 상대 경로별 매니페스트 항목)
+    """
+    loop = asyncio.get_running_loop()
+    written: Dict[str, list] = {}
+    manifest: Dict[str, Dict[str, Any]] = {}
+    job_deadline = deadlines.current_deadline()
+    # 일부 파일만 생성하는 단계의 시간은 작업 비용 추정에 기록하지 않음
+    units = phase_units(app_spec) if only is None else None
+    for phase in GENERATION_PHASES:
+        if only is not None and not only.get(phase):
+            continue
+        await report_generation_progress(job_id, "phase", {"phase": phase})
+        deadline = deadlines.Deadline(
+            phase, deadlines.step_timeout(phase, PHASE_DEADLINE), job_deadline
+        )
+        written[phase], summary = await finish_blocking(loop.run_in_executor(
+            io_executor, run_phase,
+            job_output_dir, phase, app_spec,
+            artifact_event_callback(loop, job_id, phase), manifest,
+            blob_store, deadline, only[phase] if only is not None else None
+        ))
+        await report_generation_progress(job_id, "phase_done", summary, units)
+    return written, manifest
+
+
+def record_phase_summary(summary: Dict[str, Any]):
+    """
+    생성 단계 완료 메시지의 소요 시간과 기록량을 메트릭과 작업 트레이스에 기록합니다.
+
+    Args:
+        summary: run_phase()가 만든 단계 완료 메시지
+    """
+    phase = summary["phase"]
+    trace = tracing.current_trace()
+    if trace is not None and "started" in summary:
+        trace.add(
+            f"phase:{phase}", "io", summary["started"], summary["seconds"],
+            summary.get("cpu"), tracing.current_span(), summary.get("worker"),
+            files=summary.get("count", 0), bytes=summary.get("bytes", 0)
+        )
+    metrics.phase_seconds.labels(phase).observe(summary.get("seconds", 0.0))
+    metrics.files_written.labels(phase).inc(summary.get("count", 0))
+    metrics.bytes_written.labels(phase).inc(summary.get("bytes", 0))
+    for template, seconds in summary.get("renders") or ():
+        metrics.template_render_seconds.labels(template).observe(seconds)
+
+
+async def report_generation_progress(
+    job_id: str, event: str, payload: Dict[str, Any],
+    units: Optional[Dict[str, int]] = None
+):
+    """
+    생성 진행 메시지를 작업 상태와 이벤트 스트림에 반영합니다.
+
+    제한 시간 안에 끝난 단계의 처리 시간은 작업 비용 추정에 기록합니다.
+
+    Args:
+        job_id: 작업 ID
+        event: phase, artifact, phase_done 중 하나 (generate_app_output() 참고)
+        payload: 진행 메시지 내용
+        units: 명세의 단계별 작업량 (phase_units() 참고)
+    """
+    phase = payload["phase"]
+    if event == "phase":
+        await update_job(
+            job_id, message=f"{PHASE_LABELS[phase]} 파일 생성 중..."
+        )
+    elif event == "artifact":
+        job_events.publish(job_id, "artifact", {"job_id": job_id, **payload})
+    elif event == "phase_done":
+        record_phase_summary(payload)
+        if payload.get("timed_out"):
+            deadlines.record_timeout(phase)
+        elif units is not None and "seconds" in payload:
+            job_costs.record(phase, units[phase], payload["seconds"])
+        index = GENERATION_PHASES.index(phase)
+        await update_job(
+            job_id,
+            progress=int((index + 1) * 90 / len(GENERATION_PHASES))
+        )
+        api_logger.info(
+            f"{PHASE_LABELS[phase]} 파일 생성 완료: {payload['count']}개"
+        )
+
+
+def finished_job_fields(
+    scope: Optional[deadlines.DeadlineScope], message: str
+) -> Dict[str, Any]:
+    """
+    생성이 끝난 작업의 상태 필드를 만듭니다.
+
+    결과 없이 제한 시간을 넘긴 단계가 있으면 partial, 없으면 completed입니다.
+
+    Args:
+        scope: 작업 데드라인 기록 (없으면 completed)
+        message: 완료 메시지
+
+    Returns:
+        update_job()에 넘길 상태 필드
+    """
+    fields: Dict[str, Any] = {
+        "status": "completed", "progress": 100, "message": message
+    }
+    if scope is None:
+        return fields
+    if scope.fallbacks:
+        fields["fallbacks"] = scope.fallbacks
+    if scope.timed_out:
+        fields.update(
+            status="partial", timed_out=scope.timed_out,
+            message=f"{message} (제한 시간 초과: {', '.join(scope.timed_out)})"
+        )
+    return fields
+
+
+async def start_app_creation(job_id: str, app_spec: dict):
+    """
+    Flutter 앱 생성 프로세스를 시작합니다.
+
+    파일 렌더링과 기록은 블로킹 작업이므로 단계별로 전용 I/O 실행기에서
+    수행하고, 이벤트 루프는 단계 사이에 진행 상태만 갱신합니다.
+    GENERATION_MODE=process이면 워커 프로세스에서 생성하고 진행 메시지와
+    매니페스트만 돌려받습니다.
+
+    JOB_DEADLINE이나 단계 제한 시간을 넘긴 단계는 남은 파일을 건너뛰고 다음
+    단계로 넘어가며, 이 경우 작업은 건너뛴 단계 목록(timed_out)과 함께
+    partial 상태로 끝납니다.
+
+    Args:
+        job_id: 작업 ID
+        app_spec: 앱 명세 딕셔너리
+    """
+    try:
+        api_logger.info(f"앱 생성 시작: job_id={job_id}")
+        api_logger.info(f"앱 명세: {json.dumps(app_spec, ensure_ascii=False)}")
+
+        # 앱 이름 가져오기
+        app_name = app_spec.get("app_name", "flutter_app")
+        app_description = app_spec.get("description", "Flutter application")
+        api_logger.info(f"앱 정보: 이름={app_name}, 설명={app_description}")
+
+        # 이미 저장된 폴더명 사용
+        job_info = await job_store.get(job_id) or {}
+        folder_name = job_info.get("folder_name", job_id)
+
+        # 작업별 출력 디렉토리 생성
+        job_output_dir = os.path.join(FLUTTER_OUTPUT_DIR, folder_name)
+        api_logger.info(f"작업 디렉토리 경로: {job_output_dir}")
+
+        loop = asyncio.get_running_loop()
+        with tracing.span("prepare_output_dir", "io", measure_cpu=False):
+            await finish_blocking(loop.run_in_executor(
+                io_executor, prepare_output_dir, job_output_dir
+            ))
+
+        mode = "process" if generation_pool is not None else "thread"
+        with tracing.span("generation", "generation", measure_cpu=False, mode=mode):
+            if generation_pool is not None:
+                # 워커 프로세스에서 생성하고 파일 목록과 매니페스트만 돌려받음
+                job_deadline = deadlines.current_deadline()
+                units = phase_units(app_spec)
+                written, manifest = await generation_pool.run(
+                    job_id, generate_app_output,
+                    job_output_dir, app_spec,
+                    blob_store.root if blob_store is not None else None,
+                    job_deadline.remaining() if job_deadline else None,
+                    {
+                        phase: deadlines.step_timeout(phase, PHASE_DEADLINE)
+                        for phase in GENERATION_PHASES
+                    },
+                    on_progress=lambda event, payload: report_generation_progress(
+                        job_id, event, payload, units
+                    )
+                )
+            else:
+                written, manifest = await generate_in_threads(
+                    job_id, job_output_dir, app_spec
                 )
-                raise
-            
-            page_files.append(f"pages/{page_name.lower()}.dart")
-            
-        # main.dart 파일 생성
-        main_file_path = os.path.join(lib_dir, "main.dart")
-        
-        # 첫 번째 페이지가 없으면 기본 페이지 사용
-        first_page = pages[0] if pages else "HomePage"
-        
-        main_content = f"""
-import 'package:flutter/material.dart';
-import 'pages/{first_page.lower()}.dart';
-
-void main() {{
-  runApp(const MyApp());
-}}
-
-class MyApp extends StatelessWidget {{
-  const MyApp({{Key? key}}) : super(key: key);
-
-  @override
-  Widget build(BuildContext context) {{
-    return MaterialApp(
-      title: '{app_name}',
-      theme: ThemeData(
-        primarySwatch: Colors.blue,
-      ),
-      home: const {first_page}(),
-    );
-  }}
-}}
-"""
-        
-        with open(main_file_path, 'w') as f:
-            f.write(main_content)
-        api_logger.info(f"메인 파일 생성 완료: {main_file_path}")
-        
-        # pubspec.yaml 파일 생성
-        pubspec_file_path = os.path.join(job_output_dir, "pubspec.yaml")
-        
-        pubspec_content = f"""
-name: {app_name}
-description: {app_description}
-version: 1.0.0+1
-
-environment:
-  sdk: ">=3.0.0 <4.0.0"
-
-dependencies:
-  flutter:
-    sdk: flutter
-  cupertino_icons: ^1.0.2
-  provider: ^6.0.5
-  http: ^1.1.0
-  json_annotation: ^4.8.1
-  shared_preferences: ^2.2.0
-
-dev_dependencies:
-  flutter_test:
-    sdk: flutter
-  flutter_lints: ^2.0.0
-  build_runner: ^2.4.6
-  json_serializable: ^6.7.1
-
-flutter:
-  uses-material-design: true
-  assets:
-    - assets/images/
-"""
-        
-        with open(pubspec_file_path, 'w') as f:
-            f.write(pubspec_content)
-        api_logger.info(f"pubspec.yaml 파일 생성 완료: {pubspec_file_path}")
-        
-        # README.md 파일 생성
-        readme_file_path = os.path.join(job_output_dir, "README.md")
-        
-        readme_content = f"""
-# {app_name}
 
-{app_description}
+        # 생성된 모든 파일 목록
+        artifact_files = order_artifacts(written)
 
-## Getting Started
+        # 작업 상태 업데이트 (제한 시간을 넘긴 단계가 있으면 partial)
+        fields = finished_job_fields(deadlines.current_scope(), "앱 생성 완료")
+        await update_job(
+            job_id, artifacts=artifact_files, manifest=manifest,
+            build_graph=compile_graph(app_spec, GENERATOR_FINGERPRINT), **fields
+        )
 
-This is a Flutter application.
+        # 같은 명세가 다시 제출되면 이 작업의 결과를 재사용 (부분 결과는 제외)
+        if (
+            result_cache is not None
+            and job_info.get("spec_key")
+            and fields["status"] == "completed"
+        ):
+            result_cache.put(job_info["spec_key"], job_id)
 
-### Prerequisites
+        api_logger.info(
+            f"앱 생성 완료: {app_name}, 파일 생성 수: {len(artifact_files)}"
+        )
 
-- Flutter SDK
-- Dart
+    except Exception as e:
+        api_logger.error(f"작업 실패: {job_id}, 오류: {str(e)}")
+        import traceback
+        api_logger.error(f"상세 오류: {traceback.format_exc()}")
 
-### Running the application
+        # 작업 실패 표시
+        await update_job(
+            job_id, status="failed", message=f"앱 생성 중 오류 발생: {str(e)}"
+        )
 
-1. Run `flutter pub get` to install dependencies
-2. Run `flutter run` to start the application
 
-## Features
+@app.get("/job/{job_id}", response_model=JobStatus)
+async def get_job_status(job_id: str):
+    """
+    특정 작업의 상태를 조회합니다.
 
-- [Add your features here]
-"""
-        
-        with open(readme_file_path, 'w') as f:
-            f.write(readme_content)
-        api_logger.info(f"README.md 파일 생성 완료: {readme_file_path}")
-        
-        # 안드로이드 파일 생성
-        api_logger.info("안드로이드 파일 생성 시작")
-        
-        # 안드로이드 디렉토리 구조 생성
-        android_dir = os.path.join(job_output_dir, "android")
-        android_app_dir = os.path.join(android_dir, "app")
-        android_app_src_main_dir = os.path.join(android_app_dir, "src", "main")
-        android_app_src_main_kotlin_dir = os.path.join(android_app_src_main_dir, "kotlin", "com", "example", app_name.lower().replace('-', '_').replace(' ', '_'))
-        android_app_src_main_res_dir = os.path.join(android_app_src_main_dir, "res")
-        android_app_src_main_res_values_dir = os.path.join(android_app_src_main_res_dir, "values")
-        android_app_src_main_res_drawable_dir = os.path.join(android_app_src_main_res_dir, "drawable")
-        android_app_src_main_res_drawable_v21_dir = os.path.join(android_app_src_main_res_dir, "drawable-v21")
-        android_gradle_wrapper_dir = os.path.join(android_dir, "gradle", "wrapper")
-        
-        # 디렉토리 생성
-        os.makedirs(android_dir, exist_ok=True)
-        os.makedirs(android_app_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_kotlin_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_res_values_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_res_drawable_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_res_drawable_v21_dir, exist_ok=True)
-        os.makedirs(android_gradle_wrapper_dir, exist_ok=True)
-        
-        # 앱 이름을 소문자화하고 공백과 특수문자 제거 (패키지명용)
-        app_name_slug = app_name.lower().replace('-', '_').replace(' ', '_')
-        
-        # android/build.gradle 파일 생성
-        android_build_gradle_path = os.path.join(android_dir, "build.gradle")
-        android_build_gradle_content = """buildscript {
-    ext.kotlin_version = '1.8.0'
-    repositories {
-        google()
-        mavenCentral()
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        작업 상태를 포함하는 JobStatus 객체
+    """
+    job_info = await get_job_or_404(job_id)
+
+    # job_id 값을 포함하여 JobStatus 생성
+    if "job_id" not in job_info:
+        job_info["job_id"] = job_id
+    status = apply_schedule(job_status_dict(job_info), job_queue.schedule())
+    return JobStatus(**status)
+
+
+@app.delete("/job/{job_id}", response_model=JobStatus)
+async def cancel_job_endpoint(job_id: str):
+    """
+    대기 중이거나 실행 중인 작업을 취소합니다. 이미 취소된 작업이면 현재 상태를
+    그대로 반환합니다.
+
+    작업이 다른 워커에서 실행 중이거나 제한 시간 안에 중단되지 않으면 취소를
+    요청만 하고 202와 cancel_requested가 표시된 현재 상태를 반환합니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        취소된 작업 상태
+
+    Raises:
+        HTTPException: 작업이 없으면 404, 이미 끝난 작업이면 409
+    """
+    job_info = await get_job_or_404(job_id)
+    status = job_info.get("status")
+    if status not in TERMINAL_STATUSES:
+        job_info = await cancel_job(job_id) or job_info
+        status = job_info.get("status")
+    if status not in TERMINAL_STATUSES:
+        return JSONResponse(
+            status_code=202,
+            content=JobStatus(**job_status_dict(job_info)).model_dump()
+        )
+    if status != "cancelled":
+        raise HTTPException(
+            status_code=409,
+            detail=f"이미 끝난 작업은 취소할 수 없습니다. (상태: {status})"
+        )
+    return JobStatus(**job_status_dict(job_info))
+
+
+# 명세 변경을 반영 중인 작업 ID (같은 작업을 동시에 다시 생성하지 않음)
+job_rebuilds: Set[str] = set()
+
+
+@app.patch("/job/{job_id}/spec")
+async def patch_job_spec(job_id: str, request: Request):
+    """
+    끝난 작업의 앱 명세를 바꾸고, 바뀐 명세 조각에 의존하는 파일만 다시 생성합니다.
+
+    Request body는 새 앱 명세 전체이거나, Content-Type이
+    application/merge-patch+json이면 현재 명세에 병합할 JSON Merge Patch입니다.
+    결과는 같은 작업 ID의 새 버전(version)이 됩니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        작업 상태와 다시 생성한 파일(rebuilt), 삭제한 파일(removed) 목록
+    """
+    body = await request.json()
+    job_info = await get_job_or_404(job_id)
+    if job_info["status"] not in RESULT_STATUSES:
+        return JSONResponse(
+            status_code=409,
+            content={"error": "완료된 작업의 명세만 변경할 수 있습니다."}
+        )
+    if job_id in job_rebuilds:
+        return JSONResponse(
+            status_code=409,
+            content={"error": "이 작업의 명세 변경을 이미 반영하고 있습니다."}
+        )
+
+    if "merge-patch" in request.headers.get("content-type", ""):
+        body = merge_patch(job_info.get("app_spec") or {}, body)
+    if not isinstance(body, dict) or not body.get("app_name"):
+        return JSONResponse(
+            status_code=400,
+            content={"error": "app_name을 포함한 앱 명세가 필요합니다."}
+        )
+    app_spec = normalize_app_spec(body)
+    spec_key = spec_digest(app_spec, GENERATOR_FINGERPRINT)
+    if spec_key == job_info.get("spec_key") and job_info["status"] == "completed":
+        return {**job_status_dict(job_info), "rebuilt": [], "removed": []}
+
+    job_rebuilds.add(job_id)
+    try:
+        job_info, rebuilt, removed = await rebuild_job(job_info, app_spec, spec_key)
+    except Exception as e:
+        api_logger.error(f"명세 변경 반영 중 오류 발생: {job_id}, {str(e)}")
+        return JSONResponse(
+            status_code=500,
+            content={"error": f"명세 변경 반영 중 오류 발생: {str(e)}"}
+        )
+    finally:
+        job_rebuilds.discard(job_id)
+    return {**job_status_dict(job_info), "rebuilt": rebuilt, "removed": removed}
+
+
+async def rebuild_job(
+    job_info: Dict[str, Any], app_spec: Dict[str, Any], spec_key: str
+) -> Tuple[Dict[str, Any], List[str], List[str]]:
+    """
+    작업 출력을 새 명세로 증분 재생성하여 작업의 새 버전으로 등록합니다.
+
+    이전 버전과 새 명세의 빌드 그래프를 비교하여 다시 생성할 파일을 정하고,
+    바뀌지 않은 파일은 이전 버전에서 하드링크(또는 복사)합니다. 새 버전은 새
+    출력 디렉토리에 만든 뒤 작업 레코드를 바꾸므로 재생성 중에도 이전 버전을
+    다운로드할 수 있고, 실패하면 이전 버전이 그대로 남습니다. 작업
+    레코드에서 빠진 이전 디렉토리와 ZIP 아카이브는 교체할 때 수정 시각을
+    갱신하므로, 정리기가 교체 후 RETENTION_ORPHAN_GRACE가 지나야 삭제하고
+    그동안 진행 중인 이전 버전 다운로드가 끝날 수 있습니다. 다시 생성할
+    파일이 적으므로 GENERATION_MODE와 관계없이 I/O 실행기에서 생성합니다.
+
+    Args:
+        job_info: 작업 레코드
+        app_spec: 정규화된 새 앱 명세
+        spec_key: 새 명세 키
+
+    Returns:
+        (갱신된 작업 레코드, 다시 생성한 파일 목록, 삭제한 파일 목록)
+    """
+    job_id = job_info["job_id"]
+    manifest = job_info.get("manifest") or {}
+    graph = compile_graph(app_spec, GENERATOR_FINGERPRINT)
+    dirty, removed = plan_rebuild(job_info.get("build_graph"), graph, manifest)
+    rebuilt = [path for paths in dirty.values() for path in paths]
+    kept = {
+        path: entry for path, entry in manifest.items()
+        if path in graph["nodes"] and path not in rebuilt
     }
+    version = (job_info.get("version") or 1) + 1
+    api_logger.info(
+        f"명세 변경 반영 시작: job_id={job_id}, 버전 {version}, "
+        f"다시 생성 {len(rebuilt)}개, 유지 {len(kept)}개, 삭제 {len(removed)}개"
+    )
 
-    dependencies {
-        classpath 'com.android.tools.build:gradle:7.3.0'
-        classpath "org.jetbrains.kotlin:kotlin-gradle-plugin:$kotlin_version"
+    app_name = app_spec.get("app_name", "flutter_app")
+    loop = asyncio.get_running_loop()
+    folder_name = await loop.run_in_executor(
+        io_executor, reserve_output_dir,
+        FLUTTER_OUTPUT_DIR, f"App_{app_name}_v{int(time.time()) % 10000}"
+    )
+    old_folder = job_info["folder_name"]
+    old_archive = job_info.get("archive_path")
+    source_dir = os.path.join(FLUTTER_OUTPUT_DIR, old_folder)
+    output_dir = os.path.join(FLUTTER_OUTPUT_DIR, folder_name)
+    try:
+        with job_processes.job_scope(job_id), \
+                deadlines.deadline_scope(new_job_deadline()) as scope, \
+                trace_job(job_id, "rebuild", version=version):
+            with tracing.span(
+                "clone_unchanged", "io", measure_cpu=False, files=len(kept)
+            ):
+                await finish_blocking(loop.run_in_executor(
+                    io_executor, clone_output, source_dir, output_dir, kept,
+                    blob_store
+                ))
+            _, entries = await generate_in_threads(
+                job_id, output_dir, app_spec, dirty
+            )
+    except Exception:
+        await loop.run_in_executor(
+            io_executor, release_output_dir, FLUTTER_OUTPUT_DIR, folder_name
+        )
+        raise
+
+    # 새 버전의 매니페스트와 아티팩트 목록 (빌드 그래프 순서)
+    entries.update(kept)
+    new_manifest = {
+        path: entries[path] for path in graph["nodes"] if path in entries
+    }
+    by_phase: Dict[str, List[str]] = {}
+    for path in new_manifest:
+        by_phase.setdefault(graph["nodes"][path]["phase"], []).append(path)
+
+    fields = {
+        "timed_out": None,
+        "fallbacks": None,
+        **finished_job_fields(scope, f"명세 변경 반영 완료 (버전 {version})"),
     }
-}
+    job_info = await update_job(
+        job_id,
+        app_spec=app_spec,
+        spec_key=spec_key,
+        folder_name=folder_name,
+        version=version,
+        artifacts=order_artifacts(by_phase),
+        manifest=new_manifest,
+        build_graph=graph,
+        archive_path=None,
+        **fields
+    )
+    if job_info is None:
+        # 재생성 중 작업이 삭제되었거나 취소되어 교체하지 못함
+        await loop.run_in_executor(
+            io_executor, release_output_dir, FLUTTER_OUTPUT_DIR, folder_name
+        )
+        raise RuntimeError("작업 레코드를 새 버전으로 바꿀 수 없습니다")
+
+    # 이전 버전은 교체 시점부터 유예 시간이 지나면 정리기가 삭제
+    await loop.run_in_executor(
+        io_executor, retire_output_dir, FLUTTER_OUTPUT_DIR, old_folder, old_archive
+    )
+    if result_cache is not None and fields["status"] == "completed":
+        result_cache.put(spec_key, job_id)
+    api_logger.info(f"명세 변경 반영 완료: job_id={job_id}, 버전 {version}")
+    return job_info, rebuilt, removed
+
+
+@app.get("/job/{job_id}/graph")
+async def get_job_graph(job_id: str):
+    """
+    작업의 파일 단위 빌드 그래프를 조회합니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        작업 버전과 파일별 생성 단계, 템플릿, 의존하는 명세 조각 해시
+    """
+    job_info = await get_job_or_404(job_id)
+    graph = job_info.get("build_graph")
+    if graph is None:
+        raise HTTPException(
+            status_code=404, detail="작업의 빌드 그래프가 없습니다."
+        )
+    return {"job_id": job_id, "version": job_info.get("version") or 1, **graph}
+
+
+@app.get("/job/{job_id}/trace")
+async def get_job_trace(
+    job_id: str,
+    format: str = Query(
+        "json", pattern="^(json|chrome)$",
+        description="json(스팬 트리) 또는 chrome(Chrome 트레이스 이벤트)"
+    ),
+):
+    """
+    작업의 트레이스 스팬을 조회합니다.
+
+    Args:
+        job_id: 작업 ID
+        format: 응답 형식 (json 또는 chrome)
+
+    Returns:
+        스팬 트리와 임계 경로, 또는 chrome://tracing에서 열 수 있는 트레이스 이벤트
+    """
+    await get_job_or_404(job_id)
+    trace = job_traces.get(job_id) if job_traces is not None else None
+    if trace is None:
+        raise HTTPException(
+            status_code=404, detail="작업의 트레이스가 없습니다."
+        )
+    if format == "chrome":
+        return trace.to_chrome()
+    return trace.to_dict()
+
+
+@app.get("/job/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request):
+    """
+    작업 진행 상황을 SSE(Server-Sent Events) 스트림으로 전달합니다.
+
+    status(상태/진행률 변경), artifact(파일 생성), summary(최종 결과) 이벤트를
+    전송하며, summary 이벤트 후 스트림을 종료합니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        text/event-stream 응답
+    """
+    # 구독 후 현재 상태를 읽어 그 사이의 이벤트를 놓치지 않도록 함
+    queue = job_events.subscribe(job_id)
+    try:
+        job_info = await get_job_or_404(job_id)
+    except HTTPException:
+        job_events.unsubscribe(job_id, queue)
+        raise
+
+    async def event_stream():
+        try:
+            current = status_event(job_info)
+            yield format_sse("status", current)
+            if job_info.get("status") in TERMINAL_STATUSES:
+                yield format_sse("summary", summary_event(job_info))
+                return
+
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(
+                        queue.get(), timeout=JOB_EVENTS_HEARTBEAT
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    # 다른 워커 프로세스에서 처리 중인 작업은 저장소에서 상태 확인
+                    latest = await job_store.get(job_id)
+                    if latest is None:
+                        return
+                    if status_event(latest) != current:
+                        current = status_event(latest)
+                        yield format_sse("status", current)
+                    if latest.get("status") in TERMINAL_STATUSES:
+                        yield format_sse("summary", summary_event(latest))
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if event == "status":
+                    current = data
+                yield format_sse(event, data)
+                if event == "summary":
+                    return
+        finally:
+            job_events.unsubscribe(job_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
-allprojects {
-    repositories {
-        google()
-        mavenCentral()
+
+@app.get("/jobs", response_model=Dict[str, JobStatus])
+async def get_all_jobs(
+    request: Request,
+    status: Optional[str] = Query(None, description="작업 상태 필터"),
+    app_name: Optional[str] = Query(None, description="앱 이름 필터"),
+    since: Optional[float] = Query(
+        None, description="이 시각(epoch 초) 이후에 생성된 작업만 조회"
+    ),
+    limit: int = Query(
+        JOBS_PAGE_DEFAULT_LIMIT, ge=1, le=JOBS_PAGE_MAX_LIMIT,
+        description="페이지 크기"
+    ),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서"),
+):
+    """
+    작업 상태를 생성 시간 순으로 한 페이지씩 조회합니다.
+
+    다음 페이지가 있으면 X-Next-Cursor 헤더와 Link 헤더(rel="next")로
+    다음 페이지 커서를 전달합니다.
+
+    Returns:
+        작업 ID를 키로 하는 작업 상태 딕셔너리
+    """
+    try:
+        jobs, next_cursor = await job_store.query_jobs(
+            status=status, app_name=app_name, since=since,
+            limit=limit, cursor=cursor
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = {}
+    if next_cursor is not None:
+        next_url = request.url.include_query_params(cursor=next_cursor)
+        headers["X-Next-Cursor"] = next_cursor
+        headers["Link"] = f'<{next_url}>; rel="next"'
+
+    plan = job_queue.schedule()
+    return JSONResponse(
+        content={
+            job["job_id"]: apply_schedule(job_status_dict(job), plan) for job in jobs
+        },
+        headers=headers
+    )
+
+
+@app.post("/jobs/status")
+async def get_jobs_status(body: Union[JobStatusBatchRequest, List[str]]):
+    """
+    여러 작업의 상태를 한 번에 조회합니다.
+
+    Request body는 {"job_ids": [...]} 또는 작업 ID 배열입니다.
+
+    Returns:
+        jobs(작업 ID별 상태)와 missing(찾을 수 없는 작업 ID 목록)
+    """
+    job_ids = body.job_ids if isinstance(body, JobStatusBatchRequest) else body
+    if len(job_ids) > JOBS_PAGE_MAX_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {JOBS_PAGE_MAX_LIMIT}개 작업까지 조회할 수 있습니다."
+        )
+
+    records = await job_store.get_many(job_ids)
+    plan = job_queue.schedule()
+    return JSONResponse(content={
+        "jobs": {
+            job_id: apply_schedule(job_status_dict(record), plan)
+            for job_id, record in records.items()
+        },
+        "missing": [job_id for job_id in job_ids if job_id not in records],
+    })
+
+
+async def cancel_jobs(job_ids: List[str]) -> Dict[str, Any]:
+    """
+    여러 작업을 동시에 취소합니다.
+
+    Args:
+        job_ids: 작업 ID 목록
+
+    Returns:
+        cancelled(취소한 작업 ID 목록), requested(취소를 요청만 한 작업 ID 목록),
+        finished(이미 끝난 작업 ID별 상태), missing(찾을 수 없는 작업 ID 목록)
+    """
+    job_ids = list(dict.fromkeys(job_ids))
+    results = await asyncio.gather(*(cancel_job(job_id) for job_id in job_ids))
+    response: Dict[str, Any] = {
+        "cancelled": [], "requested": [], "finished": {}, "missing": []
     }
-}
-
-rootProject.buildDir = '../build'
-subprojects {
-    project.buildDir = "${rootProject.buildDir}/${project.name}"
-}
-subprojects {
-    project.evaluationDependsOn(':app')
-}
-
-tasks.register("clean", Delete) {
-    delete rootProject.buildDir
-}"""
-        
-        with open(android_build_gradle_path, 'w') as f:
-            f.write(android_build_gradle_content)
-        api_logger.info(f"android/build.gradle 파일 생성 완료: {android_build_gradle_path}")
-        
-        # android/settings.gradle 파일 생성
-        android_settings_gradle_path = os.path.join(android_dir, "settings.gradle")
-        android_settings_gradle_content = """include ':app'
+    for job_id, job_info in zip(job_ids, results):
+        if job_info is None:
+            response["missing"].append(job_id)
+        elif job_info.get("status") == "cancelled":
+            response["cancelled"].append(job_id)
+        elif job_info.get("status") not in TERMINAL_STATUSES:
+            response["requested"].append(job_id)
+        else:
+            response["finished"][job_id] = job_info.get("status")
+    return response
+
+
+@app.post("/jobs/cancel")
+async def cancel_jobs_endpoint(body: Union[JobStatusBatchRequest, List[str]]):
+    """
+    여러 작업을 한 번에 취소합니다.
 
-def localPropertiesFile = new File(rootProject.projectDir, "local.properties")
-def properties = new Properties()
+    Request body는 {"job_ids": [...]} 또는 작업 ID 배열입니다.
 
-assert localPropertiesFile.exists()
-localPropertiesFile.withReader("UTF-8") { reader -> properties.load(reader) }
+    Returns:
+        cancelled, requested, finished, missing (cancel_jobs() 참고)
+    """
+    job_ids = body.job_ids if isinstance(body, JobStatusBatchRequest) else body
+    if len(job_ids) > JOBS_PAGE_MAX_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {JOBS_PAGE_MAX_LIMIT}개 작업까지 취소할 수 있습니다."
+        )
+    return await cancel_jobs(job_ids)
 
-def flutterSdkPath = properties.getProperty("flutter.sdk")
-assert flutterSdkPath != null, "flutter.sdk not set in local.properties"
-apply from: "$flutterSdkPath/packages/flutter_tools/gradle/app_plugin_loader.gradle" """
-        
-        with open(android_settings_gradle_path, 'w') as f:
-            f.write(android_settings_gradle_content)
-        api_logger.info(f"android/settings.gradle 파일 생성 완료: {android_settings_gradle_path}")
-        
-        # android/local.properties 파일 생성
-        android_local_properties_path = os.path.join(android_dir, "local.properties")
-        android_local_properties_content = "flutter.sdk=/path/to/your/flutter/sdk"
-        
-        with open(android_local_properties_path, 'w') as f:
-            f.write(android_local_properties_content)
-        api_logger.info(f"android/local.properties 파일 생성 완료: {android_local_properties_path}")
-        
-        # android/app/build.gradle 파일 생성
-        android_app_build_gradle_path = os.path.join(android_app_dir, "build.gradle")
-        android_app_build_gradle_content = f"""def localProperties = new Properties()
-def localPropertiesFile = rootProject.file('local.properties')
-if (localPropertiesFile.exists()) {{
-    localPropertiesFile.withReader('UTF-8') {{ reader ->
-        localProperties.load(reader)
-    }}
-}}
-
-def flutterRoot = localProperties.getProperty('flutter.sdk')
-if (flutterRoot == null) {{
-    throw new RuntimeException("Flutter SDK not found. Define location with flutter.sdk in the local.properties file.")
-}}
-
-def flutterVersionCode = localProperties.getProperty('flutter.versionCode')
-if (flutterVersionCode == null) {{
-    flutterVersionCode = '1'
-}}
-
-def flutterVersionName = localProperties.getProperty('flutter.versionName')
-if (flutterVersionName == null) {{
-    flutterVersionName = '1.0'
-}}
-
-apply plugin: 'com.android.application'
-apply plugin: 'kotlin-android'
-apply from: "$flutterRoot/packages/flutter_tools/gradle/flutter.gradle"
-
-android {{
-    compileSdkVersion 33
-    ndkVersion flutter.ndkVersion
-
-    compileOptions {{
-        sourceCompatibility JavaVersion.VERSION_1_8
-        targetCompatibility JavaVersion.VERSION_1_8
-    }}
-
-    kotlinOptions {{
-        jvmTarget = '1.8'
-    }}
-
-    sourceSets {{
-        main.java.srcDirs += 'src/main/kotlin'
-    }}
-
-    defaultConfig {{
-        applicationId "com.example.{app_name_slug}"
-        minSdkVersion 21
-        targetSdkVersion 33
-        versionCode flutterVersionCode.toInteger()
-        versionName flutterVersionName
-    }}
-
-    buildTypes {{
-        release {{
-            signingConfig signingConfigs.debug
-        }}
-    }}
-}}
-
-flutter {{
-    source '../..'
-}}
-
-dependencies {{
-    implementation "org.jetbrains.kotlin:kotlin-stdlib-jdk7:$kotlin_version"
-}}"""
-        
-        with open(android_app_build_gradle_path, 'w') as f:
-            f.write(android_app_build_gradle_content)
-        api_logger.info(f"android/app/build.gradle 파일 생성 완료: {android_app_build_gradle_path}")
-        
-        # android/app/src/main/AndroidManifest.xml 파일 생성
-        android_manifest_path = os.path.join(android_app_src_main_dir, "AndroidManifest.xml")
-        android_manifest_content = f"""<?xml version="1.0" encoding="utf-8"?>
-<manifest xmlns:android="http://schemas.android.com/apk/res/android">
-    <application
-        android:name="${{applicationName}}"
-        android:icon="@mipmap/ic_launcher"
-        android:label="@string/app_name">
-        <activity
-            android:name=".MainActivity"
-            android:configChanges="orientation|keyboardHidden|keyboard|screenSize|smallestScreenSize|locale|layoutDirection|fontScale|screenLayout|density|uiMode"
-            android:exported="true"
-            android:hardwareAccelerated="true"
-            android:launchMode="singleTop"
-            android:theme="@style/LaunchTheme"
-            android:windowSoftInputMode="adjustResize">
-            <meta-data
-                android:name="io.flutter.embedding.android.NormalTheme"
-                android:resource="@style/NormalTheme" />
-            <intent-filter>
-                <action android:name="android.intent.action.MAIN" />
-                <category android:name="android.intent.category.LAUNCHER" />
-            </intent-filter>
-        </activity>
-        <meta-data
-            android:name="flutterEmbedding"
-            android:value="2" />
-    </application>
-</manifest>"""
-        
-        with open(android_manifest_path, 'w') as f:
-            f.write(android_manifest_content)
-        api_logger.info(f"AndroidManifest.xml 파일 생성 완료: {android_manifest_path}")
-        
-        # android/app/src/main/kotlin/com/example/app_name/MainActivity.kt 파일 생성
-        android_main_activity_path = os.path.join(android_app_src_main_kotlin_dir, "MainActivity.kt")
-        android_main_activity_content = f"""package com.example.{app_name_slug}
 
-import io.flutter.embedding.android.FlutterActivity
+async def read_batch_specs(request: Request) -> List[Dict[str, Any]]:
+    """
+    배치 요청 본문에서 앱 명세 목록을 읽습니다.
 
-class MainActivity: FlutterActivity() {{
-}}"""
-        
-        with open(android_main_activity_path, 'w') as f:
-            f.write(android_main_activity_content)
-        api_logger.info(f"MainActivity.kt 파일 생성 완료: {android_main_activity_path}")
-        
-        # android/app/src/main/res/values/strings.xml 파일 생성
-        android_strings_path = os.path.join(android_app_src_main_res_values_dir, "strings.xml")
-        android_strings_content = f"""<?xml version="1.0" encoding="utf-8"?>
-<resources>
-    <string name="app_name">{app_name}</string>
-</resources>"""
-        
-        with open(android_strings_path, 'w') as f:
-            f.write(android_strings_content)
-        api_logger.info(f"strings.xml 파일 생성 완료: {android_strings_path}")
-        
-        # android/app/src/main/res/values/styles.xml 파일 생성
-        android_styles_path = os.path.join(android_app_src_main_res_values_dir, "styles.xml")
-        android_styles_content = """<?xml version="1.0" encoding="utf-8"?>
-<resources>
-    <!-- Theme applied to the Android Window while the process is starting when the OS's Dark Mode setting is off -->
-    <style name="LaunchTheme" parent="@android:style/Theme.Light.NoTitleBar">
-        <!-- Show a splash screen on the activity. Automatically removed when
-             the Flutter engine draws its first frame -->
-        <item name="android:windowBackground">@drawable/launch_background</item>
-    </style>
-    <!-- Theme applied to the Android Window as soon as the process has started.
-         This theme determines the color of the Android Window while your
-         Flutter UI initializes, as well as behind your Flutter UI while its
-         running.
-         
-         This Theme is only used starting with V2 of Flutter's Android embedding. -->
-    <style name="NormalTheme" parent="@android:style/Theme.Light.NoTitleBar">
-        <item name="android:windowBackground">?android:colorBackground</item>
-    </style>
-</resources>"""
-        
-        with open(android_styles_path, 'w') as f:
-            f.write(android_styles_content)
-        api_logger.info(f"styles.xml 파일 생성 완료: {android_styles_path}")
-        
-        # android/app/src/main/res/drawable/launch_background.xml 파일 생성
-        android_launch_background_path = os.path.join(android_app_src_main_res_drawable_dir, "launch_background.xml")
-        android_launch_background_content = """<?xml version="1.0" encoding="utf-8"?>
-<layer-list xmlns:android="http://schemas.android.com/apk/res/android">
-    <item android:drawable="@android:color/white" />
-</layer-list>"""
-        
-        with open(android_launch_background_path, 'w') as f:
-            f.write(android_launch_background_content)
-        api_logger.info(f"launch_background.xml 파일 생성 완료: {android_launch_background_path}")
-        
-        # android/app/src/main/res/drawable-v21/launch_background.xml 파일 생성
-        android_launch_background_v21_path = os.path.join(android_app_src_main_res_drawable_v21_dir, "launch_background.xml")
-        android_launch_background_v21_content = """<?xml version="1.0" encoding="utf-8"?>
-<layer-list xmlns:android="http://schemas.android.com/apk/res/android">
-    <item android:drawable="?android:colorBackground" />
-</layer-list>"""
-        
-        with open(android_launch_background_v21_path, 'w') as f:
-            f.write(android_launch_background_v21_content)
-        api_logger.info(f"launch_background_v21.xml 파일 생성 완료: {android_launch_background_v21_path}")
-        
-        # android/gradle/wrapper/gradle-wrapper.properties 파일 생성
-        android_gradle_wrapper_path = os.path.join(android_gradle_wrapper_dir, "gradle-wrapper.properties")
-        android_gradle_wrapper_content = """distributionBase=GRADLE_USER_HOME
-distributionPath=wrapper/dists
-zipStoreBase=GRADLE_USER_HOME
-zipStorePath=wrapper/dists
-distributionUrl=https\\://services.gradle.org/distributions/gradle-7.5-all.zip"""
-        
-        with open(android_gradle_wrapper_path, 'w') as f:
-            f.write(android_gradle_wrapper_content)
-        api_logger.info(f"gradle-wrapper.properties 파일 생성 완료: {android_gradle_wrapper_path}")
-        
-        # 안드로이드 관련 파일 목록
-        android_files = [
-            "android/build.gradle",
-            "android/settings.gradle",
-            "android/local.properties",
-            "android/app/build.gradle",
-            "android/app/src/main/AndroidManifest.xml",
-            f"android/app/src/main/kotlin/com/example/{app_name_slug}/MainActivity.kt",
-            "android/app/src/main/res/values/strings.xml",
-            "android/app/src/main/res/values/styles.xml",
-            "android/app/src/main/res/drawable/launch_background.xml",
-            "android/app/src/main/res/drawable-v21/launch_background.xml",
-            "android/gradle/wrapper/gradle-wrapper.properties"
-        ]
-        
-        api_logger.info("안드로이드 파일 생성 완료")
-        
-        # 생성된 모든 파일 목록 (안드로이드 파일 추가)
-        artifact_files = [
-            "lib/main.dart",
-            "pubspec.yaml",
-            "README.md"
-        ] + [f"lib/{file}" for file in model_files + page_files] + android_files
-        
-        # 작업 상태 업데이트
-        active_jobs[job_id]["status"] = "completed"
-        active_jobs[job_id]["progress"] = 100
-        active_jobs[job_id]["message"] = "앱 생성 완료"
-        active_jobs[job_id]["artifacts"] = artifact_files
-        
-        api_logger.info(
-            f"앱 생성 완료: {app_name}, "
-            f"파일 생성 수: {len(model_files) + len(page_files) + 3 + len(android_files)}"
+    Content-Type이 NDJSON이면 본문을 스트리밍하면서 한 줄씩 읽고, 그 외에는
+    명세 배열(또는 {"specs": [...]})로 읽습니다.
+
+    Args:
+        request: 요청 객체
+
+    Returns:
+        앱 명세 목록
+    """
+    specs: List[Dict[str, Any]] = []
+
+    def add(spec: Any):
+        if not isinstance(spec, dict):
+            raise HTTPException(
+                status_code=400,
+                detail=f"{len(specs) + 1}번째 명세가 JSON 객체가 아닙니다."
+            )
+        if len(specs) >= BATCH_MAX_SIZE:
+            raise HTTPException(
+                status_code=413,
+                detail=f"한 배치에 최대 {BATCH_MAX_SIZE}개 명세까지 제출할 수 있습니다."
+            )
+        specs.append(spec)
+
+    def add_line(line: bytes):
+        if not line.strip():
+            return
+        try:
+            add(json.loads(line))
+        except json.JSONDecodeError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{len(specs) + 1}번째 줄을 JSON으로 읽을 수 없습니다: {str(e)}"
+            )
+
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonl" in content_type:
+        buffer = b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                add_line(line)
+        add_line(buffer)
+        return specs
+
+    try:
+        body = json.loads(await request.body())
+    except json.JSONDecodeError as e:
+        raise HTTPException(
+            status_code=400, detail=f"요청 본문을 JSON으로 읽을 수 없습니다: {str(e)}"
+        )
+    if isinstance(body, dict):
+        body = body.get("specs")
+    if not isinstance(body, list):
+        raise HTTPException(
+            status_code=400, detail="요청 본문은 앱 명세 배열이어야 합니다."
+        )
+    for spec in body:
+        add(spec)
+    return specs
+
+
+async def create_batch_job(
+    batch_id: str,
+    index: int,
+    concurrency: int,
+    app_spec: Dict[str, Any],
+    client_id: str,
+    priority: str = BATCH,
+) -> Tuple[str, bool]:
+    """
+    배치의 명세 하나에 대한 작업을 만듭니다.
+
+    같은 명세로 진행 중인 작업이 있으면 합류하고, 완료된 결과가 있으면
+    재사용하여 즉시 완료합니다.
+
+    Args:
+        batch_id: 배치 ID
+        index: 배치 안에서의 명세 순번
+        concurrency: 배치의 동시 실행 한도
+        app_spec: 정규화된 앱 명세
+        client_id: 요청한 클라이언트 식별자
+        priority: 작업 큐 우선순위 등급
+
+    Returns:
+        (작업 ID, 배치 한도 안에서 작업 큐에 넣어야 하는지 여부)
+    """
+    spec_key = spec_digest(app_spec, GENERATOR_FINGERPRINT)
+    while True:
+        flight = job_dedup.find(spec_key)
+        if flight is None:
+            break
+        await flight.ready.wait()
+        if await job_store.exists(flight.job_id):
+            return flight.job_id, False
+        job_dedup.abandon(flight)
+
+    job_id = str(uuid.uuid4())
+    flight = job_dedup.begin(job_id, spec_key)
+    try:
+        job_info = await new_job_record(
+            job_id, app_spec, spec_key,
+            message="배치 대기 중",
+            batch_id=batch_id,
+            batch_index=index,
+            batch_concurrency=concurrency,
+            client_id=client_id,
+            priority=priority,
+            estimated_cost=job_costs.estimate(app_spec)
+        )
+        if result_cache is not None:
+            cached = await result_cache.lookup(
+                spec_key,
+                lambda source_id: reuse_job_result(source_id, job_info)
+            )
+            if cached is not None:
+                job_dedup.created(flight)
+                job_dedup.finish(spec_key, job_id)
+                return job_id, False
+        await create_job(job_info)
+    except BaseException:
+        job_dedup.abandon(flight)
+        raise
+
+    job_dedup.created(flight)
+    return job_id, True
+
+
+def batch_summary(
+    batch: JobBatch, records: Dict[str, Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    배치 작업들의 상태를 요약합니다.
+
+    Args:
+        batch: 배치
+        records: 작업 ID별 작업 레코드
+
+    Returns:
+        배치 상태, 상태별 작업 수, 전체 진행률을 포함하는 딕셔너리
+    """
+    counts: Dict[str, int] = {}
+    progress = 0
+    for job_id in batch.job_ids:
+        record = records.get(job_id)
+        # 보존 정책으로 정리된 작업은 끝난 것으로 취급
+        status = record["status"] if record is not None else "missing"
+        counts[status] = counts.get(status, 0) + 1
+        if record is None or status in TERMINAL_STATUSES:
+            progress += 100
+        else:
+            progress += record.get("progress") or 0
+
+    total = len(batch.job_ids)
+    if counts.get("pending", 0) + counts.get("running", 0):
+        status = "running"
+    elif counts.get("completed", 0) == total:
+        status = "completed"
+    else:
+        status = "completed_with_errors"
+
+    return {
+        "batch_id": batch.batch_id,
+        "status": status,
+        "total": total,
+        "concurrency": batch.concurrency,
+        "counts": counts,
+        "progress": progress // total if total else 100,
+        "created": batch.created,
+    }
+
+
+def get_batch_or_404(batch_id: str) -> JobBatch:
+    """
+    배치를 조회하고, 없으면 404 예외를 발생시킵니다.
+
+    Args:
+        batch_id: 배치 ID
+
+    Returns:
+        배치
+    """
+    batch = job_batches.get(batch_id)
+    if batch is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"배치 ID {batch_id}를 찾을 수 없습니다."
         )
-        
-        # 디버그: 최종 파일 확인
-        api_logger.info("생성된 파일 목록:")
-        for root, _, files in os.walk(job_output_dir):
-            for file in files:
-                api_logger.info(f" - {os.path.join(root, file)}")
+    return batch
+
+
+@app.post("/generate_apps")
+async def start_batch_app_creation(
+    request: Request,
+    concurrency: Optional[int] = Query(
+        None, ge=1, description="배치 작업의 동시 실행 한도"
+    ),
+    priority: str = Query(
+        BATCH, description="우선순위 등급 (interactive 또는 batch)"
+    ),
+):
+    """
+    여러 Flutter 앱 생성 작업을 하나의 배치로 시작합니다.
 
-    except Exception as e:
-        api_logger.error(f"작업 실패: {job_id}, 오류: {str(e)}")
-        import traceback
-        api_logger.error(f"상세 오류: {traceback.format_exc()}")
+    Request body는 앱 명세 배열이거나 NDJSON(application/x-ndjson) 스트림입니다.
+    배치 작업은 concurrency개까지만 동시에 작업 큐에 들어가고, 하나가 끝날
+    때마다 다음 명세가 큐에 들어갑니다. 배치 작업은 기본적으로 batch
+    우선순위로 큐에 들어가 대화형 작업보다 늦게 시작합니다.
 
-        # 작업 실패 표시
-        if job_id in active_jobs:
-            active_jobs[job_id]["status"] = "failed"
-            active_jobs[job_id]["message"] = f"앱 생성 중 오류 발생: {str(e)}"
+    Returns:
+        배치 ID, 명세 순서대로의 작업 ID 목록, 배치 상태
+    """
+    client_id, rejection = admit_request(request)
+    if rejection is not None:
+        return rejection
+    try:
+        return await create_batch(request, client_id, concurrency, priority)
+    finally:
+        # 배치 작업은 작업 큐에 들어갈 때 클라이언트의 동시 작업 자리를 사용
+        release_admission(client_id)
 
 
-@app.get("/job/{job_id}", response_model=JobStatus)
-async def get_job_status(job_id: str):
+async def create_batch(
+    request: Request, client_id: str, concurrency: Optional[int],
+    priority: str = BATCH
+) -> Union[Dict[str, Any], JSONResponse]:
     """
-    특정 작업의 상태를 조회합니다.
+    배치 요청 본문을 읽어 배치와 작업들을 만듭니다.
 
     Args:
-        job_id: 작업 ID
+        request: 요청 객체
+        client_id: 클라이언트 식별자
+        concurrency: 요청한 동시 실행 한도
+        priority: 배치 작업의 우선순위 등급
 
     Returns:
-        작업 상태를 포함하는 JobStatus 객체
+        배치 응답 본문 또는 오류 응답
     """
-    if job_id not in active_jobs:
+    if job_queue.closed:
+        return server_draining_response()
+    if priority not in job_queue.priority_penalties:
         raise HTTPException(
-            status_code=404,
-            detail=f"작업 ID {job_id}를 찾을 수 없습니다."
+            status_code=400, detail=f"알 수 없는 우선순위입니다: {priority}"
         )
 
-    # job_id 값을 포함하여 JobStatus 생성
-    job_info = active_jobs[job_id].copy()
-    if "job_id" not in job_info:
-        job_info["job_id"] = job_id
-    return JobStatus(**job_info)
+    specs = await read_batch_specs(request)
+    if not specs:
+        raise HTTPException(status_code=400, detail="제출된 앱 명세가 없습니다.")
+
+    concurrency = min(
+        concurrency or BATCH_DEFAULT_CONCURRENCY, BATCH_MAX_CONCURRENCY
+    )
+    batch_id = job_batches.new_batch_id()
+    created = time.time()
+
+    job_ids: List[str] = []
+    pending: List[str] = []
+    for index, spec in enumerate(specs):
+        job_id, queued = await create_batch_job(
+            batch_id, index, concurrency, normalize_app_spec(spec), client_id,
+            priority
+        )
+        job_ids.append(job_id)
+        if queued:
+            pending.append(job_id)
+
+    batch = job_batches.create(batch_id, job_ids, pending, concurrency, created)
+    api_logger.info(
+        f"배치 생성: {batch_id}, 명세 {len(job_ids)}개, "
+        f"새 작업 {len(pending)}개, 동시 실행 한도 {concurrency}"
+    )
 
+    response = batch_summary(batch, await job_store.get_many(job_ids))
+    response["job_ids"] = job_ids
+    return response
 
-@app.get("/jobs", response_model=Dict[str, JobStatus])
-async def get_all_jobs():
+
+@app.get("/batch/{batch_id}")
+async def get_batch_status(batch_id: str):
     """
-    모든 작업의 상태를 조회합니다.
+    배치 상태와 배치에 속한 작업별 상태를 조회합니다.
+
+    Args:
+        batch_id: 배치 ID
 
     Returns:
-        모든 작업의 상태를 포함하는 딕셔너리
-    """
-    result = {}
-    for job_id, job_info in active_jobs.items():
-        # 각 작업 정보에 job_id 명시적 추가
-        job_data = job_info.copy()
-        if "job_id" not in job_data:
-            job_data["job_id"] = job_id
-        result[job_id] = JobStatus(**job_data)
-    
-    return result
+        배치 요약과 명세 순서대로의 작업 상태 목록
+    """
+    batch = get_batch_or_404(batch_id)
+    records = await job_store.get_many(batch.job_ids)
+    response = batch_summary(batch, records)
+    response["jobs"] = [
+        job_status_dict(records[job_id]) if job_id in records
+        else {"job_id": job_id, "status": "missing"}
+        for job_id in batch.job_ids
+    ]
+    return response
+
+
+@app.get("/batch/{batch_id}/progress")
+async def get_batch_progress(batch_id: str):
+    """
+    배치의 상태별 작업 수와 전체 진행률만 조회합니다.
 
+    Args:
+        batch_id: 배치 ID
+
+    Returns:
+        배치 요약
+    """
+    batch = get_batch_or_404(batch_id)
+    return batch_summary(batch, await job_store.get_many(batch.job_ids))
+
+
+@app.delete("/batch/{batch_id}")
+async def cancel_batch(batch_id: str):
+    """
+    배치에 속한 작업 중 끝나지 않은 작업을 모두 취소합니다.
+
+    Args:
+        batch_id: 배치 ID
+
+    Returns:
+        batch_id와 cancelled, requested, finished, missing (cancel_jobs() 참고)
+    """
+    batch = get_batch_or_404(batch_id)
+    return {"batch_id": batch_id, **await cancel_jobs(batch.job_ids)}
 
-@app.get("/download/{job_id}/{artifact_name}")
-async def download_artifact(job_id: str, artifact_name: str):
+
+@app.get("/download/{job_id}/{artifact_name:path}")
+async def download_artifact(job_id: str, artifact_name: str, request: Request):
     """
     생성된 아티팩트를 다운로드합니다.
 
+    작업 매니페스트에 있는 파일은 작업 출력 디렉토리에서 바로 전송하며
+    (ETag, If-None-Match, Range 지원), 매니페스트에 없는 아티팩트만 ADK
+    아티팩트 서비스에서 읽습니다. lib/models/user.dart 같은 중첩 경로를
+    사용할 수 있습니다.
+
     Args:
         job_id: 작업 ID
-        artifact_name: 아티팩트 이름
+        artifact_name: 아티팩트 이름 (출력 디렉토리 기준 상대 경로)
 
     Returns:
-        아티팩트 파일 스트림
+        아티팩트 파일 응답
     """
-    if job_id not in active_jobs:
-        raise HTTPException(
-            status_code=404,
-            detail=f"작업 ID {job_id}를 찾을 수 없습니다."
-        )
+    job_info = await get_job_or_404(job_id)
 
-    job_info = active_jobs[job_id]
-
-    if job_info["status"] != "completed":
+    if job_info["status"] not in RESULT_STATUSES:
         raise HTTPException(
             status_code=400,
             detail=f"작업이 아직 완료되지 않았습니다. 현재 상태: {job_info['status']}"
         )
 
-    try:
-        # 저장한 러너 객체 사용
-        runner_obj = job_info.get("runner")
-        if not runner_obj:
-            raise HTTPException(
-                status_code=500,
-                detail="작업에 러너 객체가 없습니다."
-            )
+    content_type = artifact_content_type(artifact_name)
+    filename = os.path.basename(artifact_name)
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+
+    # 매니페스트에 기록된 파일은 디스크에서 바로 전송
+    entry = (job_info.get("manifest") or {}).get(artifact_name)
+    if entry is not None:
+        folder_name = job_info.get("folder_name", job_id)
+        file_path = os.path.join(FLUTTER_OUTPUT_DIR, folder_name, artifact_name)
+        # 출력 디렉토리에 파일이 없으면 같은 내용의 블롭에서 전송
+        if not os.path.isfile(file_path) and blob_store is not None:
+            file_path = blob_store.blob_path(entry["sha256"])
+        if os.path.isfile(file_path):
+            etag = f'"{entry["sha256"]}"'
+            await update_job(job_id, last_download=time.time())
+            if etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers={"ETag": etag})
+            headers["ETag"] = etag
+            return FileResponse(file_path, media_type=content_type, headers=headers)
+        api_logger.warning(f"매니페스트의 파일이 디스크에 없음: {file_path}")
 
-        # 세션 객체 가져오기
+    try:
+        # 작업에 연결된 세션 식별자 가져오기
         user_id = job_info.get("user_id")
-        if not user_id:
-            raise HTTPException(
-                status_code=500,
-                detail="작업에 사용자 ID가 없습니다."
-            )
-
-        # 세션 맵에서 세션 객체 가져오기
-        session = session_id_maps.get(user_id)
-        if not session:
-            # 세션 서비스에서 직접 가져오기 시도
-            try:
-                session = runner_obj.session_service.get_session(user_id)
-                if session:
-                    # 세션 맵에 저장
-                    session_id_maps[user_id] = session
-                    api_logger.info(f"세션 서비스에서 세션 가져옴: {user_id}")
-                else:
-                    raise HTTPException(
-                        status_code=500,
-                        detail=f"사용자 ID {user_id}에 대한 세션을 찾을 수 없습니다."
-                    )
-            except Exception as e:
-                api_logger.error(f"세션 가져오기 실패: {str(e)}")
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"세션 가져오기 실패: {str(e)}"
-                )
-
-        # 아티팩트 존재 여부 확인
-        try:
-            api_logger.info("아티팩트 목록 요청 - 세션: {0}".format(session))
-            # 직접 아티팩트 서비스에 접근해 아티팩트 목록 가져오기
-            try:
-                artifacts = (
-                    runner_obj.artifact_service.list_artifacts(
-                        session
-                    )
-                )
-            except AttributeError:
-                # ADK 0.5.0 변경사항 - 세션 메서드 사용
-                api_logger.info("list_artifacts 메서드 없음, 대체 방법 시도")
-                try:
-                    # 세션 객체의 get_artifacts 메서드 시도
-                    if hasattr(session, 'get_artifacts'):
-                        artifacts = session.get_artifacts()
-                    else:
-                        # runner의 직접 접근 시도
-                        artifacts = runner_obj.list_artifacts(
-                            session
-                        )
-                except Exception as inner_e:
-                    api_logger.error(
-                        f"대체 방법으로 아티팩트 목록 가져오기 실패: {str(inner_e)}"
-                    )
-                    artifacts = []
-
-            if artifact_name not in [str(artifact) for artifact in artifacts]:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"아티팩트 {artifact_name}을 찾을 수 없습니다."
-                )
-        except Exception as e:
-            api_logger.warning(f"아티팩트 목록 가져오기 실패: {str(e)}")
+        session_id = job_info.get("session_id")
+        if not user_id or not session_id:
             raise HTTPException(
-                status_code=500,
-                detail=f"아티팩트 목록 가져오기 실패: {str(e)}"
+                status_code=404,
+                detail=f"아티팩트 {artifact_name}을 찾을 수 없습니다."
             )
 
-        # 아티팩트 로드
+        # 아티팩트 로드 (없으면 None)
         try:
-            artifact = runner_obj.artifact_service.load_artifact(
-                session, artifact_name
+            artifact = await get_artifact_service().load_artifact(
+                app_name=ADK_APP_NAME,
+                user_id=user_id,
+                session_id=session_id,
+                filename=artifact_name
             )
-            if artifact is None:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"아티팩트 {artifact_name}을 로드할 수 없습니다."
-                )
         except Exception as e:
             api_logger.warning(f"아티팩트 로드 실패: {str(e)}")
             raise HTTPException(
                 status_code=500,
                 detail=f"아티팩트 로드 실패: {str(e)}"
             )
+        if artifact is None or artifact.inline_data is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"아티팩트 {artifact_name}을 찾을 수 없습니다."
+            )
+
+        # 보존 정책(LRU)을 위한 마지막 다운로드 시각 기록
+        await update_job(job_id, last_download=time.time())
 
-        # 파일 타입 결정
-        content_type = "application/octet-stream"
-        if artifact_name.endswith(".dart"):
-            content_type = "text/x-dart"
-        elif artifact_name.endswith(".py"):
-            content_type = "text/x-python"
-        elif artifact_name.endswith(".json"):
-            content_type = "application/json"
-        elif artifact_name.endswith(".yaml") or artifact_name.endswith(".yml"):
-            content_type = "text/yaml"
-        elif artifact_name.endswith(".md"):
-            content_type = "text/markdown"
-
-        # 파일 스트림 반환
-        content_disposition = f"attachment; filename={artifact_name}"
-        return StreamingResponse(
-            io.BytesIO(artifact.data),
+        return Response(
+            content=artifact.inline_data.data,
             media_type=content_type,
-            headers={"Content-Disposition": content_disposition}
+            headers=headers
         )
 
     except HTTPException:
@@ -1095,24 +2673,113 @@ async def download_artifact(job_id: str, artifact_name: str):
         )
 
 
+def archive_headers(digest: str, filename: str) -> Dict[str, str]:
+    """ZIP 다운로드 응답 헤더를 만듭니다. 내용 해시를 ETag로 사용합니다."""
+    return {
+        "ETag": f'"{digest}"',
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{filename}"'
+    }
+
+
+async def traced_archive_stream(
+    chunks: AsyncIterator[bytes], trace: tracing.JobTrace, started_at: float,
+    started: float, digest: str
+) -> AsyncIterator[bytes]:
+    """
+    압축하면서 스트리밍한 아카이브 전송 시간을 작업 트레이스에 기록합니다.
+
+    Args:
+        chunks: 아카이브 청크 스트림
+        trace: 작업 트레이스
+        started_at: 요청 시작 시각(epoch 초)
+        started: 요청 시작 시각(perf_counter)
+        digest: 출력 트리 내용 해시
+    """
+    sent = 0
+    try:
+        async for chunk in chunks:
+            sent += len(chunk)
+            yield chunk
+    finally:
+        trace.add(
+            "archive", "io", started_at, time.perf_counter() - started,
+            digest=digest, cached=False, bytes=sent
+        )
+
+
+async def archive_response(
+    request: Request,
+    output_dir: str,
+    digest: str,
+    signature: tuple,
+    headers: Dict[str, str],
+    trace: Optional[tracing.JobTrace] = None,
+) -> Response:
+    """
+    캐시된 아카이브를 전송하거나 압축하면서 스트리밍합니다.
+
+    Args:
+        request: 요청 객체 (If-None-Match, Range 확인)
+        output_dir: 아카이브로 묶을 디렉토리
+        digest: 출력 트리 내용 해시
+        signature: 출력 트리 시그니처
+        headers: archive_headers()로 만든 응답 헤더
+        trace: 아카이브 생성 시간을 기록할 작업 트레이스
+
+    Returns:
+        304, 파일 또는 스트리밍 응답
+    """
+    etag = headers["ETag"]
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    started_at, started = time.time(), time.perf_counter()
+    # 범위 요청은 완성된 파일이 필요하므로 압축이 끝날 때까지 대기
+    archive_path = archive_cache.cached(digest)
+    cached = archive_path is not None
+    if archive_path is None and request.headers.get("range"):
+        archive_path = await archive_cache.build(output_dir, digest, signature)
+
+    # 캐시된 아카이브는 파일 응답으로 전송 (Range/If-Range 지원)
+    if archive_path is not None:
+        if trace is not None:
+            trace.add(
+                "archive", "io", started_at, time.perf_counter() - started,
+                digest=digest, cached=cached
+            )
+        return FileResponse(
+            archive_path, media_type="application/zip", headers=headers
+        )
+
+    # 처음 요청된 아카이브는 압축하면서 스트리밍하고 동시에 캐시에 저장
+    chunks = archive_cache.stream(output_dir, digest, signature)
+    if trace is not None:
+        chunks = traced_archive_stream(chunks, trace, started_at, started, digest)
+    return StreamingResponse(
+        chunks,
+        media_type="application/zip",
+        headers=headers
+    )
+
+
 @app.get("/download_zip/{job_id}")
-async def download_zip(job_id: str):
+async def download_zip(job_id: str, request: Request):
     """
     특정 작업에서 생성된 모든 아티팩트를 ZIP 파일로 다운로드합니다.
 
+    아카이브는 출력 트리의 내용 해시로 캐시되며, 해시를 ETag로 사용하여
+    If-None-Match(304)와 Range 요청을 지원합니다.
+
     Args:
         job_id: 작업 ID
 
     Returns:
-        ZIP 파일 스트림
+        ZIP 파일 응답
     """
-    if job_id not in active_jobs:
-        raise HTTPException(
-            status_code=404,
-            detail=f"작업 ID {job_id}를 찾을 수 없습니다."
-        )
+    job_info = await get_job_or_404(job_id)
 
-    if active_jobs[job_id]["status"] != "completed":
+    if job_info["status"] not in RESULT_STATUSES:
         return JSONResponse(
             status_code=400,
             content={"error": "작업이 아직 완료되지 않았습니다."}
@@ -1120,7 +2787,7 @@ async def download_zip(job_id: str):
 
     try:
         # 작업별 출력 디렉토리 경로 (folder_name 사용)
-        folder_name = active_jobs[job_id].get("folder_name", job_id)
+        folder_name = job_info.get("folder_name", job_id)
         job_output_dir = os.path.join(FLUTTER_OUTPUT_DIR, folder_name)
 
         # 디렉토리가 존재하는지 확인
@@ -1132,46 +2799,34 @@ async def download_zip(job_id: str):
             )
 
         # 앱 이름 가져오기 (있는 경우)
-        app_spec = active_jobs[job_id].get("app_spec", {})
+        app_spec = job_info.get("app_spec", {})
         app_name = app_spec.get("app_name", "flutter_app")
         app_version = folder_name.split('_')[-1] if '_' in folder_name else ""
 
         # 앱 이름과 버전으로 ZIP 파일명 생성
         filename = f"App_{app_name}_{app_version}.zip"
-        
-        # ZIP 파일 저장 경로 (archives 디렉토리 사용)
-        from src.config.settings import FLUTTER_ARCHIVES_DIR
-        os.makedirs(FLUTTER_ARCHIVES_DIR, exist_ok=True)
-        zip_file_path = os.path.join(FLUTTER_ARCHIVES_DIR, filename)
-        
-        # ZIP 파일 생성
-        with zipfile.ZipFile(zip_file_path, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-            # 재귀적으로 모든 파일 압축
-            for root, _, files in os.walk(job_output_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    # ZIP 내 상대 경로 계산
-                    arcname = os.path.relpath(file_path, job_output_dir)
-                    zip_file.write(file_path, arcname)
-        
-        # ZIP 파일을 메모리에 로드
-        buffer = io.BytesIO()
-        with open(zip_file_path, 'rb') as f:
-            buffer.write(f.read())
 
-        # 버퍼 위치를 시작으로 재설정
-        buffer.seek(0)
-        
-        # ZIP 파일이 저장된 경로도 기록
-        active_jobs[job_id]["archive_path"] = zip_file_path
-
-        # 파일 다운로드 응답 반환
-        return StreamingResponse(
-            buffer,
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": f'attachment; filename="{filename}"'
-            }
+        # 출력 트리 내용 해시로 캐시된 아카이브를 찾고 ETag로 사용
+        trace = job_traces.get(job_id) if job_traces is not None else None
+        started_at, started = time.time(), time.perf_counter()
+        digest, signature = await archive_cache.digest(
+            job_output_dir, job_info.get("manifest")
+        )
+        if trace is not None:
+            trace.add(
+                "archive_digest", "io", started_at, time.perf_counter() - started
+            )
+        headers = archive_headers(digest, filename)
+
+        # ZIP 파일이 저장된 경로와 마지막 다운로드 시각 기록
+        await update_job(
+            job_id,
+            archive_path=archive_cache.archive_path(digest),
+            last_download=time.time()
+        )
+
+        return await archive_response(
+            request, job_output_dir, digest, signature, headers, trace
         )
 
     except Exception as e:
@@ -1182,6 +2837,88 @@ async def download_zip(job_id: str):
         )
 
 
+@app.get("/download_batch/{batch_id}")
+async def download_batch(batch_id: str, request: Request):
+    """
+    배치에서 완료된 모든 앱을 앱 폴더별로 묶은 하나의 ZIP 파일로 다운로드합니다.
+
+    Args:
+        batch_id: 배치 ID
+
+    Returns:
+        ZIP 파일 응답
+    """
+    batch = get_batch_or_404(batch_id)
+    records = await job_store.get_many(batch.job_ids)
+    if batch_summary(batch, records)["status"] == "running":
+        return JSONResponse(
+            status_code=409,
+            content={"error": "배치 작업이 아직 끝나지 않았습니다."}
+        )
+
+    # 완료된 작업의 폴더와 매니페스트 (같은 작업에 합류한 명세는 한 번만 포함)
+    folders: List[str] = []
+    manifest: Dict[str, Dict[str, Any]] = {}
+    for job_id in dict.fromkeys(batch.job_ids):
+        job_info = records.get(job_id)
+        if job_info is None or job_info["status"] not in RESULT_STATUSES:
+            continue
+        folder_name = job_info.get("folder_name", job_id)
+        if not os.path.isdir(os.path.join(FLUTTER_OUTPUT_DIR, folder_name)):
+            continue
+        folders.append(folder_name)
+        for relative_path, entry in (job_info.get("manifest") or {}).items():
+            manifest[f"{folder_name}/{relative_path}"] = entry
+
+    if not folders:
+        return JSONResponse(
+            status_code=404,
+            content={"error": "배치에서 생성된 앱 파일을 찾을 수 없습니다."}
+        )
+
+    try:
+        digest, signature = await archive_cache.digest(
+            FLUTTER_OUTPUT_DIR, manifest, folders
+        )
+        return await archive_response(
+            request, FLUTTER_OUTPUT_DIR, digest, signature,
+            archive_headers(digest, f"{batch_id}.zip")
+        )
+    except Exception as e:
+        api_logger.error(f"배치 ZIP 파일 생성 중 오류 발생: {str(e)}")
+        return JSONResponse(
+            status_code=500,
+            content={"error": f"ZIP 파일 생성 중 오류 발생: {str(e)}"}
+        )
+
+
+@app.get("/usage")
+async def get_client_usage(request: Request):
+    """
+    요청한 클라이언트의 현재 요청 한도 사용량을 조회합니다.
+
+    Returns:
+        남은 토큰, 동시 작업 수, 요청/거절 수
+    """
+    client_id = request_client_id(request)
+    if client_quotas is None:
+        return {"client": client_id, "enabled": False}
+    return {"enabled": True, **client_quotas.usage(client_id)}
+
+
+@app.get("/usage/clients")
+async def get_all_client_usage():
+    """
+    모든 클라이언트의 현재 요청 한도 사용량을 최근 요청 순으로 조회합니다.
+
+    Returns:
+        클라이언트별 사용량 목록
+    """
+    if client_quotas is None:
+        return {"enabled": False, "clients": []}
+    return {"enabled": True, "clients": client_quotas.all_usage()}
+
+
 @app.get("/status", response_model=ServerStatus)
 async def get_server_status():
     """
@@ -1191,18 +2928,12 @@ async def get_server_status():
         서버 상태 정보
     """
     # 작업 통계 계산
-    pending_count = sum(
-        1 for job in active_jobs.values() if job["status"] == "pending"
-    )
-    running_count = sum(
-        1 for job in active_jobs.values() if job["status"] == "running"
-    )
-    completed_count = sum(
-        1 for job in active_jobs.values() if job["status"] == "completed"
-    )
-    failed_count = sum(
-        1 for job in active_jobs.values() if job["status"] == "failed"
-    )
+    status_counts = await job_store.count_by_status()
+    pending_count = status_counts.get("pending", 0)
+    running_count = status_counts.get("running", 0)
+    completed_count = status_counts.get("completed", 0)
+    failed_count = status_counts.get("failed", 0)
+    total_count = sum(status_counts.values())
 
     # 서버 시작 시간 (단순화를 위해 현재 세션 시작 시간으로 대체)
     server_start_time = datetime.now()
@@ -1212,7 +2943,38 @@ async def get_server_status():
         active_jobs=pending_count + running_count,
         completed_jobs=completed_count,
         failed_jobs=failed_count,
-        uptime=str(uptime)
+        uptime=str(uptime),
+        queued_jobs=job_queue.depth,
+        running_jobs=job_queue.running,
+        queue_capacity=job_queue.max_size,
+        worker_count=job_queue.worker_count,
+        avg_queue_wait=round(job_queue.avg_wait_time, 3),
+        total_jobs=total_count,
+        evicted_jobs=int(job_reaper.stats["evicted_jobs"]),
+        reclaimed_bytes=int(job_reaper.stats["reclaimed_bytes"]),
+        result_cache_hits=result_cache.hits if result_cache else 0,
+        result_cache_misses=result_cache.misses if result_cache else 0,
+        idempotent_replays=job_dedup.replayed,
+        coalesced_requests=job_dedup.coalesced,
+        generation_mode="process" if generation_pool is not None else "thread",
+        worker_crashes=generation_pool.crashes if generation_pool else 0,
+        rate_limited_requests=client_quotas.rejected if client_quotas else 0,
+        **agent_sessions.stats()
+    )
+
+
+@app.get("/metrics")
+async def get_metrics():
+    """
+    생성 파이프라인 메트릭을 Prometheus 텍스트 노출 형식으로 반환합니다.
+
+    Returns:
+        text/plain; version=0.0.4 형식의 메트릭 응답
+    """
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="메트릭이 비활성화되어 있습니다.")
+    return Response(
+        content=metrics.registry.render(), media_type=metrics.CONTENT_TYPE
     )
 
 
@@ -1231,15 +2993,75 @@ async def root():
                 "method": "POST",
                 "description": "Flutter 앱 생성 요청"
             },
+            {
+                "path": "/generate_apps",
+                "method": "POST",
+                "description": "여러 Flutter 앱 일괄 생성 요청 (JSON 배열 또는 NDJSON)"
+            },
+            {
+                "path": "/batch/{batch_id}",
+                "method": "GET",
+                "description": "배치 상태 및 작업별 상태 조회"
+            },
+            {
+                "path": "/batch/{batch_id}/progress",
+                "method": "GET",
+                "description": "배치 진행률 조회"
+            },
+            {
+                "path": "/batch/{batch_id}",
+                "method": "DELETE",
+                "description": "배치의 끝나지 않은 작업 모두 취소"
+            },
+            {
+                "path": "/download_batch/{batch_id}",
+                "method": "GET",
+                "description": "배치의 모든 앱을 하나의 ZIP으로 다운로드"
+            },
             {
                 "path": "/job/{job_id}",
                 "method": "GET",
                 "description": "특정 작업 상태 조회"
             },
+            {
+                "path": "/job/{job_id}",
+                "method": "DELETE",
+                "description": "작업 취소 (하위 프로세스 종료, 부분 출력 삭제)"
+            },
+            {
+                "path": "/job/{job_id}/spec",
+                "method": "PATCH",
+                "description": "앱 명세 변경 후 바뀐 파일만 다시 생성 (새 버전)"
+            },
+            {
+                "path": "/job/{job_id}/graph",
+                "method": "GET",
+                "description": "작업의 파일 단위 빌드 그래프 조회"
+            },
+            {
+                "path": "/job/{job_id}/trace",
+                "method": "GET",
+                "description": "작업 트레이스 스팬 조회 (format=json 또는 chrome)"
+            },
+            {
+                "path": "/job/{job_id}/events",
+                "method": "GET",
+                "description": "작업 진행 이벤트 스트림 (SSE)"
+            },
             {
                 "path": "/jobs",
                 "method": "GET",
-                "description": "모든 작업 상태 조회"
+                "description": "작업 상태 목록 조회 (status, app_name, since, limit, cursor)"
+            },
+            {
+                "path": "/jobs/status",
+                "method": "POST",
+                "description": "여러 작업 상태 일괄 조회"
+            },
+            {
+                "path": "/jobs/cancel",
+                "method": "POST",
+                "description": "여러 작업 일괄 취소"
             },
             {
                 "path": "/download/{job_id}/{artifact_name}",
@@ -1256,61 +3078,87 @@ async def root():
                 "method": "POST",
                 "description": "기존 Flutter 앱에 안드로이드 빌드 파일 추가"
             },
+            {
+                "path": "/usage",
+                "method": "GET",
+                "description": "요청한 클라이언트의 요청 한도 사용량 조회"
+            },
+            {
+                "path": "/usage/clients",
+                "method": "GET",
+                "description": "모든 클라이언트의 요청 한도 사용량 조회"
+            },
             {
                 "path": "/status",
                 "method": "GET",
                 "description": "서버 상태 조회"
+            },
+            {
+                "path": "/metrics",
+                "method": "GET",
+                "description": "생성 파이프라인 메트릭 (Prometheus 형식)"
             }
         ]
     }
 
 
 @app.post("/generate_android_files/{job_id}")
-async def generate_android_files(job_id: str):
+async def generate_android_files(job_id: str, request: Request):
     """
     기존 Flutter 앱에 안드로이드 빌드 파일을 추가합니다.
     
     Args:
         job_id: 작업 ID
     """
+    client_id, rejection = admit_request(request)
+    if rejection is not None:
+        return rejection
+
     try:
-        # 작업 ID가 유효한지 확인
-        if job_id not in active_jobs:
+        # 작업 상태 갱신 (작업 ID가 유효한지 확인)
+        job_info = await update_job(
+            job_id,
+            status="running",
+            progress=50,
+            message="안드로이드 빌드 파일 생성 중..."
+        )
+        if job_info is None:
             return JSONResponse(
                 status_code=404,
                 content={"error": f"작업 ID {job_id}를 찾을 수 없습니다."}
             )
         
-        # 작업 상태 갱신
-        active_jobs[job_id]["status"] = "running"
-        active_jobs[job_id]["progress"] = 50
-        active_jobs[job_id]["message"] = "안드로이드 빌드 파일 생성 중..."
-        
         # 앱 명세 가져오기
-        app_spec = active_jobs[job_id].get("app_spec", {})
-        folder_name = active_jobs[job_id].get("folder_name", job_id)
+        app_spec = job_info.get("app_spec", {})
+        folder_name = job_info.get("folder_name", job_id)
         
         # 안드로이드 파일 생성 함수 호출
-        await generate_android_build_files(job_id, app_spec, folder_name)
+        with trace_job(job_id, "android_files"):
+            await generate_android_build_files(job_id, app_spec, folder_name)
         
+        job_info = await job_store.get(job_id)
         return {
             "job_id": job_id,
-            "status": active_jobs[job_id]["status"],
-            "progress": active_jobs[job_id]["progress"],
-            "message": active_jobs[job_id]["message"],
-            "artifacts": active_jobs[job_id]["artifacts"]
+            "status": job_info["status"],
+            "progress": job_info["progress"],
+            "message": job_info["message"],
+            "artifacts": job_info["artifacts"]
         }
         
     except Exception as e:
         api_logger.error(f"안드로이드 빌드 파일 생성 중 오류 발생: {str(e)}")
-        if job_id in active_jobs:
-            active_jobs[job_id]["status"] = "failed"
-            active_jobs[job_id]["message"] = f"안드로이드 빌드 파일 생성 중 오류 발생: {str(e)}"
+        await update_job(
+            job_id,
+            status="failed",
+            message=f"안드로이드 빌드 파일 생성 중 오류 발생: {str(e)}"
+        )
         
         return JSONResponse(
             status_code=500,
             content={"error": f"안드로이드 빌드 파일 생성 중 오류 발생: {str(e)}"}
         )
+    finally:
+        release_admission(client_id)
 
 
 async def generate_android_build_files(job_id: str, app_spec: dict, folder_name: str):
@@ -1323,320 +3171,23 @@ async def generate_android_build_files(job_id: str, app_spec: dict, folder_name:
         folder_name: 폴더명
     """
     try:
-        # 앱 이름 가져오기
-        app_name = app_spec.get("app_name", "flutter_app")
-        
         # 출력 디렉토리 설정
         job_output_dir = os.path.join(FLUTTER_OUTPUT_DIR, folder_name)
-        if not os.path.exists(job_output_dir):
-            os.makedirs(job_output_dir, exist_ok=True)
-            api_logger.info(f"작업 디렉토리 생성 완료: {job_output_dir}")
-        
-        # 안드로이드 디렉토리 구조 생성
-        android_dir = os.path.join(job_output_dir, "android")
-        android_app_dir = os.path.join(android_dir, "app")
-        android_app_src_main_dir = os.path.join(android_app_dir, "src", "main")
-        android_app_src_main_kotlin_dir = os.path.join(
-            android_app_src_main_dir, 
-            "kotlin", "com", "example", 
-            app_name.lower().replace('-', '_').replace(' ', '_')
-        )
-        android_app_src_main_res_dir = os.path.join(android_app_src_main_dir, "res")
-        android_app_src_main_res_values_dir = os.path.join(android_app_src_main_res_dir, "values")
-        android_app_src_main_res_drawable_dir = os.path.join(android_app_src_main_res_dir, "drawable")
-        android_app_src_main_res_drawable_v21_dir = os.path.join(android_app_src_main_res_dir, "drawable-v21")
-        android_gradle_wrapper_dir = os.path.join(android_dir, "gradle", "wrapper")
-        
-        # 디렉토리 생성
-        os.makedirs(android_dir, exist_ok=True)
-        os.makedirs(android_app_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_kotlin_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_res_values_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_res_drawable_dir, exist_ok=True)
-        os.makedirs(android_app_src_main_res_drawable_v21_dir, exist_ok=True)
-        os.makedirs(android_gradle_wrapper_dir, exist_ok=True)
-        
-        # 앱 이름을 소문자화하고 공백과 특수문자 제거 (패키지명용)
-        app_name_slug = app_name.lower().replace('-', '_').replace(' ', '_')
-        
-        # 안드로이드 파일 생성 로직 (기존 코드와 동일)
-        # android/build.gradle 파일 생성
-        android_build_gradle_path = os.path.join(android_dir, "build.gradle")
-        android_build_gradle_content = """buildscript {
-    ext.kotlin_version = '1.8.0'
-    repositories {
-        google()
-        mavenCentral()
-    }
-
-    dependencies {
-        classpath 'com.android.tools.build:gradle:7.3.0'
-        classpath "org.jetbrains.kotlin:kotlin-gradle-plugin:$kotlin_version"
-    }
-}
-
-allprojects {
-    repositories {
-        google()
-        mavenCentral()
-    }
-}
-
-rootProject.buildDir = '../build'
-subprojects {
-    project.buildDir = "${rootProject.buildDir}/${project.name}"
-}
-subprojects {
-    project.evaluationDependsOn(':app')
-}
-
-tasks.register("clean", Delete) {
-    delete rootProject.buildDir
-}"""
-        
-        with open(android_build_gradle_path, 'w') as f:
-            f.write(android_build_gradle_content)
-        api_logger.info(f"android/build.gradle 파일 생성 완료: {android_build_gradle_path}")
-        
-        # 나머지 안드로이드 파일 생성 로직 (이미 app.py에 존재하는 코드와 동일)
-        # ...
-        
-        # android/settings.gradle 파일 생성
-        android_settings_gradle_path = os.path.join(android_dir, "settings.gradle")
-        android_settings_gradle_content = """include ':app'
-
-def localPropertiesFile = new File(rootProject.projectDir, "local.properties")
-def properties = new Properties()
-
-assert localPropertiesFile.exists()
-localPropertiesFile.withReader("UTF-8") { reader -> properties.load(reader) }
-
-def flutterSdkPath = properties.getProperty("flutter.sdk")
-assert flutterSdkPath != null, "flutter.sdk not set in local.properties"
-apply from: "$flutterSdkPath/packages/flutter_tools/gradle/app_plugin_loader.gradle" """
-        
-        with open(android_settings_gradle_path, 'w') as f:
-            f.write(android_settings_gradle_content)
-        api_logger.info(f"android/settings.gradle 파일 생성 완료: {android_settings_gradle_path}")
-        
-        # android/local.properties 파일 생성
-        android_local_properties_path = os.path.join(android_dir, "local.properties")
-        android_local_properties_content = "flutter.sdk=/path/to/your/flutter/sdk"
-        
-        with open(android_local_properties_path, 'w') as f:
-            f.write(android_local_properties_content)
-        api_logger.info(f"android/local.properties 파일 생성 완료: {android_local_properties_path}")
-        
-        # android/app/build.gradle 파일 생성
-        android_app_build_gradle_path = os.path.join(android_app_dir, "build.gradle")
-        android_app_build_gradle_content = f"""def localProperties = new Properties()
-def localPropertiesFile = rootProject.file('local.properties')
-if (localPropertiesFile.exists()) {{
-    localPropertiesFile.withReader('UTF-8') {{ reader ->
-        localProperties.load(reader)
-    }}
-}}
-
-def flutterRoot = localProperties.getProperty('flutter.sdk')
-if (flutterRoot == null) {{
-    throw new RuntimeException("Flutter SDK not found. Define location with flutter.sdk in the local.properties file.")
-}}
-
-def flutterVersionCode = localProperties.getProperty('flutter.versionCode')
-if (flutterVersionCode == null) {{
-    flutterVersionCode = '1'
-}}
-
-def flutterVersionName = localProperties.getProperty('flutter.versionName')
-if (flutterVersionName == null) {{
-    flutterVersionName = '1.0'
-}}
-
-apply plugin: 'com.android.application'
-apply plugin: 'kotlin-android'
-apply from: "$flutterRoot/packages/flutter_tools/gradle/flutter.gradle"
-
-android {{
-    compileSdkVersion 33
-    ndkVersion flutter.ndkVersion
-
-    compileOptions {{
-        sourceCompatibility JavaVersion.VERSION_1_8
-        targetCompatibility JavaVersion.VERSION_1_8
-    }}
-
-    kotlinOptions {{
-        jvmTarget = '1.8'
-    }}
-
-    sourceSets {{
-        main.java.srcDirs += 'src/main/kotlin'
-    }}
-
-    defaultConfig {{
-        applicationId "com.example.{app_name_slug}"
-        minSdkVersion 21
-        targetSdkVersion 33
-        versionCode flutterVersionCode.toInteger()
-        versionName flutterVersionName
-    }}
-
-    buildTypes {{
-        release {{
-            signingConfig signingConfigs.debug
-        }}
-    }}
-}}
-
-flutter {{
-    source '../..'
-}}
-
-dependencies {{
-    implementation "org.jetbrains.kotlin:kotlin-stdlib-jdk7:$kotlin_version"
-}}"""
-        
-        with open(android_app_build_gradle_path, 'w') as f:
-            f.write(android_app_build_gradle_content)
-        api_logger.info(f"android/app/build.gradle 파일 생성 완료: {android_app_build_gradle_path}")
-        
-        # android/app/src/main/AndroidManifest.xml 파일 생성
-        android_manifest_path = os.path.join(android_app_src_main_dir, "AndroidManifest.xml")
-        android_manifest_content = f"""<?xml version="1.0" encoding="utf-8"?>
-<manifest xmlns:android="http://schemas.android.com/apk/res/android">
-    <application
-        android:name="${{applicationName}}"
-        android:icon="@mipmap/ic_launcher"
-        android:label="@string/app_name">
-        <activity
-            android:name=".MainActivity"
-            android:configChanges="orientation|keyboardHidden|keyboard|screenSize|smallestScreenSize|locale|layoutDirection|fontScale|screenLayout|density|uiMode"
-            android:exported="true"
-            android:hardwareAccelerated="true"
-            android:launchMode="singleTop"
-            android:theme="@style/LaunchTheme"
-            android:windowSoftInputMode="adjustResize">
-            <meta-data
-                android:name="io.flutter.embedding.android.NormalTheme"
-                android:resource="@style/NormalTheme" />
-            <intent-filter>
-                <action android:name="android.intent.action.MAIN" />
-                <category android:name="android.intent.category.LAUNCHER" />
-            </intent-filter>
-        </activity>
-        <meta-data
-            android:name="flutterEmbedding"
-            android:value="2" />
-    </application>
-</manifest>"""
-        
-        with open(android_manifest_path, 'w') as f:
-            f.write(android_manifest_content)
-        api_logger.info(f"AndroidManifest.xml 파일 생성 완료: {android_manifest_path}")
-        
-        # android/app/src/main/kotlin/com/example/app_name/MainActivity.kt 파일 생성
-        android_main_activity_path = os.path.join(android_app_src_main_kotlin_dir, "MainActivity.kt")
-        android_main_activity_content = f"""package com.example.{app_name_slug}
 
-import io.flutter.embedding.android.FlutterActivity
+        # 파일 렌더링 및 기록은 I/O 실행기에서 수행
+        loop = asyncio.get_running_loop()
+        job_info = await job_store.get(job_id) or {}
+        manifest = dict(job_info.get("manifest") or {})
+        android_files, summary = await loop.run_in_executor(
+            io_executor, run_phase, job_output_dir, "android", app_spec,
+            None, manifest, blob_store
+        )
+        record_phase_summary(summary)
 
-class MainActivity: FlutterActivity() {{
-}}"""
-        
-        with open(android_main_activity_path, 'w') as f:
-            f.write(android_main_activity_content)
-        api_logger.info(f"MainActivity.kt 파일 생성 완료: {android_main_activity_path}")
-        
-        # android/app/src/main/res/values/strings.xml 파일 생성
-        android_strings_path = os.path.join(android_app_src_main_res_values_dir, "strings.xml")
-        android_strings_content = f"""<?xml version="1.0" encoding="utf-8"?>
-<resources>
-    <string name="app_name">{app_name}</string>
-</resources>"""
-        
-        with open(android_strings_path, 'w') as f:
-            f.write(android_strings_content)
-        api_logger.info(f"strings.xml 파일 생성 완료: {android_strings_path}")
-        
-        # android/app/src/main/res/values/styles.xml 파일 생성
-        android_styles_path = os.path.join(android_app_src_main_res_values_dir, "styles.xml")
-        android_styles_content = """<?xml version="1.0" encoding="utf-8"?>
-<resources>
-    <!-- Theme applied to the Android Window while the process is starting when the OS's Dark Mode setting is off -->
-    <style name="LaunchTheme" parent="@android:style/Theme.Light.NoTitleBar">
-        <!-- Show a splash screen on the activity. Automatically removed when
-             the Flutter engine draws its first frame -->
-        <item name="android:windowBackground">@drawable/launch_background</item>
-    </style>
-    <!-- Theme applied to the Android Window as soon as the process has started.
-         This theme determines the color of the Android Window while your
-         Flutter UI initializes, as well as behind your Flutter UI while its
-         running.
-         
-         This Theme is only used starting with V2 of Flutter's Android embedding. -->
-    <style name="NormalTheme" parent="@android:style/Theme.Light.NoTitleBar">
-        <item name="android:windowBackground">?android:colorBackground</item>
-    </style>
-</resources>"""
-        
-        with open(android_styles_path, 'w') as f:
-            f.write(android_styles_content)
-        api_logger.info(f"styles.xml 파일 생성 완료: {android_styles_path}")
-        
-        # android/app/src/main/res/drawable/launch_background.xml 파일 생성
-        android_launch_background_path = os.path.join(android_app_src_main_res_drawable_dir, "launch_background.xml")
-        android_launch_background_content = """<?xml version="1.0" encoding="utf-8"?>
-<layer-list xmlns:android="http://schemas.android.com/apk/res/android">
-    <item android:drawable="@android:color/white" />
-</layer-list>"""
-        
-        with open(android_launch_background_path, 'w') as f:
-            f.write(android_launch_background_content)
-        api_logger.info(f"launch_background.xml 파일 생성 완료: {android_launch_background_path}")
-        
-        # android/app/src/main/res/drawable-v21/launch_background.xml 파일 생성
-        android_launch_background_v21_path = os.path.join(android_app_src_main_res_drawable_v21_dir, "launch_background.xml")
-        android_launch_background_v21_content = """<?xml version="1.0" encoding="utf-8"?>
-<layer-list xmlns:android="http://schemas.android.com/apk/res/android">
-    <item android:drawable="?android:colorBackground" />
-</layer-list>"""
-        
-        with open(android_launch_background_v21_path, 'w') as f:
-            f.write(android_launch_background_v21_content)
-        api_logger.info(f"launch_background_v21.xml 파일 생성 완료: {android_launch_background_v21_path}")
-        
-        # android/gradle/wrapper/gradle-wrapper.properties 파일 생성
-        android_gradle_wrapper_path = os.path.join(android_gradle_wrapper_dir, "gradle-wrapper.properties")
-        android_gradle_wrapper_content = """distributionBase=GRADLE_USER_HOME
-distributionPath=wrapper/dists
-zipStoreBase=GRADLE_USER_HOME
-zipStorePath=wrapper/dists
-distributionUrl=https\\://services.gradle.org/distributions/gradle-7.5-all.zip"""
-        
-        with open(android_gradle_wrapper_path, 'w') as f:
-            f.write(android_gradle_wrapper_content)
-        api_logger.info(f"gradle-wrapper.properties 파일 생성 완료: {android_gradle_wrapper_path}")
-        
-        # 안드로이드 관련 파일 목록
-        android_files = [
-            "android/build.gradle",
-            "android/settings.gradle",
-            "android/local.properties",
-            "android/app/build.gradle",
-            "android/app/src/main/AndroidManifest.xml",
-            f"android/app/src/main/kotlin/com/example/{app_name_slug}/MainActivity.kt",
-            "android/app/src/main/res/values/strings.xml",
-            "android/app/src/main/res/values/styles.xml",
-            "android/app/src/main/res/drawable/launch_background.xml",
-            "android/app/src/main/res/drawable-v21/launch_background.xml",
-            "android/gradle/wrapper/gradle-wrapper.properties"
-        ]
-        
         api_logger.info("안드로이드 파일 생성 완료")
         
         # 기존 아티팩트 목록 가져오기
-        existing_artifacts = active_jobs[job_id].get("artifacts", [])
+        existing_artifacts = job_info.get("artifacts", [])
         
         # 안드로이드 아티팩트 추가
         for android_file in android_files:
@@ -1644,10 +3195,14 @@ distributionUrl=https\\://services.gradle.org/distributions/gradle-7.5-all.zip""
                 existing_artifacts.append(android_file)
         
         # 작업 상태 업데이트
-        active_jobs[job_id]["status"] = "completed"
-        active_jobs[job_id]["progress"] = 100
-        active_jobs[job_id]["message"] = "안드로이드 빌드 파일 생성 완료"
-        active_jobs[job_id]["artifacts"] = existing_artifacts
+        await update_job(
+            job_id,
+            status="completed",
+            progress=100,
+            message="안드로이드 빌드 파일 생성 완료",
+            artifacts=existing_artifacts,
+            manifest=manifest
+        )
         
         return True
     
@@ -1657,9 +3212,11 @@ distributionUrl=https\\://services.gradle.org/distributions/gradle-7.5-all.zip""
         api_logger.error(f"상세 오류: {traceback.format_exc()}")
         
         # 작업 실패 표시
-        if job_id in active_jobs:
-            active_jobs[job_id]["status"] = "failed"
-            active_jobs[job_id]["message"] = f"안드로이드 빌드 파일 생성 중 오류 발생: {str(e)}"
+        await update_job(
+            job_id,
+            status="failed",
+            message=f"안드로이드 빌드 파일 생성 중 오류 발생: {str(e)}"
+        )
         
         return False
 
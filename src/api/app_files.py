@@ -0,0 +1,983 @@
+"""
+Flutter 앱 파일 생성 모듈.
+
+이 모듈은 앱 명세로부터 Flutter 프로젝트 파일 내용을 렌더링하고,
+렌더링된 파일을 디스크에 기록하는 함수를 제공합니다. 파일 기록은
+블로킹 I/O이므로 API 서버에서는 전용 I/O 실행기에서 호출해야 합니다.
+"""
+import hashlib
+import mimetypes
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple
+
+from src.api.blob_store import BlobStore
+from src.config.settings import FILE_IO_WORKERS
+from src.utils.deadlines import Deadline, DeadlineExceededError
+from src.utils.logger import setup_logger
+
+# 파일 생성 로거 설정
+files_logger = setup_logger("app_files")
+
+# 파일 기록 전용 I/O 실행기 (이벤트 루프 블로킹 방지)
+io_executor = ThreadPoolExecutor(
+    max_workers=FILE_IO_WORKERS, thread_name_prefix="file-io"
+)
+
+# 서버가 선점한 출력 디렉토리를 기록하는 표시 파일 디렉토리 (출력 루트 아래).
+# 보존 정책은 표시 파일이 있는 디렉토리만 고아 디렉토리로 정리함
+RESERVATIONS_DIR = ".reservations"
+
+# 생성기 버전 (생성 결과가 바뀌는 변경 시 올려서 결과 캐시를 무효화)
+GENERATOR_VERSION = "1"
+
+# 생성 결과에 영향을 주는 생성기 소스 파일 (결과 캐시 지문에 포함)
+GENERATOR_SOURCES = (os.path.abspath(__file__),)
+
+# 파일 생성 단계 (진행률 계산 순서)
+GENERATION_PHASES = ("models", "pages", "main", "project", "android")
+
+# 진행 메시지에 사용할 단계별 이름
+PHASE_LABELS = {
+    "models": "모델",
+    "pages": "페이지",
+    "main": "메인",
+    "project": "프로젝트 설정",
+    "android": "안드로이드",
+}
+
+
+# 표준 mimetypes에 없는 생성 파일 형식의 Content-Type
+ARTIFACT_CONTENT_TYPES = {
+    ".dart": "text/x-dart",
+    ".py": "text/x-python",
+    ".json": "application/json",
+    ".yaml": "text/yaml",
+    ".yml": "text/yaml",
+    ".md": "text/markdown",
+    ".gradle": "text/x-gradle",
+    ".kt": "text/x-kotlin",
+    ".properties": "text/x-java-properties",
+}
+
+
+# 앱 이름과 무관하게 항상 동일한 안드로이드 빌드 파일 내용
+ANDROID_BUILD_GRADLE = """buildscript {
+    ext.kotlin_version = '1.8.0'
+    repositories {
+        google()
+        mavenCentral()
+    }
+
+    dependencies {
+        classpath 'com.android.tools.build:gradle:7.3.0'
+        classpath "org.jetbrains.kotlin:kotlin-gradle-plugin:$kotlin_version"
+    }
+}
+
+allprojects {
+    repositories {
+        google()
+        mavenCentral()
+    }
+}
+
+rootProject.buildDir = '../build'
+subprojects {
+    project.buildDir = "${rootProject.buildDir}/${project.name}"
+}
+subprojects {
+    project.evaluationDependsOn(':app')
+}
+
+tasks.register("clean", Delete) {
+    delete rootProject.buildDir
+}"""
+
+ANDROID_SETTINGS_GRADLE = """include ':app'
+
+def localPropertiesFile = new File(rootProject.projectDir, "local.properties")
+def properties = new Properties()
+
+assert localPropertiesFile.exists()
+localPropertiesFile.withReader("UTF-8") { reader -> properties.load(reader) }
+
+def flutterSdkPath = properties.getProperty("flutter.sdk")
+assert flutterSdkPath != null, "flutter.sdk not set in local.properties"
+apply from: "$flutterSdkPath/packages/flutter_tools/gradle/app_plugin_loader.gradle" """
+
+ANDROID_LOCAL_PROPERTIES = "flutter.sdk=/path/to/your/flutter/sdk"
+
+ANDROID_MANIFEST = """<?xml version="1.0" encoding="utf-8"?>
+<manifest xmlns:android="http://schemas.android.com/apk/res/android">
+    <application
+        android:name="${applicationName}"
+        android:icon="@mipmap/ic_launcher"
+        android:label="@string/app_name">
+        <activity
+            android:name=".MainActivity"
+            android:configChanges="orientation|keyboardHidden|keyboard|screenSize|smallestScreenSize|locale|layoutDirection|fontScale|screenLayout|density|uiMode"
+            android:exported="true"
+            android:hardwareAccelerated="true"
+            android:launchMode="singleTop"
+            android:theme="@style/LaunchTheme"
+            android:windowSoftInputMode="adjustResize">
+            <meta-data
+                android:name="io.flutter.embedding.android.NormalTheme"
+                android:resource="@style/NormalTheme" />
+            <intent-filter>
+                <action android:name="android.intent.action.MAIN" />
+                <category android:name="android.intent.category.LAUNCHER" />
+            </intent-filter>
+        </activity>
+        <meta-data
+            android:name="flutterEmbedding"
+            android:value="2" />
+    </application>
+</manifest>"""
+
+ANDROID_STYLES = """<?xml version="1.0" encoding="utf-8"?>
+<resources>
+    <!-- Theme applied to the Android Window while the process is starting when the OS's Dark Mode setting is off -->
+    <style name="LaunchTheme" parent="@android:style/Theme.Light.NoTitleBar">
+        <!-- Show a splash screen on the activity. Automatically removed when
+             the Flutter engine draws its first frame -->
+        <item name="android:windowBackground">@drawable/launch_background</item>
+    </style>
+    <!-- Theme applied to the Android Window as soon as the process has started.
+         This theme determines the color of the Android Window while your
+         Flutter UI initializes, as well as behind your Flutter UI while its
+         running.
+         
+         This Theme is only used starting with V2 of Flutter's Android embedding. -->
+    <style name="NormalTheme" parent="@android:style/Theme.Light.NoTitleBar">
+        <item name="android:windowBackground">?android:colorBackground</item>
+    </style>
+</resources>"""
+
+ANDROID_LAUNCH_BACKGROUND = """<?xml version="1.0" encoding="utf-8"?>
+<layer-list xmlns:android="http://schemas.android.com/apk/res/android">
+    <item android:drawable="@android:color/white" />
+</layer-list>"""
+
+ANDROID_LAUNCH_BACKGROUND_V21 = """<?xml version="1.0" encoding="utf-8"?>
+<layer-list xmlns:android="http://schemas.android.com/apk/res/android">
+    <item android:drawable="?android:colorBackground" />
+</layer-list>"""
+
+ANDROID_GRADLE_WRAPPER_PROPERTIES = """distributionBase=GRADLE_USER_HOME
+distributionPath=wrapper/dists
+zipStoreBase=GRADLE_USER_HOME
+zipStorePath=wrapper/dists
+distributionUrl=https\\://services.gradle.org/distributions/gradle-7.5-all.zip"""
+
+
+def app_name_slug(app_name: str) -> str:
+    """
+    앱 이름을 패키지명에 사용할 수 있도록 소문자화하고 공백과 특수문자를 제거합니다.
+
+    Args:
+        app_name: 앱 이름
+
+    Returns:
+        패키지명용 문자열
+    """
+    return app_name.lower().replace('-', '_').replace(' ', '_')
+
+
+def model_file_path(model: Dict[str, Any]) -> str:
+    """모델 명세로 생성되는 Dart 파일의 상대 경로를 반환합니다."""
+    return f"lib/models/{model.get('name', 'Unknown').lower()}.dart"
+
+
+def page_file_path(page_name: str) -> str:
+    """페이지 이름으로 생성되는 Dart 파일의 상대 경로를 반환합니다."""
+    return f"lib/pages/{page_name.lower()}.dart"
+
+
+def first_page_name(app_spec: Dict[str, Any]) -> str:
+    """홈 화면으로 사용할 페이지 이름을 반환합니다. (페이지가 없으면 기본 페이지)"""
+    pages = app_spec.get("pages") or []
+    return pages[0] if pages else "HomePage"
+
+
+def render_model_file(model: Dict[str, Any]) -> str:
+    """
+    모델 명세로부터 Dart 모델 클래스 파일 내용을 생성합니다.
+
+    Args:
+        model: 모델 명세 딕셔너리
+
+    Returns:
+        Dart 파일 내용
+    """
+    model_name = model.get("name", "Unknown")
+    field_definitions = []
+    constructor_params = []
+
+    for field in model.get("fields", []):
+        field_name = field.get("name", "unknown")
+        field_type = field.get("type", "String")
+        nullable = field.get("nullable", True)
+
+        if nullable:
+            field_type = f"{field_type}?"
+            field_definitions.append(f"  {field_type} {field_name};")
+        else:
+            field_definitions.append(
+                f"  final {field_type} {field_name};"
+            )
+
+        constructor_params.append(f"    this.{field_name},")
+
+    return f"""
+class {model_name} {{
+{chr(10).join(field_definitions)}
+
+  {model_name}({{
+{chr(10).join(constructor_params)}
+  }});
+
+  factory {model_name}.fromJson(Map<String, dynamic> json) {{
+    return {model_name}(
+      // TODO: 구현
+    );
+  }}
+
+  Map<String, dynamic> toJson() {{
+    return {{
+      // TODO: 구현
+    }};
+  }}
+}}
+"""
+
+
+def render_page_file(page_name: str) -> str:
+    """
+    페이지 이름으로부터 Dart 페이지 위젯 파일 내용을 생성합니다.
+
+    Args:
+        page_name: 페이지 클래스 이름
+
+    Returns:
+        Dart 파일 내용
+    """
+    return f"""
+import 'package:flutter/material.dart';
+
+class {page_name} extends StatelessWidget {{
+  const {page_name}({{Key? key}}) : super(key: key);
+
+  @override
+  Widget build(BuildContext context) {{
+    return Scaffold(
+      appBar: AppBar(
+        title: const Text('{page_name}'),
+      ),
+      body: const Center(
+        child: Text('This is the {page_name}'),
+      ),
+    );
+  }}
+}}
+"""
+
+
+def render_main_file(app_name: str, first_page: str) -> str:
+    """
+    main.dart 파일 내용을 생성합니다.
+
+    Args:
+        app_name: 앱 이름
+        first_page: 홈 화면으로 사용할 페이지 클래스 이름
+
+    Returns:
+        Dart 파일 내용
+    """
+    return f"""
+import 'package:flutter/material.dart';
+import 'pages/{first_page.lower()}.dart';
+
+void main() {{
+  runApp(const MyApp());
+}}
+
+class MyApp extends StatelessWidget {{
+  const MyApp({{Key? key}}) : super(key: key);
+
+  @override
+  Widget build(BuildContext context) {{
+    return MaterialApp(
+      title: '{app_name}',
+      theme: ThemeData(
+        primarySwatch: Colors.blue,
+      ),
+      home: const {first_page}(),
+    );
+  }}
+}}
+"""
+
+
+def render_pubspec(app_name: str, app_description: str) -> str:
+    """pubspec.yaml 파일 내용을 생성합니다."""
+    return f"""
+name: {app_name}
+description: {app_description}
+version: 1.0.0+1
+
+environment:
+  sdk: ">=3.0.0 <4.0.0"
+
+dependencies:
+  flutter:
+    sdk: flutter
+  cupertino_icons: ^1.0.2
+  provider: ^6.0.5
+  http: ^1.1.0
+  json_annotation: ^4.8.1
+  shared_preferences: ^2.2.0
+
+dev_dependencies:
+  flutter_test:
+    sdk: flutter
+  flutter_lints: ^2.0.0
+  build_runner: ^2.4.6
+  json_serializable: ^6.7.1
+
+flutter:
+  uses-material-design: true
+  assets:
+    - assets/images/
+"""
+
+
+def render_readme(app_name: str, app_description: str) -> str:
+    """README.md 파일 내용을 생성합니다."""
+    return f"""
+# {app_name}
+
+{app_description}
+
+## Getting Started
+
+This is a Flutter application.
+
+### Prerequisites
+
+- Flutter SDK
+- Dart
+
+### Running the application
+
+1. Run `flutter pub get` to install dependencies
+2. Run `flutter run` to start the application
+
+## Features
+
+- [Add your features here]
+"""
+
+
+def render_android_files(app_name: str) -> Dict[str, str]:
+    """
+    안드로이드 빌드 파일 내용을 생성합니다.
+
+    Args:
+        app_name: 앱 이름
+
+    Returns:
+        상대 경로를 키로, 파일 내용을 값으로 하는 딕셔너리
+    """
+    slug = app_name_slug(app_name)
+    main_dir = "android/app/src/main"
+
+    return {
+        "android/build.gradle": ANDROID_BUILD_GRADLE,
+        "android/settings.gradle": ANDROID_SETTINGS_GRADLE,
+        "android/local.properties": ANDROID_LOCAL_PROPERTIES,
+        "android/app/build.gradle": _render_app_build_gradle(slug),
+        f"{main_dir}/AndroidManifest.xml": ANDROID_MANIFEST,
+        f"{main_dir}/kotlin/com/example/{slug}/MainActivity.kt": (
+            _render_main_activity(slug)
+        ),
+        f"{main_dir}/res/values/strings.xml": _render_strings(app_name),
+        f"{main_dir}/res/values/styles.xml": ANDROID_STYLES,
+        f"{main_dir}/res/drawable/launch_background.xml": (
+            ANDROID_LAUNCH_BACKGROUND
+        ),
+        f"{main_dir}/res/drawable-v21/launch_background.xml": (
+            ANDROID_LAUNCH_BACKGROUND_V21
+        ),
+        "android/gradle/wrapper/gradle-wrapper.properties": (
+            ANDROID_GRADLE_WRAPPER_PROPERTIES
+        ),
+    }
+
+
+def _render_app_build_gradle(slug: str) -> str:
+    """android/app/build.gradle 파일 내용을 생성합니다."""
+    return f"""def localProperties = new Properties()
+def localPropertiesFile = rootProject.file('local.properties')
+if (localPropertiesFile.exists()) {{
+    localPropertiesFile.withReader('UTF-8') {{ reader ->
+        localProperties.load(reader)
+    }}
+}}
+
+def flutterRoot = localProperties.getProperty('flutter.sdk')
+if (flutterRoot == null) {{
+    throw new RuntimeException("Flutter SDK not found. Define location with flutter.sdk in the local.properties file.")
+}}
+
+def flutterVersionCode = localProperties.getProperty('flutter.versionCode')
+if (flutterVersionCode == null) {{
+    flutterVersionCode = '1'
+}}
+
+def flutterVersionName = localProperties.getProperty('flutter.versionName')
+if (flutterVersionName == null) {{
+    flutterVersionName = '1.0'
+}}
+
+apply plugin: 'com.android.application'
+apply plugin: 'kotlin-android'
+apply from: "$flutterRoot/packages/flutter_tools/gradle/flutter.gradle"
+
+android {{
+    compileSdkVersion 33
+    ndkVersion flutter.ndkVersion
+
+    compileOptions {{
+        sourceCompatibility JavaVersion.VERSION_1_8
+        targetCompatibility JavaVersion.VERSION_1_8
+    }}
+
+    kotlinOptions {{
+        jvmTarget = '1.8'
+    }}
+
+    sourceSets {{
+        main.java.srcDirs += 'src/main/kotlin'
+    }}
+
+    defaultConfig {{
+        applicationId "com.example.{slug}"
+        minSdkVersion 21
+        targetSdkVersion 33
+        versionCode flutterVersionCode.toInteger()
+        versionName flutterVersionName
+    }}
+
+    buildTypes {{
+        release {{
+            signingConfig signingConfigs.debug
+        }}
+    }}
+}}
+
+flutter {{
+    source '../..'
+}}
+
+dependencies {{
+    implementation "org.jetbrains.kotlin:kotlin-stdlib-jdk7:$kotlin_version"
+}}"""
+
+
+def _render_main_activity(slug: str) -> str:
+    """MainActivity.kt 파일 내용을 생성합니다."""
+    return f"""package com.example.{slug}
+
+import io.flutter.embedding.android.FlutterActivity
+
+class MainActivity: FlutterActivity() {{
+}}"""
+
+
+def _render_strings(app_name: str) -> str:
+    """strings.xml 파일 내용을 생성합니다."""
+    return f"""<?xml version="1.0" encoding="utf-8"?>
+<resources>
+    <string name="app_name">{app_name}</string>
+</resources>"""
+
+
+def _timed_render(
+    renders: Optional[List[Tuple[str, float]]], template: str,
+    func: Callable[..., Any], *args: Any
+) -> Any:
+    """렌더링 함수를 호출하고, renders가 있으면 (템플릿 이름, 소요 시간)을 추가합니다."""
+    if renders is None:
+        return func(*args)
+    started = time.perf_counter()
+    result = func(*args)
+    renders.append((template, time.perf_counter() - started))
+    return result
+
+
+def render_phase(
+    phase: str,
+    app_spec: Dict[str, Any],
+    renders: Optional[List[Tuple[str, float]]] = None,
+    only: Optional[Collection[str]] = None,
+) -> Dict[str, str]:
+    """
+    특정 생성 단계에 해당하는 파일들을 렌더링합니다.
+
+    Args:
+        phase: GENERATION_PHASES 중 하나
+        app_spec: 앱 명세 딕셔너리
+        renders: 지정하면 템플릿별 (이름, 렌더링 시간(초))을 추가할 리스트
+        only: 지정하면 이 상대 경로의 파일만 렌더링 (증분 재생성용)
+
+    Returns:
+        상대 경로를 키로, 파일 내용을 값으로 하는 딕셔너리
+    """
+    app_name = app_spec.get("app_name", "flutter_app")
+    app_description = app_spec.get("description", "Flutter application")
+
+    def wanted(relative_path: str) -> bool:
+        return only is None or relative_path in only
+
+    if phase == "models":
+        return {
+            model_file_path(model):
+                _timed_render(renders, "model", render_model_file, model)
+            for model in app_spec.get("models") or []
+            if wanted(model_file_path(model))
+        }
+    if phase == "pages":
+        return {
+            page_file_path(page_name):
+                _timed_render(renders, "page", render_page_file, page_name)
+            for page_name in app_spec.get("pages") or []
+            if wanted(page_file_path(page_name))
+        }
+    if phase == "main":
+        if not wanted("lib/main.dart"):
+            return {}
+        return {"lib/main.dart": _timed_render(
+            renders, "main", render_main_file, app_name, first_page_name(app_spec)
+        )}
+    if phase == "project":
+        files = {}
+        if wanted("pubspec.yaml"):
+            files["pubspec.yaml"] = _timed_render(
+                renders, "pubspec", render_pubspec, app_name, app_description
+            )
+        if wanted("README.md"):
+            files["README.md"] = _timed_render(
+                renders, "readme", render_readme, app_name, app_description
+            )
+        return files
+    if phase == "android":
+        # 안드로이드 파일은 한 번에 렌더링하므로 필요한 파일만 골라냄
+        files = _timed_render(renders, "android", render_android_files, app_name)
+        return {path: content for path, content in files.items() if wanted(path)}
+
+    raise ValueError(f"알 수 없는 생성 단계: {phase}")
+
+
+def artifact_content_type(relative_path: str) -> str:
+    """
+    아티팩트 경로의 확장자로 Content-Type을 결정합니다.
+
+    Args:
+        relative_path: 아티팩트 상대 경로
+
+    Returns:
+        Content-Type 문자열 (알 수 없으면 application/octet-stream)
+    """
+    extension = os.path.splitext(relative_path)[1].lower()
+    if extension in ARTIFACT_CONTENT_TYPES:
+        return ARTIFACT_CONTENT_TYPES[extension]
+    content_type, _ = mimetypes.guess_type(relative_path)
+    return content_type or "application/octet-stream"
+
+
+def manifest_entry(data: bytes, digest: Optional[str] = None) -> Dict[str, Any]:
+    """
+    기록된 파일 하나의 매니페스트 항목을 만듭니다.
+
+    Args:
+        data: 파일 내용
+        digest: 이미 계산한 내용 해시 (없으면 계산)
+
+    Returns:
+        {"size": 바이트 수, "sha256": 내용 해시}
+    """
+    return {
+        "size": len(data),
+        "sha256": digest or hashlib.sha256(data).hexdigest(),
+    }
+
+
+def reserve_output_dir(root: str, folder_name: str) -> str:
+    """
+    작업 출력 디렉토리를 만들어 이름을 선점합니다. (블로킹 I/O)
+
+    같은 이름의 디렉토리가 이미 있으면 -2, -3, ... 접미사를 붙입니다.
+    같은 시각에 제출된 같은 이름의 앱이 서로의 출력을 덮어쓰지 않게 합니다.
+    선점한 디렉토리는 RESERVATIONS_DIR에 표시 파일을 남겨, 보존 정책이 서버가
+    만들지 않은 디렉토리를 지우지 않게 합니다.
+
+    Args:
+        root: 출력 루트 디렉토리
+        folder_name: 원하는 폴더명
+
+    Returns:
+        실제로 만든 폴더명
+    """
+    os.makedirs(os.path.join(root, RESERVATIONS_DIR), exist_ok=True)
+    candidate = folder_name
+    suffix = 1
+    while True:
+        try:
+            os.mkdir(os.path.join(root, candidate))
+            break
+        except FileExistsError:
+            suffix += 1
+            candidate = f"{folder_name}-{suffix}"
+
+    # 서버가 만든 디렉토리임을 출력 트리 밖의 표시 파일로 기록
+    open(reservation_marker(root, candidate), "w").close()
+    return candidate
+
+
+def reservation_marker(root: str, folder_name: str) -> str:
+    """선점한 출력 디렉토리의 표시 파일 경로를 반환합니다."""
+    return os.path.join(root, RESERVATIONS_DIR, folder_name)
+
+
+def release_output_dir(root: str, folder_name: str) -> None:
+    """선점했지만 사용하지 않은 작업 출력 디렉토리를 삭제합니다. (블로킹 I/O)"""
+    shutil.rmtree(os.path.join(root, folder_name), ignore_errors=True)
+    try:
+        os.remove(reservation_marker(root, folder_name))
+    except FileNotFoundError:
+        pass
+
+
+def retire_output_dir(
+    root: str, folder_name: str, archive_path: Optional[str] = None
+) -> None:
+    """
+    작업 레코드에서 빠진 출력 디렉토리와 아카이브를 정리 대상으로 넘깁니다. (블로킹 I/O)
+
+    보존 정책은 수정 시각으로 유예 시간을 재므로, 디렉토리와 표시 파일,
+    아카이브의 수정 시각을 지금으로 바꿔 RETENTION_ORPHAN_GRACE가 이 시점부터
+    적용되게 합니다. 표시 파일이 없는 디렉토리(표시 파일 도입 전 출력)에는
+    표시 파일을 만듭니다.
+
+    Args:
+        root: 출력 루트 디렉토리
+        folder_name: 빠진 폴더명
+        archive_path: 빠진 ZIP 아카이브 경로 (없으면 None)
+    """
+    path = os.path.join(root, folder_name)
+    if os.path.isdir(path):
+        os.makedirs(os.path.join(root, RESERVATIONS_DIR), exist_ok=True)
+        marker = reservation_marker(root, folder_name)
+        open(marker, "a").close()
+        os.utime(marker)
+        os.utime(path)
+    if archive_path:
+        try:
+            os.utime(archive_path)
+        except FileNotFoundError:
+            pass
+
+
+def prepare_output_dir(output_dir: str) -> None:
+    """
+    앱 출력 디렉토리와 기본 lib 디렉토리 구조를 생성합니다. (블로킹 I/O)
+
+    Args:
+        output_dir: 앱 출력 디렉토리
+    """
+    os.makedirs(os.path.join(output_dir, "lib", "models"), exist_ok=True)
+    os.makedirs(os.path.join(output_dir, "lib", "pages"), exist_ok=True)
+
+
+def write_files(
+    output_dir: str,
+    files: Dict[str, str],
+    on_written: Optional[Callable[[str], None]] = None,
+    manifest: Optional[Dict[str, Dict[str, Any]]] = None,
+    blobs: Optional[BlobStore] = None,
+    deadline: Optional[Deadline] = None,
+) -> List[str]:
+    """
+    렌더링된 파일들을 출력 디렉토리에 기록합니다. (블로킹 I/O)
+
+    Args:
+        output_dir: 앱 출력 디렉토리
+        files: 상대 경로를 키로, 파일 내용을 값으로 하는 딕셔너리
+        on_written: 파일 하나를 기록할 때마다 상대 경로로 호출할 함수
+        manifest: 상대 경로별 매니페스트 항목을 채울 딕셔너리
+        blobs: 지정하면 내용을 블롭 저장소에 한 번만 저장하고 하드링크로 배치
+        deadline: 지정하면 파일을 기록하기 전마다 제한 시간을 확인
+
+    Returns:
+        기록된 파일의 상대 경로 목록
+
+    Raises:
+        DeadlineExceededError: 모든 파일을 기록하기 전에 제한 시간이 지난 경우
+            (이미 기록한 파일 목록을 completed에 담음)
+    """
+    created_dirs = set()
+    written = []
+
+    for relative_path, content in files.items():
+        if deadline is not None and deadline.expired():
+            raise DeadlineExceededError(
+                deadline.name, written, len(files) - len(written)
+            )
+        file_path = os.path.join(output_dir, relative_path)
+        parent_dir = os.path.dirname(file_path)
+        if parent_dir not in created_dirs:
+            os.makedirs(parent_dir, exist_ok=True)
+            created_dirs.add(parent_dir)
+
+        data = content.encode("utf-8")
+        digest = None
+        if blobs is not None:
+            digest = blobs.store(data, file_path)
+        else:
+            with open(file_path, 'wb') as f:
+                f.write(data)
+        files_logger.debug(f"파일 쓰기 성공: {file_path}")
+        written.append(relative_path)
+        if manifest is not None:
+            manifest[relative_path] = manifest_entry(data, digest)
+        if on_written is not None:
+            on_written(relative_path)
+
+    return written
+
+
+def materialize_phase(
+    output_dir: str,
+    phase: str,
+    app_spec: Dict[str, Any],
+    on_written: Optional[Callable[[str], None]] = None,
+    manifest: Optional[Dict[str, Dict[str, Any]]] = None,
+    blobs: Optional[BlobStore] = None,
+    renders: Optional[List[Tuple[str, float]]] = None,
+    deadline: Optional[Deadline] = None,
+    only: Optional[Collection[str]] = None,
+) -> List[str]:
+    """
+    한 생성 단계의 파일을 렌더링하고 디스크에 기록합니다. (블로킹 I/O)
+
+    Args:
+        output_dir: 앱 출력 디렉토리
+        phase: GENERATION_PHASES 중 하나
+        app_spec: 앱 명세 딕셔너리
+        on_written: 파일 하나를 기록할 때마다 상대 경로로 호출할 함수
+        manifest: 상대 경로별 매니페스트 항목을 채울 딕셔너리
+        blobs: 지정하면 내용을 블롭 저장소에 한 번만 저장하고 하드링크로 배치
+        renders: 지정하면 템플릿별 (이름, 렌더링 시간(초))을 추가할 리스트
+        deadline: 지정하면 파일을 기록하기 전마다 제한 시간을 확인
+        only: 지정하면 이 상대 경로의 파일만 생성 (증분 재생성용)
+
+    Returns:
+        기록된 파일의 상대 경로 목록
+
+    Raises:
+        DeadlineExceededError: 모든 파일을 기록하기 전에 제한 시간이 지난 경우
+    """
+    return write_files(
+        output_dir, render_phase(phase, app_spec, renders, only), on_written,
+        manifest, blobs, deadline
+    )
+
+
+def run_phase(
+    output_dir: str,
+    phase: str,
+    app_spec: Dict[str, Any],
+    on_written: Optional[Callable[[str], None]] = None,
+    manifest: Optional[Dict[str, Dict[str, Any]]] = None,
+    blobs: Optional[BlobStore] = None,
+    deadline: Optional[Deadline] = None,
+    only: Optional[Collection[str]] = None,
+) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    한 생성 단계를 실행하고 단계 완료 메시지(phase_done) 내용을 함께 반환합니다.
+    (블로킹 I/O)
+
+    워커 프로세스나 I/O 실행기 스레드에서 생성해도 서버가 메트릭과 트레이스를
+    기록할 수 있도록, 단계를 실행한 스레드에서 측정한 시작 시각, 소요 시간,
+    CPU 시간, 기록한 바이트 수, 템플릿별 렌더링 시간을 담습니다.
+
+    기록 중인 파일은 중단할 수 없으므로 제한 시간은 파일 사이에서 확인합니다.
+    제한 시간이 지나면 남은 파일을 기록하지 않고, 완료 메시지에
+    "timed_out": True와 기록하지 못한 파일 수("skipped")를 담아 반환합니다.
+
+    Args:
+        output_dir: 앱 출력 디렉토리
+        phase: GENERATION_PHASES 중 하나
+        app_spec: 앱 명세 딕셔너리
+        on_written: 파일 하나를 기록할 때마다 상대 경로로 호출할 함수
+        manifest: 상대 경로별 매니페스트 항목을 채울 딕셔너리
+        blobs: 지정하면 내용을 블롭 저장소에 한 번만 저장하고 하드링크로 배치
+        deadline: 단계 데드라인
+        only: 지정하면 이 상대 경로의 파일만 생성 (증분 재생성용)
+
+    Returns:
+        (기록된 파일의 상대 경로 목록,
+         {"phase", "count", "bytes", "started", "seconds", "cpu", "renders",
+          "worker"[, "timed_out", "skipped"]})
+    """
+    manifest = manifest if manifest is not None else {}
+    renders: List[Tuple[str, float]] = []
+    started_at = time.time()
+    started = time.perf_counter()
+    cpu_started = time.thread_time()
+    timeout: Optional[DeadlineExceededError] = None
+    try:
+        written = materialize_phase(
+            output_dir, phase, app_spec, on_written, manifest, blobs, renders,
+            deadline, only
+        )
+    except DeadlineExceededError as e:
+        files_logger.warning(
+            f"단계 제한 시간 초과: {phase}, 기록하지 못한 파일 {e.pending}개"
+        )
+        written, timeout = e.completed, e
+    summary = {
+        "phase": phase,
+        "count": len(written),
+        "bytes": sum(manifest[path]["size"] for path in written if path in manifest),
+        "started": started_at,
+        "seconds": time.perf_counter() - started,
+        "cpu": time.thread_time() - cpu_started,
+        "renders": renders,
+        "worker": f"pid {os.getpid()} {threading.current_thread().name}",
+    }
+    if timeout is not None:
+        summary.update(timed_out=True, skipped=timeout.pending)
+    return written, summary
+
+
+def generate_app_output(
+    output_dir: str,
+    app_spec: Dict[str, Any],
+    blobs_root: Optional[str] = None,
+    job_timeout: Optional[float] = None,
+    phase_timeouts: Optional[Dict[str, Optional[float]]] = None,
+    report: Optional[Callable[[str, Any], None]] = None,
+) -> Tuple[Dict[str, List[str]], Dict[str, Dict[str, Any]]]:
+    """
+    모든 생성 단계의 파일을 렌더링하고 기록합니다. (블로킹 I/O, 워커 프로세스용)
+
+    진행 상황은 report로 알립니다.
+
+    - ("phase", {"phase"}): 단계 시작
+    - ("artifact", {"phase", "path"}): 파일 하나 기록
+    - ("phase_done", {"phase", "count", "bytes", ...}): 단계 완료 (run_phase() 참고)
+
+    제한 시간은 프로세스마다 단조 시계가 다를 수 있으므로 만료 시각 대신 남은
+    시간(초)으로 받아 워커에서 데드라인을 만듭니다.
+
+    Args:
+        output_dir: 앱 출력 디렉토리
+        app_spec: 앱 명세 딕셔너리
+        blobs_root: 블롭 저장소 디렉토리 (없으면 파일을 직접 기록)
+        job_timeout: 작업의 남은 제한 시간(초, None이면 제한 없음)
+        phase_timeouts: 단계 이름별 제한 시간(초)
+        report: 진행 메시지를 받을 함수
+
+    Returns:
+        (단계별 기록된 파일 목록, 상대 경로별 매니페스트 항목)
+    """
+    report = report or (lambda event, payload: None)
+    blobs = BlobStore(blobs_root) if blobs_root else None
+    job_deadline = Deadline("job", job_timeout)
+    phase_timeouts = phase_timeouts or {}
+    prepare_output_dir(output_dir)
+
+    written: Dict[str, List[str]] = {}
+    manifest: Dict[str, Dict[str, Any]] = {}
+    for phase in GENERATION_PHASES:
+        report("phase", {"phase": phase})
+        written[phase], summary = run_phase(
+            output_dir, phase, app_spec,
+            lambda path, phase=phase: report(
+                "artifact", {"phase": phase, "path": path}
+            ),
+            manifest, blobs,
+            Deadline(phase, phase_timeouts.get(phase), job_deadline)
+        )
+        report("phase_done", summary)
+    return written, manifest
+
+
+def clone_output(
+    source_dir: str,
+    output_dir: str,
+    manifest: Dict[str, Dict[str, Any]],
+    blobs: Optional[BlobStore] = None,
+) -> None:
+    """
+    다른 작업의 출력 트리를 새 출력 디렉토리에 배치합니다. (블로킹 I/O)
+
+    블롭 저장소에 있는 파일은 블롭을 하드링크하고, 없으면 원본 파일을
+    하드링크하거나 복사합니다.
+
+    Args:
+        source_dir: 원본 작업의 출력 디렉토리
+        output_dir: 새 출력 디렉토리
+        manifest: 원본 작업의 매니페스트
+        blobs: 블롭 저장소
+
+    Raises:
+        OSError: 원본 파일을 찾을 수 없는 경우
+    """
+    if os.path.abspath(source_dir) == os.path.abspath(output_dir):
+        return
+
+    for relative_path, entry in manifest.items():
+        file_path = os.path.join(output_dir, relative_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        if blobs is not None and blobs.exists(entry["sha256"]):
+            try:
+                blobs.link(entry["sha256"], file_path)
+                continue
+            except FileNotFoundError:
+                pass
+
+        source_path = os.path.join(source_dir, relative_path)
+        temp_path = f"{file_path}.{os.getpid()}.tmp"
+        try:
+            os.link(source_path, temp_path)
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(source_path, temp_path)
+        os.replace(temp_path, file_path)
+
+
+def order_artifacts(written: Dict[str, List[str]]) -> List[str]:
+    """
+    단계별로 기록된 파일 목록을 작업 아티팩트 목록 순서로 정렬합니다.
+
+    Args:
+        written: 단계 이름을 키로, 기록된 파일 목록을 값으로 하는 딕셔너리
+
+    Returns:
+        main.dart, pubspec.yaml, README.md, 모델, 페이지, 안드로이드 파일 순의 목록
+    """
+    return (
+        written.get("main", [])
+        + written.get("project", [])
+        + written.get("models", [])
+        + written.get("pages", [])
+        + written.get("android", [])
+    )
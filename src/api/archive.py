@@ -0,0 +1,485 @@
+"""
+앱 출력 디렉토리 ZIP 아카이브 캐시 구현.
+
+이 모듈은 작업 출력 디렉토리를 ZIP으로 압축하면서 동시에 응답으로 스트리밍하고,
+완성된 아카이브를 출력 트리의 내용 해시로 캐시하는 ArchiveCache를 제공합니다.
+
+압축 스레드는 임시 파일에 앞에서부터 순서대로(seek 없이) 기록하고, 응답은
+기록된 만큼 파일을 읽어 전송합니다. 따라서 느린 클라이언트가 압축을 막지 않고,
+같은 아카이브를 동시에 요청한 클라이언트들은 하나의 압축 작업을 공유합니다.
+압축을 워커 프로세스 풀에서 실행하는 경우에도 같은 임시 파일을 사용하며,
+기록된 크기는 프로세스 간 진행 메시지로 전달됩니다.
+아카이브 내용은 파일 내용만으로 결정되므로(고정된 파일 시각/권한) 같은 해시의
+아카이브는 항상 같은 바이트를 가지며, 해시를 ETag로 사용할 수 있습니다.
+"""
+import asyncio
+import hashlib
+import os
+import time
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from src.api.process_pool import ProcessWorkerPool
+from src.utils import metrics
+from src.utils.logger import setup_logger
+
+# 아카이브 로거 설정
+archive_logger = setup_logger("archive")
+
+# 아카이브 형식 버전 (형식이 바뀌면 캐시 키가 달라지도록 해시에 포함)
+ARCHIVE_FORMAT_VERSION = "zip-v1"
+
+# 재현 가능한 아카이브를 위한 고정 파일 시각과 권한
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+ZIP_FILE_MODE = 0o644 << 16
+
+# 파일 읽기/전송 단위
+ARCHIVE_CHUNK_SIZE = 64 * 1024
+
+# 출력 트리 (상대 경로, 크기, 수정 시각) 목록
+TreeSignature = Tuple[Tuple[str, int, int], ...]
+
+
+def is_archive_name(name: str) -> bool:
+    """파일 이름이 아카이브 캐시가 만든 아카이브(<내용 해시>.zip)인지 확인합니다."""
+    digest, extension = os.path.splitext(name)
+    return (
+        extension == ".zip" and len(digest) == 64
+        and all(c in "0123456789abcdef" for c in digest)
+    )
+
+
+def tree_signature(output_dir: str) -> TreeSignature:
+    """
+    출력 디렉토리의 파일 목록과 크기, 수정 시각을 수집합니다. (블로킹 I/O)
+
+    Args:
+        output_dir: 앱 출력 디렉토리
+
+    Returns:
+        상대 경로 순으로 정렬된 (상대 경로, 크기, 수정 시각 ns) 튜플
+    """
+    entries = []
+    for root, _, files in os.walk(output_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            relative_path = os.path.relpath(path, output_dir).replace(os.sep, "/")
+            entries.append((relative_path, stat.st_size, stat.st_mtime_ns))
+    entries.sort()
+    return tuple(entries)
+
+
+def combined_signature(root: str, folders: List[str]) -> TreeSignature:
+    """
+    여러 출력 디렉토리를 폴더명 아래에 모은 트리 시그니처를 수집합니다. (블로킹 I/O)
+
+    Args:
+        root: 출력 디렉토리들의 상위 디렉토리
+        folders: 포함할 폴더명 목록
+
+    Returns:
+        "폴더명/상대 경로" 순으로 정렬된 (상대 경로, 크기, 수정 시각 ns) 튜플
+    """
+    entries = []
+    for folder in folders:
+        for relative_path, size, mtime in tree_signature(os.path.join(root, folder)):
+            entries.append((f"{folder}/{relative_path}", size, mtime))
+    entries.sort()
+    return tuple(entries)
+
+
+def tree_digest(
+    output_dir: str,
+    signature: TreeSignature,
+    manifest: Optional[Dict[str, Dict]] = None,
+) -> str:
+    """
+    출력 트리의 내용 해시(SHA-256)를 계산합니다. (블로킹 I/O)
+
+    Args:
+        output_dir: 앱 출력 디렉토리
+        signature: tree_signature()의 결과
+        manifest: 작업 매니페스트 (크기가 같은 파일은 기록된 해시를 사용)
+
+    Returns:
+        16진수 해시 문자열
+    """
+    manifest = manifest or {}
+    digest = hashlib.sha256(ARCHIVE_FORMAT_VERSION.encode("utf-8"))
+    for relative_path, size, _ in signature:
+        entry = manifest.get(relative_path)
+        if entry is not None and entry.get("size") == size:
+            file_digest = bytes.fromhex(entry["sha256"])
+        else:
+            file_hash = hashlib.sha256()
+            with open(os.path.join(output_dir, relative_path), "rb") as f:
+                for chunk in iter(lambda: f.read(ARCHIVE_CHUNK_SIZE), b""):
+                    file_hash.update(chunk)
+            file_digest = file_hash.digest()
+        digest.update(relative_path.encode("utf-8") + b"\0")
+        digest.update(file_digest)
+    return digest.hexdigest()
+
+
+class _AppendOnlyWriter:
+    """
+    ZIP 기록용 파일 래퍼.
+
+    tell/seek을 제공하지 않아 zipfile이 데이터 디스크립터를 사용하는 스트리밍
+    모드로 기록하도록 하고, 기록한 바이트 수를 주기적으로 알립니다.
+    """
+
+    def __init__(self, fileobj, on_progress, notify_every: int):
+        self._file = fileobj
+        self._on_progress = on_progress
+        self._notify_every = notify_every
+        self.written = 0
+        self._notified = 0
+
+    def write(self, data) -> int:
+        self._file.write(data)
+        self.written += len(data)
+        if self.written - self._notified >= self._notify_every:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        self._file.flush()
+        if self.written != self._notified:
+            self._notified = self.written
+            self._on_progress(self.written)
+
+
+class _ArchiveBuild:
+    """진행 중인 아카이브 압축 상태 (이벤트 루프에서만 접근)"""
+
+    def __init__(self, temp_path: str):
+        self.temp_path = temp_path
+        self.written = 0
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.changed = asyncio.Event()
+        self.finished = asyncio.Event()
+
+    def progress(self, written: int):
+        self.written = max(self.written, written)
+        self.changed.set()
+
+    def finish(self, error: Optional[BaseException] = None):
+        self.done = True
+        self.error = error
+        self.changed.set()
+        self.finished.set()
+
+
+def write_archive(
+    output_dir: str, signature: TreeSignature, fileobj, on_progress,
+    chunk_size: int = ARCHIVE_CHUNK_SIZE
+):
+    """
+    출력 디렉토리를 재현 가능한 ZIP으로 압축하여 기록합니다. (블로킹 I/O)
+
+    Args:
+        output_dir: 앱 출력 디렉토리
+        signature: 압축할 파일 목록 (tree_signature()의 결과)
+        fileobj: 기록할 파일 객체
+        on_progress: 기록된 바이트 수를 받을 함수
+        chunk_size: 진행 알림 단위(바이트)
+    """
+    writer = _AppendOnlyWriter(fileobj, on_progress, chunk_size)
+    with zipfile.ZipFile(writer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for relative_path, _, _ in signature:
+            info = zipfile.ZipInfo(relative_path, date_time=ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = ZIP_FILE_MODE
+            with open(os.path.join(output_dir, relative_path), "rb") as src, \
+                    zip_file.open(info, "w") as dst:
+                for chunk in iter(lambda: src.read(chunk_size), b""):
+                    dst.write(chunk)
+    writer.flush()
+
+
+def write_archive_file(
+    output_dir: str, signature: TreeSignature, temp_path: str, final_path: str,
+    chunk_size: int = ARCHIVE_CHUNK_SIZE, report=None
+):
+    """
+    미리 만든 임시 파일에 아카이브를 기록하고 최종 경로로 옮깁니다.
+    (블로킹 I/O, 워커 프로세스용)
+
+    Args:
+        output_dir: 앱 출력 디렉토리
+        signature: 압축할 파일 목록
+        temp_path: 기록할 임시 파일 (서버 프로세스가 미리 생성)
+        final_path: 완성된 아카이브 경로
+        chunk_size: 진행 알림 단위(바이트)
+        report: ("written", 기록된 바이트 수) 진행 메시지를 받을 함수
+    """
+    with open(temp_path, "r+b") as f:
+        write_archive(
+            output_dir, signature, f,
+            lambda written: report("written", written) if report else None,
+            chunk_size
+        )
+    os.replace(temp_path, final_path)
+
+
+class ArchiveCache:
+    """내용 해시로 키가 지정된 ZIP 아카이브 캐시"""
+
+    def __init__(
+        self,
+        archives_dir: str,
+        compress_executor: Optional[Executor] = None,
+        io_executor: Optional[Executor] = None,
+        digest_cache_size: int = 1024,
+        chunk_size: int = ARCHIVE_CHUNK_SIZE,
+        process_pool: Optional[ProcessWorkerPool] = None,
+    ):
+        """
+        Args:
+            archives_dir: 아카이브를 저장할 디렉토리
+            compress_executor: 압축을 실행할 실행기
+            io_executor: 해시 계산과 파일 읽기를 실행할 실행기
+            digest_cache_size: 출력 디렉토리별 해시를 기억할 최대 개수
+            chunk_size: 전송 단위(바이트)
+            process_pool: 지정하면 압축을 compress_executor 대신 워커 프로세스에서 실행
+        """
+        self.archives_dir = archives_dir
+        self.compress_executor = compress_executor
+        self.process_pool = process_pool
+        self.io_executor = io_executor
+        self.digest_cache_size = digest_cache_size
+        self.chunk_size = chunk_size
+
+        # 출력 디렉토리 -> (트리 시그니처, 내용 해시)
+        self._digests: "OrderedDict[str, Tuple[TreeSignature, str]]" = OrderedDict()
+        # 내용 해시 -> 진행 중인 압축
+        self._builds: Dict[str, _ArchiveBuild] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def archive_path(self, digest: str) -> str:
+        """내용 해시에 해당하는 아카이브 경로를 반환합니다."""
+        return os.path.join(self.archives_dir, f"{digest}.zip")
+
+    async def _run_io(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.io_executor, func, *args)
+
+    async def digest(
+        self,
+        output_dir: str,
+        manifest: Optional[Dict[str, Dict]] = None,
+        folders: Optional[List[str]] = None,
+    ) -> Tuple[str, TreeSignature]:
+        """
+        출력 트리의 내용 해시를 계산합니다. 파일 목록/크기/수정 시각이 그대로면
+        이전에 계산한 해시를 재사용합니다.
+
+        Args:
+            output_dir: 앱 출력 디렉토리 (folders 지정 시 상위 디렉토리)
+            manifest: 작업 매니페스트 (기록된 파일 해시를 재사용하여 파일 읽기 생략)
+            folders: 지정하면 output_dir 아래 이 폴더들을 하나의 아카이브로 묶음
+
+        Returns:
+            (내용 해시, 트리 시그니처)
+        """
+        if folders is None:
+            cache_key = output_dir
+            signature = await self._run_io(tree_signature, output_dir)
+        else:
+            cache_key = "\0".join([output_dir, *folders])
+            signature = await self._run_io(combined_signature, output_dir, folders)
+
+        cached = self._digests.get(cache_key)
+        if cached is not None and cached[0] == signature:
+            self._digests.move_to_end(cache_key)
+            return cached[1], signature
+
+        digest = await self._run_io(tree_digest, output_dir, signature, manifest)
+        self._digests[cache_key] = (signature, digest)
+        self._digests.move_to_end(cache_key)
+        while len(self._digests) > self.digest_cache_size:
+            self._digests.popitem(last=False)
+        return digest, signature
+
+    def cached(self, digest: str) -> Optional[str]:
+        """완성된 아카이브가 있으면 경로를 반환합니다."""
+        path = self.archive_path(digest)
+        if digest not in self._builds and os.path.isfile(path):
+            self.hits += 1
+            return path
+        return None
+
+    def _start_build(
+        self, output_dir: str, digest: str, signature: TreeSignature
+    ) -> _ArchiveBuild:
+        """아카이브 압축을 시작하거나 진행 중인 압축을 반환합니다."""
+        build = self._builds.get(digest)
+        if build is not None:
+            return build
+
+        self.misses += 1
+        os.makedirs(self.archives_dir, exist_ok=True)
+        final_path = self.archive_path(digest)
+        temp_path = f"{final_path}.{os.getpid()}.partial"
+        build = _ArchiveBuild(temp_path)
+        self._builds[digest] = build
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        # 응답이 바로 읽을 수 있도록 임시 파일을 먼저 생성
+        temp_file = open(temp_path, "wb")
+
+        def compress():
+            with temp_file as f:
+                write_archive(
+                    output_dir, signature, f,
+                    lambda written: loop.call_soon_threadsafe(
+                        build.progress, written
+                    ),
+                    self.chunk_size
+                )
+            os.replace(temp_path, final_path)
+
+        def on_done(future):
+            self._builds.pop(digest, None)
+            error = future.exception()
+            if error is not None:
+                archive_logger.error(f"아카이브 생성 실패: {digest}, {str(error)}")
+                try:
+                    os.remove(temp_path)
+                except OSError:
+                    pass
+            else:
+                metrics.archive_build_seconds.observe(time.perf_counter() - started)
+                try:
+                    metrics.archive_size_bytes.observe(os.path.getsize(final_path))
+                except OSError:
+                    pass
+            build.finish(error)
+
+        if self.process_pool is not None:
+            # 워커 프로세스가 같은 임시 파일에 기록하고 기록한 크기를 진행 메시지로 보냄
+            temp_file.close()
+            future = asyncio.ensure_future(self.process_pool.run(
+                f"archive-{digest}", write_archive_file,
+                output_dir, signature, temp_path, final_path, self.chunk_size,
+                on_progress=lambda event, written: build.progress(written)
+            ))
+        else:
+            future = loop.run_in_executor(self.compress_executor, compress)
+        future.add_done_callback(on_done)
+        return build
+
+    async def build(
+        self, output_dir: str, digest: str, signature: TreeSignature
+    ) -> str:
+        """
+        아카이브를 완성될 때까지 생성하고 경로를 반환합니다.
+
+        Args:
+            output_dir: 앱 출력 디렉토리
+            digest: 내용 해시
+            signature: 트리 시그니처
+
+        Returns:
+            완성된 아카이브 경로
+        """
+        path = self.cached(digest)
+        if path is not None:
+            return path
+
+        build = self._start_build(output_dir, digest, signature)
+        await build.finished.wait()
+        if build.error is not None:
+            raise build.error
+        return self.archive_path(digest)
+
+    async def stream(
+        self, output_dir: str, digest: str, signature: TreeSignature
+    ) -> AsyncIterator[bytes]:
+        """
+        아카이브를 압축하면서 기록된 부분부터 순서대로 전송합니다.
+
+        Args:
+            output_dir: 앱 출력 디렉토리
+            digest: 내용 해시
+            signature: 트리 시그니처
+
+        Yields:
+            아카이브 바이트 청크
+        """
+        build = self._start_build(output_dir, digest, signature)
+        try:
+            # 압축 중 파일 (완료되어 이름이 바뀌어도 열린 파일은 계속 읽을 수 있음)
+            f = open(build.temp_path, "rb")
+        except FileNotFoundError:
+            # 이미 압축이 끝나 이름이 바뀐 경우 완성된 파일을 전송
+            await build.finished.wait()
+            if build.error is not None:
+                raise build.error
+            async for chunk in self._read_file(self.archive_path(digest)):
+                yield chunk
+            return
+
+        with f:
+            offset = 0
+            while True:
+                if offset < build.written:
+                    size = min(self.chunk_size, build.written - offset)
+                    chunk = await self._run_io(f.read, size)
+                    offset += len(chunk)
+                    yield chunk
+                    continue
+                if build.done:
+                    if build.error is not None:
+                        raise build.error
+                    return
+                build.changed.clear()
+                if offset < build.written or build.done:
+                    continue
+                await build.changed.wait()
+
+    async def _read_file(self, path: str) -> AsyncIterator[bytes]:
+        with open(path, "rb") as f:
+            while True:
+                chunk = await self._run_io(f.read, self.chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/실패 통계를 반환합니다."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "building": len(self._builds),
+        }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 확인합니다. (약한 비교)
+
+    Args:
+        if_none_match: If-None-Match 헤더 값
+        etag: 따옴표를 포함한 ETag
+
+    Returns:
+        일치 여부
+    """
+    if not if_none_match:
+        return False
+    candidates: List[str] = [
+        value.strip() for value in if_none_match.split(",")
+    ]
+    bare = etag.removeprefix("W/")
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") == bare
+        for candidate in candidates
+    )
@@ -0,0 +1,187 @@
+"""
+내용 주소 기반 블롭 저장소 구현.
+
+이 모듈은 생성된 파일을 SHA-256 해시로 한 번만 저장하고, 작업 출력
+디렉토리에는 하드링크로 배치하는 BlobStore를 제공합니다. 모든 작업이 같은
+내용으로 만드는 안드로이드 빌드 파일 등은 디스크에 한 벌만 존재합니다.
+
+블롭의 참조 수는 파일 시스템의 링크 수(st_nlink)로 관리됩니다. 작업 출력
+디렉토리가 삭제되면 링크 수가 줄어들고, 저장소 자신의 링크만 남은 블롭은
+가비지 컬렉션 대상이 됩니다. 하드링크를 만들 수 없는 환경(다른 파일
+시스템 등)에서는 파일을 복사하여 배치합니다.
+
+모든 메서드는 블로킹 I/O이므로 API 서버에서는 I/O 실행기에서 호출해야 합니다.
+"""
+import hashlib
+import os
+import shutil
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+# 블롭 저장소 로거 설정
+blob_logger = setup_logger("blob_store")
+
+
+class BlobStore:
+    """SHA-256으로 키가 지정된 파일 블롭 저장소"""
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root: 블롭을 저장할 디렉토리 (하드링크를 위해 출력 디렉토리와 같은 파일 시스템 권장)
+        """
+        self.root = root
+
+    def blob_path(self, digest: str) -> str:
+        """내용 해시에 해당하는 블롭 경로를 반환합니다."""
+        return os.path.join(self.root, digest[:2], digest)
+
+    def exists(self, digest: str) -> bool:
+        """블롭이 저장되어 있는지 확인합니다."""
+        return os.path.isfile(self.blob_path(digest))
+
+    @staticmethod
+    def _temp_path(path: str) -> str:
+        return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    def put(self, data: bytes, digest: Optional[str] = None) -> str:
+        """
+        내용을 블롭으로 저장합니다. 이미 있으면 다시 기록하지 않습니다.
+
+        Args:
+            data: 파일 내용
+            digest: 이미 계산한 내용 해시 (없으면 계산)
+
+        Returns:
+            내용 해시
+        """
+        digest = digest or hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+        if os.path.exists(path):
+            return digest
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = self._temp_path(path)
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        # 하드링크된 작업 파일을 제자리에서 수정하면 모든 작업이 바뀌므로 읽기 전용으로 저장
+        os.chmod(temp_path, 0o444)
+        os.replace(temp_path, path)
+        return digest
+
+    def link(self, digest: str, dest: str) -> bool:
+        """
+        블롭을 대상 경로에 배치합니다. 기존 파일은 원자적으로 교체됩니다.
+
+        Args:
+            digest: 내용 해시
+            dest: 배치할 경로
+
+        Returns:
+            하드링크로 배치했으면 True, 복사했으면 False
+
+        Raises:
+            FileNotFoundError: 블롭이 없는 경우
+        """
+        path = self.blob_path(digest)
+        temp_path = self._temp_path(dest)
+        try:
+            os.link(path, temp_path)
+            linked = True
+        except FileNotFoundError:
+            raise
+        except OSError:
+            shutil.copyfile(path, temp_path)
+            linked = False
+        os.replace(temp_path, dest)
+        return linked
+
+    def store(self, data: bytes, dest: str) -> str:
+        """
+        내용을 블롭으로 저장하고 대상 경로에 배치합니다.
+
+        Args:
+            data: 파일 내용
+            dest: 배치할 경로
+
+        Returns:
+            내용 해시
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        while True:
+            self.put(data, digest)
+            try:
+                self.link(digest, dest)
+                return digest
+            except FileNotFoundError:
+                # 확인 직후 가비지 컬렉터가 참조 없는 블롭을 지운 경우 다시 저장
+                if not os.path.isdir(os.path.dirname(dest)):
+                    raise
+
+    def collect_garbage(self, grace: float = 0) -> Tuple[int, int]:
+        """
+        어떤 작업도 링크하지 않는 블롭을 삭제합니다.
+
+        Args:
+            grace: 마지막 수정 후 이 시간(초)이 지나지 않은 블롭은 남김
+
+        Returns:
+            (삭제한 블롭 수, 회수한 바이트 수)
+        """
+        removed, reclaimed = 0, 0
+        if not os.path.isdir(self.root):
+            return removed, reclaimed
+
+        now = time.time()
+        for shard in os.listdir(self.root):
+            shard_dir = os.path.join(self.root, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(shard_dir, name)
+                try:
+                    stat = os.stat(path)
+                    if stat.st_nlink > 1 or now - stat.st_mtime < grace:
+                        continue
+                    os.remove(path)
+                except OSError:
+                    continue
+                removed += 1
+                reclaimed += stat.st_size
+
+        if removed:
+            blob_logger.info(f"참조 없는 블롭 {removed}개 삭제, {reclaimed} 바이트 회수")
+        return removed, reclaimed
+
+    def stats(self) -> Dict[str, int]:
+        """
+        저장소 통계를 계산합니다.
+
+        Returns:
+            블롭 수, 블롭 전체 크기, 참조 없는 블롭 수
+        """
+        blobs, total_bytes, unreferenced = 0, 0, 0
+        if not os.path.isdir(self.root):
+            return {"blobs": 0, "bytes": 0, "unreferenced": 0}
+
+        for shard in os.listdir(self.root):
+            shard_dir = os.path.join(self.root, shard)
+            if not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                if name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = os.stat(os.path.join(shard_dir, name))
+                except OSError:
+                    continue
+                blobs += 1
+                total_bytes += stat.st_size
+                if stat.st_nlink <= 1:
+                    unreferenced += 1
+        return {"blobs": blobs, "bytes": total_bytes, "unreferenced": unreferenced}
@@ -0,0 +1,197 @@
+"""
+파일 단위 빌드 그래프 구현.
+
+이 모듈은 앱 명세를 출력 파일별 노드로 이루어진 빌드 그래프로 컴파일합니다.
+각 노드는 파일을 만드는 생성 단계와 템플릿, 그리고 파일 내용에 영향을 주는
+명세 조각(fragment)별 해시를 기록합니다.
+
+명세 조각:
+
+- app_name, description: 앱 이름과 설명
+- first_page: 홈 화면으로 사용할 페이지 이름
+- model:<이름>: 모델 하나의 명세 (필드 포함)
+- page:<이름>: 페이지 하나
+
+명세가 바뀌면 이전 그래프와 새 그래프를 비교하여, 의존하는 조각이나 템플릿이
+바뀐 파일만 다시 생성합니다 (make와 같은 방식). 그래프를 만든 생성기 지문이
+다르면 템플릿이 바뀌었을 수 있으므로 모든 파일을 다시 생성합니다.
+
+그래프는 JSON으로 저장할 수 있는 딕셔너리입니다.
+
+    {"generator": 생성기 지문,
+     "nodes": {상대 경로: {"phase", "template", "deps": {조각 키: 해시}}}}
+"""
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.api.app_files import (
+    GENERATION_PHASES, first_page_name, model_file_path, page_file_path,
+    render_android_files,
+)
+from src.api.result_cache import canonical_json
+
+
+def _model_key(model: Dict[str, Any]) -> str:
+    """모델 명세 조각의 키"""
+    return f"model:{model.get('name', 'Unknown')}"
+
+
+def spec_fragments(app_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    앱 명세를 파일들이 의존하는 조각으로 나눕니다.
+
+    Args:
+        app_spec: 정규화된 앱 명세
+
+    Returns:
+        조각 키별 명세 값
+    """
+    fragments: Dict[str, Any] = {
+        "app_name": app_spec.get("app_name", "flutter_app"),
+        "description": app_spec.get("description", "Flutter application"),
+        "first_page": first_page_name(app_spec),
+    }
+    for model in app_spec.get("models") or []:
+        fragments[_model_key(model)] = model
+    for page_name in app_spec.get("pages") or []:
+        fragments[f"page:{page_name}"] = page_name
+    return fragments
+
+
+def fragment_digest(value: Any) -> str:
+    """명세 조각 하나의 해시를 계산합니다."""
+    return hashlib.sha256(canonical_json(value).encode("utf-8")).hexdigest()[:16]
+
+
+def phase_targets(
+    phase: str, app_spec: Dict[str, Any]
+) -> Dict[str, Tuple[str, List[str]]]:
+    """
+    생성 단계가 만드는 파일과 각 파일의 템플릿, 의존하는 명세 조각을 반환합니다.
+
+    경로는 render_phase()가 만드는 파일과 같습니다.
+
+    Args:
+        phase: GENERATION_PHASES 중 하나
+        app_spec: 앱 명세 딕셔너리
+
+    Returns:
+        상대 경로별 (템플릿 이름, 명세 조각 키 목록)
+    """
+    if phase == "models":
+        return {
+            model_file_path(model): ("model", [_model_key(model)])
+            for model in app_spec.get("models") or []
+        }
+    if phase == "pages":
+        return {
+            page_file_path(page_name): ("page", [f"page:{page_name}"])
+            for page_name in app_spec.get("pages") or []
+        }
+    if phase == "main":
+        return {"lib/main.dart": ("main", ["app_name", "first_page"])}
+    if phase == "project":
+        return {
+            "pubspec.yaml": ("pubspec", ["app_name", "description"]),
+            "README.md": ("readme", ["app_name", "description"]),
+        }
+    if phase == "android":
+        app_name = app_spec.get("app_name", "flutter_app")
+        return {
+            path: ("android", ["app_name"]) for path in render_android_files(app_name)
+        }
+    raise ValueError(f"알 수 없는 생성 단계: {phase}")
+
+
+def compile_graph(app_spec: Dict[str, Any], generator: str) -> Dict[str, Any]:
+    """
+    앱 명세를 파일 단위 빌드 그래프로 컴파일합니다.
+
+    Args:
+        app_spec: 정규화된 앱 명세
+        generator: 생성기 지문
+
+    Returns:
+        빌드 그래프
+    """
+    digests = {
+        key: fragment_digest(value) for key, value in spec_fragments(app_spec).items()
+    }
+    nodes: Dict[str, Dict[str, Any]] = {}
+    for phase in GENERATION_PHASES:
+        for path, (template, keys) in phase_targets(phase, app_spec).items():
+            nodes[path] = {
+                "phase": phase,
+                "template": template,
+                "deps": {key: digests[key] for key in keys},
+            }
+    return {"generator": generator, "nodes": nodes}
+
+
+def plan_rebuild(
+    old_graph: Optional[Dict[str, Any]],
+    new_graph: Dict[str, Any],
+    built: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, List[str]], List[str]]:
+    """
+    두 빌드 그래프를 비교하여 다시 생성할 파일과 삭제할 파일을 계산합니다.
+
+    다음 파일을 다시 생성합니다.
+
+    - 새로 생긴 파일
+    - 템플릿이나 의존하는 명세 조각의 해시가 바뀐 파일
+    - 이전 버전에서 기록되지 않은 파일 (제한 시간 초과로 건너뛴 파일 등)
+
+    Args:
+        old_graph: 이전 버전의 빌드 그래프 (없으면 모든 파일을 다시 생성)
+        new_graph: 새 명세의 빌드 그래프
+        built: 이전 버전에서 실제로 기록된 파일 (매니페스트, 없으면 검사 안 함)
+
+    Returns:
+        (단계별 다시 생성할 파일 경로 목록, 새 버전에서 삭제할 파일 경로 목록)
+    """
+    old_nodes = {}
+    if old_graph is not None and old_graph.get("generator") == new_graph["generator"]:
+        old_nodes = old_graph.get("nodes") or {}
+
+    dirty: Dict[str, List[str]] = {}
+    for path, node in new_graph["nodes"].items():
+        old = old_nodes.get(path)
+        if (
+            old is None
+            or old.get("template") != node["template"]
+            or old.get("deps") != node["deps"]
+            or (built is not None and path not in built)
+        ):
+            dirty.setdefault(node["phase"], []).append(path)
+
+    previous = set(old_graph.get("nodes") or {}) if old_graph is not None else set()
+    if built is not None:
+        previous |= set(built)
+    removed = sorted(previous - set(new_graph["nodes"]))
+    return dirty, removed
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """
+    JSON Merge Patch(RFC 7386)를 적용한 새 값을 반환합니다.
+
+    패치의 객체 값은 재귀적으로 병합하고, null 값은 키를 삭제하며, 그 밖의
+    값(목록 포함)은 통째로 바꿉니다.
+
+    Args:
+        target: 원본 값
+        patch: 병합할 패치
+
+    Returns:
+        패치를 적용한 새 값 (원본은 바꾸지 않음)
+    """
+    if not isinstance(patch, dict):
+        return patch
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
@@ -0,0 +1,268 @@
+"""
+클라이언트별 요청 한도 구현.
+
+이 모듈은 API 키 또는 클라이언트 IP별로 토큰 버킷 요청 속도 제한과 동시
+작업 수 한도를 적용하는 ClientQuotas를 제공합니다. 한 클라이언트가 작업
+큐를 채워 다른 클라이언트의 작업이 밀리는 것을 막습니다.
+
+- 요청 속도: 클라이언트마다 burst개의 토큰을 가진 버킷이 초당 rate개씩
+  채워지며, 생성 요청 하나가 토큰 하나를 사용합니다.
+- 동시 작업 수: 작업 큐에 있거나 실행 중인 작업과 처리 중인 요청이 한도에
+  도달하면 새 요청을 거절합니다.
+
+요청은 명세를 읽기 전에 admit()으로 검사하므로 거절은 저렴합니다. 모든
+메서드는 이벤트 루프에서만 호출해야 합니다.
+"""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.utils.logger import setup_logger
+
+# 요청 한도 로거 설정
+quota_logger = setup_logger("client_quotas")
+
+
+def client_key(api_key: Optional[str], client_host: Optional[str]) -> str:
+    """
+    요청의 클라이언트 식별자를 만듭니다.
+
+    API 키는 사용량 조회 응답에 노출되지 않도록 해시합니다.
+
+    Args:
+        api_key: API 키 헤더 값
+        client_host: 클라이언트 IP 주소
+
+    Returns:
+        "key:<해시 앞 16자리>" 또는 "ip:<주소>"
+    """
+    if api_key:
+        return "key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    return f"ip:{client_host or 'unknown'}"
+
+
+class TokenBucket:
+    """초당 rate개씩 최대 burst개까지 채워지는 토큰 버킷"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def take(self) -> float:
+        """
+        토큰 하나를 사용합니다.
+
+        Returns:
+            사용했으면 0, 토큰이 없으면 다음 토큰까지 남은 시간(초)
+        """
+        self._refill(time.monotonic())
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        if self.rate <= 0:
+            return float("inf")
+        return (1 - self.tokens) / self.rate
+
+    def available(self) -> float:
+        """현재 남은 토큰 수"""
+        self._refill(time.monotonic())
+        return self.tokens
+
+
+class ClientUsage:
+    """클라이언트 하나의 요청 한도 상태"""
+
+    def __init__(self, rate: float, burst: int):
+        self.bucket = TokenBucket(rate, burst)
+        # 작업 큐에 있거나 실행 중인 작업
+        self.active: Set[str] = set()
+        # 허용되었지만 아직 작업이 만들어지지 않은 요청 수
+        self.reserved = 0
+        self.requests = 0
+        self.rejected = 0
+        self.last_seen = time.time()
+        # 동시 작업 자리가 나면 설정 (배치 작업이 대기)
+        self.released = asyncio.Event()
+
+    @property
+    def busy(self) -> bool:
+        return bool(self.active) or self.reserved > 0
+
+
+class ClientQuotas:
+    """클라이언트별 요청 속도 및 동시 작업 수 한도"""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        max_concurrent_jobs: int = 0,
+        max_clients: int = 10000,
+    ):
+        """
+        Args:
+            rate: 초당 채워지는 요청 토큰 수 (0이면 속도 제한 없음)
+            burst: 버킷 크기 (연속으로 보낼 수 있는 최대 요청 수)
+            max_concurrent_jobs: 클라이언트별 동시 작업 수 한도 (0이면 제한 없음)
+            max_clients: 기억할 최대 클라이언트 수 (작업이 없는 클라이언트부터 제거)
+        """
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[str, ClientUsage]" = OrderedDict()
+        # 작업 ID -> 클라이언트 식별자
+        self._job_clients: Dict[str, str] = {}
+        self.rejected = 0
+
+    def _usage(self, client_id: str) -> ClientUsage:
+        usage = self._clients.get(client_id)
+        if usage is None:
+            usage = ClientUsage(self.rate, self.burst)
+            self._clients[client_id] = usage
+            self._evict()
+        else:
+            self._clients.move_to_end(client_id)
+        usage.last_seen = time.time()
+        return usage
+
+    def _evict(self):
+        """한도를 넘은 만큼 작업이 없는 오래된 클라이언트를 제거합니다."""
+        excess = len(self._clients) - self.max_clients
+        if excess <= 0:
+            return
+        for client_id in list(self._clients):
+            if excess <= 0:
+                break
+            if not self._clients[client_id].busy:
+                del self._clients[client_id]
+                excess -= 1
+
+    def _slots_full(self, usage: ClientUsage) -> bool:
+        return (
+            self.max_concurrent_jobs > 0
+            and len(usage.active) + usage.reserved >= self.max_concurrent_jobs
+        )
+
+    def admit(self, client_id: str) -> Optional[Tuple[str, float]]:
+        """
+        요청을 허용할지 검사하고, 허용하면 토큰과 동시 작업 자리 하나를 예약합니다.
+
+        허용된 요청은 작업을 만들면 bind(), 만들지 않으면 cancel()을 호출해야 합니다.
+
+        Args:
+            client_id: 클라이언트 식별자
+
+        Returns:
+            허용하면 None, 거절하면 (사유, 재시도 대기 시간(초))
+            사유는 "concurrency" 또는 "rate"
+        """
+        usage = self._usage(client_id)
+        usage.requests += 1
+
+        rejection = None
+        if self._slots_full(usage):
+            rejection = ("concurrency", 1.0)
+        elif self.rate > 0:
+            wait = usage.bucket.take()
+            if wait > 0:
+                rejection = ("rate", wait)
+
+        if rejection is not None:
+            usage.rejected += 1
+            self.rejected += 1
+            quota_logger.info(
+                f"요청 거절: {client_id}, 사유={rejection[0]}, "
+                f"재시도 대기={rejection[1]:.1f}초"
+            )
+            return rejection
+
+        usage.reserved += 1
+        return None
+
+    def bind(self, client_id: str, job_id: str):
+        """admit()으로 예약한 자리를 새 작업에 연결합니다."""
+        usage = self._usage(client_id)
+        usage.reserved = max(0, usage.reserved - 1)
+        self._add_job(client_id, usage, job_id)
+
+    def cancel(self, client_id: str):
+        """admit()으로 예약한 자리를 반환합니다. (작업을 만들지 않은 요청)"""
+        usage = self._clients.get(client_id)
+        if usage is not None and usage.reserved > 0:
+            usage.reserved -= 1
+            self._notify(usage)
+
+    def track(self, client_id: str, job_id: str):
+        """한도 검사 없이 작업을 클라이언트의 동시 작업으로 기록합니다. (재시작 복원용)"""
+        self._add_job(client_id, self._usage(client_id), job_id)
+
+    async def acquire(self, client_id: str, job_id: str):
+        """
+        동시 작업 자리가 날 때까지 기다린 뒤 작업을 기록합니다. (배치 작업용)
+
+        Args:
+            client_id: 클라이언트 식별자
+            job_id: 작업 ID
+        """
+        usage = self._usage(client_id)
+        while self._slots_full(usage):
+            usage.released.clear()
+            await usage.released.wait()
+        self._add_job(client_id, usage, job_id)
+
+    def _add_job(self, client_id: str, usage: ClientUsage, job_id: str):
+        usage.active.add(job_id)
+        self._job_clients[job_id] = client_id
+
+    def release(self, job_id: str):
+        """
+        작업이 끝났음을 알려 클라이언트의 동시 작업 자리를 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+        """
+        client_id = self._job_clients.pop(job_id, None)
+        usage = self._clients.get(client_id) if client_id else None
+        if usage is not None:
+            usage.active.discard(job_id)
+            self._notify(usage)
+
+    def _notify(self, usage: ClientUsage):
+        """동시 작업 자리를 기다리는 배치 작업을 깨웁니다."""
+        usage.released.set()
+
+    def usage(self, client_id: str) -> Dict[str, Any]:
+        """
+        클라이언트의 현재 사용량을 반환합니다.
+
+        Args:
+            client_id: 클라이언트 식별자
+
+        Returns:
+            남은 토큰, 동시 작업 수, 요청/거절 수를 포함하는 딕셔너리
+        """
+        usage = self._clients.get(client_id) or ClientUsage(self.rate, self.burst)
+        return {
+            "client": client_id,
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(usage.bucket.available(), 3),
+            "active_jobs": len(usage.active),
+            "max_concurrent_jobs": self.max_concurrent_jobs,
+            "requests": usage.requests,
+            "rejected": usage.rejected,
+            "last_seen": usage.last_seen,
+        }
+
+    def all_usage(self) -> List[Dict[str, Any]]:
+        """기억하고 있는 모든 클라이언트의 사용량을 최근 요청 순으로 반환합니다."""
+        return [self.usage(client_id) for client_id in reversed(self._clients)]
@@ -0,0 +1,49 @@
+"""
+HTTP 요청 메트릭 미들웨어.
+
+이 모듈은 엔드포인트별 요청 수와 처리 시간을 기록하는 ASGI 미들웨어를
+제공합니다. 스트리밍 응답(SSE, ZIP 다운로드)도 본문 전송이 끝날 때까지의
+시간을 기록하도록 BaseHTTPMiddleware 대신 순수 ASGI 미들웨어로 구현합니다.
+
+경로 레이블에는 요청 경로 대신 라우트 템플릿(/job/{job_id})을 사용하므로
+작업 ID가 늘어나도 시계열 수가 늘어나지 않습니다.
+"""
+import time
+
+from src.utils import metrics
+
+# 라우트와 일치하지 않은 요청(404)의 경로 레이블
+UNMATCHED_ROUTE = "unmatched"
+
+
+class HttpMetricsMiddleware:
+    """HTTP 요청 수와 처리 시간을 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 라우터가 일치한 라우트를 scope에 기록함
+            route = scope.get("route")
+            path = getattr(route, "path", None) or UNMATCHED_ROUTE
+            method = scope.get("method", "")
+            metrics.http_requests.labels(method, path, str(status)).inc()
+            metrics.http_request_seconds.labels(method, path).observe(
+                time.perf_counter() - started
+            )
@@ -0,0 +1,155 @@
+"""
+앱 일괄 생성 배치 관리 구현.
+
+이 모듈은 여러 앱 명세를 하나의 배치로 묶고, 배치의 작업들을 공유
+동시 실행 한도 안에서만 작업 큐에 넣는 BatchRegistry를 제공합니다.
+수백 개의 명세가 한 번에 제출되어도 작업 큐를 가득 채우지 않으므로
+개별 요청과 다른 배치도 함께 처리됩니다.
+
+배치 소속은 작업 레코드의 batch_id, batch_index 필드로 저장되므로 서버가
+다시 시작되면 저널에서 복원한 작업으로 배치를 다시 구성합니다.
+"""
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from src.api.job_queue import QueueClosedError
+from src.utils.logger import setup_logger
+
+# 배치 로거 설정
+batch_logger = setup_logger("job_batches")
+
+
+class JobBatch:
+    """여러 작업을 묶은 배치"""
+
+    def __init__(
+        self,
+        batch_id: str,
+        job_ids: List[str],
+        concurrency: int,
+        created: Optional[float] = None,
+    ):
+        """
+        Args:
+            batch_id: 배치 ID
+            job_ids: 명세 순서대로의 작업 ID 목록
+            concurrency: 동시에 작업 큐에 넣을 최대 작업 수
+            created: 배치 생성 시각
+        """
+        self.batch_id = batch_id
+        self.job_ids = job_ids
+        self.concurrency = concurrency
+        self.created = created or time.time()
+        self.slots = asyncio.Semaphore(concurrency)
+        # 작업 큐에 넣었지만 아직 끝나지 않은 작업
+        self.active: Set[str] = set()
+        self.task: Optional[asyncio.Task] = None
+
+
+class BatchRegistry:
+    """배치 목록과 배치별 작업 공급기"""
+
+    def __init__(
+        self,
+        submit_job: Callable[[str], Awaitable[bool]],
+        max_batches: int = 1000,
+    ):
+        """
+        Args:
+            submit_job: 작업을 작업 큐에 넣는 코루틴 함수 (넣지 않고 건너뛴
+                작업은 False 반환, 서버 종료 중이면 QueueClosedError 발생)
+            max_batches: 기억할 최대 배치 수 (초과 시 가장 오래된 배치부터 제거)
+        """
+        self.submit_job = submit_job
+        self.max_batches = max_batches
+        self._batches: "OrderedDict[str, JobBatch]" = OrderedDict()
+
+    @staticmethod
+    def new_batch_id() -> str:
+        """새 배치 ID를 만듭니다."""
+        return f"batch-{uuid.uuid4()}"
+
+    def get(self, batch_id: str) -> Optional[JobBatch]:
+        """배치를 조회합니다."""
+        return self._batches.get(batch_id)
+
+    def create(
+        self,
+        batch_id: str,
+        job_ids: List[str],
+        pending: Iterable[str],
+        concurrency: int,
+        created: Optional[float] = None,
+    ) -> JobBatch:
+        """
+        배치를 등록하고 대기 중인 작업을 한도 안에서 작업 큐에 넣기 시작합니다.
+
+        Args:
+            batch_id: 배치 ID
+            job_ids: 명세 순서대로의 작업 ID 목록
+            pending: 작업 큐에 넣어야 하는 작업 ID (명세 순서)
+            concurrency: 동시 실행 한도
+            created: 배치 생성 시각
+
+        Returns:
+            등록된 배치
+        """
+        batch = JobBatch(batch_id, job_ids, max(1, concurrency), created)
+        self._batches[batch_id] = batch
+        while len(self._batches) > self.max_batches:
+            _, evicted = self._batches.popitem(last=False)
+            if evicted.task is not None:
+                evicted.task.cancel()
+
+        pending = list(pending)
+        if pending:
+            batch.task = asyncio.create_task(
+                self._feed(batch, pending), name=f"batch-{batch_id}"
+            )
+        return batch
+
+    async def _feed(self, batch: JobBatch, pending: List[str]):
+        """동시 실행 한도가 빌 때마다 다음 작업을 작업 큐에 넣습니다."""
+        for job_id in pending:
+            await batch.slots.acquire()
+            batch.active.add(job_id)
+            try:
+                submitted = await self.submit_job(job_id)
+            except QueueClosedError:
+                # 남은 작업은 저널에 대기 상태로 남아 재시작 시 복원
+                batch_logger.info(f"서버 종료로 배치 공급 중단: {batch.batch_id}")
+                return
+            except Exception as e:
+                batch_logger.error(f"배치 작업 제출 실패: {job_id}, {str(e)}")
+                submitted = False
+            if not submitted:
+                self.job_finished(batch.batch_id, job_id)
+
+    def job_finished(self, batch_id: str, job_id: str):
+        """
+        배치 작업이 끝났음을 알려 다음 작업이 시작되도록 합니다.
+
+        Args:
+            batch_id: 배치 ID
+            job_id: 끝난 작업 ID
+        """
+        batch = self._batches.get(batch_id)
+        if batch is not None and job_id in batch.active:
+            batch.active.discard(job_id)
+            batch.slots.release()
+
+    async def stop(self):
+        """모든 작업 공급기를 중단합니다."""
+        tasks = [
+            batch.task for batch in self._batches.values()
+            if batch.task is not None and not batch.task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def __len__(self) -> int:
+        return len(self._batches)
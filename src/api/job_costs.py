@@ -0,0 +1,101 @@
+"""
+앱 생성 작업 비용 추정.
+
+이 모듈은 앱 명세의 크기(모델, 필드, 페이지, 컨트롤러, API 엔드포인트 수)와
+지금까지 측정한 생성 단계별 처리 시간으로 작업 하나의 예상 처리 시간을
+계산하는 CostEstimator를 제공합니다. 작업 큐는 이 값으로 짧은 작업을 먼저
+시작하고 예상 시작/완료 시각을 계산합니다.
+
+단계별로 명세 항목 하나당 처리 시간(초)을 지수 가중 이동 평균으로 기록하며,
+기록이 없는 단계는 기본값을 사용합니다.
+"""
+from typing import Any, Dict, Optional
+
+
+def _count(items: Any) -> int:
+    """명세 목록의 항목 수 (목록이 아니면 0)"""
+    return len(items) if isinstance(items, list) else 0
+
+
+def phase_units(app_spec: Dict[str, Any]) -> Dict[str, int]:
+    """
+    앱 명세에서 생성 단계별 작업량(명세 항목 수)을 계산합니다.
+
+    모델 단계는 모델과 필드 수, 페이지 단계는 페이지 수에 비례합니다.
+    컨트롤러와 API 엔드포인트는 비슷한 크기의 Dart 파일을 만드는 페이지와
+    모델 단계에 더합니다. 나머지 단계는 명세와 관계없이 항목 하나로 셉니다.
+
+    Args:
+        app_spec: 앱 명세 딕셔너리
+
+    Returns:
+        단계 이름별 작업량 (항상 1 이상)
+    """
+    models = app_spec.get("models") or []
+    fields = sum(
+        _count(model.get("fields")) for model in models if isinstance(model, dict)
+    )
+    endpoints = _count(app_spec.get("api_endpoints"))
+    controllers = _count(app_spec.get("controllers"))
+    return {
+        "models": max(1, _count(models) + fields + endpoints),
+        "pages": max(1, _count(app_spec.get("pages")) + controllers),
+        "main": 1,
+        "project": 1,
+        "android": 1,
+    }
+
+
+class CostEstimator:
+    """명세 크기와 단계별 처리 시간 기록으로 작업 처리 시간을 추정"""
+
+    def __init__(self, default_unit_seconds: float, alpha: float = 0.2):
+        """
+        Args:
+            default_unit_seconds: 기록이 없는 단계의 항목당 처리 시간(초)
+            alpha: 이동 평균 가중치 (클수록 최근 측정값을 많이 반영)
+        """
+        self.default_unit_seconds = default_unit_seconds
+        self.alpha = alpha
+        # 단계 이름 -> 항목당 처리 시간(초) 이동 평균
+        self._unit_seconds: Dict[str, float] = {}
+        self.samples = 0
+
+    def unit_seconds(self, phase: str) -> float:
+        """단계의 항목당 예상 처리 시간(초)을 반환합니다."""
+        return self._unit_seconds.get(phase, self.default_unit_seconds)
+
+    def estimate(
+        self, app_spec: Dict[str, Any], units: Optional[Dict[str, int]] = None
+    ) -> float:
+        """
+        작업의 예상 처리 시간을 계산합니다.
+
+        Args:
+            app_spec: 앱 명세 딕셔너리
+            units: 미리 계산한 단계별 작업량 (없으면 명세에서 계산)
+
+        Returns:
+            예상 처리 시간(초)
+        """
+        if units is None:
+            units = phase_units(app_spec)
+        return round(
+            sum(self.unit_seconds(phase) * count for phase, count in units.items()), 3
+        )
+
+    def record(self, phase: str, units: int, seconds: float):
+        """
+        끝난 생성 단계의 처리 시간을 기록합니다.
+
+        Args:
+            phase: 생성 단계 이름
+            units: 단계의 작업량
+            seconds: 단계 처리 시간(초)
+        """
+        sample = seconds / max(1, units)
+        previous = self._unit_seconds.get(phase)
+        self._unit_seconds[phase] = (
+            sample if previous is None else previous + self.alpha * (sample - previous)
+        )
+        self.samples += 1
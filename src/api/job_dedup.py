@@ -0,0 +1,162 @@
+"""
+앱 생성 요청 중복 제거 구현.
+
+이 모듈은 같은 요청이 여러 번 제출될 때 하나의 작업으로 합치는
+JobDeduplicator를 제공합니다.
+
+- Idempotency-Key: 같은 키로 다시 제출된 요청은 처음 만든 작업을 반환합니다.
+- 싱글플라이트: 정규화된 명세가 같은 요청이 동시에 제출되면 실행 중인
+  작업에 합류합니다.
+
+작업 레코드가 만들어지기 전에 합류한 요청은 레코드가 준비될 때까지
+기다립니다. 모든 메서드는 이벤트 루프에서만 호출해야 합니다.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+# 중복 제거 로거 설정
+dedup_logger = setup_logger("job_dedup")
+
+
+class JobFlight:
+    """하나의 작업에 합쳐진 요청들이 공유하는 상태"""
+
+    def __init__(self, job_id: str, spec_key: str):
+        self.job_id = job_id
+        self.spec_key = spec_key
+        # 작업 레코드 생성이 끝나면(또는 실패하면) 설정
+        self.ready = asyncio.Event()
+        self.abandoned = False
+
+
+class IdempotencyConflictError(Exception):
+    """같은 Idempotency-Key로 다른 명세가 제출된 경우"""
+
+
+class JobDeduplicator:
+    """Idempotency-Key와 진행 중인 명세로 중복 요청을 찾는 인덱스"""
+
+    def __init__(self, key_ttl: float = 86400, max_keys: int = 100000):
+        """
+        Args:
+            key_ttl: Idempotency-Key를 기억하는 시간(초)
+            max_keys: 기억할 최대 Idempotency-Key 수
+        """
+        self.key_ttl = key_ttl
+        self.max_keys = max_keys
+
+        # Idempotency-Key -> (작업 흐름, 만료 시각)
+        self._keys: "OrderedDict[str, Tuple[JobFlight, float]]" = OrderedDict()
+        # 명세 키 -> 대기 중이거나 실행 중인 작업 흐름
+        self._in_flight: Dict[str, JobFlight] = {}
+
+        self.replayed = 0
+        self.coalesced = 0
+
+    def find(
+        self, spec_key: str, idempotency_key: Optional[str] = None
+    ) -> Optional[JobFlight]:
+        """
+        요청이 합류할 작업을 찾습니다.
+
+        Args:
+            spec_key: 정규화된 명세 키
+            idempotency_key: 요청의 Idempotency-Key
+
+        Returns:
+            합류할 작업 흐름 또는 없으면 None
+
+        Raises:
+            IdempotencyConflictError: 같은 키로 다른 명세가 제출된 경우
+        """
+        if idempotency_key is not None:
+            entry = self._keys.get(idempotency_key)
+            if entry is not None and entry[1] < time.time():
+                del self._keys[idempotency_key]
+                entry = None
+            if entry is not None:
+                flight = entry[0]
+                if flight.spec_key != spec_key:
+                    raise IdempotencyConflictError(
+                        f"Idempotency-Key {idempotency_key}는 다른 명세에 사용되었습니다."
+                    )
+                if not flight.abandoned:
+                    self.replayed += 1
+                    return flight
+
+        flight = self._in_flight.get(spec_key)
+        if flight is not None and not flight.abandoned:
+            self.coalesced += 1
+            return flight
+        return None
+
+    def begin(
+        self,
+        job_id: str,
+        spec_key: str,
+        idempotency_key: Optional[str] = None,
+        created: Optional[float] = None,
+    ) -> JobFlight:
+        """
+        새 작업을 진행 중으로 등록합니다. find() 직후 await 없이 호출해야 합니다.
+
+        Args:
+            job_id: 작업 ID
+            spec_key: 정규화된 명세 키
+            idempotency_key: 요청의 Idempotency-Key
+            created: 키 만료 계산 기준 시각 (기본: 현재)
+
+        Returns:
+            등록된 작업 흐름
+        """
+        flight = JobFlight(job_id, spec_key)
+        self._in_flight[spec_key] = flight
+        if idempotency_key is not None:
+            self.remember_key(idempotency_key, flight, created)
+        return flight
+
+    def remember_key(
+        self, idempotency_key: str, flight: JobFlight,
+        created: Optional[float] = None
+    ):
+        """Idempotency-Key를 작업 흐름에 연결합니다."""
+        expires = (created or time.time()) + self.key_ttl
+        self._keys[idempotency_key] = (flight, expires)
+        self._keys.move_to_end(idempotency_key)
+        while len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+
+    def created(self, flight: JobFlight):
+        """작업 레코드가 만들어졌음을 알립니다."""
+        flight.ready.set()
+
+    def abandon(self, flight: JobFlight):
+        """작업 생성이 실패하여 합류한 요청들이 새로 시작하도록 합니다."""
+        flight.abandoned = True
+        flight.ready.set()
+        self.finish(flight.spec_key, flight.job_id)
+        for key, (entry, _) in list(self._keys.items()):
+            if entry is flight:
+                del self._keys[key]
+
+    def finish(self, spec_key: str, job_id: str):
+        """
+        작업이 끝났음을 알립니다. 이후 같은 명세는 새 작업(또는 결과 캐시)을 사용합니다.
+
+        Args:
+            spec_key: 정규화된 명세 키
+            job_id: 작업 ID
+        """
+        flight = self._in_flight.get(spec_key)
+        if flight is not None and flight.job_id == job_id:
+            del self._in_flight[spec_key]
+            flight.ready.set()
+
+    @property
+    def in_flight(self) -> int:
+        """진행 중인 명세 수"""
+        return len(self._in_flight)
@@ -0,0 +1,140 @@
+"""
+작업 이벤트 브로커 구현.
+
+이 모듈은 작업 상태 변경, 파일 생성 등의 이벤트를 구독자에게 전달하는
+JobEventBroker와 SSE(Server-Sent Events) 형식 변환 함수를 제공합니다.
+구독자는 작업별 큐를 통해 이벤트를 받으며, 느린 구독자 때문에 작업 처리가
+지연되지 않도록 큐가 가득 차면 가장 오래된 이벤트를 버립니다.
+"""
+import asyncio
+import json
+from typing import Any, Dict, Optional, Set, Tuple
+
+from src.utils.logger import setup_logger
+
+# 이벤트 로거 설정
+events_logger = setup_logger("job_events")
+
+# 더 이상 상태가 바뀌지 않는 작업 상태
+TERMINAL_STATUSES = (
+    "completed", "partial", "failed", "interrupted", "cancelled"
+)
+
+# 생성 결과를 내려받을 수 있는 작업 상태 (partial: 제한 시간을 넘긴 단계가 있음)
+RESULT_STATUSES = ("completed", "partial")
+
+Event = Tuple[str, Dict[str, Any]]
+
+
+class JobEventBroker:
+    """작업별 이벤트 발행/구독 브로커 (프로세스 로컬)"""
+
+    def __init__(self, queue_size: int = 1000):
+        """
+        Args:
+            queue_size: 구독자별로 보관할 최대 이벤트 수
+        """
+        self.queue_size = max(1, queue_size)
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+
+    def subscriber_count(self, job_id: Optional[str] = None) -> int:
+        """
+        구독자 수를 반환합니다.
+
+        Args:
+            job_id: 작업 ID (None이면 전체 구독자 수)
+
+        Returns:
+            구독자 수
+        """
+        if job_id is not None:
+            return len(self._subscribers.get(job_id, ()))
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def subscribe(self, job_id: str) -> asyncio.Queue:
+        """
+        작업 이벤트를 구독합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            (이벤트 이름, 데이터) 튜플을 받을 큐
+        """
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(job_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue):
+        """
+        작업 이벤트 구독을 해제합니다.
+
+        Args:
+            job_id: 작업 ID
+            queue: subscribe()가 반환한 큐
+        """
+        queues = self._subscribers.get(job_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[job_id]
+
+    def publish(self, job_id: str, event: str, data: Dict[str, Any]):
+        """
+        작업 이벤트를 모든 구독자에게 전달합니다. 구독자가 없으면 무시합니다.
+
+        Args:
+            job_id: 작업 ID
+            event: 이벤트 이름 (status, artifact, summary)
+            data: 이벤트 데이터
+        """
+        for queue in self._subscribers.get(job_id, ()):
+            if queue.full():
+                # 느린 구독자: 가장 오래된 이벤트를 버리고 최신 이벤트 유지
+                queue.get_nowait()
+                events_logger.debug(f"이벤트 큐가 가득 차 오래된 이벤트 삭제: {job_id}")
+            queue.put_nowait((event, data))
+
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    """
+    이벤트를 SSE 메시지 형식으로 변환합니다.
+
+    Args:
+        event: 이벤트 이름
+        data: 이벤트 데이터
+
+    Returns:
+        SSE 메시지 문자열
+    """
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def status_event(job_info: Dict[str, Any]) -> Dict[str, Any]:
+    """작업 레코드에서 status 이벤트 데이터를 만듭니다."""
+    return {
+        "job_id": job_info.get("job_id"),
+        "status": job_info.get("status"),
+        "progress": job_info.get("progress"),
+        "message": job_info.get("message"),
+        "queue_position": job_info.get("queue_position"),
+    }
+
+
+def summary_event(job_info: Dict[str, Any]) -> Dict[str, Any]:
+    """작업 레코드에서 최종 summary 이벤트 데이터를 만듭니다."""
+    summary = status_event(job_info)
+    summary.update({
+        "folder_name": job_info.get("folder_name"),
+        "artifact_count": len(job_info.get("artifacts") or []),
+        "queue_wait": job_info.get("queue_wait"),
+    })
+    if job_info.get("timed_out"):
+        summary["timed_out"] = job_info["timed_out"]
+    if job_info.get("start_time") and job_info.get("end_time"):
+        summary["duration"] = round(
+            job_info["end_time"] - job_info["start_time"], 3
+        )
+    return summary
@@ -0,0 +1,259 @@
+"""
+작업 상태 저널 구현.
+
+이 모듈은 작업 상태 전이를 추가 전용(append-only) 저널 파일에 기록하고,
+주기적으로 스냅샷으로 압축하는 JobJournal을 제공합니다. 서버가 재시작되면
+스냅샷과 저널을 재생하여 작업 테이블을 복원할 수 있습니다.
+
+기록은 이벤트 루프를 막지 않도록 대기열에 넣고, 한 번에 하나만 실행되는
+기록 태스크가 모인 항목을 실행기에서 한꺼번에 파일에 씁니다. fsync를 켜도
+묶음마다 한 번만 동기화합니다.
+
+파일 구성 (AGENT_ARTIFACTS_DIR/job_states/):
+    snapshot.json           압축된 작업 레코드 전체
+    journal.jsonl           스냅샷 이후의 상태 전이 (한 줄에 하나)
+    journal.compacting.jsonl  압축 진행 중인 이전 저널 (압축 완료 시 삭제)
+"""
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional
+
+from src.utils.logger import setup_logger
+
+# 저널 로거 설정
+journal_logger = setup_logger("job_journal")
+
+SNAPSHOT_FILE = "snapshot.json"
+JOURNAL_FILE = "journal.jsonl"
+COMPACTING_FILE = "journal.compacting.jsonl"
+
+
+class JobJournal:
+    """작업 상태 전이를 기록하는 추가 전용 저널"""
+
+    def __init__(
+        self,
+        directory: str,
+        compact_every: int = 1000,
+        executor: Optional[Executor] = None,
+        fsync: bool = False,
+    ):
+        """
+        Args:
+            directory: 저널 파일을 저장할 디렉토리
+            compact_every: 몇 개의 기록마다 압축할지
+            executor: 저널 기록과 압축 작업을 실행할 실행기 (None이면 기본 실행기)
+            fsync: 기록한 묶음마다 디스크 동기화 여부
+        """
+        self.directory = directory
+        self.compact_every = max(1, compact_every)
+        self.executor = executor
+        self.fsync = fsync
+
+        self._file = None
+        self._entries_since_compaction = 0
+        # 파일에 아직 쓰지 않은 저널 줄과 이를 쓰는 기록 태스크 (하나만 실행)
+        self._pending: List[str] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._compaction_task: Optional[asyncio.Task] = None
+        # 예약된 압축과 직접 호출한 압축(복구, 종료)이 저널 교체와 스냅샷
+        # 기록을 겹쳐 실행하지 않도록 직렬화
+        self._compaction_lock = asyncio.Lock()
+
+    @property
+    def snapshot_path(self) -> str:
+        return os.path.join(self.directory, SNAPSHOT_FILE)
+
+    @property
+    def journal_path(self) -> str:
+        return os.path.join(self.directory, JOURNAL_FILE)
+
+    @property
+    def compacting_path(self) -> str:
+        return os.path.join(self.directory, COMPACTING_FILE)
+
+    def _open(self):
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+        return self._file
+
+    def record_set(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """
+        작업 레코드 생성 또는 필드 갱신을 기록합니다.
+
+        Args:
+            job_id: 작업 ID
+            fields: 생성된 레코드 전체 또는 갱신된 필드
+        """
+        self._append({"op": "set", "job_id": job_id, "fields": fields})
+
+    def record_delete(self, job_id: str) -> None:
+        """
+        작업 레코드 삭제를 기록합니다.
+
+        Args:
+            job_id: 작업 ID
+        """
+        self._append({"op": "del", "job_id": job_id})
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        entry["ts"] = time.time()
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_lines([line])
+        else:
+            self._pending.append(line)
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = loop.create_task(self._flush_pending())
+
+        self._entries_since_compaction += 1
+        if self._entries_since_compaction >= self.compact_every:
+            self._schedule_compaction()
+
+    def _write_lines(self, lines: List[str]) -> None:
+        """저널 줄을 파일에 쓰고 동기화합니다. (블로킹 I/O)"""
+        journal_file = self._open()
+        journal_file.write("".join(lines))
+        journal_file.flush()
+        if self.fsync:
+            os.fsync(journal_file.fileno())
+
+    async def _flush_pending(self) -> None:
+        """대기열이 빌 때까지 모인 저널 줄을 실행기에서 파일에 씁니다."""
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            lines, self._pending = self._pending, []
+            try:
+                await loop.run_in_executor(self.executor, self._write_lines, lines)
+            except Exception as e:
+                journal_logger.error(f"작업 저널 기록 중 오류 발생: {str(e)}")
+
+    async def flush(self) -> None:
+        """대기 중인 저널 기록이 모두 파일에 쓰일 때까지 기다립니다."""
+        # 기다리는 동안 새 기록 태스크가 생길 수 있으므로 남은 태스크가 없을 때까지 확인
+        while self._flush_task is not None and not self._flush_task.done():
+            await asyncio.shield(self._flush_task)
+
+    def _schedule_compaction(self):
+        if self._compaction_task and not self._compaction_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.compact_sync()
+            return
+        self._compaction_task = loop.create_task(self.compact())
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """
+        스냅샷과 저널을 재생하여 작업 레코드를 복원합니다. (블로킹 I/O)
+
+        Returns:
+            작업 ID를 키로, 작업 레코드를 값으로 하는 딕셔너리
+        """
+        records = _read_snapshot(self.snapshot_path)
+        _replay(records, self.compacting_path)
+        _replay(records, self.journal_path)
+        return records
+
+    def _rotate(self) -> bool:
+        """현재 저널을 압축 대상 파일로 교체합니다."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._entries_since_compaction = 0
+
+        if os.path.exists(self.compacting_path):
+            # 이전 압축이 중단된 경우, 남은 저널을 이어 붙여 함께 압축
+            if os.path.exists(self.journal_path):
+                with open(self.journal_path, "r", encoding="utf-8") as src, \
+                        open(self.compacting_path, "a", encoding="utf-8") as dst:
+                    dst.write(src.read())
+                os.remove(self.journal_path)
+            return True
+        if not os.path.exists(self.journal_path):
+            return False
+        os.replace(self.journal_path, self.compacting_path)
+        return True
+
+    def _write_compacted(self) -> int:
+        """스냅샷과 압축 대상 저널을 합쳐 새 스냅샷을 기록합니다. (블로킹 I/O)"""
+        records = _read_snapshot(self.snapshot_path)
+        _replay(records, self.compacting_path)
+
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+        os.remove(self.compacting_path)
+        return len(records)
+
+    async def compact(self) -> None:
+        """
+        저널을 스냅샷으로 압축합니다. 파일 기록은 실행기에서 수행합니다.
+
+        진행 중인 압축이 있으면 끝날 때까지 기다린 후 압축합니다.
+        """
+        async with self._compaction_lock:
+            # 대기 중인 기록을 먼저 쓰고, 기다린 뒤 바로 교체하여 기록과 겹치지 않게 함
+            await self.flush()
+            if not self._rotate():
+                return
+            loop = asyncio.get_running_loop()
+            try:
+                count = await loop.run_in_executor(
+                    self.executor, self._write_compacted
+                )
+                journal_logger.info(f"작업 저널 압축 완료: 작업 {count}개")
+            except Exception as e:
+                journal_logger.error(f"작업 저널 압축 중 오류 발생: {str(e)}")
+
+    def compact_sync(self) -> None:
+        """저널을 스냅샷으로 동기적으로 압축합니다."""
+        if self._rotate():
+            self._write_compacted()
+
+    async def close(self) -> None:
+        """진행 중인 압축을 기다린 후 저널을 압축하고 파일을 닫습니다."""
+        if self._compaction_task:
+            await asyncio.gather(self._compaction_task, return_exceptions=True)
+        await self.compact()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _read_snapshot(path: str) -> Dict[str, Dict[str, Any]]:
+    """스냅샷 파일을 읽습니다. 없으면 빈 딕셔너리를 반환합니다."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _replay(records: Dict[str, Dict[str, Any]], path: str) -> None:
+    """저널 파일의 상태 전이를 레코드에 순서대로 적용합니다."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # 비정상 종료로 마지막 줄이 잘린 경우 무시
+                journal_logger.warning(f"손상된 저널 항목 무시: {path}")
+                continue
+
+            job_id = entry.get("job_id")
+            if entry.get("op") == "set":
+                records.setdefault(job_id, {}).update(entry.get("fields", {}))
+            elif entry.get("op") == "del":
+                records.pop(job_id, None)
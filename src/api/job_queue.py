@@ -0,0 +1,457 @@
+"""
+작업 큐 및 워커 풀 구현.
+
+이 모듈은 앱 생성 작업을 제한된 크기의 큐에 넣고, 고정된 수의 워커
+코루틴이 처리하도록 하는 스케줄러를 제공합니다.
+
+워커는 작업마다 별도 태스크를 만들어 실행하므로, 작업 하나를 취소해도
+워커는 계속 다음 작업을 처리합니다.
+
+대기 작업은 다음 순서 점수가 가장 낮은 것부터 시작합니다.
+
+    점수 = 우선순위 벌점 + 예상 처리 시간 - aging_rate * 대기 시간
+
+- 우선순위 벌점: 우선순위 등급(interactive, batch)별 고정 값(초)으로,
+  배치 작업이 대화형 작업 뒤로 밀립니다.
+- 예상 처리 시간: 같은 등급 안에서는 짧은 작업이 먼저 시작합니다.
+- 대기 시간: 오래 기다린 작업은 점수가 계속 줄어들어 결국 시작되므로,
+  큰 작업이나 배치 작업이 무한히 밀리지 않습니다.
+
+모든 대기 작업의 점수가 같은 속도로 줄어들기 때문에 두 작업의 순서는
+시간이 지나도 바뀌지 않습니다. 따라서 점수를 "벌점 + 처리 시간 +
+aging_rate * 큐에 들어온 시각"으로 고정해 힙에 넣습니다. 예상 처리 시간이
+모두 같으면 먼저 들어온 작업이 먼저 시작합니다.
+"""
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import deque
+from typing import (
+    Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+)
+
+from src.utils.logger import setup_logger
+
+# 큐 로거 설정
+queue_logger = setup_logger("job_queue")
+
+# 우선순위 등급
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+
+class QueueFullError(Exception):
+    """작업 큐가 가득 차 새 작업을 받을 수 없을 때 발생하는 예외"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("작업 큐가 가득 찼습니다.")
+        self.retry_after = retry_after
+
+
+class QueueClosedError(Exception):
+    """서버 종료 중이라 작업 큐가 새 작업을 받지 않을 때 발생하는 예외"""
+
+    def __init__(self):
+        super().__init__("서버가 종료 중이므로 새 작업을 받을 수 없습니다.")
+
+
+class QueuedJob:
+    """큐에서 시작을 기다리는 작업"""
+
+    __slots__ = (
+        "job_id", "payload", "priority", "cost", "enqueued_at", "score", "seq"
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        payload: Any,
+        priority: str,
+        cost: float,
+        enqueued_at: float,
+        score: float,
+        seq: int,
+    ):
+        self.job_id = job_id
+        self.payload = payload
+        self.priority = priority
+        self.cost = cost
+        self.enqueued_at = enqueued_at
+        self.score = score
+        self.seq = seq
+
+    def __lt__(self, other: "QueuedJob") -> bool:
+        return (self.score, self.seq) < (other.score, other.seq)
+
+
+class JobQueue:
+    """
+    제한된 크기의 우선순위 작업 큐와 워커 풀.
+
+    큐가 가득 차면 submit()이 QueueFullError를 발생시켜 호출자가
+    요청을 거절(백프레셔)할 수 있도록 합니다.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[str, Any, float], Awaitable[Any]],
+        max_size: int,
+        worker_count: int,
+        default_retry_after: int = 5,
+        priority_penalties: Optional[Dict[str, float]] = None,
+        aging_rate: float = 1.0,
+    ):
+        """
+        Args:
+            handler: 작업을 처리할 코루틴 함수 (job_id, payload, 대기 시간)
+            max_size: 큐에 대기할 수 있는 최대 작업 수
+            worker_count: 동시에 작업을 처리할 워커 코루틴 수
+            default_retry_after: 처리 시간 통계가 없을 때의 재시도 대기 시간(초)
+            priority_penalties: 우선순위 등급별 순서 벌점(초)
+                (기본값: interactive와 batch 모두 0)
+            aging_rate: 대기 1초마다 줄어드는 순서 점수(초)
+        """
+        self.handler = handler
+        self.max_size = max(1, max_size)
+        self.worker_count = max(1, worker_count)
+        self.default_retry_after = default_retry_after
+        self.priority_penalties = (
+            dict(priority_penalties) if priority_penalties is not None
+            else {INTERACTIVE: 0.0, BATCH: 0.0}
+        )
+        self.aging_rate = max(0.0, aging_rate)
+
+        # 순서 점수 힙
+        self._pending: List[QueuedJob] = []
+        self._seq = itertools.count()
+        # 대기 작업이 생기기를 기다리는 워커
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._workers: List[asyncio.Task] = []
+        self._busy: Set[asyncio.Task] = set()
+        # 작업 ID -> 실행 중인 작업 태스크
+        self._tasks: Dict[str, asyncio.Task] = {}
+        # 작업 ID -> (시작 시각, 예상 처리 시간)
+        self._running_jobs: Dict[str, Tuple[float, float]] = {}
+        self._running = 0
+        self._closed = False
+        # schedule() 결과 캐시 (대기 힙이나 실행 중인 작업이 바뀌면 무효화)
+        self._plan: Optional[Dict[str, Dict[str, Any]]] = None
+        self._plan_valid_until = 0.0
+
+        # 처리 시간 및 대기 시간 이동 평균 (초)
+        self._avg_service_time: Optional[float] = None
+        self._avg_wait_time = 0.0
+
+    @property
+    def depth(self) -> int:
+        """현재 큐에서 대기 중인 작업 수"""
+        return len(self._pending)
+
+    @property
+    def full(self) -> bool:
+        """큐가 가득 차 새 작업을 받을 수 없는지 여부"""
+        return self.depth >= self.max_size
+
+    @property
+    def running(self) -> int:
+        """현재 워커가 처리 중인 작업 수"""
+        return self._running
+
+    @property
+    def avg_wait_time(self) -> float:
+        """최근 작업들의 평균 큐 대기 시간(초)"""
+        return self._avg_wait_time
+
+    @property
+    def started(self) -> bool:
+        """워커 풀이 시작되었는지 여부"""
+        return bool(self._workers)
+
+    @property
+    def closed(self) -> bool:
+        """종료 중이라 새 작업을 받지 않는지 여부"""
+        return self._closed
+
+    def start(self):
+        """워커 코루틴을 시작합니다. 이미 시작된 경우 아무 작업도 하지 않습니다."""
+        if self._workers:
+            return
+
+        for index in range(self.worker_count):
+            self._workers.append(
+                asyncio.create_task(
+                    self._worker(index), name=f"job-worker-{index}"
+                )
+            )
+        queue_logger.info(
+            f"작업 큐 시작: 워커 {self.worker_count}개, 최대 크기 {self.max_size}"
+        )
+
+    async def stop(self):
+        """모든 워커 코루틴을 취소하고 종료될 때까지 기다립니다."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._busy.clear()
+        self._tasks.clear()
+        self._running_jobs.clear()
+        self._pending = []
+        self._invalidate_plan()
+
+    async def drain(self, timeout: float) -> List[str]:
+        """
+        새 작업 접수를 중단하고 처리 중인 작업이 끝날 때까지 기다립니다.
+
+        대기 중인 작업은 시작하지 않고 큐에 남겨두며, 제한 시간 안에
+        끝나지 않은 작업은 취소합니다.
+
+        Args:
+            timeout: 처리 중인 작업을 기다릴 최대 시간(초)
+
+        Returns:
+            시작되지 못하고 큐에 남아 있던 작업 ID 목록
+        """
+        self._closed = True
+        busy = set(self._busy)
+        for worker in self._workers:
+            if worker not in busy:
+                worker.cancel()
+
+        if busy:
+            queue_logger.info(f"처리 중인 작업 {len(busy)}개 종료 대기 (최대 {timeout}초)")
+            _, pending = await asyncio.wait(busy, timeout=timeout)
+            if pending:
+                queue_logger.warning(
+                    f"제한 시간 초과로 작업 {len(pending)}개를 중단합니다."
+                )
+
+        left_over = [item.job_id for item in sorted(self._pending)]
+
+        await self.stop()
+        return left_over
+
+    def retry_after(self) -> int:
+        """
+        큐가 가득 찼을 때 클라이언트에게 제안할 재시도 대기 시간을 계산합니다.
+
+        Returns:
+            재시도까지 대기할 시간(초)
+        """
+        if self._avg_service_time is None:
+            return self.default_retry_after
+        estimate = self._avg_service_time * self.depth / self.worker_count
+        return max(1, math.ceil(estimate))
+
+    def submit(
+        self,
+        job_id: str,
+        payload: Any,
+        priority: str = INTERACTIVE,
+        cost: float = 0.0,
+    ) -> int:
+        """
+        작업을 큐에 추가합니다.
+
+        Args:
+            job_id: 작업 ID
+            payload: 핸들러에 전달할 작업 데이터
+            priority: 우선순위 등급
+            cost: 예상 처리 시간(초)
+
+        Returns:
+            큐에 추가된 후의 대기 순번 (1부터 시작)
+
+        Raises:
+            ValueError: 알 수 없는 우선순위 등급인 경우
+            QueueClosedError: 서버가 종료 중인 경우
+            QueueFullError: 큐가 가득 찬 경우
+        """
+        if priority not in self.priority_penalties:
+            raise ValueError(f"알 수 없는 우선순위: {priority}")
+        if self._closed:
+            raise QueueClosedError()
+        self.start()
+        if self.full:
+            raise QueueFullError(self.retry_after())
+
+        enqueued_at = time.time()
+        score = (
+            self.priority_penalties[priority] + cost + self.aging_rate * enqueued_at
+        )
+        item = QueuedJob(
+            job_id, payload, priority, cost, enqueued_at, score, next(self._seq)
+        )
+        heapq.heappush(self._pending, item)
+        self._invalidate_plan()
+        self._wake_worker()
+        return 1 + sum(1 for other in self._pending if other < item)
+
+    def position(self, job_id: str) -> Optional[int]:
+        """대기 중인 작업의 현재 대기 순번을 반환합니다. 대기 중이 아니면 None"""
+        for item in self._pending:
+            if item.job_id == job_id:
+                return 1 + sum(1 for other in self._pending if other < item)
+        return None
+
+    def _invalidate_plan(self):
+        """대기 힙이나 실행 중인 작업이 바뀌었을 때 schedule() 캐시를 버립니다."""
+        self._plan = None
+
+    def schedule(self) -> Dict[str, Dict[str, Any]]:
+        """
+        실행 중이거나 대기 중인 작업의 예상 시작/완료 시각을 계산합니다.
+
+        실행 중인 작업은 시작 시각과 예상 처리 시간으로 워커가 비는 시각을
+        정하고, 대기 작업을 시작 순서대로 가장 먼저 비는 워커에 배정합니다.
+        예상 처리 시간을 넘긴 작업은 곧 끝나는 것으로 봅니다.
+
+        계산에는 대기 작업 정렬이 필요하므로 결과를 캐시하고, 작업이 큐에
+        들어오거나 빠지거나 시작/종료될 때, 또는 실행 중인 작업이 예상
+        처리 시간을 넘길 때 다시 계산합니다. 반환값은 수정하지 않아야 합니다.
+
+        Returns:
+            작업 ID별 queue_position(실행 중이면 0), expected_start,
+            expected_finish(epoch 초)
+        """
+        now = time.time()
+        if self._plan is not None and now < self._plan_valid_until:
+            return self._plan
+
+        plan: Dict[str, Dict[str, Any]] = {}
+        free_at: List[float] = []
+        # 실행 중인 작업이 예상 처리 시간을 넘기면 완료 예상 시각이 현재 시각을
+        # 따라가므로 그때까지만 캐시를 사용
+        valid_until = math.inf
+        for job_id, (started_at, cost) in self._running_jobs.items():
+            finish = max(now, started_at + cost)
+            valid_until = min(valid_until, started_at + cost)
+            free_at.append(finish)
+            plan[job_id] = {
+                "queue_position": 0,
+                "expected_start": round(started_at, 3),
+                "expected_finish": round(finish, 3),
+            }
+        free_at.extend([now] * max(0, self.worker_count - len(free_at)))
+        heapq.heapify(free_at)
+
+        for position, item in enumerate(sorted(self._pending), 1):
+            start = heapq.heappop(free_at)
+            finish = start + item.cost
+            heapq.heappush(free_at, finish)
+            plan[item.job_id] = {
+                "queue_position": position,
+                "expected_start": round(start, 3),
+                "expected_finish": round(finish, 3),
+            }
+        self._plan = plan
+        self._plan_valid_until = valid_until
+        return plan
+
+    def job_ids(self) -> List[str]:
+        """실행 중이거나 대기 중인 작업 ID 목록을 반환합니다."""
+        return [*self._tasks, *(item.job_id for item in self._pending)]
+
+    def task(self, job_id: str) -> Optional[asyncio.Task]:
+        """실행 중인 작업의 태스크를 반환합니다. 실행 중이 아니면 None"""
+        return self._tasks.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """
+        작업을 취소합니다.
+
+        대기 중인 작업은 큐에서 빼서 자리를 바로 반환하고, 실행 중인 작업은
+        태스크를 취소합니다. 취소된 태스크가 끝날 때까지 기다리려면
+        취소 전에 task()로 태스크를 받아 두어야 합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            "queued"(큐에서 뺌), "running"(실행 중 취소) 또는 큐에 없으면 None
+        """
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+            return "running"
+        for index, item in enumerate(self._pending):
+            if item.job_id == job_id:
+                self._pending.pop(index)
+                heapq.heapify(self._pending)
+                self._invalidate_plan()
+                queue_logger.info(f"대기 중인 작업 취소: {job_id}")
+                return "queued"
+        return None
+
+    def _wake_worker(self):
+        """대기 작업을 기다리는 워커 하나를 깨웁니다."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _next_job(self) -> QueuedJob:
+        """순서 점수가 가장 낮은 대기 작업을 꺼냅니다. 없으면 생길 때까지 기다립니다."""
+        while not self._pending:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # 깨운 직후 취소된 경우 다른 워커가 작업을 가져가도록 넘김
+                if waiter.done() and not waiter.cancelled() and self._pending:
+                    self._wake_worker()
+                raise
+        self._invalidate_plan()
+        return heapq.heappop(self._pending)
+
+    async def _worker(self, index: int):
+        """큐에서 순서 점수가 가장 낮은 작업을 꺼내 처리하는 워커 코루틴"""
+        current = asyncio.current_task()
+        while not self._closed:
+            item = await self._next_job()
+            job_id, payload = item.job_id, item.payload
+            wait_time = time.time() - item.enqueued_at
+            self._avg_wait_time = _ewma(self._avg_wait_time, wait_time)
+
+            self._busy.add(current)
+            self._running += 1
+            started_at = time.time()
+            self._running_jobs[job_id] = (started_at, item.cost)
+            self._invalidate_plan()
+            task = asyncio.create_task(
+                self.handler(job_id, payload, wait_time), name=f"job-{job_id}"
+            )
+            self._tasks[job_id] = task
+            try:
+                await asyncio.shield(task)
+            except asyncio.CancelledError:
+                if not task.cancelled():
+                    # 워커 자체가 취소된 경우(서버 종료): 작업도 취소하고 종료
+                    task.cancel()
+                    await asyncio.wait({task})
+                    raise
+                queue_logger.info(f"워커 {index} 작업 취소됨: {job_id}")
+            except Exception as e:
+                queue_logger.error(
+                    f"워커 {index} 작업 처리 중 오류 발생: {job_id}, {str(e)}"
+                )
+            finally:
+                self._tasks.pop(job_id, None)
+                self._running_jobs.pop(job_id, None)
+                self._invalidate_plan()
+                self._busy.discard(current)
+                self._running -= 1
+                self._avg_service_time = _ewma(
+                    self._avg_service_time, time.time() - started_at
+                )
+
+
+def _ewma(previous: Optional[float], sample: float, alpha: float = 0.2) -> float:
+    """지수 가중 이동 평균을 계산합니다."""
+    if previous is None:
+        return sample
+    return previous + alpha * (sample - previous)
@@ -0,0 +1,715 @@
+"""
+작업 상태 저장소 구현.
+
+이 모듈은 작업 레코드를 저장하는 JobStore 인터페이스와
+메모리 기반 구현, Redis 기반 구현을 제공합니다. Redis 구현을 사용하면
+여러 uvicorn 워커 프로세스가 동일한 작업 상태를 공유할 수 있습니다.
+
+작업 레코드는 JSON으로 직렬화 가능한 값만 포함해야 합니다.
+작업 목록은 (생성 시간, 작업 ID) 순으로 정렬되며, 상태와 앱 이름별
+보조 인덱스와 상태별 카운터는 상태 전이마다 함께 갱신됩니다.
+"""
+import base64
+import binascii
+import json
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+# 저장소 로거 설정
+store_logger = setup_logger("job_store")
+
+# 작업 정렬 키 (생성 시간, 작업 ID)
+JobKey = Tuple[float, str]
+
+# 한 번 기록되면 다른 상태로 바꿀 수 없는 작업 상태. 취소된 작업을 늦게 끝난
+# 워커가 completed 등으로 덮어쓰지 않도록 update()가 상태 변경을 거부함
+STICKY_STATUSES = ("cancelled",)
+
+
+class InvalidCursorError(ValueError):
+    """페이지 커서 형식이 올바르지 않을 때 발생하는 예외"""
+
+
+class JobStatusConflictError(Exception):
+    """더 바꿀 수 없는 상태의 작업을 다른 상태로 바꾸려 할 때 발생하는 예외"""
+
+    def __init__(self, job_id: str, status: str):
+        super().__init__(f"{status} 상태인 작업의 상태를 바꿀 수 없습니다: {job_id}")
+        self.job_id = job_id
+        self.status = status
+
+
+def check_status_transition(
+    job_id: str, old_status: Optional[str], fields: Dict[str, Any]
+) -> None:
+    """
+    갱신할 필드의 상태 변경이 허용되는지 확인합니다.
+
+    Args:
+        job_id: 작업 ID
+        old_status: 저장된 현재 상태
+        fields: 갱신할 필드
+
+    Raises:
+        JobStatusConflictError: 현재 상태가 STICKY_STATUSES이고 다른 상태로
+            바꾸려는 경우
+    """
+    new_status = fields.get("status", old_status)
+    if old_status in STICKY_STATUSES and new_status != old_status:
+        raise JobStatusConflictError(job_id, old_status)
+
+
+def encode_cursor(key: JobKey) -> str:
+    """
+    작업 정렬 키를 페이지 커서 문자열로 변환합니다.
+
+    Args:
+        key: (생성 시간, 작업 ID)
+
+    Returns:
+        URL에 안전한 커서 문자열
+    """
+    raw = json.dumps([key[0], key[1]]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> JobKey:
+    """
+    페이지 커서 문자열을 작업 정렬 키로 변환합니다.
+
+    Args:
+        cursor: encode_cursor()가 만든 커서 문자열
+
+    Returns:
+        (생성 시간, 작업 ID)
+
+    Raises:
+        InvalidCursorError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        start_time, job_id = json.loads(base64.urlsafe_b64decode(padded))
+        return float(start_time), str(job_id)
+    except (binascii.Error, ValueError, TypeError) as e:
+        raise InvalidCursorError(f"잘못된 페이지 커서입니다: {cursor}") from e
+
+
+def job_key(record: Dict[str, Any]) -> JobKey:
+    """작업 레코드의 정렬 키를 반환합니다."""
+    return float(record.get("start_time") or 0), record["job_id"]
+
+
+def job_app_name(record: Dict[str, Any]) -> Optional[str]:
+    """작업 레코드의 앱 이름을 반환합니다."""
+    app_spec = record.get("app_spec")
+    if isinstance(app_spec, dict) and app_spec.get("app_name"):
+        return str(app_spec["app_name"])
+    return None
+
+
+def _start_key(since: Optional[float], cursor: Optional[str]) -> Optional[JobKey]:
+    """since와 cursor 중 더 뒤쪽의 시작 위치를 계산합니다. (키 자체는 제외)"""
+    after = decode_cursor(cursor) if cursor else None
+    if since is not None:
+        # 작업 ID는 빈 문자열보다 크므로 since 시각의 작업도 포함됨
+        since_key = (float(since), "")
+        if after is None or since_key > after:
+            after = since_key
+    return after
+
+
+class JobStore(ABC):
+    """작업 레코드 저장소 인터페이스"""
+
+    @abstractmethod
+    async def create(self, record: Dict[str, Any]) -> None:
+        """
+        새 작업 레코드를 저장합니다.
+
+        Args:
+            record: job_id, status, start_time 필드를 포함하는 작업 레코드
+        """
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 레코드를 조회합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            작업 레코드 사본 또는 None
+        """
+
+    @abstractmethod
+    async def update(
+        self, job_id: str, **fields: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        작업 레코드의 일부 필드를 갱신합니다.
+
+        현재 상태를 확인하고 갱신하는 과정은 원자적으로 수행됩니다(compare-and-set).
+
+        Args:
+            job_id: 작업 ID
+            **fields: 갱신할 필드
+
+        Returns:
+            갱신된 작업 레코드 사본 또는 작업이 없으면 None
+
+        Raises:
+            JobStatusConflictError: 취소된 작업을 다른 상태로 바꾸려는 경우
+                (아무 필드도 갱신하지 않음)
+        """
+
+    @abstractmethod
+    async def delete(self, job_id: str) -> bool:
+        """
+        작업 레코드를 삭제합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            삭제 여부
+        """
+
+    @abstractmethod
+    async def list_jobs(self) -> List[Dict[str, Any]]:
+        """
+        모든 작업 레코드를 생성 시간 순으로 조회합니다.
+
+        Returns:
+            작업 레코드 사본 목록
+        """
+
+    @abstractmethod
+    async def job_ids_by_status(self, status: str) -> List[str]:
+        """
+        특정 상태의 작업 ID를 생성 시간 순으로 조회합니다.
+
+        Args:
+            status: 작업 상태
+
+        Returns:
+            작업 ID 목록
+        """
+
+    @abstractmethod
+    async def count_by_status(self) -> Dict[str, int]:
+        """
+        상태별 작업 수를 조회합니다.
+
+        Returns:
+            상태를 키로, 작업 수를 값으로 하는 딕셔너리
+        """
+
+    @abstractmethod
+    async def get_many(self, job_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 작업 레코드를 한 번에 조회합니다.
+
+        Args:
+            job_ids: 작업 ID 목록
+
+        Returns:
+            작업 ID를 키로 하는 작업 레코드 사본 (없는 작업은 제외)
+        """
+
+    @abstractmethod
+    async def query_jobs(
+        self,
+        status: Optional[str] = None,
+        app_name: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        조건에 맞는 작업 레코드를 생성 시간 순으로 한 페이지 조회합니다.
+
+        Args:
+            status: 작업 상태 필터
+            app_name: 앱 이름 필터
+            since: 이 시각(epoch 초) 이후에 생성된 작업만 조회
+            limit: 페이지 크기
+            cursor: 이전 페이지가 반환한 다음 페이지 커서
+
+        Returns:
+            (작업 레코드 사본 목록, 다음 페이지 커서 또는 None)
+
+        Raises:
+            InvalidCursorError: 커서 형식이 올바르지 않은 경우
+        """
+
+    async def exists(self, job_id: str) -> bool:
+        """작업 레코드 존재 여부를 확인합니다."""
+        return await self.get(job_id) is not None
+
+    async def close(self) -> None:
+        """저장소 연결을 정리합니다."""
+
+
+class _OrderedIndex:
+    """(생성 시간, 작업 ID) 순으로 정렬된 작업 키 인덱스"""
+
+    def __init__(self):
+        self._keys: List[JobKey] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: JobKey):
+        # 대부분의 작업은 가장 최근에 생성되므로 끝에 추가됨
+        if not self._keys or self._keys[-1] < key:
+            self._keys.append(key)
+        else:
+            insort(self._keys, key)
+
+    def remove(self, key: JobKey):
+        index = bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            del self._keys[index]
+
+    def iter_after(self, after: Optional[JobKey]) -> Iterator[JobKey]:
+        index = bisect_right(self._keys, after) if after is not None else 0
+        while index < len(self._keys):
+            yield self._keys[index]
+            index += 1
+
+
+class InMemoryJobStore(JobStore):
+    """단일 프로세스용 메모리 기반 작업 저장소"""
+
+    def __init__(self):
+        self._records: Dict[str, Dict[str, Any]] = {}
+        # 생성 순서 인덱스 및 상태/앱 이름별 보조 인덱스
+        self._created = _OrderedIndex()
+        self._status_index: Dict[str, _OrderedIndex] = {}
+        self._app_index: Dict[str, _OrderedIndex] = {}
+        # 상태별 작업 수 (상태 전이마다 갱신)
+        self._status_counts: Dict[str, int] = {}
+
+    async def create(self, record: Dict[str, Any]) -> None:
+        job_id = record["job_id"]
+        if job_id in self._records:
+            await self.delete(job_id)
+
+        self._records[job_id] = dict(record)
+        key = job_key(record)
+        self._created.add(key)
+        self._index_status(key, record.get("status"))
+        self._index_app(key, job_app_name(record))
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        record = self._records.get(job_id)
+        return dict(record) if record is not None else None
+
+    async def get_many(self, job_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        return {
+            job_id: dict(self._records[job_id])
+            for job_id in job_ids if job_id in self._records
+        }
+
+    async def update(
+        self, job_id: str, **fields: Any
+    ) -> Optional[Dict[str, Any]]:
+        record = self._records.get(job_id)
+        if record is None:
+            return None
+
+        old_status = record.get("status")
+        old_app_name = job_app_name(record)
+        check_status_transition(job_id, old_status, fields)
+        record.update(fields)
+        key = job_key(record)
+        if "status" in fields and fields["status"] != old_status:
+            self._unindex_status(key, old_status)
+            self._index_status(key, fields["status"])
+        # 명세 변경으로 앱 이름이 바뀌면 앱 이름 인덱스도 옮김
+        new_app_name = job_app_name(record)
+        if new_app_name != old_app_name:
+            self._unindex_app(key, old_app_name)
+            self._index_app(key, new_app_name)
+        return dict(record)
+
+    async def delete(self, job_id: str) -> bool:
+        record = self._records.pop(job_id, None)
+        if record is None:
+            return False
+
+        key = job_key(record)
+        self._created.remove(key)
+        self._unindex_status(key, record.get("status"))
+        self._unindex_app(key, job_app_name(record))
+        return True
+
+    async def list_jobs(self) -> List[Dict[str, Any]]:
+        return [
+            dict(self._records[job_id])
+            for _, job_id in self._created.iter_after(None)
+        ]
+
+    async def job_ids_by_status(self, status: str) -> List[str]:
+        index = self._status_index.get(status)
+        if index is None:
+            return []
+        return [job_id for _, job_id in index.iter_after(None)]
+
+    async def count_by_status(self) -> Dict[str, int]:
+        return {
+            status: count
+            for status, count in self._status_counts.items() if count
+        }
+
+    async def query_jobs(
+        self,
+        status: Optional[str] = None,
+        app_name: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        after = _start_key(since, cursor)
+        limit = max(1, limit)
+
+        # 가장 작은 인덱스를 순회하고 나머지 조건은 레코드로 확인
+        candidates = [self._created]
+        if status is not None:
+            candidates.append(self._status_index.get(status, _OrderedIndex()))
+        if app_name is not None:
+            candidates.append(self._app_index.get(app_name, _OrderedIndex()))
+        index = min(candidates, key=len)
+
+        page: List[Dict[str, Any]] = []
+        for key in index.iter_after(after):
+            record = self._records[key[1]]
+            if status is not None and record.get("status") != status:
+                continue
+            if app_name is not None and job_app_name(record) != app_name:
+                continue
+            if len(page) == limit:
+                return page, encode_cursor(job_key(page[-1]))
+            page.append(dict(record))
+        return page, None
+
+    def _index_status(self, key: JobKey, status: Optional[str]):
+        if status is not None:
+            self._status_index.setdefault(status, _OrderedIndex()).add(key)
+            self._status_counts[status] = self._status_counts.get(status, 0) + 1
+
+    def _unindex_status(self, key: JobKey, status: Optional[str]):
+        if status is not None and status in self._status_index:
+            self._status_index[status].remove(key)
+            self._status_counts[status] -= 1
+
+    def _index_app(self, key: JobKey, app_name: Optional[str]):
+        if app_name is not None:
+            self._app_index.setdefault(app_name, _OrderedIndex()).add(key)
+
+    def _unindex_app(self, key: JobKey, app_name: Optional[str]):
+        if app_name in self._app_index:
+            self._app_index[app_name].remove(key)
+            if not self._app_index[app_name]:
+                del self._app_index[app_name]
+
+
+class RedisJobStore(JobStore):
+    """
+    Redis 기반 작업 저장소.
+
+    키 구성:
+        {prefix}:job:{job_id}      작업 레코드 해시 (필드 값은 JSON)
+        {prefix}:jobs              전체 작업 정렬 집합 (점수: 생성 시간)
+        {prefix}:status:{status}   상태별 작업 정렬 집합 (점수: 생성 시간)
+        {prefix}:app:{app_name}    앱 이름별 작업 정렬 집합 (점수: 생성 시간)
+        {prefix}:counts            상태별 작업 수 해시
+
+    같은 점수의 멤버는 사전 순으로 정렬되므로 정렬 집합의 순서는
+    (생성 시간, 작업 ID) 순서와 같습니다.
+    """
+
+    # 페이지 조회 시 한 번에 읽을 인덱스 항목 수
+    SCAN_BATCH = 200
+
+    def __init__(self, client: Any, prefix: str = "aof"):
+        """
+        Args:
+            client: redis.asyncio.Redis 호환 클라이언트 (decode_responses=True)
+            prefix: 키 접두사
+        """
+        self.redis = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "aof") -> "RedisJobStore":
+        """Redis URL로부터 저장소를 생성합니다."""
+        import redis.asyncio as redis_asyncio
+
+        client = redis_asyncio.Redis.from_url(url, decode_responses=True)
+        return cls(client, prefix=prefix)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    def _status_key(self, status: str) -> str:
+        return f"{self.prefix}:status:{status}"
+
+    def _app_key(self, app_name: str) -> str:
+        return f"{self.prefix}:app:{app_name}"
+
+    @property
+    def _all_key(self) -> str:
+        return f"{self.prefix}:jobs"
+
+    @property
+    def _counts_key(self) -> str:
+        return f"{self.prefix}:counts"
+
+    @staticmethod
+    def _encode(fields: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            key: json.dumps(value, ensure_ascii=False)
+            for key, value in fields.items()
+        }
+
+    @staticmethod
+    def _decode(raw: Dict[str, str]) -> Dict[str, Any]:
+        return {key: json.loads(value) for key, value in raw.items()}
+
+    def _add_to_indexes(self, pipe: Any, record: Dict[str, Any]):
+        """파이프라인에 레코드의 인덱스 및 카운터 추가 명령을 넣습니다."""
+        created, job_id = job_key(record)
+        status = record.get("status", "pending")
+        pipe.zadd(self._all_key, {job_id: created})
+        pipe.zadd(self._status_key(status), {job_id: created})
+        pipe.hincrby(self._counts_key, status, 1)
+        app_name = job_app_name(record)
+        if app_name is not None:
+            pipe.zadd(self._app_key(app_name), {job_id: created})
+
+    def _remove_from_indexes(self, pipe: Any, record: Dict[str, Any]):
+        """파이프라인에 레코드의 인덱스 및 카운터 제거 명령을 넣습니다."""
+        job_id = record["job_id"]
+        status = record.get("status", "pending")
+        pipe.zrem(self._all_key, job_id)
+        pipe.zrem(self._status_key(status), job_id)
+        pipe.hincrby(self._counts_key, status, -1)
+        app_name = job_app_name(record)
+        if app_name is not None:
+            pipe.zrem(self._app_key(app_name), job_id)
+
+    async def create(self, record: Dict[str, Any]) -> None:
+        from redis.exceptions import WatchError
+
+        record = dict(record, status=record.get("status", "pending"))
+        key = self._job_key(record["job_id"])
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    # 같은 ID의 레코드가 있으면 인덱스와 카운터를 먼저 정리
+                    await pipe.watch(key)
+                    raw = await pipe.hgetall(key)
+
+                    pipe.multi()
+                    if raw:
+                        self._remove_from_indexes(pipe, self._decode(raw))
+                        pipe.delete(key)
+                    pipe.hset(key, mapping=self._encode(record))
+                    self._add_to_indexes(pipe, record)
+                    await pipe.execute()
+                    return
+                except WatchError:
+                    continue
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self.redis.hgetall(self._job_key(job_id))
+        return self._decode(raw) if raw else None
+
+    async def get_many(self, job_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        job_ids = list(job_ids)
+        if not job_ids:
+            return {}
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for job_id in job_ids:
+                pipe.hgetall(self._job_key(job_id))
+            raws = await pipe.execute()
+        return {
+            job_id: self._decode(raw)
+            for job_id, raw in zip(job_ids, raws) if raw
+        }
+
+    async def update(
+        self, job_id: str, **fields: Any
+    ) -> Optional[Dict[str, Any]]:
+        from redis.exceptions import WatchError
+
+        key = self._job_key(job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    # 인덱스 갱신을 위해 이전 상태와 앱 이름을 읽고 원자적으로 갱신
+                    await pipe.watch(key)
+                    raw = await pipe.hgetall(key)
+                    if not raw:
+                        await pipe.reset()
+                        return None
+                    record = self._decode(raw)
+                    old_status = record.get("status")
+                    try:
+                        check_status_transition(job_id, old_status, fields)
+                    except JobStatusConflictError:
+                        await pipe.reset()
+                        raise
+
+                    pipe.multi()
+                    pipe.hset(key, mapping=self._encode(fields))
+                    new_status = fields.get("status", old_status)
+                    if new_status != old_status:
+                        created = job_key(record)[0]
+                        if old_status is not None:
+                            pipe.zrem(self._status_key(old_status), job_id)
+                            pipe.hincrby(self._counts_key, old_status, -1)
+                        pipe.zadd(
+                            self._status_key(new_status), {job_id: created}
+                        )
+                        pipe.hincrby(self._counts_key, new_status, 1)
+                    # 명세 변경으로 앱 이름이 바뀌면 앱 이름 인덱스도 옮김
+                    old_app_name = job_app_name(record)
+                    new_app_name = job_app_name({**record, **fields})
+                    if new_app_name != old_app_name:
+                        created = job_key(record)[0]
+                        if old_app_name is not None:
+                            pipe.zrem(self._app_key(old_app_name), job_id)
+                        if new_app_name is not None:
+                            pipe.zadd(
+                                self._app_key(new_app_name), {job_id: created}
+                            )
+                    await pipe.execute()
+
+                    record.update(fields)
+                    return record
+                except WatchError:
+                    continue
+
+    async def delete(self, job_id: str) -> bool:
+        from redis.exceptions import WatchError
+
+        key = self._job_key(job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            while True:
+                try:
+                    await pipe.watch(key)
+                    raw = await pipe.hgetall(key)
+                    if not raw:
+                        await pipe.reset()
+                        return False
+
+                    pipe.multi()
+                    pipe.delete(key)
+                    self._remove_from_indexes(pipe, self._decode(raw))
+                    await pipe.execute()
+                    return True
+                except WatchError:
+                    continue
+
+    async def list_jobs(self) -> List[Dict[str, Any]]:
+        job_ids = await self.redis.zrange(self._all_key, 0, -1)
+        records = await self.get_many(job_ids)
+        return [records[job_id] for job_id in job_ids if job_id in records]
+
+    async def job_ids_by_status(self, status: str) -> List[str]:
+        return await self.redis.zrange(self._status_key(status), 0, -1)
+
+    async def count_by_status(self) -> Dict[str, int]:
+        counts = await self.redis.hgetall(self._counts_key)
+        return {
+            status: int(count)
+            for status, count in sorted(counts.items()) if int(count) > 0
+        }
+
+    async def query_jobs(
+        self,
+        status: Optional[str] = None,
+        app_name: Optional[str] = None,
+        since: Optional[float] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        after = _start_key(since, cursor)
+        limit = max(1, limit)
+
+        # 가장 작은 인덱스를 순회하고 나머지 조건은 레코드로 확인
+        candidates = [self._all_key]
+        if status is not None:
+            candidates.append(self._status_key(status))
+        if app_name is not None:
+            candidates.append(self._app_key(app_name))
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for candidate in candidates:
+                pipe.zcard(candidate)
+            sizes = await pipe.execute()
+        index_key = candidates[sizes.index(min(sizes))]
+
+        min_score = repr(after[0]) if after is not None else "-inf"
+        offset = 0
+        page: List[Dict[str, Any]] = []
+        while True:
+            batch = await self.redis.zrangebyscore(
+                index_key, min_score, "+inf",
+                start=offset, num=self.SCAN_BATCH, withscores=True
+            )
+            if not batch:
+                return page, None
+            offset += len(batch)
+
+            # 같은 점수에서 커서 이전의 항목 제외
+            job_ids = [
+                job_id for job_id, score in batch
+                if after is None or (float(score), job_id) > after
+            ]
+            records = await self.get_many(job_ids)
+            for job_id in job_ids:
+                record = records.get(job_id)
+                if record is None:
+                    continue
+                if status is not None and record.get("status") != status:
+                    continue
+                if app_name is not None and job_app_name(record) != app_name:
+                    continue
+                if len(page) == limit:
+                    return page, encode_cursor(job_key(page[-1]))
+                page.append(record)
+
+    async def exists(self, job_id: str) -> bool:
+        return bool(await self.redis.exists(self._job_key(job_id)))
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+def create_job_store(backend: str, redis_url: str, prefix: str) -> JobStore:
+    """
+    설정에 따라 작업 저장소를 생성합니다.
+
+    Args:
+        backend: "memory" 또는 "redis"
+        redis_url: Redis 연결 URL
+        prefix: Redis 키 접두사
+
+    Returns:
+        JobStore 구현 객체
+    """
+    if backend == "redis":
+        store_logger.info(f"Redis 작업 저장소 사용: {redis_url}")
+        return RedisJobStore.from_url(redis_url, prefix=prefix)
+
+    if backend != "memory":
+        store_logger.warning(f"알 수 없는 작업 저장소 유형: {backend}, 메모리 사용")
+    return InMemoryJobStore()
@@ -0,0 +1,371 @@
+"""
+워커 프로세스 풀 구현.
+
+이 모듈은 템플릿 렌더링과 ZIP 압축처럼 CPU를 많이 쓰는 작업을 별도
+프로세스에서 실행하는 ProcessWorkerPool을 제공합니다. 서버 프로세스의 GIL을
+공유하지 않으므로 여러 코어를 사용할 수 있고, 잘못된 명세로 워커가
+비정상 종료되어도 서버는 계속 동작합니다.
+
+- 워커는 spawn 방식으로 시작하므로 이벤트 루프나 스레드 상태를 물려받지 않습니다.
+- 작업 함수는 결과(파일 목록, 매니페스트)만 반환하고, 진행 메시지는
+  report(event, payload) 콜백으로 보내면 프로세스 간 큐를 거쳐 이벤트
+  루프에서 on_progress로 전달됩니다.
+- 워커별 메모리 한도(RLIMIT_AS)와 작업별 CPU 시간 한도(RLIMIT_CPU)를
+  적용하며, 워커는 정해진 수의 작업을 처리하면 새 프로세스로 교체됩니다.
+- run()을 실행하던 코루틴이 취소되면 워커에 SIGUSR1을 보내고, 작업 함수는
+  다음 진행 메시지를 보낼 때 TaskCancelledError로 중단됩니다. run()은 작업
+  함수가 실제로 끝난 뒤에 취소를 전파하므로, 호출자는 취소 직후 출력을
+  정리해도 워커가 이후에 파일을 더 쓰지 않습니다.
+
+리소스 한도는 resource 모듈을 지원하는 POSIX 환경에서만 적용됩니다.
+"""
+import asyncio
+import inspect
+import math
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Union
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from src.utils.logger import setup_logger
+
+# 프로세스 풀 로거 설정
+pool_logger = setup_logger("process_pool")
+
+# 작업 함수가 끝났음을 알리는 진행 메시지 (이후 메시지가 더 없음)
+_TASK_DONE = "__done__"
+# 실행기 future가 끝났음을 알리는 내부 메시지
+_FUTURE_DONE = "__future__"
+# 작업 함수 시작을 알리는 진행 메시지 (워커 프로세스 ID 포함)
+_TASK_STARTED = "__started__"
+
+ProgressCallback = Callable[[str, Any], Union[None, Awaitable[None]]]
+
+
+class CpuLimitExceededError(Exception):
+    """작업이 CPU 시간 한도를 초과한 경우"""
+
+
+class WorkerCrashedError(Exception):
+    """워커 프로세스가 비정상 종료된 경우 (메모리 부족으로 종료된 경우 포함)"""
+
+
+class TaskCancelledError(Exception):
+    """실행 중인 작업이 취소 요청을 받아 중단된 경우"""
+
+
+# ===== 워커 프로세스에서 실행되는 함수 =====
+
+_progress_queue = None
+# 현재 작업에 취소 요청이 왔는지 여부 (SIGUSR1 처리기가 설정)
+_cancel_requested = False
+
+
+def _raise_cpu_limit(signum, frame):
+    raise CpuLimitExceededError("작업이 CPU 시간 한도를 초과했습니다.")
+
+
+def _request_cancel(signum, frame):
+    global _cancel_requested
+    _cancel_requested = True
+
+
+def _init_worker(progress_queue, memory_limit: int):
+    """워커 프로세스 초기화: 진행 큐 연결 및 메모리 한도 설정"""
+    global _progress_queue
+    _progress_queue = progress_queue
+    # 서버 종료 시 Ctrl+C가 워커에서 KeyboardInterrupt를 일으키지 않도록 무시
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if hasattr(signal, "SIGUSR1"):
+        signal.signal(signal.SIGUSR1, _request_cancel)
+    if resource is None:
+        return
+    if memory_limit > 0:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            memory_limit = min(memory_limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, hard))
+    # CPU 시간 초과 시 프로세스를 종료하지 않고 작업에서 예외 발생
+    signal.signal(signal.SIGXCPU, _raise_cpu_limit)
+
+
+def _limit_cpu(cpu_limit: float) -> Optional[Tuple[int, int]]:
+    """현재까지 사용한 CPU 시간에 작업 한도를 더해 소프트 한도로 설정합니다."""
+    if resource is None or cpu_limit <= 0:
+        return None
+    previous = resource.getrlimit(resource.RLIMIT_CPU)
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = math.ceil(usage.ru_utime + usage.ru_stime + cpu_limit)
+    hard = previous[1]
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    return previous
+
+
+def _run_task(task_id: str, cpu_limit: float, func: Callable, args: tuple):
+    """
+    워커에서 작업 함수를 실행합니다. 진행 메시지는 작업 ID와 함께 큐로 보냅니다.
+
+    작업 함수가 진행 메시지를 보낼 때 취소 요청이 와 있으면 TaskCancelledError로
+    중단합니다. 신호 처리기에서 바로 예외를 일으키지 않으므로 파일을 쓰는
+    도중에는 중단되지 않습니다.
+    """
+    global _cancel_requested
+
+    def report(event: str, payload: Any = None):
+        _progress_queue.put((task_id, event, payload))
+
+    def report_or_cancel(event: str, payload: Any = None):
+        if _cancel_requested:
+            raise TaskCancelledError("작업이 취소되었습니다.")
+        report(event, payload)
+
+    _cancel_requested = False
+    report(_TASK_STARTED, os.getpid())
+    previous = _limit_cpu(cpu_limit)
+    try:
+        return func(*args, report=report_or_cancel)
+    finally:
+        if previous is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, previous)
+        report(_TASK_DONE)
+
+
+# ===== 서버 프로세스 =====
+
+class ProcessWorkerPool:
+    """진행 메시지 채널과 리소스 한도를 갖춘 워커 프로세스 풀"""
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_tasks_per_worker: int = 0,
+        memory_limit: int = 0,
+        cpu_limit: float = 0,
+    ):
+        """
+        Args:
+            max_workers: 워커 프로세스 수
+            max_tasks_per_worker: 워커를 교체하기 전까지 처리할 작업 수 (0이면 교체 안 함)
+            memory_limit: 워커별 주소 공간 한도(바이트, 0이면 제한 없음)
+            cpu_limit: 작업별 CPU 시간 한도(초, 0이면 제한 없음)
+        """
+        self.max_workers = max_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.memory_limit = memory_limit
+        self.cpu_limit = cpu_limit
+
+        self._context = multiprocessing.get_context("spawn")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # max_tasks_per_child를 지원하지 않는 버전에서 풀 전체를 교체하기 위한 카운터
+        self._submitted = 0
+        self._progress_queue = None
+        self._reader: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # 작업 ID -> 진행 메시지 채널
+        self._channels: Dict[str, asyncio.Queue] = {}
+
+        self.tasks = 0
+        self.crashes = 0
+
+    def _start(self) -> ProcessPoolExecutor:
+        """필요하면 진행 메시지 리더와 프로세스 실행기를 시작합니다."""
+        if self._progress_queue is None:
+            self._loop = asyncio.get_running_loop()
+            self._progress_queue = self._context.Queue()
+            self._reader = threading.Thread(
+                target=self._read_progress, name="process-pool-progress",
+                daemon=True
+            )
+            self._reader.start()
+
+        native_recycle = sys.version_info >= (3, 11)
+        if (
+            self._executor is not None
+            and not native_recycle
+            and self.max_tasks_per_worker > 0
+            and self._submitted >= self.max_tasks_per_worker * self.max_workers
+        ):
+            # 실행 중인 작업은 기존 프로세스에서 끝까지 실행
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        if self._executor is None:
+            kwargs = {}
+            if native_recycle and self.max_tasks_per_worker > 0:
+                kwargs["max_tasks_per_child"] = self.max_tasks_per_worker
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(self._progress_queue, self.memory_limit),
+                **kwargs
+            )
+            self._submitted = 0
+        return self._executor
+
+    def _read_progress(self):
+        """프로세스 간 진행 큐를 읽어 이벤트 루프의 채널로 전달합니다. (리더 스레드)"""
+        while True:
+            try:
+                message = self._progress_queue.get()
+            except (EOFError, OSError):
+                return
+            if message is None:
+                return
+            try:
+                self._loop.call_soon_threadsafe(self._dispatch, *message)
+            except RuntimeError:
+                # 이벤트 루프가 닫힌 경우
+                return
+
+    def _dispatch(self, task_id: str, event: str, payload: Any):
+        channel = self._channels.get(task_id)
+        if channel is not None:
+            channel.put_nowait((event, payload))
+
+    async def run(
+        self,
+        task_id: str,
+        func: Callable,
+        *args: Any,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> Any:
+        """
+        워커 프로세스에서 작업 함수를 실행하고 결과를 반환합니다.
+
+        작업 함수는 모듈 최상위에 정의되어 있어야 하며, report 키워드 인자로
+        진행 메시지 함수를 받습니다.
+
+        Args:
+            task_id: 작업 ID (진행 메시지 구분용, 동시에 실행되는 작업 간 고유해야 함)
+            func: 작업 함수
+            *args: 작업 함수 인자 (pickle 가능해야 함)
+            on_progress: 진행 메시지를 받을 함수 (코루틴 함수 가능)
+
+        Returns:
+            작업 함수의 반환값
+
+        Raises:
+            CpuLimitExceededError: CPU 시간 한도를 초과한 경우
+            WorkerCrashedError: 워커 프로세스가 비정상 종료된 경우
+            asyncio.CancelledError: 호출한 코루틴이 취소된 경우 (작업 함수가
+                끝난 뒤에 전파)
+        """
+        executor = self._start()
+        channel: asyncio.Queue = asyncio.Queue()
+        self._channels[task_id] = channel
+        self._submitted += 1
+        self.tasks += 1
+        try:
+            submitted = executor.submit(
+                _run_task, task_id, self.cpu_limit, func, args
+            )
+            future = asyncio.wrap_future(submitted, loop=self._loop)
+            future.add_done_callback(
+                lambda _: channel.put_nowait((_FUTURE_DONE, None))
+            )
+
+            # 결과가 먼저 도착해도 작업이 보낸 진행 메시지를 모두 전달한 뒤 반환
+            future_done = task_done = False
+            worker_pid = None
+            try:
+                while not (future_done and (task_done or future.exception())):
+                    event, payload = await channel.get()
+                    if event == _FUTURE_DONE:
+                        future_done = True
+                    elif event == _TASK_DONE:
+                        task_done = True
+                    elif event == _TASK_STARTED:
+                        worker_pid = payload
+                    elif on_progress is not None:
+                        result = on_progress(event, payload)
+                        if inspect.isawaitable(result):
+                            await result
+            except asyncio.CancelledError:
+                # 아직 시작하지 않은 작업은 실행기에서 빼고, 실행 중이면 중단을 기다림
+                if not future_done and not submitted.cancel():
+                    await self._interrupt(
+                        task_id, channel, None if task_done else worker_pid
+                    )
+                if future.done() and not future.cancelled():
+                    # 중단된 작업의 TaskCancelledError는 취소로 대신 전파
+                    future.exception()
+                raise
+
+            try:
+                return future.result()
+            except BrokenProcessPool as e:
+                self.crashes += 1
+                if self._executor is executor:
+                    # 깨진 실행기는 다시 사용할 수 없으므로 다음 작업에서 새로 생성
+                    self._executor = None
+                pool_logger.error(f"워커 프로세스 비정상 종료: {task_id}")
+                raise WorkerCrashedError(
+                    "작업을 실행하던 워커 프로세스가 비정상 종료되었습니다."
+                ) from e
+        finally:
+            self._channels.pop(task_id, None)
+
+    async def _interrupt(
+        self, task_id: str, channel: asyncio.Queue, worker_pid: Optional[int]
+    ):
+        """
+        실행 중인 작업 함수에 취소를 요청하고 실행기 future가 끝날 때까지 기다립니다.
+
+        Args:
+            task_id: 작업 ID
+            channel: 작업의 진행 메시지 채널
+            worker_pid: 작업을 실행 중인 워커 프로세스 ID (시작 메시지를 아직
+                받지 못했거나 작업 함수가 이미 끝났으면 None)
+        """
+        signalled = False
+        while True:
+            if worker_pid is not None and not signalled and hasattr(signal, "SIGUSR1"):
+                try:
+                    os.kill(worker_pid, signal.SIGUSR1)
+                except ProcessLookupError:
+                    pass
+                signalled = True
+                pool_logger.info(f"워커 프로세스 작업 취소 요청: {task_id}")
+            event, payload = await channel.get()
+            if event == _FUTURE_DONE:
+                return
+            if event == _TASK_STARTED:
+                worker_pid = payload
+
+    def shutdown(self, wait: bool = True):
+        """
+        워커 프로세스와 진행 메시지 리더를 종료합니다. (블로킹)
+
+        Args:
+            wait: 실행 중인 작업이 끝날 때까지 기다릴지 여부
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+        if self._progress_queue is not None:
+            self._progress_queue.put(None)
+            if self._reader is not None:
+                self._reader.join(timeout=5)
+            self._progress_queue.close()
+            self._progress_queue = None
+            self._reader = None
+
+    def stats(self) -> Dict[str, int]:
+        """실행한 작업 수와 워커 비정상 종료 수를 반환합니다."""
+        return {
+            "workers": self.max_workers,
+            "tasks": self.tasks,
+            "crashes": self.crashes,
+        }
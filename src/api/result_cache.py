@@ -0,0 +1,200 @@
+"""
+앱 명세 결과 캐시 구현.
+
+이 모듈은 앱 명세를 정규화한 뒤 생성기 지문(템플릿, 생성기 소스, 생성기
+버전)과 함께 해시하여 캐시 키를 만들고, 같은 키로 이미 완료된 작업을
+기억하는 ResultCache를 제공합니다. 같은 명세가 다시 제출되면 기존 작업의
+출력 트리를 재사용하여 새 작업을 즉시 완료할 수 있습니다.
+
+템플릿이나 생성기 코드가 바뀌거나 생성기 버전이 올라가면 지문이 달라지므로
+이전 결과는 더 이상 일치하지 않습니다.
+"""
+import copy
+import hashlib
+import json
+import os
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, TypeVar
+
+from src.utils.logger import setup_logger
+
+# 결과 캐시 로거 설정
+cache_logger = setup_logger("result_cache")
+
+T = TypeVar("T")
+
+
+def _normalize_name(value: Any) -> Any:
+    """이름 문자열을 NFC로 정규화하고 앞뒤 공백을 제거합니다."""
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value).strip()
+    return value
+
+
+def normalize_app_spec(app_spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    앱 명세를 정규화합니다.
+
+    생성기는 값이 없는 항목과 None/빈 목록을 같게 취급하므로 이런 항목을
+    제거하고, 앱/모델/필드/페이지 이름의 유니코드 표현과 앞뒤 공백을
+    정규화합니다. 정규화된 명세로 생성해도 결과는 같습니다.
+
+    Args:
+        app_spec: 앱 명세 딕셔너리
+
+    Returns:
+        정규화된 새 명세 딕셔너리
+    """
+    spec = {
+        key: copy.deepcopy(value) for key, value in app_spec.items()
+        if value is not None and value != []
+    }
+
+    if "app_name" in spec:
+        spec["app_name"] = _normalize_name(spec["app_name"])
+
+    for model in spec.get("models") or []:
+        if not isinstance(model, dict):
+            continue
+        if "name" in model:
+            model["name"] = _normalize_name(model["name"])
+        for field in model.get("fields") or []:
+            if isinstance(field, dict):
+                for key in ("name", "type"):
+                    if key in field:
+                        field[key] = _normalize_name(field[key])
+
+    if isinstance(spec.get("pages"), list):
+        spec["pages"] = [_normalize_name(page) for page in spec["pages"]]
+
+    return spec
+
+
+def canonical_json(app_spec: Dict[str, Any]) -> str:
+    """키를 정렬한 공백 없는 JSON 문자열로 변환합니다."""
+    return json.dumps(
+        app_spec, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def spec_digest(app_spec: Dict[str, Any], fingerprint: str) -> str:
+    """
+    정규화된 앱 명세와 생성기 지문으로 명세 키를 계산합니다.
+
+    Args:
+        app_spec: normalize_app_spec()으로 정규화된 명세
+        fingerprint: 생성기 지문
+
+    Returns:
+        16진수 SHA-256 키
+    """
+    payload = f"{fingerprint}\0{canonical_json(app_spec)}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def generator_fingerprint(
+    template_dir: str, sources: Iterable[str] = (), version: str = ""
+) -> str:
+    """
+    생성 결과에 영향을 주는 템플릿과 소스 파일의 지문을 계산합니다. (블로킹 I/O)
+
+    Args:
+        template_dir: 템플릿 디렉토리
+        sources: 생성기 소스 파일 경로 목록
+        version: 생성기 버전
+
+    Returns:
+        16진수 SHA-256 지문
+    """
+    digest = hashlib.sha256(version.encode("utf-8") + b"\0")
+
+    paths = []
+    for root, dirs, files in os.walk(template_dir):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            paths.append((os.path.relpath(path, template_dir), path))
+    paths.extend((os.path.basename(path), path) for path in sources)
+
+    for label, path in paths:
+        with open(path, "rb") as f:
+            file_digest = hashlib.sha256(f.read()).digest()
+        digest.update(label.replace(os.sep, "/").encode("utf-8") + b"\0")
+        digest.update(file_digest)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """정규화된 앱 명세 해시 -> 완료된 작업 ID 캐시"""
+
+    def __init__(self, fingerprint: str, max_entries: int = 10000):
+        """
+        Args:
+            fingerprint: 생성기 지문 (generator_fingerprint()의 결과)
+            max_entries: 기억할 최대 명세 수
+        """
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, app_spec: Dict[str, Any]) -> str:
+        """
+        정규화된 앱 명세의 캐시 키를 계산합니다.
+
+        Args:
+            app_spec: normalize_app_spec()으로 정규화된 명세
+
+        Returns:
+            16진수 SHA-256 키
+        """
+        return spec_digest(app_spec, self.fingerprint)
+
+    def put(self, key: str, job_id: str):
+        """완료된 작업을 캐시 키에 기록합니다."""
+        self._entries[key] = job_id
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str):
+        """캐시 키를 제거합니다."""
+        self._entries.pop(key, None)
+
+    async def lookup(
+        self, key: str, reuse: Callable[[str], Awaitable[Optional[T]]]
+    ) -> Optional[T]:
+        """
+        캐시 키에 해당하는 작업의 결과를 재사용합니다.
+
+        Args:
+            key: 캐시 키
+            reuse: 캐시된 작업 ID를 받아 결과를 재사용하는 코루틴 함수
+                (재사용할 수 없으면 None 반환)
+
+        Returns:
+            reuse의 결과 또는 캐시 실패 시 None
+        """
+        job_id = self._entries.get(key)
+        result = await reuse(job_id) if job_id is not None else None
+        if result is None:
+            if job_id is not None:
+                # 원본 작업이 정리되었거나 출력이 사라진 경우
+                self.discard(key)
+                cache_logger.info(f"재사용할 수 없는 캐시 항목 제거: {job_id}")
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/실패 통계를 반환합니다."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
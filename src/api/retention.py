@@ -0,0 +1,386 @@
+"""
+작업 보존 정책 및 가비지 컬렉터 구현.
+
+이 모듈은 끝난 작업의 레코드, 출력 디렉토리, ZIP 아카이브를 보존 정책에
+따라 정리하는 JobReaper를 제공합니다. 보존 정책은 최대 보존 기간,
+최대 작업 수, 최대 디스크 사용량으로 구성되며, 초과분은 마지막으로
+다운로드된(없으면 완료된) 시각이 가장 오래된 작업부터 제거합니다.
+
+대기 중이거나 실행 중인 작업은 정리 대상이 아닙니다.
+"""
+import asyncio
+import os
+import shutil
+import time
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.api.app_files import RESERVATIONS_DIR, reservation_marker
+from src.api.archive import is_archive_name
+from src.api.blob_store import BlobStore
+from src.api.job_events import TERMINAL_STATUSES
+from src.api.job_store import JobStore
+from src.utils.logger import setup_logger
+
+# 보존 정책 로거 설정
+retention_logger = setup_logger("retention")
+
+
+class RetentionPolicy:
+    """작업 보존 정책 (0이면 해당 제한 없음)"""
+
+    def __init__(
+        self,
+        max_age: float = 0,
+        max_jobs: int = 0,
+        max_disk_bytes: int = 0,
+        orphan_grace: float = 3600,
+    ):
+        """
+        Args:
+            max_age: 마지막 사용 후 보존할 최대 시간(초)
+            max_jobs: 보존할 최대 작업 수
+            max_disk_bytes: 끝난 작업들이 사용할 최대 디스크 용량(바이트)
+            orphan_grace: 작업 레코드가 없는 디렉토리/아카이브를 지우기 전 대기 시간(초)
+        """
+        self.max_age = max_age
+        self.max_jobs = max_jobs
+        self.max_disk_bytes = max_disk_bytes
+        self.orphan_grace = orphan_grace
+
+
+def last_access(job_info: Dict[str, Any]) -> float:
+    """작업의 마지막 사용 시각 (다운로드, 완료, 생성 순으로 확인)"""
+    return (
+        job_info.get("last_download")
+        or job_info.get("end_time")
+        or job_info.get("start_time")
+        or 0
+    )
+
+
+def path_size(path: Optional[str]) -> int:
+    """파일 또는 디렉토리의 전체 크기(바이트)를 계산합니다. (블로킹 I/O)"""
+    if not path or not os.path.exists(path):
+        return 0
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+def remove_path(path: Optional[str]) -> int:
+    """파일 또는 디렉토리를 삭제하고 회수한 크기(바이트)를 반환합니다. (블로킹 I/O)"""
+    size = path_size(path)
+    if not path or not os.path.exists(path):
+        return 0
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        os.remove(path)
+    return size
+
+
+def remove_job_path(path: Optional[str]) -> int:
+    """
+    작업 파일을 삭제하고, 선점한 출력 디렉토리이면 표시 파일도 삭제합니다. (블로킹 I/O)
+
+    Args:
+        path: 출력 디렉토리 또는 아카이브 경로
+
+    Returns:
+        회수한 디스크 용량(바이트)
+    """
+    reclaimed = remove_path(path)
+    if path:
+        marker = reservation_marker(os.path.dirname(path), os.path.basename(path))
+        if os.path.isfile(marker):
+            os.remove(marker)
+    return reclaimed
+
+
+def find_orphans(
+    roots: List[str], referenced: set, now: float, grace: float
+) -> List[str]:
+    """
+    작업 레코드가 참조하지 않는 출력 디렉토리와 아카이브를 찾습니다. (블로킹 I/O)
+
+    서버가 만든 것이 확실한 항목만 대상으로 합니다. 출력 디렉토리는
+    reserve_output_dir()가 표시 파일을 남긴 디렉토리, 아카이브는 아카이브
+    캐시가 만든 <내용 해시>.zip 파일입니다. 업그레이드 전에 만든 출력이나
+    사용자가 만든 디렉토리는 삭제하지 않습니다. 디렉토리가 이미 없어진 표시
+    파일도 함께 반환합니다.
+
+    Args:
+        roots: 검사할 디렉토리 목록
+        referenced: 작업 레코드가 참조하는 절대 경로 집합
+        now: 현재 시각
+        grace: 마지막 수정 후 이 시간(초)이 지난 항목만 반환
+
+    Returns:
+        삭제할 경로 목록
+    """
+    orphans = []
+    for root in roots:
+        if not os.path.isdir(root):
+            continue
+        marker_dir = os.path.join(root, RESERVATIONS_DIR)
+        reserved = set(os.listdir(marker_dir)) if os.path.isdir(marker_dir) else set()
+
+        candidates = []
+        for name in os.listdir(root):
+            path = os.path.abspath(os.path.join(root, name))
+            if path in referenced:
+                continue
+            is_output = name in reserved and os.path.isdir(path)
+            is_archive = is_archive_name(name) and os.path.isfile(path)
+            if is_output or is_archive:
+                candidates.append(path)
+        for name in reserved:
+            if not os.path.exists(os.path.join(root, name)):
+                candidates.append(os.path.abspath(os.path.join(marker_dir, name)))
+
+        for path in candidates:
+            try:
+                if now - os.path.getmtime(path) >= grace:
+                    orphans.append(path)
+            except OSError:
+                continue
+    return orphans
+
+
+class JobReaper:
+    """보존 정책에 따라 끝난 작업과 그 파일을 주기적으로 정리하는 컬렉터"""
+
+    def __init__(
+        self,
+        store: JobStore,
+        policy: RetentionPolicy,
+        job_paths: Callable[[Dict[str, Any]], Dict[str, Optional[str]]],
+        delete_job: Callable[[str], Awaitable[bool]],
+        update_job: Callable[..., Awaitable[Any]],
+        orphan_dirs: Callable[[], List[str]],
+        executor: Optional[Executor] = None,
+        interval: float = 300,
+        blob_store: Optional[BlobStore] = None,
+        blob_grace: float = 600,
+    ):
+        """
+        Args:
+            store: 작업 저장소
+            policy: 보존 정책
+            job_paths: 작업 레코드로부터 {"output": 출력 디렉토리, "archive": ZIP 경로}를 반환하는 함수
+            delete_job: 작업 레코드를 삭제하는 코루틴 함수
+            update_job: 작업 레코드를 갱신하는 코루틴 함수
+            orphan_dirs: (출력 디렉토리 루트, 아카이브 디렉토리) 목록을 반환하는 함수
+            executor: 파일 삭제 및 크기 계산을 실행할 실행기
+            interval: 정리 주기(초)
+            blob_store: 작업 정리 후 참조 없는 블롭을 삭제할 블롭 저장소
+            blob_grace: 참조 없는 블롭을 삭제하기 전 대기 시간(초)
+        """
+        self.store = store
+        self.policy = policy
+        self.job_paths = job_paths
+        self.delete_job = delete_job
+        self.update_job = update_job
+        self.orphan_dirs = orphan_dirs
+        self.executor = executor
+        self.interval = interval
+        self.blob_store = blob_store
+        self.blob_grace = blob_grace
+
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+        # 정리 통계 (누적)
+        self.stats: Dict[str, float] = {
+            "runs": 0,
+            "evicted_jobs": 0,
+            "evicted_by_age": 0,
+            "evicted_by_count": 0,
+            "evicted_by_disk": 0,
+            "reclaimed_bytes": 0,
+            "orphans_removed": 0,
+            "blobs_removed": 0,
+            "last_run": 0,
+            "last_duration": 0,
+        }
+
+    def start(self):
+        """백그라운드 정리 작업을 시작합니다."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="job-reaper")
+
+    async def stop(self):
+        """백그라운드 정리 작업을 중단합니다."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.collect()
+            except Exception as e:
+                retention_logger.error(f"작업 정리 중 오류 발생: {str(e)}")
+
+    async def _run_io(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def _finished_jobs(self) -> List[Dict[str, Any]]:
+        """끝난 작업 레코드를 모두 조회합니다."""
+        jobs = []
+        for status in TERMINAL_STATUSES:
+            cursor = None
+            while True:
+                page, cursor = await self.store.query_jobs(
+                    status=status, limit=500, cursor=cursor
+                )
+                jobs.extend(page)
+                if cursor is None:
+                    break
+        return jobs
+
+    async def _disk_usage(self, job_info: Dict[str, Any]) -> int:
+        """작업의 출력 디렉토리와 아카이브 크기를 계산합니다."""
+        paths = self.job_paths(job_info)
+
+        # 출력 디렉토리 크기는 한 번만 계산하여 레코드에 저장
+        output_bytes = job_info.get("output_bytes")
+        if output_bytes is None:
+            output_bytes = await self._run_io(path_size, paths.get("output"))
+            job_info["output_bytes"] = output_bytes
+            await self.update_job(job_info["job_id"], output_bytes=output_bytes)
+
+        archive_bytes = await self._run_io(path_size, paths.get("archive"))
+        return output_bytes + archive_bytes
+
+    async def collect(self) -> Dict[str, int]:
+        """
+        보존 정책을 한 번 적용합니다.
+
+        Returns:
+            이번 실행의 정리 사유별 작업 수와 회수한 바이트 수
+        """
+        async with self._lock:
+            started = time.time()
+            report = await self._collect(started)
+            self.stats["runs"] += 1
+            self.stats["last_run"] = started
+            self.stats["last_duration"] = round(time.time() - started, 3)
+
+        if (
+            report["evicted_jobs"] or report["orphans_removed"]
+            or report["blobs_removed"]
+        ):
+            retention_logger.info(
+                f"작업 정리 완료: 작업 {report['evicted_jobs']}개, "
+                f"고아 파일 {report['orphans_removed']}개, "
+                f"블롭 {report['blobs_removed']}개, "
+                f"{report['reclaimed_bytes']} 바이트 회수"
+            )
+        return report
+
+    async def _collect(self, now: float) -> Dict[str, int]:
+        policy = self.policy
+        report = {
+            "evicted_jobs": 0, "evicted_by_age": 0, "evicted_by_count": 0,
+            "evicted_by_disk": 0, "reclaimed_bytes": 0, "orphans_removed": 0,
+            "blobs_removed": 0,
+        }
+
+        finished = await self._finished_jobs()
+        finished.sort(key=last_access)
+        reasons: Dict[str, str] = {}
+
+        # 1. 최대 보존 기간 초과
+        if policy.max_age:
+            for job_info in finished:
+                if now - last_access(job_info) > policy.max_age:
+                    reasons[job_info["job_id"]] = "age"
+
+        remaining = [j for j in finished if j["job_id"] not in reasons]
+
+        # 2. 최대 작업 수 초과 (실행 중인 작업도 수에 포함하되 제거하지 않음)
+        if policy.max_jobs:
+            total = sum((await self.store.count_by_status()).values())
+            excess = total - len(reasons) - policy.max_jobs
+            for job_info in remaining[:max(0, excess)]:
+                reasons[job_info["job_id"]] = "count"
+            remaining = remaining[max(0, excess):]
+
+        # 3. 최대 디스크 사용량 초과
+        if policy.max_disk_bytes:
+            sizes = [await self._disk_usage(job_info) for job_info in remaining]
+            usage = sum(sizes)
+            for job_info, size in zip(remaining, sizes):
+                if usage <= policy.max_disk_bytes:
+                    break
+                reasons[job_info["job_id"]] = "disk"
+                usage -= size
+
+        by_id = {job_info["job_id"]: job_info for job_info in finished}
+        for job_id, reason in reasons.items():
+            report["reclaimed_bytes"] += await self.evict(by_id[job_id])
+            report["evicted_jobs"] += 1
+            report[f"evicted_by_{reason}"] += 1
+
+        orphans, reclaimed = await self._remove_orphans(now)
+        report["orphans_removed"] += orphans
+        report["reclaimed_bytes"] += reclaimed
+
+        # 삭제된 작업만 참조하던 블롭 정리
+        if self.blob_store is not None:
+            blobs, reclaimed = await self._run_io(
+                self.blob_store.collect_garbage, self.blob_grace
+            )
+            report["blobs_removed"] += blobs
+            report["reclaimed_bytes"] += reclaimed
+
+        for key, value in report.items():
+            self.stats[key] += value
+        return report
+
+    async def evict(self, job_info: Dict[str, Any]) -> int:
+        """
+        작업 레코드와 출력 디렉토리, 아카이브를 삭제합니다.
+
+        Args:
+            job_info: 작업 레코드
+
+        Returns:
+            회수한 디스크 용량(바이트)
+        """
+        reclaimed = 0
+        for path in self.job_paths(job_info).values():
+            reclaimed += await self._run_io(remove_job_path, path)
+        await self.delete_job(job_info["job_id"])
+        return reclaimed
+
+    async def _remove_orphans(self, now: float):
+        """작업 레코드가 참조하지 않는 오래된 출력 디렉토리와 아카이브를 삭제합니다."""
+        referenced = set()
+        for job_info in await self.store.list_jobs():
+            for path in self.job_paths(job_info).values():
+                if path:
+                    referenced.add(os.path.abspath(path))
+
+        orphans = await self._run_io(
+            find_orphans, self.orphan_dirs(), referenced, now,
+            self.policy.orphan_grace
+        )
+        removed, reclaimed = 0, 0
+        for path in orphans:
+            reclaimed += await self._run_io(remove_job_path, path)
+            removed += 1
+        return removed, reclaimed
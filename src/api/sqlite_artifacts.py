@@ -0,0 +1,259 @@
+"""
+SQLite 기반 ADK 아티팩트 서비스 구현.
+
+이 모듈은 InMemoryArtifactService 대신 사용할 수 있는 SqliteArtifactService를
+제공합니다. InMemoryArtifactService는 모든 세션의 모든 아티팩트 버전을 메모리에
+보관하지만, 이 서비스는 (세션, 파일 이름, 버전) 색인만 SQLite 파일에 두고 내용은
+블롭 디렉토리(또는 SQLite 행)에 저장한 뒤 load_artifact()에서 필요할 때만
+읽습니다. 따라서 서버 메모리는 생성한 파일 크기와 관계없이 일정합니다.
+
+파일 이름별로 최근 max_versions개 버전만 보관하고, 더 오래된 버전은 저장할
+때 삭제합니다. 블롭은 SHA-256으로 키가 지정되어 같은 내용은 한 벌만 저장되며,
+어떤 행도 참조하지 않게 된 블롭은 바로 삭제됩니다.
+
+"user:"로 시작하는 파일 이름은 InMemoryArtifactService와 같이 세션과 관계없는
+사용자 네임스페이스에 저장됩니다.
+
+ADK를 가져오므로 API 서버에서는 아티팩트 서비스를 처음 만들 때 가져옵니다.
+"""
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from google.adk.artifacts import BaseArtifactService
+from google.genai import types
+
+from src.api.blob_store import BlobStore
+from src.utils.logger import setup_logger
+
+# 아티팩트 서비스 로거 설정
+artifacts_logger = setup_logger("sqlite_artifacts")
+
+# 사용자 네임스페이스 아티팩트를 저장하는 세션 ID (실제 세션 ID와 겹치지 않음)
+USER_SCOPE = ""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    app_name TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    session_id TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    mime_type TEXT,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    created REAL NOT NULL,
+    data BLOB,
+    PRIMARY KEY (app_name, user_id, session_id, filename, version)
+);
+CREATE INDEX IF NOT EXISTS artifacts_digest ON artifacts (digest);
+"""
+
+
+class SqliteArtifactService(BaseArtifactService):
+    """SQLite 색인과 블롭 디렉토리에 아티팩트를 저장하는 ADK 아티팩트 서비스"""
+
+    def __init__(
+        self, db_path: str, blob_dir: Optional[str] = None, max_versions: int = 3
+    ):
+        """
+        Args:
+            db_path: SQLite 색인 파일 경로
+            blob_dir: 아티팩트 내용을 저장할 디렉토리 (없으면 SQLite 행에 저장)
+            max_versions: 파일 이름별로 보관할 최대 버전 수 (0이면 모두 보관)
+        """
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.db_path = db_path
+        self.blobs = BlobStore(blob_dir) if blob_dir else None
+        self.max_versions = max_versions
+
+        # 작업 실행기 스레드에서 호출되므로 연결 하나를 잠금으로 보호
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self.pruned = 0
+
+    @staticmethod
+    def _scope(
+        app_name: str, user_id: str, session_id: str, filename: str
+    ) -> Tuple[str, str, str, str]:
+        if filename.startswith("user:"):
+            session_id = USER_SCOPE
+        return app_name, user_id, session_id, filename
+
+    @staticmethod
+    def _encode(artifact: types.Part) -> Tuple[bytes, Optional[str], str]:
+        if artifact.inline_data is not None:
+            return artifact.inline_data.data or b"", artifact.inline_data.mime_type, "bytes"
+        if artifact.text is not None:
+            return artifact.text.encode("utf-8"), "text/plain", "text"
+        raise ValueError("inline_data 또는 text가 있는 아티팩트만 저장할 수 있습니다")
+
+    def _release_blobs(self, digests: List[str]):
+        """어떤 행도 참조하지 않는 블롭을 삭제합니다. 잠금 안에서 호출합니다."""
+        if self.blobs is None:
+            return
+        for digest in set(digests):
+            referenced = self._db.execute(
+                "SELECT 1 FROM artifacts WHERE digest = ? AND data IS NULL LIMIT 1",
+                (digest,)
+            ).fetchone()
+            if referenced is None:
+                try:
+                    os.remove(self.blobs.blob_path(digest))
+                except FileNotFoundError:
+                    pass
+
+    def _save(self, scope: Tuple[str, str, str, str], artifact: types.Part) -> int:
+        data, mime_type, kind = self._encode(artifact)
+        digest = hashlib.sha256(data).hexdigest()
+
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT MAX(version) FROM artifacts WHERE app_name = ? AND user_id = ?"
+                " AND session_id = ? AND filename = ?",
+                scope
+            ).fetchone()
+            version = 0 if row[0] is None else row[0] + 1
+
+            if self.blobs is not None:
+                self.blobs.put(data, digest)
+            self._db.execute(
+                "INSERT INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (*scope, version, mime_type, kind, len(data), digest, time.time(),
+                 None if self.blobs is not None else sqlite3.Binary(data))
+            )
+
+            if self.max_versions > 0 and version >= self.max_versions:
+                where = (
+                    "app_name = ? AND user_id = ? AND session_id = ? AND filename = ?"
+                    " AND version <= ?"
+                )
+                args = (*scope, version - self.max_versions)
+                stale = [
+                    digest for digest, in self._db.execute(
+                        f"SELECT digest FROM artifacts WHERE {where}", args
+                    )
+                ]
+                self._db.execute(f"DELETE FROM artifacts WHERE {where}", args)
+                self._release_blobs(stale)
+                self.pruned += len(stale)
+        return version
+
+    def _load(
+        self, scope: Tuple[str, str, str, str], version: Optional[int]
+    ) -> Optional[types.Part]:
+        where = "app_name = ? AND user_id = ? AND session_id = ? AND filename = ?"
+        with self._lock:
+            if version is None:
+                row = self._db.execute(
+                    "SELECT mime_type, kind, digest, data FROM artifacts"
+                    f" WHERE {where} ORDER BY version DESC LIMIT 1",
+                    scope
+                ).fetchone()
+            else:
+                row = self._db.execute(
+                    "SELECT mime_type, kind, digest, data FROM artifacts"
+                    f" WHERE {where} AND version = ?",
+                    (*scope, version)
+                ).fetchone()
+            if row is None:
+                return None
+            mime_type, kind, digest, data = row
+            if data is None:
+                # 블롭 삭제와 겹치지 않도록 잠금 안에서 읽음
+                try:
+                    with open(self.blobs.blob_path(digest), "rb") as f:
+                        data = f.read()
+                except (AttributeError, OSError) as e:
+                    artifacts_logger.error(
+                        f"아티팩트 블롭을 읽을 수 없음: {scope[3]}, {str(e)}"
+                    )
+                    return None
+
+        if kind == "text":
+            return types.Part(text=bytes(data).decode("utf-8"))
+        return types.Part.from_bytes(data=bytes(data), mime_type=mime_type)
+
+    def _list_keys(self, app_name: str, user_id: str, session_id: str) -> List[str]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT DISTINCT filename FROM artifacts WHERE app_name = ?"
+                " AND user_id = ? AND session_id IN (?, ?)",
+                (app_name, user_id, session_id, USER_SCOPE)
+            ).fetchall()
+        return sorted(filename for filename, in rows)
+
+    def _delete(self, scope: Tuple[str, str, str, str]):
+        where = "app_name = ? AND user_id = ? AND session_id = ? AND filename = ?"
+        with self._lock, self._db:
+            digests = [
+                digest for digest, in self._db.execute(
+                    f"SELECT digest FROM artifacts WHERE {where}", scope
+                )
+            ]
+            self._db.execute(f"DELETE FROM artifacts WHERE {where}", scope)
+            self._release_blobs(digests)
+
+    def _list_versions(self, scope: Tuple[str, str, str, str]) -> List[int]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT version FROM artifacts WHERE app_name = ? AND user_id = ?"
+                " AND session_id = ? AND filename = ? ORDER BY version",
+                scope
+            ).fetchall()
+        return [version for version, in rows]
+
+    async def save_artifact(
+        self, *, app_name: str, user_id: str, session_id: str, filename: str,
+        artifact: types.Part
+    ) -> int:
+        return await asyncio.to_thread(
+            self._save, self._scope(app_name, user_id, session_id, filename), artifact
+        )
+
+    async def load_artifact(
+        self, *, app_name: str, user_id: str, session_id: str, filename: str,
+        version: Optional[int] = None
+    ) -> Optional[types.Part]:
+        return await asyncio.to_thread(
+            self._load, self._scope(app_name, user_id, session_id, filename), version
+        )
+
+    async def list_artifact_keys(
+        self, *, app_name: str, user_id: str, session_id: str
+    ) -> List[str]:
+        return await asyncio.to_thread(self._list_keys, app_name, user_id, session_id)
+
+    async def delete_artifact(
+        self, *, app_name: str, user_id: str, session_id: str, filename: str
+    ) -> None:
+        await asyncio.to_thread(
+            self._delete, self._scope(app_name, user_id, session_id, filename)
+        )
+
+    async def list_versions(
+        self, *, app_name: str, user_id: str, session_id: str, filename: str
+    ) -> List[int]:
+        return await asyncio.to_thread(
+            self._list_versions, self._scope(app_name, user_id, session_id, filename)
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """저장된 아티팩트 버전 수, 내용 크기 합계, 삭제한 이전 버전 수를 반환합니다."""
+        with self._lock:
+            count, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM artifacts"
+            ).fetchone()
+        return {"versions": count, "bytes": size, "pruned_versions": self.pruned}
+
+    def close(self):
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            self._db.close()
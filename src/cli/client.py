@@ -5,6 +5,7 @@ CLI 클라이언트 도구.
 """
 import os
 import sys
+import asyncio
 import json
 import time
 import argparse
@@ -43,8 +44,16 @@ def parse_args():
         "status", help="서버 상태 확인")  # 향후 기능 확장 시 사용
 
     # 'list' 명령
-    list_parser = subparsers.add_parser(
-        "list", help="모든 작업 목록 조회")  # 향후 기능 확장 시 사용
+    list_parser = subparsers.add_parser("list", help="작업 목록 조회")
+    list_parser.add_argument(
+        "--status",
+        help="작업 상태 필터 (pending, running, completed, partial, failed, cancelled)"
+    )
+    list_parser.add_argument("--app-name", help="앱 이름 필터")
+    list_parser.add_argument(
+        "--page-size", "-n", type=int, default=50,
+        help="한 번에 조회할 작업 수 (기본값: 50)"
+    )
 
     # 'create' 명령
     create_parser = subparsers.add_parser("create", help="새로운 Flutter 앱 생성")
@@ -52,6 +61,10 @@ def parse_args():
         "--spec", "-s", required=True,
         help="앱 명세 JSON 파일 경로"
     )
+    create_parser.add_argument(
+        "--priority", choices=["interactive", "batch"], default="interactive",
+        help="작업 큐 우선순위 (기본값: interactive)"
+    )
 
     # 'show' 명령
     show_parser = subparsers.add_parser("show", help="특정 작업 상태 조회")
@@ -71,6 +84,18 @@ def parse_args():
         help="출력 디렉토리 (기본값: 현재 디렉토리)"
     )
 
+    # 'cancel' 명령
+    cancel_parser = subparsers.add_parser("cancel", help="작업 취소")
+    cancel_target = cancel_parser.add_mutually_exclusive_group(required=True)
+    cancel_target.add_argument(
+        "--job-id", "-j", nargs="+", dest="job_ids",
+        help="취소할 작업 ID (여러 개 지정 가능)"
+    )
+    cancel_target.add_argument(
+        "--batch-id", "-b",
+        help="끝나지 않은 작업을 모두 취소할 배치 ID"
+    )
+
     return parser.parse_args()
 
 
@@ -97,40 +122,45 @@ async def get_server_status():
             return False
 
 
-async def list_jobs():
+async def list_jobs(
+    status: str = None, app_name: str = None, page_size: int = 50
+):
     """
-    모든 작업 목록을 조회합니다.
+    작업 목록을 페이지 단위로 조회합니다.
+
+    Args:
+        status: 작업 상태 필터
+        app_name: 앱 이름 필터
+        page_size: 한 페이지에 조회할 작업 수
     """
+    params = {"limit": page_size}
+    if status:
+        params["status"] = status
+    if app_name:
+        params["app_name"] = app_name
+
     async with httpx.AsyncClient(base_url=BASE_URL) as client:
         try:
-            response = await client.get("/jobs")
-            response.raise_for_status()
-            jobs_data = response.json()
+            total = 0
+            while True:
+                response = await client.get("/jobs", params=params)
+                response.raise_for_status()
+                jobs_data = response.json()
 
-            if not jobs_data:
-                print("작업이 없습니다.")
-                return True
+                for job_id, job_info in jobs_data.items():
+                    print_job_summary(job_id, job_info)
+                total += len(jobs_data)
 
-            print(f"총 {len(jobs_data)}개 작업:")
-            for job_id, job_info in jobs_data.items():
-                status = job_info["status"]
-                progress = job_info.get("progress", 0)
-                message = job_info.get("message", "")
-
-                # 상태별 색상 코드
-                color = ""
-                if status == "completed":
-                    color = "\033[92m"  # 녹색
-                elif status == "failed":
-                    color = "\033[91m"  # 빨간색
-                elif status == "running":
-                    color = "\033[93m"  # 노란색
-                reset = "\033[0m"
-
-                print(f"- 작업 ID: {job_id}")
-                print(f"  상태: {color}{status}{reset} ({progress}%)")
-                print(f"  메시지: {message}")
-                print("")
+                # 다음 페이지 커서가 없으면 마지막 페이지
+                next_cursor = response.headers.get("X-Next-Cursor")
+                if not next_cursor:
+                    break
+                params["cursor"] = next_cursor
+
+            if total == 0:
+                print("작업이 없습니다.")
+            else:
+                print(f"총 {total}개 작업")
 
             return True
         except Exception as e:
@@ -139,6 +169,38 @@ async def list_jobs():
             return False
 
 
+def print_job_summary(job_id: str, job_info: dict):
+    """
+    작업 목록의 한 항목을 출력합니다.
+
+    Args:
+        job_id: 작업 ID
+        job_info: 작업 상태 데이터
+    """
+    status = job_info["status"]
+    progress = job_info.get("progress") or 0
+    message = job_info.get("message") or ""
+
+    # 상태별 색상 코드
+    color = ""
+    if status == "completed":
+        color = "\033[92m"  # 녹색
+    elif status == "failed":
+        color = "\033[91m"  # 빨간색
+    elif status == "running":
+        color = "\033[93m"  # 노란색
+    elif status == "partial":
+        color = "\033[95m"  # 보라색
+    elif status == "cancelled":
+        color = "\033[90m"  # 회색
+    reset = "\033[0m"
+
+    print(f"- 작업 ID: {job_id}")
+    print(f"  상태: {color}{status}{reset} ({progress}%)")
+    print(f"  메시지: {message}")
+    print("")
+
+
 async def show_job(job_id: str):
     """
     특정 작업의 상태를 조회합니다.
@@ -161,6 +223,10 @@ async def show_job(job_id: str):
                 color = "\033[91m"  # 빨간색
             elif status == "running":
                 color = "\033[93m"  # 노란색
+            elif status == "partial":
+                color = "\033[95m"  # 보라색
+            elif status == "cancelled":
+                color = "\033[90m"  # 회색
             reset = "\033[0m"
 
             print(f"작업 ID: {job_id}")
@@ -170,6 +236,16 @@ async def show_job(job_id: str):
                         'progress',
                         0)}%)")
             print(f"메시지: {job_data.get('message', '')}")
+            if job_data.get("timed_out"):
+                print(f"시간 초과 단계: {', '.join(job_data['timed_out'])}")
+            if job_data.get("expected_finish"):
+                start = time.strftime(
+                    "%H:%M:%S", time.localtime(job_data["expected_start"])
+                )
+                finish = time.strftime(
+                    "%H:%M:%S", time.localtime(job_data["expected_finish"])
+                )
+                print(f"예상 시작/완료: {start} / {finish}")
 
             if job_data.get("artifacts"):
                 print(f"생성된 파일: {len(job_data['artifacts'])}개")
@@ -185,12 +261,146 @@ async def show_job(job_id: str):
             return False
 
 
-async def create_app(spec_file: str):
+async def iter_sse_events(response: httpx.Response):
+    """
+    SSE 응답 본문을 (이벤트 이름, 데이터) 튜플로 변환합니다.
+
+    Args:
+        response: text/event-stream 스트리밍 응답
+
+    Yields:
+        이벤트 이름과 JSON 디코딩된 데이터
+    """
+    event, data_lines = "message", []
+    async for line in response.aiter_lines():
+        if not line:
+            if data_lines:
+                yield event, json.loads("\n".join(data_lines))
+            event, data_lines = "message", []
+        elif line.startswith(":"):
+            continue
+        elif line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data_lines.append(line[len("data:"):].strip())
+
+
+async def watch_job_events(client: httpx.AsyncClient, job_id: str):
+    """
+    작업 이벤트 스트림(/job/{job_id}/events)으로 진행 상황을 출력합니다.
+
+    Args:
+        client: API 클라이언트
+        job_id: 작업 ID
+
+    Returns:
+        최종 summary 이벤트 데이터 또는 스트림을 사용할 수 없으면 None
+    """
+    prev_progress = -1
+    try:
+        async with client.stream(
+            "GET", f"/job/{job_id}/events",
+            timeout=httpx.Timeout(10.0, read=None)
+        ) as response:
+            if response.status_code != 200:
+                return None
+            async for event, data in iter_sse_events(response):
+                if event == "status":
+                    progress = data.get("progress") or 0
+                    if progress != prev_progress:
+                        print(f"  - 진행: {progress}% - {data.get('message', '')}")
+                        prev_progress = progress
+                elif event == "artifact":
+                    print(f"    + {data['path']}")
+                elif event == "summary":
+                    return data
+    except KeyboardInterrupt:
+        print("\n작업 모니터링 중단됨")
+        return {}
+    except httpx.HTTPError as e:
+        cli_logger.warning(f"이벤트 스트림 사용 불가, 폴링으로 전환: {str(e)}")
+    return None
+
+
+async def poll_job_status(client: httpx.AsyncClient, job_id: str):
+    """
+    작업 상태를 1초 간격으로 조회하여 진행 상황을 출력합니다.
+
+    Args:
+        client: API 클라이언트
+        job_id: 작업 ID
+
+    Returns:
+        최종 작업 상태 데이터 또는 모니터링을 중단하면 None
+    """
+    prev_progress = -1
+    while True:
+        try:
+            status_response = await client.get(f"/job/{job_id}")
+            status_response.raise_for_status()
+            job_status = status_response.json()
+
+            progress = job_status.get("progress", 0)
+            # 진행 상황이 변경된 경우에만 출력
+            if progress != prev_progress:
+                print(f"  - 진행: {progress}% - {job_status.get('message', '')}")
+                prev_progress = progress
+
+            # 완료, 실패 또는 취소 시 종료
+            if job_status["status"] in [
+                "completed", "partial", "failed", "interrupted", "cancelled"
+            ]:
+                job_status["artifact_count"] = len(
+                    job_status.get("artifacts") or []
+                )
+                return job_status
+
+            # 잠시 대기
+            await asyncio.sleep(1)
+
+        except KeyboardInterrupt:
+            print("\n작업 모니터링 중단됨")
+            return None
+        except Exception as e:
+            print(f"상태 조회 중 오류 발생: {str(e)}")
+            await asyncio.sleep(2)
+
+
+def print_job_result(job_id: str, summary: dict):
+    """
+    작업의 최종 결과를 출력합니다.
+
+    Args:
+        job_id: 작업 ID
+        summary: summary 이벤트 또는 작업 상태 데이터
+    """
+    if not summary:
+        return
+    if summary.get("status") == "completed":
+        print("\n✅ 앱 생성 성공!")
+        print(f"생성된 파일: {summary.get('artifact_count', 0)}개")
+        print(
+            f"다운로드 명령: python -m src.cli.client download --job-id {job_id} --output ./output")
+    elif summary.get("status") == "partial":
+        print("\n⚠ 앱 일부 생성됨 (제한 시간 초과)")
+        print(f"시간 초과 단계: {', '.join(summary.get('timed_out') or [])}")
+        print(f"생성된 파일: {summary.get('artifact_count', 0)}개")
+        print(
+            f"다운로드 명령: python -m src.cli.client download --job-id {job_id} --output ./output")
+    elif summary.get("status") == "cancelled":
+        print("\n⏹ 앱 생성 취소됨")
+    else:
+        print("\n❌ 앱 생성 실패!")
+        print(f"오류 메시지: {summary.get('message', '')}")
+
+
+async def create_app(spec_file: str, priority: str = "interactive"):
     """
     새로운 Flutter 앱 생성을 요청합니다.
 
     Args:
         spec_file: 앱 명세 JSON 파일 경로
+        priority: 작업 큐 우선순위 (interactive 또는 batch)
     """
     try:
         # 앱 명세 파일 로드
@@ -201,53 +411,22 @@ async def create_app(spec_file: str):
 
         async with httpx.AsyncClient(base_url=BASE_URL) as client:
             # 앱 생성 요청
-            response = await client.post("/generate_app", json=app_spec)
+            response = await client.post(
+                "/generate_app", json=app_spec, params={"priority": priority}
+            )
             response.raise_for_status()
             result = response.json()
 
             job_id = result["job_id"]
             print(f"앱 생성 요청 성공: 작업 ID {job_id}")
 
-            # 작업 상태 실시간 업데이트
-            prev_progress = -1
+            # 작업 상태 실시간 업데이트 (SSE 스트림, 실패 시 폴링)
             print("작업 진행 상태:")
-            while True:
-                try:
-                    status_response = await client.get(f"/job/{job_id}")
-                    status_response.raise_for_status()
-                    job_status = status_response.json()
-
-                    status = job_status["status"]
-                    progress = job_status.get("progress", 0)
-                    message = job_status.get("message", "")
-
-                    # 진행 상황이 변경된 경우에만 출력
-                    if progress != prev_progress:
-                        print(f"  - 진행: {progress}% - {message}")
-                        prev_progress = progress
-
-                    # 완료 또는 실패 시 종료
-                    if status in ["completed", "failed"]:
-                        if status == "completed":
-                            print("\n✅ 앱 생성 성공!")
-                            print(
-                                f"생성된 파일: {len(job_status.get('artifacts', []))}개")
-                            print(
-                                f"다운로드 명령: python -m src.cli.client download --job-id {job_id} --output ./output")
-                        else:
-                            print("\n❌ 앱 생성 실패!")
-                            print(f"오류 메시지: {message}")
-                        break
-
-                    # 잠시 대기
-                    await httpx.AsyncClient().sleep(1)
-
-                except KeyboardInterrupt:
-                    print("\n작업 모니터링 중단됨")
-                    break
-                except Exception as e:
-                    print(f"상태 조회 중 오류 발생: {str(e)}")
-                    await httpx.AsyncClient().sleep(2)
+            summary = await watch_job_events(client, job_id)
+            if summary is None:
+                summary = await poll_job_status(client, job_id)
+            if summary is not None:
+                print_job_result(job_id, summary)
 
             return True
 
@@ -283,7 +462,7 @@ async def download_app(job_id: str, output_dir: str):
             response.raise_for_status()
             job_data = response.json()
 
-            if job_data["status"] != "completed":
+            if job_data["status"] not in ("completed", "partial"):
                 print(f"오류: 작업이 완료되지 않았습니다. 현재 상태: {job_data['status']}")
                 return False
 
@@ -323,24 +502,76 @@ async def download_app(job_id: str, output_dir: str):
         return False
 
 
+async def cancel_jobs(job_ids: list, batch_id: str = None):
+    """
+    작업을 취소합니다.
+
+    작업 하나는 DELETE /job/{job_id}, 여러 작업은 POST /jobs/cancel,
+    배치는 DELETE /batch/{batch_id}로 요청합니다.
+
+    Args:
+        job_ids: 취소할 작업 ID 목록
+        batch_id: 끝나지 않은 작업을 모두 취소할 배치 ID
+    """
+    async with httpx.AsyncClient(base_url=BASE_URL, timeout=60.0) as client:
+        try:
+            if batch_id is None and len(job_ids) == 1:
+                response = await client.delete(f"/job/{job_ids[0]}")
+                if response.status_code in (404, 409):
+                    print(f"오류: {response.json().get('detail', '')}")
+                    return False
+                response.raise_for_status()
+                if response.status_code == 202:
+                    print(f"작업 취소 요청됨 (작업을 실행하는 워커가 중단 후 취소): {job_ids[0]}")
+                else:
+                    print(f"작업 취소 완료: {job_ids[0]}")
+                return True
+
+            if batch_id is not None:
+                response = await client.delete(f"/batch/{batch_id}")
+            else:
+                response = await client.post("/jobs/cancel", json=job_ids)
+            if response.status_code == 404:
+                print(f"오류: {response.json().get('detail', '')}")
+                return False
+            response.raise_for_status()
+            result = response.json()
+
+            print(f"취소한 작업: {len(result['cancelled'])}개")
+            for job_id in result["cancelled"]:
+                print(f"- {job_id}")
+            for job_id in result.get("requested", []):
+                print(f"취소 요청한 작업: {job_id}")
+            for job_id, status in result["finished"].items():
+                print(f"이미 끝난 작업: {job_id} ({status})")
+            for job_id in result["missing"]:
+                print(f"찾을 수 없는 작업: {job_id}")
+            return True
+
+        except Exception as e:
+            cli_logger.error(f"작업 취소 중 오류 발생: {str(e)}")
+            print(f"오류: {str(e)}")
+            return False
+
+
 def main():
     """
     메인 함수.
     """
-    import asyncio
-
     args = parse_args()
 
     if args.command == "status":
         asyncio.run(get_server_status())
     elif args.command == "list":
-        asyncio.run(list_jobs())
+        asyncio.run(list_jobs(args.status, args.app_name, args.page_size))
     elif args.command == "show":
         asyncio.run(show_job(args.job_id))
     elif args.command == "create":
-        asyncio.run(create_app(args.spec))
+        asyncio.run(create_app(args.spec, args.priority))
     elif args.command == "download":
         asyncio.run(download_app(args.job_id, args.output))
+    elif args.command == "cancel":
+        asyncio.run(cancel_jobs(args.job_ids or [], args.batch_id))
     else:
         print("유효한 명령을 입력하세요. 도움말을 보려면 --help를 사용하세요.")
         return 1
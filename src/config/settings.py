@@ -39,7 +39,13 @@ DATABASE_URL = (
 REDIS_HOST = os.getenv("REDIS_HOST", "localhost")
 REDIS_PORT = os.getenv("REDIS_PORT", "6379")
 REDIS_DB = os.getenv("REDIS_DB", "0")
-REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+REDIS_URL = os.getenv(
+    "REDIS_URL", f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
+)
+
+# 작업 상태 저장소 설정 (memory: 단일 프로세스, redis: 다중 워커 공유)
+JOB_STORE_BACKEND = os.getenv("JOB_STORE_BACKEND", "memory").lower()
+JOB_STORE_PREFIX = os.getenv("JOB_STORE_PREFIX", "aof")
 
 # Flutter 프로젝트 설정
 FLUTTER_OUTPUT_DIR = os.getenv(
@@ -52,6 +58,142 @@ FLUTTER_ARCHIVES_DIR = os.getenv(
     "FLUTTER_ARCHIVES_DIR", str(BASE_DIR / "output" / "flutter_apps" / "archives")
 )
 
+# 작업 큐 설정
+JOB_QUEUE_MAX_SIZE = int(os.getenv("JOB_QUEUE_MAX_SIZE", "100"))
+JOB_WORKER_COUNT = int(os.getenv("JOB_WORKER_COUNT", "4"))
+JOB_QUEUE_RETRY_AFTER = int(os.getenv("JOB_QUEUE_RETRY_AFTER", "5"))
+# 종료(SIGTERM) 시 처리 중인 작업을 기다리는 최대 시간(초)
+JOB_DRAIN_TIMEOUT = float(os.getenv("JOB_DRAIN_TIMEOUT", "30"))
+
+# 작업 상태 저널 설정 (Redis 저장소는 Redis 자체가 상태를 보존하므로 기본 비활성화)
+JOB_STATES_DIR = os.getenv(
+    "JOB_STATES_DIR", os.path.join(AGENT_ARTIFACTS_DIR, "job_states")
+)
+JOB_JOURNAL_ENABLED = os.getenv(
+    "JOB_JOURNAL_ENABLED", str(JOB_STORE_BACKEND == "memory")
+).lower() == "true"
+JOB_JOURNAL_COMPACT_EVERY = int(os.getenv("JOB_JOURNAL_COMPACT_EVERY", "1000"))
+JOB_JOURNAL_FSYNC = os.getenv("JOB_JOURNAL_FSYNC", "false").lower() == "true"
+# 재시작 시 실행 중이던 작업 처리 방식 (requeue: 다시 실행, interrupt: 중단 표시)
+JOB_RECOVERY_MODE = os.getenv("JOB_RECOVERY_MODE", "requeue").lower()
+
+# 작업 이벤트(SSE) 스트림 설정
+JOB_EVENTS_HEARTBEAT = float(os.getenv("JOB_EVENTS_HEARTBEAT", "15"))
+JOB_EVENTS_QUEUE_SIZE = int(os.getenv("JOB_EVENTS_QUEUE_SIZE", "1000"))
+
+# 작업 목록 페이지 크기 설정
+JOBS_PAGE_DEFAULT_LIMIT = int(os.getenv("JOBS_PAGE_DEFAULT_LIMIT", "100"))
+JOBS_PAGE_MAX_LIMIT = int(os.getenv("JOBS_PAGE_MAX_LIMIT", "1000"))
+
+# 작업 보존 정책 설정 (0이면 해당 제한 없음)
+RETENTION_MAX_AGE = float(os.getenv("RETENTION_MAX_AGE", str(7 * 24 * 3600)))
+RETENTION_MAX_JOBS = int(os.getenv("RETENTION_MAX_JOBS", "1000"))
+RETENTION_MAX_DISK_BYTES = int(
+    os.getenv("RETENTION_MAX_DISK_BYTES", str(5 * 1024 ** 3))
+)
+RETENTION_ORPHAN_GRACE = float(os.getenv("RETENTION_ORPHAN_GRACE", "3600"))
+RETENTION_INTERVAL = float(os.getenv("RETENTION_INTERVAL", "300"))
+
+# 파일 생성 I/O 실행기 스레드 수
+FILE_IO_WORKERS = int(os.getenv("FILE_IO_WORKERS", "4"))
+# 생성 파일 블롭 저장소 (하드링크를 위해 출력 디렉토리와 같은 파일 시스템에 위치)
+BLOB_STORE_ENABLED = os.getenv("BLOB_STORE_ENABLED", "true").lower() == "true"
+BLOB_STORE_DIR = os.getenv(
+    "BLOB_STORE_DIR", os.path.join(FLUTTER_OUTPUT_DIR, ".blobs")
+)
+# 참조가 없어진 블롭을 삭제하기 전 대기 시간(초)
+BLOB_GC_GRACE = float(os.getenv("BLOB_GC_GRACE", "600"))
+# 같은 앱 명세의 생성 결과 재사용 (결과 캐시)
+RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "10000"))
+# Idempotency-Key를 기억하는 시간(초)과 최대 개수
+IDEMPOTENCY_KEY_TTL = float(os.getenv("IDEMPOTENCY_KEY_TTL", "86400"))
+IDEMPOTENCY_MAX_KEYS = int(os.getenv("IDEMPOTENCY_MAX_KEYS", "100000"))
+# 클라이언트별 요청 한도 (API 키 헤더가 없으면 클라이언트 IP 기준)
+RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+API_KEY_HEADER = os.getenv("API_KEY_HEADER", "X-API-Key")
+# 초당 허용 생성 요청 수와 연속으로 보낼 수 있는 최대 요청 수 (토큰 버킷)
+RATE_LIMIT_RATE = float(os.getenv("RATE_LIMIT_RATE", "1"))
+RATE_LIMIT_BURST = int(os.getenv("RATE_LIMIT_BURST", "10"))
+# 클라이언트별 동시 작업 수 한도 (0이면 제한 없음)
+CLIENT_MAX_CONCURRENT_JOBS = int(os.getenv("CLIENT_MAX_CONCURRENT_JOBS", "10"))
+RATE_LIMIT_MAX_CLIENTS = int(os.getenv("RATE_LIMIT_MAX_CLIENTS", "10000"))
+# 앱 생성 실행 방식 (thread: 서버 프로세스의 I/O 스레드, process: 워커 프로세스 풀)
+GENERATION_MODE = os.getenv("GENERATION_MODE", "thread").lower()
+# 워커 프로세스 수, 워커 교체 전 처리할 작업 수 (0이면 교체 안 함)
+GENERATION_PROCESSES = int(
+    os.getenv("GENERATION_PROCESSES", str(JOB_WORKER_COUNT))
+)
+GENERATION_MAX_TASKS_PER_PROCESS = int(
+    os.getenv("GENERATION_MAX_TASKS_PER_PROCESS", "100")
+)
+# 워커별 메모리 한도(바이트)와 작업별 CPU 시간 한도(초) (0이면 제한 없음)
+GENERATION_MEMORY_LIMIT = int(os.getenv("GENERATION_MEMORY_LIMIT", "0"))
+GENERATION_CPU_LIMIT = float(os.getenv("GENERATION_CPU_LIMIT", "0"))
+# 일괄 생성 배치 설정 (배치당 최대 명세 수, 동시 실행 한도 기본값/최대값, 기억할 배치 수)
+BATCH_MAX_SIZE = int(os.getenv("BATCH_MAX_SIZE", "1000"))
+BATCH_DEFAULT_CONCURRENCY = int(os.getenv("BATCH_DEFAULT_CONCURRENCY", "2"))
+BATCH_MAX_CONCURRENCY = int(
+    os.getenv("BATCH_MAX_CONCURRENCY", str(JOB_WORKER_COUNT))
+)
+BATCH_MAX_KEEP = int(os.getenv("BATCH_MAX_KEEP", "1000"))
+# Prometheus 형식 /metrics 엔드포인트 및 HTTP 요청 메트릭 사용 여부
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+# 작업별 트레이스 스팬 기록 설정 (보관할 작업 수, 작업별 최대 스팬 수)
+TRACE_ENABLED = os.getenv("TRACE_ENABLED", "true").lower() == "true"
+TRACE_MAX_JOBS = int(os.getenv("TRACE_MAX_JOBS", "1000"))
+TRACE_MAX_SPANS = int(os.getenv("TRACE_MAX_SPANS", "5000"))
+# 작업 취소 시 실행 중인 작업이 중단될 때까지 기다릴 최대 시간(초)
+JOB_CANCEL_TIMEOUT = float(os.getenv("JOB_CANCEL_TIMEOUT", "10"))
+# 다른 워커가 받은 취소 요청(cancel_requested)을 확인하는 주기(초)
+JOB_CANCEL_POLL_INTERVAL = float(os.getenv("JOB_CANCEL_POLL_INTERVAL", "2"))
+# 작업 전체 제한 시간(초, 0이면 제한 없음). 넘기면 부분 결과로 끝냄
+JOB_DEADLINE = float(os.getenv("JOB_DEADLINE", "0"))
+# 생성 단계별 기본 제한 시간(초, 0이면 제한 없음)
+PHASE_DEADLINE = float(os.getenv("PHASE_DEADLINE", "0"))
+# 병렬 그룹의 하위 에이전트별 기본 제한 시간(초, 0이면 제한 없음)
+AGENT_DEADLINE = float(os.getenv("AGENT_DEADLINE", "0"))
+# 단계/그룹/에이전트 이름별 제한 시간 재정의 (예: "pages=5,HomePageViewAgent=60")
+STEP_DEADLINES = {
+    name.strip(): float(seconds)
+    for name, _, seconds in (
+        item.partition("=") for item in os.getenv("STEP_DEADLINES", "").split(",")
+    )
+    if name.strip() and seconds.strip()
+}
+# 배치 우선순위 작업에 더하는 대기 순서 벌점(초). 대화형 작업이 먼저 시작됨
+SCHEDULER_BATCH_PENALTY = float(os.getenv("SCHEDULER_BATCH_PENALTY", "60"))
+# 대기 1초마다 줄어드는 순서 점수(초). 0이면 오래 기다린 작업을 앞당기지 않음
+SCHEDULER_AGING_RATE = float(os.getenv("SCHEDULER_AGING_RATE", "1.0"))
+# 단계별 처리 시간 기록이 없을 때 명세 항목 하나의 예상 처리 시간(초)
+SCHEDULER_DEFAULT_UNIT_SECONDS = float(
+    os.getenv("SCHEDULER_DEFAULT_UNIT_SECONDS", "0.05")
+)
+# 명세 구조별로 보관할 오케스트레이터 에이전트 트리 수
+AGENT_TREE_CACHE_SIZE = int(os.getenv("AGENT_TREE_CACHE_SIZE", "16"))
+# 에이전트 작업 세션 저장소 (memory 또는 sqlite: 상태와 이벤트 기록을 SQLite 파일에 저장)
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory").lower()
+SESSION_DB_PATH = os.getenv(
+    "SESSION_DB_PATH", os.path.join(AGENT_ARTIFACTS_DIR, "sessions.db")
+)
+# 작업이 끝난 뒤 세션과 세션 아티팩트를 삭제하기 전 대기 시간(초, 다운로드 유예)
+SESSION_GRACE = float(os.getenv("SESSION_GRACE", "600"))
+# 유예 시간이 지난 세션을 확인하는 주기(초)
+SESSION_GC_INTERVAL = float(os.getenv("SESSION_GC_INTERVAL", "60"))
+# ADK 아티팩트 저장소 (memory 또는 sqlite: 색인은 SQLite 파일, 내용은 블롭 디렉토리에 저장)
+ARTIFACT_BACKEND = os.getenv("ARTIFACT_BACKEND", "memory").lower()
+ARTIFACT_DB_PATH = os.getenv(
+    "ARTIFACT_DB_PATH", os.path.join(AGENT_ARTIFACTS_DIR, "artifacts.db")
+)
+# 아티팩트 내용을 저장할 디렉토리 (빈 값이면 SQLite 파일에 함께 저장)
+ARTIFACT_BLOB_DIR = os.getenv(
+    "ARTIFACT_BLOB_DIR", os.path.join(AGENT_ARTIFACTS_DIR, "artifact_blobs")
+)
+# 아티팩트 파일 이름별로 보관할 최대 버전 수 (0이면 모두 보관)
+ARTIFACT_MAX_VERSIONS = int(os.getenv("ARTIFACT_MAX_VERSIONS", "3"))
+# ZIP 아카이브 압축 실행기 스레드 수
+ARCHIVE_WORKERS = int(os.getenv("ARCHIVE_WORKERS", "2"))
+
 # 로깅 설정
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
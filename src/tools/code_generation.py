@@ -13,6 +13,7 @@ from google.adk.tools import FunctionTool
 from google.genai.types import Part
 
 from src.config.settings import TEMPLATES_DIR
+from src.utils import metrics
 from src.utils.logger import logger
 
 
@@ -37,7 +38,7 @@ def get_jinja_env(template_dir: Optional[str] = None) -> jinja2.Environment:
     )
 
 
-def generate_dart_file(
+async def generate_dart_file(
     template_name: str,
     output_filename: str,
     context: Dict[str, Any],
@@ -61,17 +62,18 @@ def generate_dart_file(
 
         # 템플릿 로드 및 렌더링
         template = env.get_template(template_name)
-        rendered_content = template.render(**context)
+        with metrics.template_render_seconds.labels(template_name).time():
+            rendered_content = template.render(**context)
 
         # 아티팩트로 저장
         dart_bytes = rendered_content.encode('utf-8')
-        dart_part = Part.from_data(
+        dart_part = Part.from_bytes(
             data=dart_bytes,
             mime_type="text/x-dart"
         )
 
         # 아티팩트 저장
-        version = tool_context.save_artifact(
+        version = await tool_context.save_artifact(
             filename=output_filename,
             artifact=dart_part
         )
@@ -110,7 +112,7 @@ def generate_dart_file(
         }
 
 
-def generate_python_file(
+async def generate_python_file(
     template_name: str,
     output_filename: str,
     context: Dict[str, Any],
@@ -134,17 +136,18 @@ def generate_python_file(
 
         # 템플릿 로드 및 렌더링
         template = env.get_template(template_name)
-        rendered_content = template.render(**context)
+        with metrics.template_render_seconds.labels(template_name).time():
+            rendered_content = template.render(**context)
 
         # 아티팩트로 저장
         python_bytes = rendered_content.encode('utf-8')
-        python_part = Part.from_data(
+        python_part = Part.from_bytes(
             data=python_bytes,
             mime_type="text/x-python"
         )
 
         # 아티팩트 저장
-        version = tool_context.save_artifact(
+        version = await tool_context.save_artifact(
             filename=output_filename,
             artifact=python_part
         )
@@ -176,7 +179,7 @@ def generate_python_file(
         }
 
 
-def direct_code_generation(
+async def direct_code_generation(
     code_content: str,
     output_filename: str,
     mime_type: str,
@@ -199,13 +202,13 @@ def direct_code_generation(
     try:
         # 코드 내용을 바이트로 인코딩
         code_bytes = code_content.encode('utf-8')
-        code_part = Part.from_data(
+        code_part = Part.from_bytes(
             data=code_bytes,
             mime_type=mime_type
         )
 
         # 아티팩트로 저장
-        version = tool_context.save_artifact(
+        version = await tool_context.save_artifact(
             filename=output_filename,
             artifact=code_part
         )
@@ -0,0 +1,162 @@
+"""
+작업 제한 시간(데드라인) 유틸리티.
+
+이 모듈은 작업 전체, 생성 단계, 그룹/하위 에이전트의 제한 시간을 표현하는
+Deadline과, 제한 시간을 넘긴 단계를 작업별로 기록하는 컨텍스트를 제공합니다.
+
+- Deadline은 부모 데드라인보다 늦게 끝나지 않습니다. 단계 제한 시간이
+  남아 있어도 작업 제한 시간이 지나면 단계도 만료됩니다.
+- deadline_scope(deadline)로 현재 컨텍스트의 작업 데드라인을 설정하면,
+  그 안에서 record_timeout()으로 기록한 단계가 작업에 모입니다. 컨텍스트
+  변수는 ADK가 만드는 하위 태스크에도 복사되므로 에이전트 코드는 작업
+  정보를 전달받지 않아도 됩니다 (job_processes와 같은 방식).
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from src.config.settings import STEP_DEADLINES
+from src.utils.logger import setup_logger
+
+# 데드라인 로거 설정
+deadline_logger = setup_logger("deadlines")
+
+
+class DeadlineExceededError(Exception):
+    """단계가 제한 시간 안에 끝나지 않은 경우"""
+
+    def __init__(
+        self, step: str, completed: Optional[List[str]] = None, pending: int = 0
+    ):
+        """
+        Args:
+            step: 제한 시간을 넘긴 단계 이름
+            completed: 제한 시간 전에 끝낸 항목 (예: 기록한 파일 경로)
+            pending: 끝내지 못한 항목 수
+        """
+        super().__init__(f"제한 시간 초과: {step}")
+        self.step = step
+        self.completed = completed or []
+        self.pending = pending
+
+
+class Deadline:
+    """단계 하나의 만료 시각 (부모 데드라인을 넘지 않음)"""
+
+    def __init__(
+        self,
+        name: str,
+        seconds: Optional[float] = None,
+        parent: Optional["Deadline"] = None,
+    ):
+        """
+        Args:
+            name: 단계 이름 (작업, 생성 단계, 에이전트 이름)
+            seconds: 제한 시간(초). None이면 부모 데드라인만 따름
+            parent: 상위 단계 데드라인
+        """
+        self.name = name
+        expires_at = time.monotonic() + seconds if seconds is not None else None
+        if parent is not None and parent.expires_at is not None:
+            if expires_at is None or parent.expires_at < expires_at:
+                expires_at = parent.expires_at
+        self.expires_at = expires_at
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간(초)을 반환합니다. 제한이 없으면 None입니다."""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """제한 시간이 지났는지 반환합니다."""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+
+def step_timeout(step: str, default: float) -> Optional[float]:
+    """
+    단계별 제한 시간을 반환합니다. STEP_DEADLINES에 단계 이름이 있으면 그 값을 씁니다.
+
+    Args:
+        step: 생성 단계 또는 그룹/에이전트 이름
+        default: 기본 제한 시간(초)
+
+    Returns:
+        제한 시간(초) 또는 제한이 없으면 None
+    """
+    seconds = STEP_DEADLINES.get(step, default)
+    return seconds if seconds and seconds > 0 else None
+
+
+class DeadlineScope:
+    """작업 하나의 데드라인과 제한 시간을 넘긴 단계 기록"""
+
+    def __init__(self, deadline: Deadline):
+        """
+        Args:
+            deadline: 작업 전체 데드라인
+        """
+        self.deadline = deadline
+        # 단계 이름 -> 결과 ("fallback": 기본 템플릿으로 대체, "timed_out": 결과 없음)
+        self.steps: Dict[str, str] = {}
+
+    @property
+    def timed_out(self) -> List[str]:
+        """결과 없이 제한 시간을 넘긴 단계 목록"""
+        return [step for step, result in self.steps.items() if result == "timed_out"]
+
+    @property
+    def fallbacks(self) -> List[str]:
+        """제한 시간을 넘겨 기본 템플릿으로 대체한 단계 목록"""
+        return [step for step, result in self.steps.items() if result == "fallback"]
+
+
+_current_scope: ContextVar[Optional[DeadlineScope]] = ContextVar(
+    "deadline_scope", default=None
+)
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline) -> Iterator[DeadlineScope]:
+    """
+    블록 안에서 실행하는 단계에 작업 데드라인을 적용하고 시간 초과를 기록합니다.
+
+    Args:
+        deadline: 작업 전체 데드라인
+
+    Yields:
+        제한 시간을 넘긴 단계가 모이는 DeadlineScope
+    """
+    scope = DeadlineScope(deadline)
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def current_scope() -> Optional[DeadlineScope]:
+    """현재 컨텍스트의 작업 데드라인 기록을 반환합니다."""
+    return _current_scope.get()
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 작업 데드라인을 반환합니다."""
+    scope = _current_scope.get()
+    return scope.deadline if scope is not None else None
+
+
+def record_timeout(step: str, fallback: bool = False):
+    """
+    현재 작업에 제한 시간을 넘긴 단계를 기록합니다. 작업 밖에서는 로그만 남깁니다.
+
+    Args:
+        step: 단계 이름
+        fallback: 기본 템플릿으로 결과를 대체했으면 True
+    """
+    result = "fallback" if fallback else "timed_out"
+    deadline_logger.warning(f"제한 시간 초과: {step} ({result})")
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.steps[step] = result
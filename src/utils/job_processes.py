@@ -0,0 +1,130 @@
+"""
+작업별 하위 프로세스 관리 유틸리티.
+
+이 모듈은 작업 실행 중에 띄운 하위 프로세스(dart analyze 등)를 작업 ID별로
+기록하여, 작업을 취소할 때 해당 작업의 프로세스를 한 번에 종료할 수 있게
+합니다.
+
+- job_scope(job_id)로 현재 컨텍스트의 작업 ID를 설정하면, 그 안에서
+  run_process()로 실행한 프로세스가 작업에 연결됩니다. 컨텍스트 변수는
+  ADK가 만드는 하위 태스크에도 복사되므로 에이전트와 도구 코드는 작업 ID를
+  전달받지 않아도 됩니다.
+- 프로세스는 새 세션(프로세스 그룹)으로 시작하므로 종료할 때 프로세스가
+  띄운 하위 프로세스(dart 분석 서버 등)까지 함께 종료됩니다.
+"""
+import asyncio
+import os
+import signal
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+from src.utils.logger import setup_logger
+
+# 하위 프로세스 로거 설정
+process_logger = setup_logger("job_processes")
+
+_current_job: ContextVar[Optional[str]] = ContextVar("current_job", default=None)
+
+# 작업 ID -> 실행 중인 하위 프로세스
+_processes: Dict[str, Set[asyncio.subprocess.Process]] = {}
+
+
+def current_job_id() -> Optional[str]:
+    """현재 컨텍스트에서 실행 중인 작업 ID를 반환합니다."""
+    return _current_job.get()
+
+
+@contextmanager
+def job_scope(job_id: str) -> Iterator[None]:
+    """
+    블록 안에서 실행하는 하위 프로세스를 작업에 연결합니다.
+
+    Args:
+        job_id: 작업 ID
+    """
+    token = _current_job.set(job_id)
+    try:
+        yield
+    finally:
+        _current_job.reset(token)
+
+
+def _kill(process: asyncio.subprocess.Process):
+    """프로세스와 프로세스 그룹을 종료합니다. 이미 종료된 경우 무시합니다."""
+    if process.returncode is not None:
+        return
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:  # Windows
+            process.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def kill_job_processes(job_id: str) -> int:
+    """
+    작업에 연결된 모든 하위 프로세스를 종료합니다.
+
+    Args:
+        job_id: 작업 ID
+
+    Returns:
+        종료 신호를 보낸 프로세스 수
+    """
+    processes = _processes.pop(job_id, set())
+    for process in processes:
+        _kill(process)
+    if processes:
+        process_logger.info(
+            f"작업 하위 프로세스 종료: {job_id}, {len(processes)}개"
+        )
+    return len(processes)
+
+
+def running_processes(job_id: str) -> int:
+    """작업에 연결된 실행 중인 하위 프로세스 수를 반환합니다."""
+    return len(_processes.get(job_id, ()))
+
+
+async def run_process(*cmd: str) -> Tuple[int, str, str]:
+    """
+    하위 프로세스를 실행하고 종료될 때까지 기다립니다.
+
+    이벤트 루프를 막지 않으며, 호출한 코루틴이 취소되거나 작업이 취소되면
+    프로세스를 종료합니다.
+
+    Args:
+        *cmd: 실행할 명령과 인자
+
+    Returns:
+        (종료 코드, 표준 출력, 표준 오류)
+    """
+    kwargs = {"start_new_session": True} if hasattr(os, "killpg") else {}
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        **kwargs
+    )
+    job_id = current_job_id()
+    if job_id is not None:
+        _processes.setdefault(job_id, set()).add(process)
+    try:
+        stdout, stderr = await process.communicate()
+    except BaseException:
+        _kill(process)
+        raise
+    finally:
+        if job_id is not None:
+            processes = _processes.get(job_id)
+            if processes is not None:
+                processes.discard(process)
+                if not processes:
+                    del _processes[job_id]
+    return (
+        process.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
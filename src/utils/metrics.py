@@ -0,0 +1,316 @@
+"""
+Prometheus 형식 메트릭 유틸리티.
+
+이 모듈은 카운터와 고정 버킷 히스토그램, 그리고 이를 Prometheus 텍스트
+노출 형식(text/plain; version=0.0.4)으로 출력하는 MetricsRegistry를
+제공합니다. 생성 파이프라인 전체에서 쓰는 메트릭은 모듈 전역 registry에
+미리 정의되어 있으므로 API 서버, 도구, 에이전트 어디서든 가져와 기록할 수
+있습니다.
+
+히스토그램은 버킷 경계를 생성 시점에 고정하고 버킷별 개수를 리스트에
+보관하므로, 값 하나를 기록하는 비용은 이진 탐색 한 번과 정수 덧셈뿐입니다.
+누적 개수는 /metrics를 출력할 때만 계산합니다.
+"""
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 지연 시간 히스토그램 기본 버킷(초)
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+# 템플릿 렌더링처럼 짧은 작업용 버킷(초)
+FAST_LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0,
+)
+# 크기 히스토그램 버킷(바이트)
+SIZE_BUCKETS = (
+    1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216,
+    67108864, 268435456,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class CounterChild:
+    """레이블 값 하나에 해당하는 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        """카운터를 amount만큼 증가시킵니다."""
+        with self._lock:
+            self.value += amount
+
+
+class HistogramChild:
+    """레이블 값 하나에 해당하는 고정 버킷 히스토그램"""
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._lock = threading.Lock()
+        self.bounds = bounds
+        # 마지막 칸은 +Inf 버킷
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """값 하나를 기록합니다."""
+        index = bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """블록 실행 시간(초)을 기록합니다."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """(버킷별 개수, 합계, 개수)를 일관된 상태로 복사합니다."""
+        with self._lock:
+            return list(self.counts), self.sum, self.count
+
+
+class _MetricFamily:
+    """레이블 이름이 같은 메트릭 묶음"""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """
+        레이블 값에 해당하는 메트릭을 반환합니다. 없으면 만듭니다.
+
+        Args:
+            *values: labelnames 순서의 레이블 값
+
+        Raises:
+            ValueError: 레이블 값 개수가 맞지 않는 경우
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} 메트릭의 레이블 수가 맞지 않습니다: {key}"
+                )
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _samples(self) -> List[Tuple[Tuple[str, ...], object]]:
+        with self._lock:
+            return sorted(self._children.items())
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_MetricFamily):
+    """단조 증가하는 카운터"""
+
+    kind = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0):
+        """레이블이 없는 카운터를 증가시킵니다."""
+        self.labels().inc(amount)
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} "
+            f"{_format_value(child.value)}"
+            for values, child in self._samples()
+        ]
+
+
+class Histogram(_MetricFamily):
+    """고정 버킷 히스토그램"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.bounds = tuple(sorted(float(bound) for bound in buckets))
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.bounds)
+
+    def observe(self, value: float):
+        """레이블이 없는 히스토그램에 값을 기록합니다."""
+        self.labels().observe(value)
+
+    def time(self):
+        """레이블이 없는 히스토그램에 블록 실행 시간을 기록합니다."""
+        return self.labels().time()
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        bucket_names = self.labelnames + ("le",)
+        for values, child in self._samples():
+            counts, total, count = child.snapshot()
+            cumulative = 0
+            for bound, bucket_count in zip(self.bounds + (math.inf,), counts):
+                cumulative += bucket_count
+                labels = _format_labels(
+                    bucket_names, values + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭을 등록하고 Prometheus 텍스트 형식으로 출력하는 레지스트리"""
+
+    def __init__(self, prefix: str = ""):
+        """
+        Args:
+            prefix: 모든 메트릭 이름 앞에 붙일 접두사
+        """
+        self.prefix = prefix
+        self._metrics: Dict[str, _MetricFamily] = {}
+
+    def _register(self, metric: _MetricFamily) -> _MetricFamily:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """카운터를 등록합니다."""
+        return self._register(
+            Counter(self.prefix + name, documentation, labelnames)
+        )
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """고정 버킷 히스토그램을 등록합니다."""
+        return self._register(
+            Histogram(self.prefix + name, documentation, labelnames, buckets)
+        )
+
+    def get(self, name: str) -> Optional[_MetricFamily]:
+        """접두사를 포함한 이름으로 메트릭을 찾습니다."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """등록된 모든 메트릭을 Prometheus 텍스트 노출 형식으로 출력합니다."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# ===== 생성 파이프라인 메트릭 =====
+
+registry = MetricsRegistry(prefix="agentofflutter_")
+
+http_requests = registry.counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+http_request_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP 요청 처리 시간(응답 본문 전송 포함)", ("method", "route")
+)
+queue_wait_seconds = registry.histogram(
+    "queue_wait_seconds", "작업이 작업 큐에서 대기한 시간"
+)
+jobs_finished = registry.counter(
+    "jobs_finished_total", "종료 상태에 도달한 작업 수", ("status",)
+)
+phase_seconds = registry.histogram(
+    "generation_phase_duration_seconds", "생성 단계별 렌더링 및 기록 시간",
+    ("phase",)
+)
+template_render_seconds = registry.histogram(
+    "template_render_duration_seconds", "템플릿별 렌더링 시간", ("template",),
+    buckets=FAST_LATENCY_BUCKETS
+)
+files_written = registry.counter(
+    "files_written_total", "생성 단계별 기록한 파일 수", ("phase",)
+)
+bytes_written = registry.counter(
+    "file_bytes_written_total", "생성 단계별 기록한 파일 바이트 수", ("phase",)
+)
+archive_build_seconds = registry.histogram(
+    "archive_build_duration_seconds", "ZIP 아카이브 압축 시간"
+)
+archive_size_bytes = registry.histogram(
+    "archive_size_bytes", "압축한 ZIP 아카이브 크기", buckets=SIZE_BUCKETS
+)
+agent_turn_seconds = registry.histogram(
+    "agent_turn_duration_seconds",
+    "LLM 에이전트가 이벤트 하나를 내기까지 걸린 시간", ("agent",)
+)
+dart_analyze_seconds = registry.histogram(
+    "dart_analyze_duration_seconds", "dart analyze 실행 시간", ("result",)
+)
@@ -0,0 +1,561 @@
+"""
+작업별 트레이스 스팬 유틸리티.
+
+이 모듈은 작업 하나에서 시간이 어디에 쓰였는지 확인할 수 있도록 계층형
+스팬 트리를 기록하는 JobTrace와, 최근 작업의 트레이스를 보관하는
+TraceStore를 제공합니다. 스팬마다 벽시계 시간과 CPU 시간을 기록하며,
+트리(JSON)나 Chrome 트레이스 이벤트 형식(chrome://tracing, Perfetto)으로
+내보낼 수 있습니다.
+
+- activate()로 작업의 루트 스팬을 현재 컨텍스트에 설정하면, 같은 컨텍스트에서
+  실행되는 span()과 ADK 에이전트/도구 호출이 그 아래에 기록됩니다.
+- ADK는 에이전트 실행(agent_run)과 도구 호출(tool_call), LLM 호출(call_llm)마다
+  OpenTelemetry 스팬을 만듭니다. install_adk_bridge()는 이 스팬들을 현재
+  작업의 트레이스로 옮겨 기록하는 스팬 프로세서를 등록합니다.
+- 실행기 스레드나 워커 프로세스에서 측정한 시간은 add()로 나중에 추가합니다.
+
+CPU 시간은 스팬을 연 스레드의 CPU 시간(time.thread_time) 차이입니다.
+await를 포함하는 스팬은 그 사이 이벤트 루프에서 실행된 다른 코루틴의 CPU
+시간이 섞이므로 직접 측정하지 않고 자식 스팬의 CPU 시간 합계로 보고합니다.
+"""
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.logger import setup_logger
+
+# 트레이스 로거 설정
+trace_logger = setup_logger("tracing")
+
+# ADK OpenTelemetry 스팬 이름 접두사 -> 스팬 종류
+ADK_SPAN_KINDS = {
+    "agent_run [": "agent",
+    "tool_call [": "tool",
+    "call_llm": "llm",
+}
+
+
+def _lane() -> str:
+    """스팬을 연 실행 흐름 이름 (비동기 태스크 또는 스레드)"""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    if task is not None:
+        return task.get_name()
+    return threading.current_thread().name
+
+
+class Span:
+    """트레이스 스팬 하나"""
+
+    def __init__(
+        self,
+        span_id: int,
+        parent_id: Optional[int],
+        name: str,
+        kind: str,
+        attrs: Optional[Dict[str, Any]] = None,
+    ):
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attrs = dict(attrs or {})
+        self.lane = _lane()
+        self.start = time.time()
+        self.wall: Optional[float] = None
+        self.cpu: Optional[float] = None
+        self.error: Optional[str] = None
+        self._started = time.perf_counter()
+        self._cpu_started: Optional[float] = None
+
+    @property
+    def end(self) -> Optional[float]:
+        return None if self.wall is None else self.start + self.wall
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start": self.start,
+            "wall": self.wall,
+            "cpu": self.cpu,
+            "lane": self.lane,
+            "error": self.error,
+            "attrs": self.attrs,
+        }
+
+
+class JobTrace:
+    """작업 하나의 스팬 트리 (스레드 안전)"""
+
+    def __init__(self, job_id: str, max_spans: int = 5000):
+        """
+        Args:
+            job_id: 작업 ID
+            max_spans: 기록할 최대 스팬 수 (넘으면 이후 스팬은 버림)
+        """
+        self.job_id = job_id
+        self.max_spans = max_spans
+        self.spans: List[Span] = []
+        self.dropped = 0
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def start(
+        self,
+        name: str,
+        kind: str,
+        parent: Optional[Span] = None,
+        measure_cpu: bool = True,
+        **attrs: Any
+    ) -> Optional[Span]:
+        """
+        스팬을 시작합니다.
+
+        Args:
+            name: 스팬 이름
+            kind: 스팬 종류 (job, agent, tool, llm, io 등)
+            parent: 부모 스팬 (없으면 최상위)
+            measure_cpu: 이 스레드의 CPU 시간을 직접 측정할지 여부
+            **attrs: 스팬 속성
+
+        Returns:
+            시작된 스팬 또는 스팬 수 한도를 넘었으면 None
+        """
+        with self._lock:
+            if len(self.spans) >= self.max_spans:
+                self.dropped += 1
+                return None
+            span = Span(
+                self._next_id, parent.span_id if parent else None, name, kind,
+                attrs
+            )
+            self._next_id += 1
+            self.spans.append(span)
+        if measure_cpu:
+            span._cpu_started = time.thread_time()
+        return span
+
+    def finish(self, span: Optional[Span], error: Optional[BaseException] = None):
+        """
+        스팬을 종료하고 벽시계 시간과 CPU 시간을 기록합니다.
+
+        Args:
+            span: start()가 반환한 스팬
+            error: 스팬 안에서 발생한 예외
+        """
+        if span is None or span.wall is not None:
+            return
+        span.wall = time.perf_counter() - span._started
+        if span._cpu_started is not None:
+            span.cpu = time.thread_time() - span._cpu_started
+        if error is not None:
+            span.error = f"{type(error).__name__}: {error}"
+
+    def add(
+        self,
+        name: str,
+        kind: str,
+        start: float,
+        wall: float,
+        cpu: Optional[float] = None,
+        parent: Optional[Span] = None,
+        lane: Optional[str] = None,
+        **attrs: Any
+    ) -> Optional[Span]:
+        """
+        다른 스레드나 프로세스에서 측정한 스팬을 추가합니다.
+
+        Args:
+            name: 스팬 이름
+            kind: 스팬 종류
+            start: 시작 시각(epoch 초)
+            wall: 벽시계 시간(초)
+            cpu: CPU 시간(초, 모르면 None)
+            parent: 부모 스팬
+            lane: 실행 흐름 이름 (없으면 현재 흐름)
+            **attrs: 스팬 속성
+
+        Returns:
+            추가된 스팬 또는 스팬 수 한도를 넘었으면 None
+        """
+        span = self.start(name, kind, parent, measure_cpu=False, **attrs)
+        if span is not None:
+            span.start = start
+            span.wall = wall
+            span.cpu = cpu
+            if lane:
+                span.lane = lane
+        return span
+
+    def _snapshot(self) -> List[Span]:
+        with self._lock:
+            return list(self.spans)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        스팬 트리와 임계 경로를 반환합니다.
+
+        끝나지 않은 스팬의 wall은 None이며, CPU 시간을 직접 측정하지 않은
+        스팬의 cpu는 자식 스팬 CPU 시간의 합계입니다.
+
+        Returns:
+            {"job_id", "spans", "critical_path", "span_count", "dropped"}
+        """
+        spans = self._snapshot()
+        nodes: Dict[int, Dict[str, Any]] = {}
+        roots: List[Dict[str, Any]] = []
+        for span in spans:
+            node = span.to_dict()
+            node["children"] = []
+            nodes[span.span_id] = node
+        for span in spans:
+            parent = nodes.get(span.parent_id) if span.parent_id else None
+            (parent["children"] if parent else roots).append(nodes[span.span_id])
+        for root in roots:
+            _fill_cpu(root)
+        return {
+            "job_id": self.job_id,
+            "spans": roots,
+            "critical_path": _critical_path(roots),
+            "span_count": len(spans),
+            "dropped": self.dropped,
+        }
+
+    def to_chrome(self) -> Dict[str, Any]:
+        """
+        Chrome 트레이스 이벤트 형식으로 반환합니다. (chrome://tracing, Perfetto)
+
+        Returns:
+            {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        spans = self._snapshot()
+        lanes: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+        now = time.time()
+        for span in spans:
+            tid = lanes.setdefault(span.lane, len(lanes) + 1)
+            wall = span.wall if span.wall is not None else now - span.start
+            args: Dict[str, Any] = dict(span.attrs)
+            args["cpu_ms"] = None if span.cpu is None else round(span.cpu * 1000, 3)
+            if span.wall is None:
+                args["unfinished"] = True
+            if span.error:
+                args["error"] = span.error
+            events.append({
+                "name": span.name,
+                "cat": span.kind,
+                "ph": "X",
+                "ts": round(span.start * 1_000_000),
+                "dur": round(wall * 1_000_000),
+                "pid": 1,
+                "tid": tid,
+                "args": args,
+            })
+        for lane, tid in lanes.items():
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": 1, "tid": tid,
+                "args": {"name": lane},
+            })
+        events.append({
+            "name": "process_name", "ph": "M", "pid": 1, "tid": 0,
+            "args": {"name": f"job {self.job_id}"},
+        })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _fill_cpu(node: Dict[str, Any]) -> float:
+    """CPU 시간을 직접 측정하지 않은 스팬에 자식 스팬 CPU 시간의 합계를 채웁니다."""
+    children_cpu = sum(_fill_cpu(child) for child in node["children"])
+    if node["cpu"] is None and node["children"]:
+        node["cpu"] = children_cpu
+    return node["cpu"] or 0.0
+
+
+def _critical_path(roots: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    가장 늦게 끝나는 최상위 스팬부터 매 단계 가장 늦게 끝나는 자식을 따라간
+    경로를 반환합니다. 경로의 각 스팬이 부모의 종료 시각을 결정합니다.
+    """
+
+    def end(node):
+        wall = node["wall"]
+        return node["start"] + (wall if wall is not None else float("inf"))
+
+    path = []
+    candidates = roots
+    while candidates:
+        node = max(candidates, key=end)
+        path.append({
+            "span_id": node["span_id"],
+            "name": node["name"],
+            "kind": node["kind"],
+            "wall": node["wall"],
+            "cpu": node["cpu"],
+        })
+        candidates = node["children"]
+    return path
+
+
+# ===== 현재 컨텍스트의 트레이스 =====
+
+_current: ContextVar[Optional[Tuple[JobTrace, Optional[Span]]]] = ContextVar(
+    "job_trace", default=None
+)
+
+
+def current_trace() -> Optional[JobTrace]:
+    """현재 컨텍스트의 작업 트레이스를 반환합니다."""
+    current = _current.get()
+    return current[0] if current else None
+
+
+def _current_parent() -> Tuple[Optional[JobTrace], Optional[Span]]:
+    """현재 컨텍스트에서 새 스팬의 부모가 될 스팬을 찾습니다."""
+    current = _current.get()
+    if current is None:
+        return None, None
+    trace, parent = current
+    # ADK 스팬 안이면 더 나중에 시작된(더 안쪽) 스팬을 부모로 사용
+    mirrored = _adk_bridge.current_span(trace) if _adk_bridge else None
+    if mirrored is not None and (parent is None or mirrored.start >= parent.start):
+        parent = mirrored
+    return trace, parent
+
+
+@contextmanager
+def activate(
+    trace: Optional[JobTrace], name: str, kind: str = "job", **attrs: Any
+) -> Iterator[Optional[Span]]:
+    """
+    작업 트레이스의 루트 스팬을 시작하고 현재 컨텍스트에 설정합니다.
+
+    Args:
+        trace: 작업 트레이스 (None이면 아무것도 기록하지 않음)
+        name: 루트 스팬 이름
+        kind: 루트 스팬 종류
+        **attrs: 스팬 속성
+
+    Yields:
+        루트 스팬 또는 None
+    """
+    if trace is None:
+        yield None
+        return
+    root = trace.start(name, kind, measure_cpu=False, **attrs)
+    token = _current.set((trace, root))
+    try:
+        yield root
+    except BaseException as e:
+        trace.finish(root, e)
+        raise
+    finally:
+        trace.finish(root)
+        _current.reset(token)
+
+
+@contextmanager
+def span(
+    name: str, kind: str = "internal", measure_cpu: bool = True, **attrs: Any
+) -> Iterator[Optional[Span]]:
+    """
+    현재 작업 트레이스에 자식 스팬을 기록합니다. 트레이스가 없으면 아무것도 하지 않습니다.
+
+    await를 포함하는 블록은 measure_cpu=False로 열어야 CPU 시간에 다른
+    코루틴의 실행 시간이 섞이지 않습니다.
+
+    Args:
+        name: 스팬 이름
+        kind: 스팬 종류
+        measure_cpu: 이 스레드의 CPU 시간을 직접 측정할지 여부
+        **attrs: 스팬 속성
+
+    Yields:
+        시작된 스팬 또는 None
+    """
+    trace, parent = _current_parent()
+    if trace is None:
+        yield None
+        return
+    child = trace.start(name, kind, parent, measure_cpu, **attrs)
+    token = _current.set((trace, child or parent))
+    try:
+        yield child
+    except BaseException as e:
+        trace.finish(child, e)
+        raise
+    finally:
+        trace.finish(child)
+        _current.reset(token)
+
+
+def current_span() -> Optional[Span]:
+    """현재 컨텍스트에서 새 스팬의 부모가 될 스팬을 반환합니다."""
+    return _current_parent()[1]
+
+
+class TraceStore:
+    """최근 작업의 트레이스를 보관하는 LRU 저장소 (이벤트 루프에서만 호출)"""
+
+    def __init__(self, max_jobs: int = 1000, max_spans: int = 5000):
+        """
+        Args:
+            max_jobs: 보관할 최대 작업 수 (넘으면 오래된 작업부터 제거)
+            max_spans: 작업별 최대 스팬 수
+        """
+        self.max_jobs = max_jobs
+        self.max_spans = max_spans
+        self._traces: "OrderedDict[str, JobTrace]" = OrderedDict()
+
+    def start(self, job_id: str) -> JobTrace:
+        """
+        작업의 트레이스를 반환합니다. 없으면 새로 만듭니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            작업 트레이스
+        """
+        trace = self._traces.get(job_id)
+        if trace is None:
+            trace = JobTrace(job_id, self.max_spans)
+            self._traces[job_id] = trace
+            while len(self._traces) > self.max_jobs:
+                self._traces.popitem(last=False)
+        else:
+            self._traces.move_to_end(job_id)
+        return trace
+
+    def get(self, job_id: str) -> Optional[JobTrace]:
+        """작업의 트레이스를 반환합니다."""
+        return self._traces.get(job_id)
+
+    def discard(self, job_id: str):
+        """작업의 트레이스를 삭제합니다."""
+        self._traces.pop(job_id, None)
+
+
+# ===== ADK OpenTelemetry 스팬 연결 =====
+
+try:
+    from opentelemetry import trace as otel_trace
+    from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
+except ImportError:  # OpenTelemetry SDK가 없는 경우
+    otel_trace = None
+    SpanProcessor = object
+    TracerProvider = None
+
+
+class AdkSpanBridge(SpanProcessor):
+    """ADK의 OpenTelemetry 스팬을 현재 작업 트레이스에 옮겨 기록하는 스팬 프로세서"""
+
+    def __init__(self):
+        # OpenTelemetry 스팬 ID -> (작업 트레이스, 기록한 스팬)
+        # 옮기지 않는 스팬은 가장 가까운 옮긴 조상 스팬을 가리킴
+        self._spans: Dict[int, Tuple[JobTrace, Optional[Span], bool]] = {}
+        self._lock = threading.Lock()
+
+    def on_start(self, otel_span, parent_context=None):
+        current = _current.get()
+        if current is None:
+            return
+        trace, parent = current
+        otel_parent = otel_span.parent
+        with self._lock:
+            linked = self._spans.get(otel_parent.span_id) if otel_parent else None
+        if linked is not None and linked[0] is trace and linked[1] is not None:
+            if parent is None or linked[1].start >= parent.start:
+                parent = linked[1]
+
+        name = otel_span.name
+        kind = next(
+            (kind for prefix, kind in ADK_SPAN_KINDS.items() if name.startswith(prefix)),
+            None
+        )
+        if kind is None:
+            # 옮기지 않는 스팬 아래의 스팬은 가까운 조상에 연결
+            entry = (trace, parent, False)
+        else:
+            label = name[name.find("[") + 1:-1] if "[" in name else name
+            # 비동기 실행 중 스팬이므로 CPU 시간은 자식 스팬 합계로 보고
+            # (동기 도구 함수는 스레드를 점유하므로 직접 측정)
+            entry = (
+                trace,
+                trace.start(label, kind, parent, measure_cpu=(kind == "tool")),
+                True,
+            )
+        with self._lock:
+            self._spans[otel_span.context.span_id] = entry
+
+    def on_end(self, otel_span):
+        with self._lock:
+            entry = self._spans.pop(otel_span.context.span_id, None)
+        if entry is None:
+            return
+        trace, span, owned = entry
+        if owned:
+            if span is not None and not otel_span.status.is_ok:
+                span.error = otel_span.status.description or "error"
+            trace.finish(span)
+
+    def current_span(self, trace: JobTrace) -> Optional[Span]:
+        """현재 OpenTelemetry 스팬에 대응하는 기록된 스팬을 반환합니다."""
+        context = otel_trace.get_current_span().get_span_context()
+        with self._lock:
+            entry = self._spans.get(context.span_id)
+        if entry is None or entry[0] is not trace or entry[1] is None:
+            return None
+        return entry[1] if entry[1].wall is None else None
+
+    def shutdown(self):
+        with self._lock:
+            self._spans.clear()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+_adk_bridge: Optional[AdkSpanBridge] = None
+
+
+def install_adk_bridge() -> bool:
+    """
+    ADK 스팬을 작업 트레이스로 옮기는 스팬 프로세서를 등록합니다.
+
+    전역 TracerProvider가 설정되어 있지 않으면 내보내기 없는 SDK
+    TracerProvider를 설정하고, 이미 SDK TracerProvider가 있으면 프로세서만
+    추가합니다. 여러 번 호출해도 한 번만 등록합니다.
+
+    Returns:
+        등록되었으면 True, OpenTelemetry SDK가 없거나 등록할 수 없으면 False
+    """
+    global _adk_bridge
+    if _adk_bridge is not None:
+        return True
+    if otel_trace is None:
+        trace_logger.info("OpenTelemetry SDK가 없어 ADK 스팬을 기록하지 않습니다.")
+        return False
+
+    provider = otel_trace.get_tracer_provider()
+    if not hasattr(provider, "add_span_processor"):
+        otel_trace.set_tracer_provider(TracerProvider())
+        provider = otel_trace.get_tracer_provider()
+    if not hasattr(provider, "add_span_processor"):
+        trace_logger.warning(
+            "SDK TracerProvider가 아니어서 ADK 스팬을 기록하지 않습니다."
+        )
+        return False
+
+    bridge = AdkSpanBridge()
+    provider.add_span_processor(bridge)
+    _adk_bridge = bridge
+    return True
@@ -0,0 +1,90 @@
+"""
+에이전트 트리 캐시 테스트
+
+이 테스트는 명세 구조(shape)가 같은 작업이 캐시된 오케스트레이터 에이전트
+트리를 함께 사용하는지, 캐시가 가장 오래 사용되지 않은 트리부터 제거하는지,
+그리고 register_agents가 기본 트리로 대체되지 않고 하위 에이전트를 모두
+가진 새 트리를 만드는지 검증합니다.
+"""
+import unittest
+
+from src.agents.agent_tree import AgentTreeCache, agent_tree_shape
+from src.agents.main_orchestrator_agent import (
+    agent_trees, main_orchestrator_agent, register_agents
+)
+
+
+class TestAgentTreeCache(unittest.TestCase):
+    """AgentTreeCache 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.built = []
+
+        def build(app_spec):
+            self.built.append(agent_tree_shape(app_spec))
+            return object()
+
+        self.cache = AgentTreeCache(build, max_entries=2)
+
+    def test_same_shape_shares_tree(self):
+        """구조가 같은 명세는 작업별 데이터가 달라도 같은 트리를 사용하는지 테스트"""
+        shop = {"app_name": "shop", "models": [{"name": "Item"}], "pages": ["Home"]}
+        memo = {"app_name": "memo", "models": [{"name": "Note"}], "pages": ["List"]}
+        self.assertEqual(agent_tree_shape(shop), ("models", "pages"))
+
+        tree = self.cache.get(shop)
+        self.assertIs(self.cache.get(memo), tree)
+        self.assertIsNot(self.cache.get({"app_name": "bare"}), tree)
+        self.assertEqual(self.built, [("models", "pages"), ()])
+        self.assertEqual(self.cache.stats(), {"size": 2, "hits": 1, "misses": 2})
+
+    def test_least_recently_used_tree_is_evicted(self):
+        """최대 수를 넘으면 가장 오래 사용되지 않은 트리를 제거하는지 테스트"""
+        models = {"models": []}
+        pages = {"pages": []}
+        self.cache.get(models)
+        self.cache.get(pages)
+        self.cache.get(models)
+        self.cache.get({"tests": []})
+
+        self.cache.get(models)
+        self.cache.get(pages)
+        self.assertEqual(
+            self.built, [("models",), ("pages",), ("tests",), ("pages",)]
+        )
+
+
+class TestRegisterAgents(unittest.TestCase):
+    """register_agents 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        agent_trees.clear()
+
+    def test_builds_and_reuses_full_tree(self):
+        """명세 구조별로 전체 트리를 한 번만 만들고 재사용하는지 테스트"""
+        spec = {"app_name": "shop", "models": [{"name": "Item"}]}
+        tree = register_agents(spec)
+
+        self.assertIsNot(tree, main_orchestrator_agent)
+        self.assertEqual(
+            [agent.name for agent in tree.sub_agents],
+            [agent.name for agent in main_orchestrator_agent.sub_agents]
+        )
+        model_group = tree.find_agent("ModelGroupAgent")
+        self.assertIs(model_group.parent_agent, tree)
+        self.assertIs(model_group.sub_agents[0].parent_agent, model_group)
+        # 모듈 수준 에이전트는 기본 트리에 그대로 연결되어 있음
+        self.assertIs(
+            main_orchestrator_agent.find_agent("UserModelAgent").parent_agent,
+            main_orchestrator_agent.find_agent("ModelGroupAgent")
+        )
+
+        self.assertIs(register_agents({"app_name": "memo", "models": []}), tree)
+        self.assertIsNot(register_agents({"app_name": "memo"}), tree)
+        self.assertEqual(agent_trees.stats()["misses"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+앱 생성 API 테스트
+
+이 테스트는 앱 파일 생성 중에도 상태 조회 엔드포인트가 응답하는지 검증합니다.
+"""
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+import httpx
+
+import src.api.app as api_app
+from src.api.job_journal import JobJournal
+
+
+def make_large_spec(model_count: int = 3000, field_count: int = 30) -> dict:
+    """파일 기록에 오래 걸리는 대형 앱 명세를 생성합니다."""
+    return {
+        "app_name": "large_app",
+        "description": "대형 명세 테스트",
+        "models": [
+            {
+                "name": f"Model{i}",
+                "fields": [
+                    {"name": f"field{j}", "type": "String"}
+                    for j in range(field_count)
+                ],
+            }
+            for i in range(model_count)
+        ],
+        "pages": [f"Page{i}" for i in range(200)],
+    }
+
+
+class TestAppGeneration(unittest.IsolatedAsyncioTestCase):
+    """앱 생성 작업 처리 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.original_output_dir = api_app.FLUTTER_OUTPUT_DIR
+        api_app.FLUTTER_OUTPUT_DIR = self.temp_dir.name
+        self.original_journal = api_app.job_journal
+        api_app.job_journal = JobJournal(
+            os.path.join(self.temp_dir.name, "job_states")
+        )
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await api_app.job_queue.stop()
+        api_app.FLUTTER_OUTPUT_DIR = self.original_output_dir
+        await api_app.job_journal.close()
+        api_app.job_journal = self.original_journal
+        self.temp_dir.cleanup()
+
+    async def test_status_responsive_during_large_generation(self):
+        """대형 명세 파일 기록 중에도 상태 조회가 지연되지 않는지 테스트"""
+        response = await self.client.post(
+            "/generate_app", json=make_large_spec()
+        )
+        self.assertEqual(response.status_code, 200)
+        job_id = response.json()["job_id"]
+
+        latencies = []
+        statuses = []
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            started = time.monotonic()
+            job_response = await self.client.get(f"/job/{job_id}")
+            status_response = await self.client.get("/status")
+            latencies.append(time.monotonic() - started)
+
+            self.assertEqual(job_response.status_code, 200)
+            self.assertEqual(status_response.status_code, 200)
+            status = job_response.json()["status"]
+            statuses.append(status)
+            if status in ("completed", "failed"):
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(statuses[-1], "completed")
+        # 파일 기록 중에 여러 번 조회에 성공해야 함
+        self.assertGreaterEqual(statuses.count("running"), 3)
+        self.assertLess(max(latencies), 0.5)
+
+        job_data = (await self.client.get(f"/job/{job_id}")).json()
+        self.assertEqual(job_data["progress"], 100)
+        self.assertIn("lib/models/model0.dart", job_data["artifacts"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+"""
+ZIP 아카이브 캐시 테스트
+
+이 테스트는 ArchiveCache의 재현 가능한 압축, 압축 중 스트리밍, 캐시 공유와
+/download_zip/{job_id}의 ETag, If-None-Match, Range 처리를 검증합니다.
+"""
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.archive import ArchiveCache, etag_matches
+from src.api.job_store import InMemoryJobStore
+
+
+def make_tree(root, files):
+    """상대 경로 -> 내용 사전으로 출력 디렉토리를 만듭니다."""
+    for relative_path, content in files.items():
+        path = os.path.join(root, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+
+class TestArchiveCache(unittest.IsolatedAsyncioTestCase):
+    """ArchiveCache 기능 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = os.path.join(self.temp_dir.name, "App_test_1")
+        make_tree(self.output_dir, {
+            "lib/main.dart": b"void main() {}\n",
+            "pubspec.yaml": b"name: test\n" * 5000,
+        })
+        self.cache = ArchiveCache(
+            os.path.join(self.temp_dir.name, "archives"), chunk_size=1024
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        self.temp_dir.cleanup()
+
+    async def collect(self, digest, signature):
+        chunks = []
+        async for chunk in self.cache.stream(self.output_dir, digest, signature):
+            chunks.append(chunk)
+        return b"".join(chunks)
+
+    async def test_digest_tracks_content(self):
+        """내용이 바뀔 때만 해시가 바뀌는지 테스트"""
+        digest, _ = await self.cache.digest(self.output_dir)
+        self.assertEqual((await self.cache.digest(self.output_dir))[0], digest)
+
+        make_tree(self.output_dir, {"lib/main.dart": b"void main() { }\n"})
+        self.assertNotEqual((await self.cache.digest(self.output_dir))[0], digest)
+
+    async def test_stream_matches_cached_archive(self):
+        """스트리밍된 바이트가 캐시된 아카이브와 같고 압축이 재현 가능한지 테스트"""
+        digest, signature = await self.cache.digest(self.output_dir)
+        body = await self.collect(digest, signature)
+
+        path = self.cache.cached(digest)
+        self.assertIsNotNone(path)
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), body)
+
+        with zipfile.ZipFile(io.BytesIO(body)) as zip_file:
+            self.assertEqual(
+                sorted(zip_file.namelist()), ["lib/main.dart", "pubspec.yaml"]
+            )
+            self.assertEqual(zip_file.read("lib/main.dart"), b"void main() {}\n")
+
+        # 다시 압축해도 같은 바이트
+        os.remove(path)
+        self.assertEqual(await self.collect(digest, signature), body)
+
+    async def test_concurrent_streams_share_one_build(self):
+        """동시에 요청된 같은 아카이브는 한 번만 압축하는지 테스트"""
+        digest, signature = await self.cache.digest(self.output_dir)
+        bodies = await asyncio.gather(
+            *(self.collect(digest, signature) for _ in range(3))
+        )
+
+        self.assertEqual(len(set(bodies)), 1)
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.stats()["building"], 0)
+        self.assertEqual(
+            os.listdir(self.cache.archives_dir), [f"{digest}.zip"]
+        )
+
+    def test_etag_matches(self):
+        """If-None-Match 비교 테스트"""
+        self.assertTrue(etag_matches('"a", W/"b"', '"b"'))
+        self.assertTrue(etag_matches("*", '"b"'))
+        self.assertFalse(etag_matches('"a"', '"b"'))
+        self.assertFalse(etag_matches(None, '"b"'))
+
+
+class TestDownloadZipEndpoint(unittest.IsolatedAsyncioTestCase):
+    """/download_zip/{job_id} 엔드포인트 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.cache = ArchiveCache(os.path.join(self.temp_dir.name, "archives"))
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "archive_cache", self.cache),
+        ]
+        for p in self.patches:
+            p.start()
+
+        make_tree(os.path.join(self.temp_dir.name, "App_shop_1"), {
+            "lib/main.dart": b"void main() {}\n",
+        })
+        await self.store.create({
+            "job_id": "job1",
+            "status": "completed",
+            "folder_name": "App_shop_1",
+            "app_spec": {"app_name": "shop"},
+            "artifacts": [],
+        })
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def test_download_then_cached_download(self):
+        """첫 다운로드는 스트리밍, 이후 다운로드는 캐시 파일로 전송하는지 테스트"""
+        first = await self.client.get("/download_zip/job1")
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("App_shop_1.zip", first.headers["content-disposition"])
+        self.assertNotIn("content-length", first.headers)
+        etag = first.headers["etag"]
+
+        second = await self.client.get("/download_zip/job1")
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.headers["etag"], etag)
+        self.assertEqual(
+            int(second.headers["content-length"]), len(first.content)
+        )
+        self.assertEqual(self.cache.hits, 1)
+
+        job = await self.store.get("job1")
+        self.assertEqual(job["archive_path"], self.cache.archive_path(etag.strip('"')))
+        self.assertIsNotNone(job["last_download"])
+
+    async def test_if_none_match_returns_304(self):
+        """ETag가 일치하면 304를 반환하는지 테스트"""
+        etag = (await self.client.get("/download_zip/job1")).headers["etag"]
+        response = await self.client.get(
+            "/download_zip/job1", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    async def test_range_request(self):
+        """Range 요청에 부분 응답을 반환하는지 테스트"""
+        response = await self.client.get(
+            "/download_zip/job1", headers={"Range": "bytes=0-3"}
+        )
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, b"PK\x03\x04")
+
+    async def test_unfinished_job_returns_400(self):
+        """완료되지 않은 작업은 400을 반환하는지 테스트"""
+        await self.store.update("job1", status="running")
+        response = await self.client.get("/download_zip/job1")
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+단일 아티팩트 다운로드 테스트
+
+이 테스트는 /download/{job_id}/{artifact_name}이 작업 매니페스트를 통해
+출력 디렉토리의 파일을 바로 전송하고(ETag, Range, 중첩 경로), 매니페스트에
+없는 아티팩트는 ADK 아티팩트 서비스에서 읽는지 검증합니다.
+"""
+import asyncio
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import httpx
+from google.adk.artifacts import InMemoryArtifactService
+from google.genai import types
+
+import src.api.app as api_app
+from src.api.blob_store import BlobStore
+from src.api.job_store import InMemoryJobStore
+
+
+class TestArtifactDownload(unittest.IsolatedAsyncioTestCase):
+    """아티팩트 다운로드 엔드포인트 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.artifacts = InMemoryArtifactService()
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "artifact_service", self.artifacts),
+            patch.object(
+                api_app, "blob_store",
+                BlobStore(os.path.join(self.temp_dir.name, ".blobs"))
+            ),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await api_app.job_queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def _generate(self):
+        spec = {
+            "app_name": "shop",
+            "models": [{"name": "User", "fields": [{"name": "id", "type": "int"}]}],
+            "pages": ["Home"],
+        }
+        job_id = (await self.client.post("/generate_app", json=spec)).json()["job_id"]
+        for _ in range(500):
+            job_info = await self.store.get(job_id)
+            if job_info["status"] == "completed":
+                return job_info
+            await asyncio.sleep(0.01)
+        self.fail("앱 생성이 완료되지 않았습니다.")
+
+    async def test_nested_artifact_served_from_disk(self):
+        """중첩 경로의 아티팩트를 디스크에서 ETag와 함께 전송하는지 테스트"""
+        job_info = await self._generate()
+        self.assertIn("lib/models/user.dart", job_info["manifest"])
+
+        response = await self.client.get(
+            f"/download/{job_info['job_id']}/lib/models/user.dart"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/x-dart"))
+        self.assertIn('filename="user.dart"', response.headers["content-disposition"])
+
+        path = os.path.join(
+            self.temp_dir.name, job_info["folder_name"], "lib/models/user.dart"
+        )
+        with open(path, "rb") as f:
+            content = f.read()
+        self.assertEqual(response.content, content)
+        self.assertEqual(
+            response.headers["etag"], f'"{hashlib.sha256(content).hexdigest()}"'
+        )
+
+        cached = await self.client.get(
+            f"/download/{job_info['job_id']}/lib/models/user.dart",
+            headers={"If-None-Match": response.headers["etag"]}
+        )
+        self.assertEqual(cached.status_code, 304)
+
+        partial = await self.client.get(
+            f"/download/{job_info['job_id']}/lib/models/user.dart",
+            headers={"Range": "bytes=0-4"}
+        )
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(partial.content, content[:5])
+
+    async def test_unknown_artifact_returns_404(self):
+        """매니페스트와 ADK 어디에도 없는 아티팩트는 404를 반환하는지 테스트"""
+        job_info = await self._generate()
+        response = await self.client.get(
+            f"/download/{job_info['job_id']}/../../etc/passwd"
+        )
+        self.assertEqual(response.status_code, 404)
+
+    async def test_adk_fallback(self):
+        """매니페스트가 없는 작업은 ADK 아티팩트 서비스에서 읽는지 테스트"""
+        await self.artifacts.save_artifact(
+            app_name=api_app.ADK_APP_NAME, user_id="u", session_id="s",
+            filename="notes.md",
+            artifact=types.Part.from_bytes(data=b"# notes", mime_type="text/markdown")
+        )
+        await self.store.create({
+            "job_id": "adk", "status": "completed", "artifacts": ["notes.md"],
+            "user_id": "u", "session_id": "s",
+        })
+
+        response = await self.client.get("/download/adk/notes.md")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"# notes")
+        self.assertTrue(response.headers["content-type"].startswith("text/markdown"))
+
+        missing = await self.client.get("/download/adk/other.md")
+        self.assertEqual(missing.status_code, 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+블롭 저장소 테스트
+
+이 테스트는 BlobStore의 내용 기반 중복 제거, 링크 수 기반 가비지 컬렉션과
+여러 작업이 같은 생성 파일을 공유하는지 검증합니다.
+"""
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.app_files import write_files
+from src.api.blob_store import BlobStore
+from src.api.job_store import InMemoryJobStore
+
+
+class TestBlobStore(unittest.TestCase):
+    """BlobStore 기능 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.blobs = BlobStore(os.path.join(self.temp_dir.name, "blobs"))
+        self.first = os.path.join(self.temp_dir.name, "a.txt")
+        self.second = os.path.join(self.temp_dir.name, "b.txt")
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.temp_dir.cleanup()
+
+    def test_identical_content_stored_once(self):
+        """같은 내용은 블롭 하나를 하드링크로 공유하는지 테스트"""
+        digest = self.blobs.store(b"same", self.first)
+        self.assertEqual(self.blobs.store(b"same", self.second), digest)
+
+        self.assertTrue(os.path.samefile(self.first, self.second))
+        self.assertTrue(os.path.samefile(self.first, self.blobs.blob_path(digest)))
+        self.assertEqual(self.blobs.stats()["blobs"], 1)
+
+        # 같은 경로에 다른 내용을 기록해도 다른 파일은 바뀌지 않음
+        self.blobs.store(b"changed", self.first)
+        with open(self.second, "rb") as f:
+            self.assertEqual(f.read(), b"same")
+
+    def test_gc_removes_only_unreferenced_blobs(self):
+        """링크가 모두 사라진 블롭만 삭제하는지 테스트"""
+        kept = self.blobs.store(b"kept", self.first)
+        dropped = self.blobs.store(b"dropped", self.second)
+        os.remove(self.second)
+
+        # 유예 시간 안의 블롭은 남김
+        self.assertEqual(self.blobs.collect_garbage(grace=3600), (0, 0))
+        self.assertEqual(self.blobs.collect_garbage(), (1, len(b"dropped")))
+        self.assertFalse(self.blobs.exists(dropped))
+        self.assertTrue(self.blobs.exists(kept))
+
+        # 삭제된 내용도 다시 저장 가능
+        self.blobs.store(b"dropped", self.second)
+        self.assertTrue(self.blobs.exists(dropped))
+
+    def test_copy_fallback_when_hardlink_fails(self):
+        """하드링크를 만들 수 없으면 복사하여 배치하는지 테스트"""
+        with patch("os.link", side_effect=OSError(18, "Invalid cross-device link")):
+            digest = self.blobs.store(b"copied", self.first)
+
+        self.assertFalse(os.path.samefile(self.first, self.blobs.blob_path(digest)))
+        with open(self.first, "rb") as f:
+            self.assertEqual(f.read(), b"copied")
+        self.assertEqual(self.blobs.stats()["unreferenced"], 1)
+
+    def test_write_files_records_blob_digest(self):
+        """write_files가 블롭 해시를 매니페스트에 기록하는지 테스트"""
+        manifest = {}
+        output_dir = os.path.join(self.temp_dir.name, "App_x")
+        write_files(
+            output_dir, {"lib/main.dart": "void main() {}"},
+            manifest=manifest, blobs=self.blobs
+        )
+        digest = manifest["lib/main.dart"]["sha256"]
+        self.assertTrue(os.path.samefile(
+            os.path.join(output_dir, "lib/main.dart"), self.blobs.blob_path(digest)
+        ))
+
+
+class TestSharedGeneration(unittest.IsolatedAsyncioTestCase):
+    """여러 작업의 생성 파일 공유 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.blobs = BlobStore(os.path.join(self.temp_dir.name, ".blobs"))
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "blob_store", self.blobs),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await api_app.job_queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def _generate(self, app_name):
+        spec = {"app_name": app_name, "models": [], "pages": ["Home"]}
+        job_id = (await self.client.post("/generate_app", json=spec)).json()["job_id"]
+        for _ in range(500):
+            job_info = await self.store.get(job_id)
+            if job_info["status"] == "completed":
+                return job_info
+            await asyncio.sleep(0.01)
+        self.fail("앱 생성이 완료되지 않았습니다.")
+
+    async def test_jobs_share_identical_files(self):
+        """두 작업의 동일한 안드로이드 파일이 같은 블롭을 가리키는지 테스트"""
+        first = await self._generate("first")
+        second = await self._generate("second")
+
+        def path(job_info, relative_path):
+            return os.path.join(
+                self.temp_dir.name, job_info["folder_name"], relative_path
+            )
+
+        shared = "android/build.gradle"
+        self.assertTrue(os.path.samefile(path(first, shared), path(second, shared)))
+        self.assertNotEqual(
+            first["manifest"]["pubspec.yaml"]["sha256"],
+            second["manifest"]["pubspec.yaml"]["sha256"]
+        )
+
+        # 출력 파일이 사라져도 블롭에서 다운로드
+        os.remove(path(first, shared))
+        response = await self.client.get(f"/download/{first['job_id']}/{shared}")
+        self.assertEqual(response.status_code, 200)
+        with open(path(second, shared), "rb") as f:
+            self.assertEqual(response.content, f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,311 @@
+"""
+빌드 그래프 및 증분 재생성 테스트
+
+이 테스트는 앱 명세를 파일 단위 빌드 그래프로 컴파일하고 명세 변경 시
+바뀐 명세 조각에 의존하는 파일만 다시 생성할 대상으로 고르는지, 그리고
+PATCH /job/{job_id}/spec이 바뀐 파일만 다시 생성하여 같은 작업의 새 버전을
+만드는지 검증합니다.
+"""
+import asyncio
+import copy
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.app_files import render_phase, reservation_marker
+from src.api.archive import ArchiveCache
+from src.api.build_graph import compile_graph, merge_patch, plan_rebuild
+from src.api.job_dedup import JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+from src.api.retention import JobReaper, RetentionPolicy, find_orphans
+
+SPEC = {
+    "app_name": "shop",
+    "description": "쇼핑 앱",
+    "models": [
+        {"name": "Item", "fields": [{"name": "id", "type": "String"}]},
+        {"name": "Order", "fields": [{"name": "id", "type": "String"}]},
+    ],
+    "pages": ["HomePage", "CartPage"],
+}
+
+
+def changed_spec(**changes) -> dict:
+    """SPEC을 복사하여 최상위 항목을 바꾼 명세를 반환합니다."""
+    spec = copy.deepcopy(SPEC)
+    spec.update(changes)
+    return spec
+
+
+class TestBuildGraph(unittest.TestCase):
+    """빌드 그래프 컴파일 및 재생성 계획 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.graph = compile_graph(SPEC, "gen")
+
+    def test_nodes_match_rendered_files(self):
+        """그래프 노드가 생성 단계가 만드는 파일과 같은지 테스트"""
+        rendered = set()
+        for phase in ("models", "pages", "main", "project", "android"):
+            rendered |= set(render_phase(phase, SPEC))
+        self.assertEqual(set(self.graph["nodes"]), rendered)
+
+        node = self.graph["nodes"]["lib/models/item.dart"]
+        self.assertEqual(node["phase"], "models")
+        self.assertEqual(node["template"], "model")
+        self.assertEqual(list(node["deps"]), ["model:Item"])
+
+    def test_model_change_rebuilds_only_its_file(self):
+        """모델 필드 하나를 바꾸면 그 모델 파일만 다시 생성하는지 테스트"""
+        models = copy.deepcopy(SPEC["models"])
+        models[0]["fields"].append({"name": "price", "type": "double"})
+        new_graph = compile_graph(changed_spec(models=models), "gen")
+
+        dirty, removed = plan_rebuild(self.graph, new_graph)
+        self.assertEqual(dirty, {"models": ["lib/models/item.dart"]})
+        self.assertEqual(removed, [])
+
+    def test_page_and_app_name_changes(self):
+        """첫 페이지와 앱 이름 변경이 의존하는 파일에만 전파되는지 테스트"""
+        new_graph = compile_graph(changed_spec(pages=["CartPage"]), "gen")
+        dirty, removed = plan_rebuild(self.graph, new_graph)
+        self.assertEqual(dirty, {"main": ["lib/main.dart"]})
+        self.assertEqual(removed, ["lib/pages/homepage.dart"])
+
+        new_graph = compile_graph(changed_spec(app_name="store"), "gen")
+        dirty, removed = plan_rebuild(self.graph, new_graph)
+        self.assertEqual(sorted(dirty), ["android", "main", "project"])
+        self.assertIn(
+            "android/app/src/main/kotlin/com/example/shop/MainActivity.kt", removed
+        )
+
+    def test_missing_files_and_generator_change_rebuild(self):
+        """기록되지 않은 파일과 생성기 지문 변경은 다시 생성하는지 테스트"""
+        built = {path: {} for path in self.graph["nodes"]}
+        del built["lib/pages/cartpage.dart"]
+        dirty, _ = plan_rebuild(self.graph, self.graph, built)
+        self.assertEqual(dirty, {"pages": ["lib/pages/cartpage.dart"]})
+
+        dirty, _ = plan_rebuild(self.graph, compile_graph(SPEC, "new-gen"))
+        self.assertEqual(
+            sum(len(paths) for paths in dirty.values()), len(self.graph["nodes"])
+        )
+
+    def test_merge_patch(self):
+        """JSON Merge Patch가 객체는 병합하고 null은 삭제하는지 테스트"""
+        patched = merge_patch(SPEC, {"description": None, "pages": ["HomePage"]})
+        self.assertNotIn("description", patched)
+        self.assertEqual(patched["pages"], ["HomePage"])
+        self.assertEqual(patched["models"], SPEC["models"])
+        self.assertIn("description", SPEC)
+
+
+class TestSpecPatch(unittest.IsolatedAsyncioTestCase):
+    """PATCH /job/{job_id}/spec 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.queue = JobQueue(api_app.run_queued_job, max_size=10, worker_count=1)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_dedup", JobDeduplicator()),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "blob_store", None),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def generate(self) -> dict:
+        """SPEC으로 앱을 생성하고 끝날 때까지 기다립니다."""
+        response = await self.client.post("/generate_app", json=SPEC)
+        job_id = response.json()["job_id"]
+        for _ in range(500):
+            job_info = await self.store.get(job_id)
+            if job_info["status"] not in ("pending", "running"):
+                return job_info
+            await asyncio.sleep(0.01)
+        self.fail("작업이 끝나지 않았습니다.")
+
+    def read(self, job_info: dict, relative_path: str) -> str:
+        path = os.path.join(self.temp_dir.name, job_info["folder_name"], relative_path)
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+    async def test_patch_rebuilds_changed_files_as_new_version(self):
+        """바뀐 모델 파일만 다시 생성하고 나머지는 유지한 새 버전을 만드는지 테스트"""
+        job_info = await self.generate()
+        self.assertEqual(job_info["version"], 1)
+        job_id = job_info["job_id"]
+        home_before = self.read(job_info, "lib/pages/homepage.dart")
+
+        models = copy.deepcopy(SPEC["models"])
+        models[0]["fields"].append({"name": "price", "type": "double"})
+        response = await self.client.patch(
+            f"/job/{job_id}/spec",
+            content=api_app.json.dumps({"models": models}),
+            headers={"Content-Type": "application/merge-patch+json"}
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["version"], 2)
+        self.assertEqual(body["status"], "completed")
+        self.assertEqual(body["rebuilt"], ["lib/models/item.dart"])
+        self.assertEqual(body["removed"], [])
+        self.assertEqual(sorted(body["artifacts"]), sorted(job_info["artifacts"]))
+
+        updated = await self.store.get(job_id)
+        self.assertNotEqual(updated["folder_name"], job_info["folder_name"])
+        self.assertIn("double? price;", self.read(updated, "lib/models/item.dart"))
+        self.assertEqual(self.read(updated, "lib/pages/homepage.dart"), home_before)
+        self.assertEqual(updated["app_spec"]["models"], models)
+        # 이전 버전은 작업 레코드에서 빠질 뿐 그대로 남음
+        self.assertNotIn("price", self.read(job_info, "lib/models/item.dart"))
+
+        graph = (await self.client.get(f"/job/{job_id}/graph")).json()
+        self.assertEqual(graph["version"], 2)
+        self.assertIn("lib/models/item.dart", graph["nodes"])
+        response = await self.client.get(f"/download_zip/{job_id}")
+        self.assertEqual(response.status_code, 200)
+
+        # 같은 명세는 다시 생성하지 않음
+        response = await self.client.patch(
+            f"/job/{job_id}/spec", json=updated["app_spec"]
+        )
+        self.assertEqual(response.json()["version"], 2)
+        self.assertEqual(response.json()["rebuilt"], [])
+
+    async def test_previous_version_gets_fresh_orphan_grace(self):
+        """이전 버전 폴더와 아카이브의 유예 시간을 교체 시점부터 재는지 테스트"""
+        job_info = await self.generate()
+        job_id = job_info["job_id"]
+        old_dir = os.path.join(self.temp_dir.name, job_info["folder_name"])
+        old_marker = reservation_marker(self.temp_dir.name, job_info["folder_name"])
+        old_archive = os.path.join(self.temp_dir.name, "a" * 64 + ".zip")
+        open(old_archive, "wb").close()
+        await self.store.update(job_id, archive_path=old_archive)
+
+        # 이전 버전을 오래전에 만든 것처럼 수정 시각을 되돌림
+        long_ago = time.time() - 7200
+        for path in (old_dir, old_marker, old_archive):
+            os.utime(path, (long_ago, long_ago))
+
+        models = copy.deepcopy(SPEC["models"])
+        models[0]["fields"].append({"name": "price", "type": "double"})
+        response = await self.client.patch(
+            f"/job/{job_id}/spec", json={**SPEC, "models": models}
+        )
+        self.assertEqual(response.status_code, 200)
+        updated = await self.store.get(job_id)
+        self.assertIsNone(updated["archive_path"])
+
+        referenced = {os.path.abspath(
+            os.path.join(self.temp_dir.name, updated["folder_name"])
+        )}
+        now = time.time()
+        self.assertEqual(
+            find_orphans([self.temp_dir.name], referenced, now, grace=3600), []
+        )
+        self.assertEqual(
+            sorted(find_orphans([self.temp_dir.name], referenced, now + 3601, 3600)),
+            sorted([os.path.abspath(old_dir), os.path.abspath(old_archive)])
+        )
+
+    async def test_rename_moves_listing_download_and_retention(self):
+        """앱 이름을 바꾼 새 버전이 목록, 다운로드, 보존 정책에서 새 이름으로 다뤄지는지 테스트"""
+        archives_dir = os.path.join(self.temp_dir.name, "archives")
+        job_info = await self.generate()
+        job_id = job_info["job_id"]
+        old_name = SPEC["app_name"]
+
+        with patch.object(
+            api_app, "archive_cache",
+            ArchiveCache(archives_dir, io_executor=api_app.io_executor)
+        ):
+            response = await self.client.get(f"/download_zip/{job_id}")
+            self.assertEqual(response.status_code, 200)
+
+            response = await self.client.patch(
+                f"/job/{job_id}/spec",
+                content=api_app.json.dumps({"app_name": "renamed_app"}),
+                headers={"Content-Type": "application/merge-patch+json"}
+            )
+            self.assertEqual(response.status_code, 200)
+            updated = await self.store.get(job_id)
+            self.assertTrue(updated["folder_name"].startswith("App_renamed_app_v"))
+
+            async def listed(app_name):
+                response = await self.client.get("/jobs", params={"app_name": app_name})
+                self.assertEqual(response.status_code, 200)
+                return list(response.json())
+
+            self.assertEqual(await listed(old_name), [])
+            self.assertEqual(await listed("renamed_app"), [job_id])
+
+            response = await self.client.get(f"/download_zip/{job_id}")
+            self.assertEqual(response.status_code, 200)
+            self.assertIn("renamed_app", response.headers["content-disposition"])
+
+        # 정리기가 작업을 지운 뒤에도 두 이름의 목록 조회가 실패하지 않음
+        reaper = JobReaper(
+            store=self.store,
+            policy=RetentionPolicy(max_disk_bytes=1, orphan_grace=3600),
+            job_paths=api_app.job_paths,
+            delete_job=api_app.delete_job,
+            update_job=api_app.update_job,
+            orphan_dirs=lambda: [self.temp_dir.name, archives_dir],
+        )
+        report = await reaper.collect()
+        self.assertEqual(report["evicted_jobs"], 1)
+        self.assertEqual(await listed(old_name), [])
+        self.assertEqual(await listed("renamed_app"), [])
+        self.assertFalse(os.path.exists(
+            os.path.join(self.temp_dir.name, updated["folder_name"])
+        ))
+        # 이전 버전 폴더는 유예 시간 동안 남음
+        self.assertTrue(os.path.isdir(
+            os.path.join(self.temp_dir.name, job_info["folder_name"])
+        ))
+
+    async def test_patch_rejects_unfinished_or_invalid(self):
+        """끝나지 않은 작업은 409, app_name이 없는 명세는 400을 반환하는지 테스트"""
+        await self.store.create({"job_id": "running", "status": "running"})
+        response = await self.client.patch("/job/running/spec", json=SPEC)
+        self.assertEqual(response.status_code, 409)
+        response = await self.client.patch("/job/unknown/spec", json=SPEC)
+        self.assertEqual(response.status_code, 404)
+
+        job_info = await self.generate()
+        response = await self.client.patch(
+            f"/job/{job_info['job_id']}/spec", json={"pages": ["HomePage"]}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
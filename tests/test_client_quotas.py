@@ -0,0 +1,188 @@
+"""
+클라이언트별 요청 한도 테스트
+
+이 테스트는 토큰 버킷 속도 제한, 클라이언트별 동시 작업 수 한도, API 키와
+IP별 구분, 사용량 조회 엔드포인트를 검증합니다.
+"""
+import asyncio
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.client_quotas import ClientQuotas, client_key
+from src.api.job_batches import BatchRegistry
+from src.api.job_dedup import JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+
+
+def make_spec(index):
+    return {"app_name": f"app{index}", "models": [], "pages": ["Home"]}
+
+
+class TestClientQuotas(unittest.IsolatedAsyncioTestCase):
+    """ClientQuotas 기능 테스트"""
+
+    async def test_token_bucket_limits_bursts(self):
+        """버킷 크기만큼 허용한 뒤 거절하고 시간이 지나면 다시 허용하는지 테스트"""
+        quotas = ClientQuotas(rate=10, burst=2)
+        for _ in range(2):
+            self.assertIsNone(quotas.admit("a"))
+            quotas.cancel("a")
+
+        reason, retry_after = quotas.admit("a")
+        self.assertEqual(reason, "rate")
+        self.assertGreater(retry_after, 0)
+        # 다른 클라이언트는 영향 없음
+        self.assertIsNone(quotas.admit("b"))
+
+        await asyncio.sleep(0.11)
+        self.assertIsNone(quotas.admit("a"))
+
+    async def test_concurrency_slots_are_released(self):
+        """동시 작업 수 한도에 도달하면 거절하고 작업이 끝나면 허용하는지 테스트"""
+        quotas = ClientQuotas(rate=0, burst=0, max_concurrent_jobs=2)
+        for job_id in ("job1", "job2"):
+            self.assertIsNone(quotas.admit("a"))
+            quotas.bind("a", job_id)
+
+        self.assertEqual(quotas.admit("a")[0], "concurrency")
+        quotas.release("job1")
+        self.assertIsNone(quotas.admit("a"))
+        self.assertEqual(quotas.usage("a")["active_jobs"], 1)
+
+    async def test_acquire_waits_for_free_slot(self):
+        """배치 작업이 동시 작업 자리가 날 때까지 기다리는지 테스트"""
+        quotas = ClientQuotas(rate=0, burst=0, max_concurrent_jobs=1)
+        quotas.track("a", "job1")
+
+        waiter = asyncio.create_task(quotas.acquire("a", "job2"))
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiter.done())
+
+        quotas.release("job1")
+        await asyncio.wait_for(waiter, 1)
+        self.assertEqual(quotas.usage("a")["active_jobs"], 1)
+
+    def test_client_key_hides_api_key(self):
+        """API 키는 해시되고 없으면 IP를 사용하는지 테스트"""
+        self.assertTrue(client_key("secret", "10.0.0.1").startswith("key:"))
+        self.assertNotIn("secret", client_key("secret", "10.0.0.1"))
+        self.assertEqual(client_key(None, "10.0.0.1"), "ip:10.0.0.1")
+
+
+class TestClientQuotaEndpoints(unittest.IsolatedAsyncioTestCase):
+    """생성 엔드포인트 요청 한도 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.release = asyncio.Event()
+        self.store = InMemoryJobStore()
+        self.queue = JobQueue(self._handler, max_size=100, worker_count=4)
+        self.quotas = ClientQuotas(rate=0, burst=0, max_concurrent_jobs=2)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_dedup", JobDeduplicator()),
+            patch.object(api_app, "job_batches", BatchRegistry(api_app.submit_batch_job)),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "client_quotas", self.quotas),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def _handler(self, job_id, payload, queue_wait):
+        """테스트가 허용할 때까지 작업 시작을 늦추는 핸들러"""
+        await self.release.wait()
+        await api_app.run_queued_job(job_id, payload, queue_wait)
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await api_app.job_batches.stop()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def test_concurrent_job_quota_per_client(self):
+        """클라이언트별 동시 작업 수 한도를 넘으면 429로 거절하는지 테스트"""
+        for index in range(2):
+            response = await self.client.post("/generate_app", json=make_spec(index))
+            self.assertEqual(response.status_code, 200)
+
+        rejected = await self.client.post("/generate_app", json=make_spec(2))
+        self.assertEqual(rejected.status_code, 429)
+        self.assertEqual(rejected.json()["reason"], "concurrency")
+        self.assertIn("retry-after", rejected.headers)
+
+        # API 키가 다른 클라이언트는 별도 한도
+        other = await self.client.post(
+            "/generate_app", json=make_spec(3), headers={"X-API-Key": "other"}
+        )
+        self.assertEqual(other.status_code, 200)
+
+        usage = (await self.client.get("/usage")).json()
+        self.assertEqual(usage["active_jobs"], 2)
+        self.assertEqual(usage["rejected"], 1)
+        clients = (await self.client.get("/usage/clients")).json()["clients"]
+        self.assertEqual(len(clients), 2)
+
+        # 작업이 끝나면 다시 허용
+        self.release.set()
+        for _ in range(500):
+            if self.quotas.usage(usage["client"])["active_jobs"] == 0:
+                break
+            await asyncio.sleep(0.01)
+        response = await self.client.post("/generate_app", json=make_spec(4))
+        self.assertEqual(response.status_code, 200)
+
+    async def test_rate_limit_rejects_before_reading_spec(self):
+        """속도 제한에 걸린 요청은 본문을 읽지 않고 거절하는지 테스트"""
+        with patch.object(
+            api_app, "client_quotas", ClientQuotas(rate=0.01, burst=1)
+        ):
+            first = await self.client.post("/generate_app", json=make_spec(0))
+            self.assertEqual(first.status_code, 200)
+
+            rejected = await self.client.post(
+                "/generate_app", content=b"not json",
+                headers={"Content-Type": "application/json"}
+            )
+            self.assertEqual(rejected.status_code, 429)
+            self.assertEqual(rejected.json()["reason"], "rate")
+            self.assertGreaterEqual(int(rejected.headers["retry-after"]), 1)
+
+    async def test_batch_jobs_share_client_quota(self):
+        """배치 작업도 클라이언트의 동시 작업 수 한도 안에서 실행되는지 테스트"""
+        body = (await self.client.post(
+            "/generate_apps", params={"concurrency": 4},
+            json=[make_spec(index) for index in range(4)]
+        )).json()
+        self.assertEqual(body["total"], 4)
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.queue.depth + self.queue.running, 2)
+
+        self.release.set()
+        for _ in range(500):
+            progress = (await self.client.get(f"/batch/{body['batch_id']}/progress")).json()
+            if progress["status"] != "running":
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(progress["status"], "completed")
+
+
+if __name__ == "__main__":
+    unittest.main()
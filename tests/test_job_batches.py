@@ -0,0 +1,180 @@
+"""
+앱 일괄 생성 배치 테스트
+
+이 테스트는 JSON 배열과 NDJSON 배치 제출, 배치의 동시 실행 한도,
+배치 상태/진행률 조회와 배치 전체 ZIP 다운로드를 검증합니다.
+"""
+import asyncio
+import io
+import json
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.archive import ArchiveCache
+from src.api.app_files import io_executor
+from src.api.job_batches import BatchRegistry
+from src.api.job_dedup import JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+
+
+def make_specs(count):
+    """서로 다른 앱 명세 목록을 만듭니다."""
+    return [
+        {"app_name": f"app{index}", "models": [], "pages": ["Home"]}
+        for index in range(count)
+    ]
+
+
+class TestJobBatches(unittest.IsolatedAsyncioTestCase):
+    """/generate_apps 및 배치 조회 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.release = asyncio.Event()
+        self.max_active = 0
+        self.active = 0
+        self.store = InMemoryJobStore()
+        self.queue = JobQueue(self._handler, max_size=100, worker_count=4)
+        self.batches = BatchRegistry(api_app.submit_batch_job)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_batches", self.batches),
+            patch.object(api_app, "job_dedup", JobDeduplicator()),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "blob_store", None),
+            patch.object(
+                api_app, "archive_cache",
+                ArchiveCache(f"{self.temp_dir.name}/.archives", io_executor=io_executor)
+            ),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def _handler(self, job_id, payload, queue_wait):
+        """동시에 실행 중인 작업 수를 기록하고 테스트가 허용할 때까지 대기"""
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await self.release.wait()
+            await api_app.run_queued_job(job_id, payload, queue_wait)
+        finally:
+            self.active -= 1
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await self.batches.stop()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def _wait_batch(self, batch_id):
+        for _ in range(500):
+            progress = (await self.client.get(f"/batch/{batch_id}/progress")).json()
+            if progress["status"] != "running":
+                return progress
+            await asyncio.sleep(0.01)
+        self.fail("배치가 완료되지 않았습니다.")
+
+    async def test_array_batch_respects_concurrency(self):
+        """배치 작업이 동시 실행 한도만큼만 작업 큐에 들어가는지 테스트"""
+        response = await self.client.post(
+            "/generate_apps", params={"concurrency": 2}, json=make_specs(5)
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["total"], 5)
+        self.assertEqual(body["concurrency"], 2)
+        self.assertEqual(len(set(body["job_ids"])), 5)
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.queue.depth + self.queue.running, 2)
+
+        self.release.set()
+        progress = await self._wait_batch(body["batch_id"])
+        self.assertEqual(progress["status"], "completed")
+        self.assertEqual(progress["counts"], {"completed": 5})
+        self.assertEqual(progress["progress"], 100)
+        self.assertLessEqual(self.max_active, 2)
+
+        status = (await self.client.get(f"/batch/{body['batch_id']}")).json()
+        self.assertEqual(
+            [job["job_id"] for job in status["jobs"]], body["job_ids"]
+        )
+
+    async def test_ndjson_batch_and_combined_archive(self):
+        """NDJSON 배치를 받고 모든 앱을 하나의 ZIP으로 다운로드하는지 테스트"""
+        specs = make_specs(3)
+        payload = "\n".join(json.dumps(spec) for spec in specs) + "\n\n"
+        body = (await self.client.post(
+            "/generate_apps",
+            content=payload.encode("utf-8"),
+            headers={"Content-Type": "application/x-ndjson"}
+        )).json()
+        self.assertEqual(body["total"], 3)
+
+        # 끝나지 않은 배치는 다운로드할 수 없음
+        self.assertEqual(
+            (await self.client.get(f"/download_batch/{body['batch_id']}")).status_code,
+            409
+        )
+
+        self.release.set()
+        await self._wait_batch(body["batch_id"])
+
+        response = await self.client.get(f"/download_batch/{body['batch_id']}")
+        self.assertEqual(response.status_code, 200)
+        folders = set()
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            for name in archive.namelist():
+                folders.add(name.split("/", 1)[0])
+        expected = {
+            (await self.store.get(job_id))["folder_name"]
+            for job_id in body["job_ids"]
+        }
+        self.assertEqual(folders, expected)
+
+        cached = await self.client.get(
+            f"/download_batch/{body['batch_id']}",
+            headers={"If-None-Match": response.headers["etag"]}
+        )
+        self.assertEqual(cached.status_code, 304)
+
+    async def test_invalid_batches_are_rejected(self):
+        """잘못된 본문, 크기 초과, 없는 배치에 대한 오류 응답 테스트"""
+        response = await self.client.post("/generate_apps", json=[{"app_name": "a"}, 1])
+        self.assertEqual(response.status_code, 400)
+
+        response = await self.client.post("/generate_apps", json=[])
+        self.assertEqual(response.status_code, 400)
+
+        with patch.object(api_app, "BATCH_MAX_SIZE", 2):
+            response = await self.client.post("/generate_apps", json=make_specs(3))
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(await self.store.list_jobs(), [])
+
+        self.assertEqual((await self.client.get("/batch/unknown")).status_code, 404)
+        self.assertEqual(
+            (await self.client.get("/download_batch/unknown")).status_code, 404
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,271 @@
+"""
+작업 취소 테스트
+
+이 테스트는 DELETE /job/{job_id}와 POST /jobs/cancel이 대기 중인 작업을 큐에서
+빼고, 실행 중인 작업의 태스크와 하위 프로세스를 중단하며, 부분 출력
+디렉토리를 삭제하고 작업을 cancelled 상태로 바꾸는지, 그리고 병렬 에이전트가
+취소될 때 하위 에이전트 태스크도 함께 취소되는지 검증합니다.
+"""
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from typing import AsyncGenerator
+from unittest.mock import patch
+
+import httpx
+from google.adk import Runner
+from google.adk.agents import BaseAgent
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+import src.api.app as api_app
+from src.agents.parallel_agent import CancellableParallelAgent
+from src.api.job_dedup import JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+from src.utils import job_processes
+
+# 하위 에이전트별 종료 방식 기록 (pydantic 모델이라 인스턴스에 저장하지 않음)
+AGENT_EXITS = {}
+
+
+class SleepingAgent(BaseAgent):
+    """취소될 때까지 기다리는 테스트용 에이전트"""
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            AGENT_EXITS[self.name] = "cancelled"
+            raise
+        yield Event(author=self.name, invocation_id=ctx.invocation_id)
+
+
+async def slow_app_creation(job_id: str, app_spec: dict):
+    """출력 디렉토리에 파일을 쓰고 오래 걸리는 하위 프로세스를 기다립니다."""
+    job_info = await api_app.job_store.get(job_id)
+    output_dir = os.path.join(api_app.FLUTTER_OUTPUT_DIR, job_info["folder_name"])
+    os.makedirs(os.path.join(output_dir, "lib"), exist_ok=True)
+    with open(os.path.join(output_dir, "lib", "main.dart"), "w") as f:
+        f.write("void main() {}")
+    await job_processes.run_process("sleep", "30")
+
+
+class TestJobCancel(unittest.IsolatedAsyncioTestCase):
+    """작업 취소 엔드포인트 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.queue = JobQueue(api_app.run_queued_job, max_size=10, worker_count=1)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_dedup", JobDeduplicator()),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "blob_store", None),
+            patch.object(api_app, "start_app_creation", slow_app_creation),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def submit(self, app_name: str) -> str:
+        response = await self.client.post("/generate_app", json={"app_name": app_name})
+        return response.json()["job_id"]
+
+    async def wait_for_process(self, job_id: str):
+        """작업이 하위 프로세스를 띄울 때까지 기다립니다."""
+        for _ in range(500):
+            if job_processes.running_processes(job_id):
+                return
+            await asyncio.sleep(0.01)
+        self.fail("하위 프로세스가 시작되지 않았습니다.")
+
+    async def test_cancel_running_job(self):
+        """실행 중인 작업의 하위 프로세스를 종료하고 부분 출력을 삭제하는지 테스트"""
+        job_id = await self.submit("shop")
+        await self.wait_for_process(job_id)
+        job_info = await self.store.get(job_id)
+        output_dir = os.path.join(self.temp_dir.name, job_info["folder_name"])
+        self.assertTrue(os.path.isdir(output_dir))
+
+        started = time.monotonic()
+        response = await self.client.delete(f"/job/{job_id}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "cancelled")
+        self.assertLess(time.monotonic() - started, 5)
+
+        self.assertEqual(job_processes.running_processes(job_id), 0)
+        self.assertFalse(os.path.exists(output_dir))
+        self.assertEqual(self.queue.running, 0)
+        self.assertIsNone(self.queue.task(job_id))
+
+        # 다시 취소해도 같은 응답이고, 같은 명세는 새 작업으로 시작
+        self.assertEqual((await self.client.delete(f"/job/{job_id}")).status_code, 200)
+        self.assertNotEqual(await self.submit("shop"), job_id)
+
+    async def test_cancel_finished_or_missing_job(self):
+        """끝난 작업은 409, 없는 작업은 404를 반환하는지 테스트"""
+        await self.store.create({"job_id": "done", "status": "completed"})
+        response = await self.client.delete("/job/done")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual((await self.store.get("done"))["status"], "completed")
+        self.assertEqual((await self.client.delete("/job/unknown")).status_code, 404)
+
+    async def test_cancel_queued_job(self):
+        """대기 중인 작업을 큐에서 빼고 실행 중인 작업은 계속되는지 테스트"""
+        running_id = await self.submit("first")
+        await self.wait_for_process(running_id)
+        queued_id = await self.submit("second")
+        self.assertEqual(self.queue.depth, 1)
+
+        response = await self.client.delete(f"/job/{queued_id}")
+        self.assertEqual(response.json()["status"], "cancelled")
+        self.assertEqual(self.queue.depth, 0)
+        self.assertEqual((await self.store.get(running_id))["status"], "running")
+        self.assertEqual(job_processes.running_processes(running_id), 1)
+
+    async def test_bulk_cancel(self):
+        """여러 작업을 한 번에 취소하고 끝난 작업과 없는 작업을 구분하는지 테스트"""
+        running_id = await self.submit("first")
+        await self.wait_for_process(running_id)
+        queued_id = await self.submit("second")
+        await self.store.create({"job_id": "done", "status": "completed"})
+
+        response = await self.client.post(
+            "/jobs/cancel", json={"job_ids": [running_id, queued_id, "done", "unknown"]}
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(sorted(body["cancelled"]), sorted([running_id, queued_id]))
+        self.assertEqual(body["finished"], {"done": "completed"})
+        self.assertEqual(body["missing"], ["unknown"])
+        for job_id in (running_id, queued_id):
+            self.assertEqual((await self.store.get(job_id))["status"], "cancelled")
+        self.assertEqual(self.queue.running, 0)
+
+
+    async def wait_for_status(self, job_id: str, status: str):
+        """작업이 주어진 상태가 될 때까지 기다립니다."""
+        for _ in range(500):
+            if (await self.store.get(job_id))["status"] == status:
+                return
+            await asyncio.sleep(0.01)
+        self.fail(f"작업이 {status} 상태가 되지 않았습니다.")
+
+    async def test_job_on_other_worker_is_only_flagged(self):
+        """다른 워커의 작업은 취소 요청만 기록하고 상태와 출력을 그대로 두는지 테스트"""
+        output_dir = os.path.join(self.temp_dir.name, "App_remote")
+        os.makedirs(output_dir)
+        await self.store.create({
+            "job_id": "remote", "status": "running", "folder_name": "App_remote",
+            "worker_id": "other-host:1234", "start_time": time.time(),
+        })
+
+        response = await self.client.delete("/job/remote")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["status"], "running")
+        self.assertTrue(response.json()["cancel_requested"])
+        self.assertTrue(os.path.isdir(output_dir))
+
+        response = await self.client.post("/jobs/cancel", json=["remote"])
+        self.assertEqual(response.json()["requested"], ["remote"])
+
+    async def test_flagged_job_is_cancelled_by_owner(self):
+        """작업을 실행하는 워커가 취소 요청을 확인하여 작업을 취소하는지 테스트"""
+        job_id = await self.submit("shop")
+        await self.wait_for_process(job_id)
+        await self.store.update(job_id, cancel_requested=True)
+
+        self.assertEqual(await api_app.poll_cancel_requests(), 1)
+        job_info = await self.store.get(job_id)
+        self.assertEqual(job_info["status"], "cancelled")
+        self.assertFalse(
+            os.path.exists(os.path.join(self.temp_dir.name, job_info["folder_name"]))
+        )
+        self.assertEqual(job_processes.running_processes(job_id), 0)
+
+    async def test_slow_task_is_cancelled_after_it_stops(self):
+        """제한 시간 안에 멈추지 않은 작업은 실제로 멈춘 뒤에 취소를 마치는지 테스트"""
+        async def stubborn_app_creation(job_id: str, app_spec: dict):
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                # 기록 중인 파일을 마치는 작업
+                await asyncio.sleep(0.3)
+                raise
+
+        with patch.object(api_app, "start_app_creation", stubborn_app_creation), \
+                patch.object(api_app, "JOB_CANCEL_TIMEOUT", 0.05):
+            job_id = await self.submit("shop")
+            while self.queue.task(job_id) is None:
+                await asyncio.sleep(0.01)
+            folder_name = (await self.store.get(job_id))["folder_name"]
+
+            response = await self.client.delete(f"/job/{job_id}")
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual((await self.store.get(job_id))["status"], "running")
+            self.assertTrue(os.path.isdir(os.path.join(self.temp_dir.name, folder_name)))
+
+            await self.wait_for_status(job_id, "cancelled")
+            self.assertFalse(os.path.exists(os.path.join(self.temp_dir.name, folder_name)))
+
+    async def test_cancelled_status_is_not_overwritten(self):
+        """취소된 작업을 늦게 끝난 워커가 다른 상태로 덮어쓰지 못하는지 테스트"""
+        await self.store.create({"job_id": "late", "status": "running"})
+        await api_app.update_job("late", status="cancelled")
+
+        self.assertIsNone(await api_app.update_job("late", status="completed"))
+        self.assertEqual((await self.store.get("late"))["status"], "cancelled")
+
+class TestCancellableParallelAgent(unittest.IsolatedAsyncioTestCase):
+    """CancellableParallelAgent 취소 테스트"""
+
+    async def test_sub_agent_tasks_are_cancelled(self):
+        """러너 실행을 취소하면 하위 에이전트 태스크도 취소되는지 테스트"""
+        AGENT_EXITS.clear()
+        agent = CancellableParallelAgent(
+            name="ModelGroupAgent",
+            sub_agents=[SleepingAgent(name="First"), SleepingAgent(name="Second")]
+        )
+        session_service = InMemorySessionService()
+        runner = Runner(app_name="test", agent=agent, session_service=session_service)
+        session = session_service.create_session(app_name="test", user_id="user")
+
+        async def consume():
+            async for _ in runner.run_async(
+                user_id="user", session_id=session.id,
+                new_message=types.Content(role="user", parts=[types.Part(text="앱")])
+            ):
+                pass
+
+        task = asyncio.create_task(consume())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        self.assertEqual(AGENT_EXITS, {"First": "cancelled", "Second": "cancelled"})
+
+
+if __name__ == "__main__":
+    unittest.main()
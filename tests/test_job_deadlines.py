@@ -0,0 +1,253 @@
+"""
+작업 제한 시간 테스트
+
+이 테스트는 생성 단계가 제한 시간을 넘기면 남은 파일을 건너뛰고 다음 단계를
+계속 진행하여 작업이 partial 상태로 끝나는지, 작업 제한 시간이 모든 단계에
+적용되는지, 그리고 병렬 그룹의 하위 에이전트가 제한 시간을 넘기면 취소되고
+기본 템플릿으로 대체되는지 검증합니다.
+"""
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+from typing import AsyncGenerator
+from unittest.mock import patch
+
+import httpx
+from google.adk import Runner
+from google.adk.agents import BaseAgent
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+
+import src.api.app as api_app
+from src.agents.parallel_agent import CancellableParallelAgent
+from src.agents.webview_group.home_page_view_agent import create_default_home_page
+from src.api import app_files
+from src.api.app_files import GENERATION_PHASES, generate_app_output, run_phase
+from src.api.job_dedup import JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+from src.utils import deadlines
+
+SPEC = {"app_name": "shop", "models": [{"name": "Item", "fields": []}],
+        "pages": ["Home", "Detail"]}
+
+
+def slow_page(page_name: str) -> str:
+    """렌더링에 0.1초가 걸리는 페이지 렌더러"""
+    time.sleep(0.1)
+    return f"class {page_name} {{}}"
+
+
+class SlowAgent(BaseAgent):
+    """이벤트 하나를 내고 오래 기다리는 테스트용 에이전트"""
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        yield Event(author=self.name, invocation_id=ctx.invocation_id)
+        await asyncio.sleep(30)
+
+
+class QuickAgent(BaseAgent):
+    """바로 끝나는 테스트용 에이전트"""
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        yield Event(author=self.name, invocation_id=ctx.invocation_id)
+
+
+class TestPhaseDeadlines(unittest.TestCase):
+    """생성 단계 제한 시간 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_dir = os.path.join(self.temp_dir.name, "shop")
+
+    def tearDown(self):
+        """테스트 정리"""
+        self.temp_dir.cleanup()
+
+    def test_expired_phase_skips_remaining_files(self):
+        """제한 시간이 지난 단계는 남은 파일을 기록하지 않는지 테스트"""
+        deadline = deadlines.Deadline("pages", 0.05)
+        with patch.object(app_files, "render_page_file", slow_page):
+            written, summary = run_phase(
+                self.output_dir, "pages", SPEC, deadline=deadline
+            )
+        self.assertEqual(written, [])
+        self.assertTrue(summary["timed_out"])
+        self.assertEqual(summary["skipped"], 2)
+
+        # 제한 시간 안에 끝난 단계는 표시하지 않음
+        written, summary = run_phase(
+            self.output_dir, "models", SPEC,
+            deadline=deadlines.Deadline("models", 5)
+        )
+        self.assertEqual(written, ["lib/models/item.dart"])
+        self.assertNotIn("timed_out", summary)
+
+    def test_job_deadline_applies_to_every_phase(self):
+        """작업 제한 시간이 지나면 이후 단계도 모두 건너뛰는지 테스트"""
+        events = []
+        with patch.object(app_files, "render_page_file", slow_page):
+            written, manifest = generate_app_output(
+                self.output_dir, SPEC, None, 0.05, {"models": None},
+                report=lambda event, payload: events.append((event, payload))
+            )
+        timed_out = [
+            payload["phase"] for event, payload in events
+            if event == "phase_done" and payload.get("timed_out")
+        ]
+        self.assertEqual(timed_out, list(GENERATION_PHASES[1:]))
+        self.assertEqual(written["models"], ["lib/models/item.dart"])
+        self.assertEqual(list(manifest), ["lib/models/item.dart"])
+
+    def test_step_deadline_overrides(self):
+        """STEP_DEADLINES가 기본 제한 시간보다 우선하는지 테스트"""
+        with patch.dict(deadlines.STEP_DEADLINES, {"pages": 3}):
+            self.assertEqual(deadlines.step_timeout("pages", 10), 3)
+            self.assertEqual(deadlines.step_timeout("models", 10), 10)
+            self.assertIsNone(deadlines.step_timeout("models", 0))
+
+        parent = deadlines.Deadline("job", 0.01)
+        child = deadlines.Deadline("pages", 60, parent)
+        self.assertLessEqual(child.remaining(), 0.01)
+        self.assertIsNone(deadlines.Deadline("job").remaining())
+
+
+class TestPartialJob(unittest.IsolatedAsyncioTestCase):
+    """제한 시간을 넘긴 작업의 partial 완료 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.queue = JobQueue(api_app.run_queued_job, max_size=10, worker_count=1)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_dedup", JobDeduplicator()),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "blob_store", None),
+            patch.object(app_files, "render_page_file", slow_page),
+            patch.dict(deadlines.STEP_DEADLINES, {"pages": 0.05}),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def wait_for_job(self, job_id: str) -> dict:
+        for _ in range(500):
+            job_info = await self.store.get(job_id)
+            if job_info["status"] not in ("pending", "running"):
+                return job_info
+            await asyncio.sleep(0.01)
+        self.fail("작업이 끝나지 않았습니다.")
+
+    async def test_timed_out_phase_finishes_partial(self):
+        """단계가 제한 시간을 넘겨도 나머지 단계를 생성하고 partial로 끝나는지 테스트"""
+        response = await self.client.post("/generate_app", json=SPEC)
+        job_id = response.json()["job_id"]
+        job_info = await self.wait_for_job(job_id)
+
+        self.assertEqual(job_info["status"], "partial")
+        self.assertEqual(job_info["timed_out"], ["pages"])
+        self.assertIn("lib/main.dart", job_info["artifacts"])
+        self.assertIn("lib/models/item.dart", job_info["artifacts"])
+        self.assertFalse(any(
+            path.startswith("lib/pages/") for path in job_info["artifacts"]
+        ))
+
+        body = (await self.client.get(f"/job/{job_id}")).json()
+        self.assertEqual(body["timed_out"], ["pages"])
+        response = await self.client.get(f"/download_zip/{job_id}")
+        self.assertEqual(response.status_code, 200)
+
+
+class TestAgentDeadlines(unittest.IsolatedAsyncioTestCase):
+    """병렬 그룹 하위 에이전트 제한 시간 테스트"""
+
+    async def test_timed_out_agents_use_fallback(self):
+        """제한 시간을 넘긴 하위 에이전트는 기본 템플릿으로 대체되는지 테스트"""
+        agent = CancellableParallelAgent(
+            name="WebviewGroupAgent",
+            sub_agents=[
+                SlowAgent(name="HomePageViewAgent"),
+                SlowAgent(name="SettingsPageViewAgent"),
+                QuickAgent(name="Quick"),
+            ],
+            fallbacks={"HomePageViewAgent": create_default_home_page}
+        )
+        session_service = InMemorySessionService()
+        artifact_service = InMemoryArtifactService()
+        runner = Runner(
+            app_name="test", agent=agent, session_service=session_service,
+            artifact_service=artifact_service
+        )
+        session = session_service.create_session(app_name="test", user_id="user")
+
+        started = time.monotonic()
+        with patch.dict(deadlines.STEP_DEADLINES, {"WebviewGroupAgent": 0.1}), \
+                deadlines.deadline_scope(deadlines.Deadline("job")) as scope:
+            authors = [
+                event.author async for event in runner.run_async(
+                    user_id="user", session_id=session.id,
+                    new_message=types.Content(
+                        role="user", parts=[types.Part(text="앱")]
+                    )
+                )
+            ]
+        self.assertLess(time.monotonic() - started, 5)
+
+        self.assertEqual(scope.fallbacks, ["HomePageViewAgent"])
+        self.assertEqual(scope.timed_out, ["SettingsPageViewAgent"])
+        self.assertEqual(authors.count("HomePageViewAgent"), 2)
+        keys = await artifact_service.list_artifact_keys(
+            app_name="test", user_id="user", session_id=session.id
+        )
+        self.assertEqual(keys, ["lib/pages/home_page.dart"])
+
+    async def test_job_deadline_finishes_agent_job_partial(self):
+        """작업 제한 시간이 지나면 러너를 중단하고 partial로 끝나는지 테스트"""
+        store = InMemoryJobStore()
+        await store.create({"job_id": "job1", "status": "running"})
+        session_service = InMemorySessionService()
+        runner = Runner(
+            app_name="AgentOfFlutter", agent=SlowAgent(name="Slow"),
+            session_service=session_service,
+            artifact_service=InMemoryArtifactService()
+        )
+        with patch.object(api_app, "job_store", store), \
+                patch.object(api_app, "job_journal", None), \
+                patch.object(api_app, "runner", runner), \
+                patch.object(api_app, "session_service", session_service), \
+                patch.object(api_app, "JOB_DEADLINE", 0.1), \
+                patch.object(api_app, "register_agents", lambda spec: None):
+            await asyncio.wait_for(
+                api_app.handle_app_generation("job1", {"app_name": "shop"}), 5
+            )
+
+        job_info = await store.get("job1")
+        self.assertEqual(job_info["status"], "partial")
+        self.assertEqual(job_info["timed_out"], ["job"])
+
+
+if __name__ == "__main__":
+    unittest.main()
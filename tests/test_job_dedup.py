@@ -0,0 +1,163 @@
+"""
+앱 생성 요청 중복 제거 테스트
+
+이 테스트는 Idempotency-Key 재시도와 같은 명세의 동시 제출이 하나의
+작업으로 합쳐지는지, 같은 이름의 앱이 서로 다른 폴더를 사용하는지 검증합니다.
+"""
+import asyncio
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.job_dedup import IdempotencyConflictError, JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+
+SPEC = {"app_name": "shop", "models": [], "pages": ["Home"]}
+
+
+class TestJobDeduplicator(unittest.IsolatedAsyncioTestCase):
+    """JobDeduplicator 기능 테스트"""
+
+    async def test_in_flight_spec_is_shared_until_finished(self):
+        """진행 중인 명세는 합류하고 끝나면 합류하지 않는지 테스트"""
+        dedup = JobDeduplicator()
+        self.assertIsNone(dedup.find("spec"))
+        flight = dedup.begin("job1", "spec")
+
+        self.assertIs(dedup.find("spec"), flight)
+        self.assertEqual(dedup.coalesced, 1)
+
+        dedup.finish("spec", "job1")
+        self.assertIsNone(dedup.find("spec"))
+        self.assertTrue(flight.ready.is_set())
+
+    async def test_idempotency_key_outlives_job_until_ttl(self):
+        """Idempotency-Key는 작업이 끝나도 만료 전까지 같은 작업을 반환하는지 테스트"""
+        dedup = JobDeduplicator(key_ttl=60)
+        flight = dedup.begin("job1", "spec", "key")
+        dedup.finish("spec", "job1")
+
+        self.assertIs(dedup.find("spec", "key"), flight)
+        self.assertEqual(dedup.replayed, 1)
+        with self.assertRaises(IdempotencyConflictError):
+            dedup.find("other", "key")
+
+        with patch("src.api.job_dedup.time.time", return_value=time.time() + 61):
+            self.assertIsNone(dedup.find("spec", "key"))
+
+    async def test_abandoned_flight_is_forgotten(self):
+        """생성에 실패한 작업은 키와 진행 목록에서 제거되는지 테스트"""
+        dedup = JobDeduplicator()
+        flight = dedup.begin("job1", "spec", "key")
+        dedup.abandon(flight)
+
+        self.assertTrue(flight.ready.is_set())
+        self.assertIsNone(dedup.find("spec", "key"))
+        self.assertEqual(dedup.in_flight, 0)
+
+
+class TestGenerateAppDedup(unittest.IsolatedAsyncioTestCase):
+    """/generate_app 중복 제거 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.release = asyncio.Event()
+        self.store = InMemoryJobStore()
+        self.dedup = JobDeduplicator()
+        self.queue = JobQueue(self._handler, max_size=10, worker_count=1)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_dedup", self.dedup),
+            patch.object(api_app, "result_cache", None),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def _handler(self, job_id, payload, queue_wait):
+        """테스트가 허용할 때까지 작업 시작을 늦추는 핸들러"""
+        await self.release.wait()
+        await api_app.run_queued_job(job_id, payload, queue_wait)
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def _wait_completed(self, job_id):
+        for _ in range(500):
+            if (await self.store.get(job_id))["status"] == "completed":
+                return
+            await asyncio.sleep(0.01)
+        self.fail("앱 생성이 완료되지 않았습니다.")
+
+    async def test_concurrent_identical_specs_share_one_job(self):
+        """같은 명세를 동시에 제출하면 하나의 작업에 합류하는지 테스트"""
+        responses = await asyncio.gather(*(
+            self.client.post("/generate_app", json=spec)
+            for spec in (SPEC, dict(reversed(list(SPEC.items()))), SPEC)
+        ))
+
+        job_ids = {response.json()["job_id"] for response in responses}
+        self.assertEqual(len(job_ids), 1)
+        self.assertEqual(len(await self.store.list_jobs()), 1)
+        self.assertEqual(self.dedup.coalesced, 2)
+
+        # 작업이 끝나면 같은 명세도 새 작업으로 실행
+        self.release.set()
+        await self._wait_completed(job_ids.pop())
+        response = await self.client.post("/generate_app", json=SPEC)
+        self.assertNotIn("idempotent-replayed", response.headers)
+        self.assertEqual(len(await self.store.list_jobs()), 2)
+
+    async def test_idempotency_key_returns_original_job(self):
+        """같은 Idempotency-Key로 재시도하면 처음 작업을 반환하는지 테스트"""
+        headers = {"Idempotency-Key": "retry-1"}
+        first = await self.client.post("/generate_app", json=SPEC, headers=headers)
+        self.release.set()
+        await self._wait_completed(first.json()["job_id"])
+
+        retry = await self.client.post("/generate_app", json=SPEC, headers=headers)
+        self.assertEqual(retry.json()["job_id"], first.json()["job_id"])
+        self.assertEqual(retry.json()["status"], "completed")
+        self.assertEqual(retry.headers["idempotent-replayed"], "true")
+
+        conflict = await self.client.post(
+            "/generate_app", json={**SPEC, "pages": ["Other"]}, headers=headers
+        )
+        self.assertEqual(conflict.status_code, 422)
+
+        status = (await self.client.get("/status")).json()
+        self.assertEqual(status["idempotent_replays"], 1)
+
+    async def test_same_app_name_uses_distinct_folders(self):
+        """같은 시각에 제출된 같은 이름의 앱이 다른 폴더를 사용하는지 테스트"""
+        with patch.object(api_app.time, "time", return_value=1234.0):
+            first = await self.client.post("/generate_app", json=SPEC)
+            second = await self.client.post(
+                "/generate_app", json={**SPEC, "pages": ["Other"]}
+            )
+
+        self.assertEqual(first.json()["folder_name"], "App_shop_v1234")
+        self.assertEqual(second.json()["folder_name"], "App_shop_v1234-2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+작업 이벤트 스트림 테스트
+
+이 테스트는 이벤트 브로커와 /job/{job_id}/events SSE 엔드포인트,
+CLI의 이벤트 스트림 소비 동작을 검증합니다.
+"""
+import asyncio
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.job_events import JobEventBroker, format_sse
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+from src.cli.client import watch_job_events
+
+
+def parse_sse(body: str):
+    """SSE 응답 본문을 (이벤트, 데이터) 목록으로 변환합니다."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(
+            line.split(": ", 1) for line in block.splitlines()
+            if not line.startswith(":")
+        )
+        if lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestJobEventBroker(unittest.IsolatedAsyncioTestCase):
+    """JobEventBroker 기능 테스트"""
+
+    async def test_publish_reaches_only_job_subscribers(self):
+        """발행된 이벤트가 해당 작업 구독자에게만 전달되는지 테스트"""
+        broker = JobEventBroker()
+        first = broker.subscribe("a")
+        other = broker.subscribe("b")
+
+        broker.publish("a", "status", {"progress": 10})
+        self.assertEqual(first.get_nowait(), ("status", {"progress": 10}))
+        self.assertTrue(other.empty())
+
+        broker.unsubscribe("a", first)
+        broker.unsubscribe("b", other)
+        self.assertEqual(broker.subscriber_count(), 0)
+
+    async def test_slow_subscriber_drops_oldest_events(self):
+        """구독자 큐가 가득 차면 오래된 이벤트를 버리는지 테스트"""
+        broker = JobEventBroker(queue_size=2)
+        queue = broker.subscribe("a")
+        for progress in range(4):
+            broker.publish("a", "status", {"progress": progress})
+
+        self.assertEqual(queue.get_nowait()[1]["progress"], 2)
+        self.assertEqual(queue.get_nowait()[1]["progress"], 3)
+
+    def test_format_sse(self):
+        """SSE 메시지 형식 테스트"""
+        self.assertEqual(
+            format_sse("status", {"message": "완료"}),
+            'event: status\ndata: {"message": "완료"}\n\n'
+        )
+
+
+class TestJobEventsEndpoint(unittest.IsolatedAsyncioTestCase):
+    """/job/{job_id}/events 엔드포인트 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.release = asyncio.Event()
+        self.queue = JobQueue(self._handler, max_size=10, worker_count=1)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_store", InMemoryJobStore()),
+            patch.object(api_app, "job_queue", self.queue),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def _handler(self, job_id, payload, queue_wait):
+        """구독자가 연결될 때까지 작업 시작을 늦추는 핸들러"""
+        await self.release.wait()
+        await api_app.run_queued_job(job_id, payload, queue_wait)
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def _create_job(self):
+        spec = {
+            "app_name": "events_app",
+            "models": [{"name": "User", "fields": []}],
+            "pages": ["Home"],
+        }
+        response = await self.client.post("/generate_app", json=spec)
+        return response.json()["job_id"]
+
+    async def test_stream_reports_progress_artifacts_and_summary(self):
+        """진행 상태, 파일 생성, 최종 요약 이벤트가 순서대로 전달되는지 테스트"""
+        job_id = await self._create_job()
+
+        stream = asyncio.create_task(
+            self.client.get(f"/job/{job_id}/events")
+        )
+        while not api_app.job_events.subscriber_count(job_id):
+            await asyncio.sleep(0.01)
+        self.release.set()
+        response = await asyncio.wait_for(stream, 10)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            response.headers["content-type"].startswith("text/event-stream")
+        )
+        events = parse_sse(response.text)
+        names = [event for event, _ in events]
+
+        self.assertEqual(names[0], "status")
+        self.assertEqual(events[0][1]["status"], "pending")
+        self.assertEqual(names[-1], "summary")
+        self.assertEqual(events[-1][1]["status"], "completed")
+
+        artifacts = [data["path"] for event, data in events if event == "artifact"]
+        job = await api_app.job_store.get(job_id)
+        self.assertEqual(sorted(artifacts), sorted(job["artifacts"]))
+        self.assertEqual(events[-1][1]["artifact_count"], len(artifacts))
+
+        progress = [data["progress"] for event, data in events if event == "status"]
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(api_app.job_events.subscriber_count(), 0)
+
+    async def test_finished_job_returns_summary_immediately(self):
+        """이미 끝난 작업은 현재 상태와 요약만 보내고 종료하는지 테스트"""
+        self.release.set()
+        job_id = await self._create_job()
+        while (await api_app.job_store.get(job_id))["status"] != "completed":
+            await asyncio.sleep(0.01)
+
+        response = await self.client.get(f"/job/{job_id}/events")
+        names = [event for event, _ in parse_sse(response.text)]
+        self.assertEqual(names, ["status", "summary"])
+
+    async def test_unknown_job_returns_404(self):
+        """존재하지 않는 작업은 404를 반환하는지 테스트"""
+        response = await self.client.get("/job/missing/events")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(api_app.job_events.subscriber_count(), 0)
+
+    async def test_cli_consumes_event_stream(self):
+        """CLI가 이벤트 스트림에서 최종 요약을 받는지 테스트"""
+        self.release.set()
+        job_id = await self._create_job()
+
+        with patch("builtins.print"):
+            summary = await watch_job_events(self.client, job_id)
+        self.assertEqual(summary["status"], "completed")
+        self.assertGreater(summary["artifact_count"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+"""
+작업 상태 저널 테스트
+
+이 테스트는 저널 기록/압축과 서버 재시작 시 작업 복원 동작을 검증합니다.
+"""
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import src.api.app as api_app
+from src.api.job_journal import JobJournal
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+
+
+class TestJobJournal(unittest.IsolatedAsyncioTestCase):
+    """JobJournal 기록 및 압축 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.journal = JobJournal(self.temp_dir.name, compact_every=1000)
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.journal.close()
+        self.temp_dir.cleanup()
+
+    async def test_replay_applies_transitions_in_order(self):
+        """저널 재생 시 상태 전이가 순서대로 적용되는지 테스트"""
+        self.journal.record_set("a", {"job_id": "a", "status": "pending"})
+        self.journal.record_set("b", {"job_id": "b", "status": "pending"})
+        self.journal.record_set("a", {"status": "running", "progress": 50})
+        self.journal.record_delete("b")
+        await self.journal.flush()
+
+        records = JobJournal(self.temp_dir.name).load()
+        self.assertEqual(
+            records, {"a": {"job_id": "a", "status": "running", "progress": 50}}
+        )
+
+    async def test_compaction_writes_snapshot_and_truncates_journal(self):
+        """압축 후 스냅샷만으로 상태가 복원되는지 테스트"""
+        self.journal.compact_every = 3
+        self.journal.record_set("a", {"job_id": "a", "status": "pending"})
+        self.journal.record_set("a", {"status": "running"})
+        self.journal.record_set("a", {"status": "completed"})
+        await self.journal._compaction_task
+
+        self.assertTrue(os.path.exists(self.journal.snapshot_path))
+        self.assertFalse(os.path.exists(self.journal.journal_path))
+        self.assertFalse(os.path.exists(self.journal.compacting_path))
+
+        self.journal.record_set("a", {"progress": 100})
+        await self.journal.flush()
+        records = JobJournal(self.temp_dir.name).load()
+        self.assertEqual(records["a"]["status"], "completed")
+        self.assertEqual(records["a"]["progress"], 100)
+
+    async def test_direct_compaction_waits_for_scheduled_one(self):
+        """예약된 압축 중에 직접 압축하면 앞의 압축이 끝난 뒤 저널을 교체하는지 테스트"""
+        calls = []
+        gate = threading.Event()
+        rotate, write_compacted = self.journal._rotate, self.journal._write_compacted
+
+        def traced_rotate():
+            calls.append("rotate")
+            return rotate()
+
+        def gated_write():
+            calls.append("write")
+            gate.wait(5)
+            return write_compacted()
+
+        self.journal.compact_every = 2
+        with patch.object(self.journal, "_rotate", traced_rotate), \
+                patch.object(self.journal, "_write_compacted", gated_write):
+            self.journal.record_set("a", {"job_id": "a", "status": "pending"})
+            self.journal.record_set("a", {"status": "running"})
+            while "write" not in calls:
+                await asyncio.sleep(0.01)
+
+            # 예약된 압축이 스냅샷을 기록하는 동안 기록하고 직접 압축
+            self.journal.record_set("a", {"status": "completed"})
+            direct = asyncio.create_task(self.journal.compact())
+            await asyncio.sleep(0.05)
+            self.assertEqual(calls, ["rotate", "write"])
+            gate.set()
+            await asyncio.gather(self.journal._compaction_task, direct)
+
+        self.assertEqual(calls, ["rotate", "write", "rotate", "write"])
+        self.assertFalse(os.path.exists(self.journal.compacting_path))
+        records = JobJournal(self.temp_dir.name).load()
+        self.assertEqual(records["a"]["status"], "completed")
+
+    async def test_writes_are_batched_off_the_event_loop(self):
+        """기록이 이벤트 루프를 막지 않고 기록 태스크가 모아서 쓰는지 테스트"""
+        batches = []
+        gate = threading.Event()
+        write_lines = self.journal._write_lines
+
+        def gated_write(lines):
+            batches.append(len(lines))
+            gate.wait(5)
+            write_lines(lines)
+
+        with patch.object(self.journal, "_write_lines", gated_write):
+            self.journal.record_set("a", {"job_id": "a", "status": "pending"})
+            while not batches:
+                await asyncio.sleep(0.01)
+
+            # 첫 기록을 쓰는 동안 들어온 기록은 다음 묶음으로 한 번에 씀
+            for progress in (10, 20, 30):
+                self.journal.record_set("a", {"progress": progress})
+            self.assertEqual(batches, [1])
+            gate.set()
+            await self.journal.flush()
+
+        self.assertEqual(batches, [1, 3])
+        records = JobJournal(self.temp_dir.name).load()
+        self.assertEqual(records["a"]["progress"], 30)
+
+    async def test_torn_last_line_is_ignored(self):
+        """비정상 종료로 잘린 마지막 줄이 무시되는지 테스트"""
+        self.journal.record_set("a", {"job_id": "a", "status": "pending"})
+        await self.journal.flush()
+        with open(self.journal.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"op": "set", "job_id": "a", "fie')
+
+        records = JobJournal(self.temp_dir.name).load()
+        self.assertEqual(records["a"]["status"], "pending")
+
+
+class TestJobRecovery(unittest.IsolatedAsyncioTestCase):
+    """서버 재시작 시 작업 복원 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.submitted = []
+        self.release = asyncio.Event()
+
+        previous = JobJournal(self.temp_dir.name)
+        for job_id, status, start_time in [
+            ("done", "completed", 1.0),
+            ("waiting", "pending", 2.0),
+            ("working", "running", 3.0),
+        ]:
+            previous.record_set(job_id, {
+                "job_id": job_id,
+                "status": status,
+                "app_spec": {"app_name": job_id},
+                "artifacts": [],
+                "start_time": start_time,
+            })
+        await previous.close()
+
+        self.queue = JobQueue(self._handler, max_size=10, worker_count=1)
+        self.journal = JobJournal(self.temp_dir.name)
+        self.patches = [
+            patch.object(api_app, "job_journal", self.journal),
+            patch.object(api_app, "job_store", InMemoryJobStore()),
+            patch.object(api_app, "job_queue", self.queue),
+        ]
+        for p in self.patches:
+            p.start()
+
+    async def _handler(self, job_id, payload, queue_wait):
+        """복원된 작업 실행을 기록하는 테스트 핸들러"""
+        self.submitted.append(job_id)
+        await self.release.wait()
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        self.release.set()
+        await self.queue.stop()
+        await self.journal.close()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def test_requeues_pending_and_running_jobs(self):
+        """대기 및 실행 중이던 작업이 다시 큐에 들어가는지 테스트"""
+        with patch.object(api_app, "JOB_RECOVERY_MODE", "requeue"):
+            summary = await api_app.recover_jobs()
+
+        self.assertEqual(summary["restored"], 3)
+        self.assertEqual(summary["requeued"], 2)
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.submitted, ["waiting"])
+
+        working = await api_app.job_store.get("working")
+        self.assertEqual(working["status"], "pending")
+        self.assertEqual(working["queue_position"], 2)
+        done = await api_app.job_store.get("done")
+        self.assertEqual(done["status"], "completed")
+
+    async def test_interrupt_mode_marks_running_jobs(self):
+        """interrupt 모드에서 실행 중이던 작업이 중단 표시되는지 테스트"""
+        with patch.object(api_app, "JOB_RECOVERY_MODE", "interrupt"):
+            summary = await api_app.recover_jobs()
+
+        self.assertEqual(summary["interrupted"], 1)
+        working = await api_app.job_store.get("working")
+        self.assertEqual(working["status"], "interrupted")
+
+        # 복원 결과가 저널에 기록되어 다음 재시작에도 유지되는지 확인
+        records = JobJournal(self.temp_dir.name).load()
+        self.assertEqual(records["working"]["status"], "interrupted")
+        self.assertEqual(records["waiting"]["status"], "pending")
+
+
+if __name__ == "__main__":
+    unittest.main()
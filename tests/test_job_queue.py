@@ -0,0 +1,259 @@
+"""
+작업 큐 테스트
+
+이 테스트는 JobQueue의 동시 실행 제한과 백프레셔 동작, 그리고 우선순위 등급,
+짧은 작업 우선, 대기 시간 보정(aging) 순서와 예상 시작/완료 시각을 검증합니다.
+"""
+import asyncio
+import time
+import unittest
+
+from src.api.job_queue import JobQueue, QueueClosedError, QueueFullError
+
+
+class TestJobQueue(unittest.IsolatedAsyncioTestCase):
+    """JobQueue 기능 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.release = asyncio.Event()
+        self.started = []
+        self.waits = {}
+        self.max_running = 0
+
+    async def _handler(self, job_id, payload, queue_wait):
+        """릴리스 이벤트가 설정될 때까지 대기하는 테스트 핸들러"""
+        self.started.append(job_id)
+        self.waits[job_id] = queue_wait
+        self.max_running = max(self.max_running, self.queue.running)
+        await self.release.wait()
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.queue.stop()
+
+    async def test_worker_count_limits_concurrency(self):
+        """워커 수만큼만 동시에 실행되는지 테스트"""
+        self.queue = JobQueue(self._handler, max_size=10, worker_count=2)
+        for i in range(5):
+            self.queue.submit(f"job-{i}", {})
+
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(self.started), 2)
+        self.assertEqual(self.queue.running, 2)
+        self.assertEqual(self.queue.depth, 3)
+
+        self.release.set()
+        await asyncio.sleep(0.05)
+        self.assertEqual(len(self.started), 5)
+        self.assertLessEqual(self.max_running, 2)
+        self.assertEqual(self.queue.depth, 0)
+
+    async def test_full_queue_raises_with_retry_after(self):
+        """큐가 가득 차면 QueueFullError가 발생하는지 테스트"""
+        self.queue = JobQueue(
+            self._handler, max_size=2, worker_count=1, default_retry_after=7
+        )
+        self.queue.submit("job-0", {})
+        await asyncio.sleep(0.01)
+
+        # 워커 1개가 job-0을 처리 중이므로 큐에는 2개까지 대기 가능
+        self.assertEqual(self.queue.submit("job-1", {}), 1)
+        self.assertEqual(self.queue.submit("job-2", {}), 2)
+
+        with self.assertRaises(QueueFullError) as ctx:
+            self.queue.submit("job-3", {})
+        self.assertEqual(ctx.exception.retry_after, 7)
+        self.assertNotIn("job-3", self.started)
+
+    async def test_queue_wait_is_reported(self):
+        """대기 시간이 핸들러에 전달되는지 테스트"""
+        self.queue = JobQueue(self._handler, max_size=5, worker_count=1)
+        self.queue.submit("job-0", {})
+        self.queue.submit("job-1", {})
+
+        await asyncio.sleep(0.1)
+        self.release.set()
+        await asyncio.sleep(0.02)
+
+        self.assertLess(self.waits["job-0"], self.waits["job-1"])
+        self.assertGreaterEqual(self.waits["job-1"], 0.09)
+        self.assertGreater(self.queue.avg_wait_time, 0)
+
+    async def test_drain_finishes_running_jobs_and_keeps_queued(self):
+        """종료 시 처리 중인 작업은 마무리하고 대기 작업은 남기는지 테스트"""
+        self.queue = JobQueue(self._handler, max_size=5, worker_count=1)
+        self.queue.submit("job-0", {})
+        self.queue.submit("job-1", {})
+        await asyncio.sleep(0.01)
+
+        drain = asyncio.create_task(self.queue.drain(timeout=5))
+        await asyncio.sleep(0.01)
+        self.assertTrue(self.queue.closed)
+        with self.assertRaises(QueueClosedError):
+            self.queue.submit("job-2", {})
+        self.assertFalse(drain.done())
+
+        self.release.set()
+        left_over = await drain
+        self.assertEqual(self.started, ["job-0"])
+        self.assertEqual(left_over, ["job-1"])
+        self.assertFalse(self.queue.started)
+
+    async def test_drain_cancels_jobs_after_timeout(self):
+        """제한 시간이 지나면 처리 중인 작업을 취소하는지 테스트"""
+        self.queue = JobQueue(self._handler, max_size=5, worker_count=2)
+        self.queue.submit("job-0", {})
+        await asyncio.sleep(0.01)
+
+        left_over = await asyncio.wait_for(self.queue.drain(timeout=0.05), 1)
+        self.assertEqual(left_over, [])
+        self.assertEqual(self.queue.running, 0)
+
+    async def test_cancel_queued_and_running_jobs(self):
+        """대기 작업은 큐에서 빠지고 실행 중인 작업만 취소되며 워커는 계속 동작하는지 테스트"""
+        self.queue = JobQueue(self._handler, max_size=5, worker_count=1)
+        for i in range(3):
+            self.queue.submit(f"job-{i}", {})
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(self.queue.cancel("job-1"), "queued")
+        self.assertEqual(self.queue.depth, 1)
+        self.assertIsNone(self.queue.cancel("unknown"))
+
+        task = self.queue.task("job-0")
+        self.assertEqual(self.queue.cancel("job-0"), "running")
+        await asyncio.wait({task})
+        self.assertTrue(task.cancelled())
+
+        # 같은 워커가 다음 작업을 시작
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.started, ["job-0", "job-2"])
+        self.assertEqual(self.queue.running, 1)
+        self.release.set()
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.queue.running, 0)
+        self.assertIsNone(self.queue.task("job-2"))
+
+
+class TestJobScheduling(unittest.IsolatedAsyncioTestCase):
+    """JobQueue 작업 순서 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.release = asyncio.Event()
+        self.started = []
+
+    async def _handler(self, job_id, payload, queue_wait):
+        """릴리스 이벤트가 설정될 때까지 대기하는 테스트 핸들러"""
+        self.started.append(job_id)
+        await self.release.wait()
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.queue.stop()
+
+    async def start_blocker(self, cost: float = 0.0):
+        """워커 하나를 차지하는 작업을 시작합니다."""
+        self.queue.submit("blocker", {}, cost=cost)
+        await asyncio.sleep(0.01)
+        self.assertEqual(self.started, ["blocker"])
+
+    async def run_all(self):
+        self.release.set()
+        await asyncio.sleep(0.02)
+
+    async def test_shortest_job_first(self):
+        """같은 등급에서는 예상 처리 시간이 짧은 작업이 먼저 시작하는지 테스트"""
+        self.queue = JobQueue(self._handler, max_size=5, worker_count=1, aging_rate=0)
+        await self.start_blocker()
+        self.assertEqual(self.queue.submit("big", {}, cost=10), 1)
+        self.assertEqual(self.queue.submit("small", {}, cost=1), 1)
+        self.assertEqual(self.queue.position("big"), 2)
+
+        await self.run_all()
+        self.assertEqual(self.started, ["blocker", "small", "big"])
+
+    async def test_batch_waits_for_interactive(self):
+        """batch 작업은 더 큰 interactive 작업보다도 늦게 시작하는지 테스트"""
+        self.queue = JobQueue(
+            self._handler, max_size=5, worker_count=1,
+            priority_penalties={"interactive": 0, "batch": 30}, aging_rate=0
+        )
+        await self.start_blocker()
+        self.queue.submit("nightly", {}, priority="batch", cost=1)
+        self.queue.submit("user", {}, priority="interactive", cost=5)
+        with self.assertRaises(ValueError):
+            self.queue.submit("other", {}, priority="urgent")
+
+        await self.run_all()
+        self.assertEqual(self.started, ["blocker", "user", "nightly"])
+
+    async def test_aging_prevents_starvation(self):
+        """오래 기다린 batch 작업이 새 interactive 작업보다 먼저 시작하는지 테스트"""
+        self.queue = JobQueue(
+            self._handler, max_size=5, worker_count=1,
+            priority_penalties={"interactive": 0, "batch": 0.05}, aging_rate=1
+        )
+        await self.start_blocker()
+        self.queue.submit("nightly", {}, priority="batch", cost=0.01)
+        await asyncio.sleep(0.1)
+        self.queue.submit("user", {}, priority="interactive", cost=0.01)
+
+        await self.run_all()
+        self.assertEqual(self.started, ["blocker", "nightly", "user"])
+
+    async def test_schedule_reports_expected_times(self):
+        """실행 중인 작업과 대기 작업의 예상 시작/완료 시각을 계산하는지 테스트"""
+        self.queue = JobQueue(self._handler, max_size=5, worker_count=1)
+        await self.start_blocker(cost=2)
+        self.queue.submit("long", {}, cost=3)
+        self.queue.submit("short", {}, cost=1)
+
+        now = time.time()
+        plan = self.queue.schedule()
+        self.assertEqual(plan["blocker"]["queue_position"], 0)
+        self.assertEqual(plan["short"]["queue_position"], 1)
+        self.assertEqual(plan["long"]["queue_position"], 2)
+        self.assertAlmostEqual(plan["short"]["expected_start"], now + 2, delta=0.1)
+        self.assertAlmostEqual(plan["short"]["expected_finish"], now + 3, delta=0.1)
+        self.assertEqual(
+            plan["long"]["expected_start"], plan["short"]["expected_finish"]
+        )
+        self.assertAlmostEqual(plan["long"]["expected_finish"], now + 6, delta=0.1)
+
+
+    async def test_schedule_is_cached_until_queue_changes(self):
+        """대기 힙이나 실행 중인 작업이 바뀔 때만 예상 시각을 다시 계산하는지 테스트"""
+        self.queue = JobQueue(self._handler, max_size=5, worker_count=1)
+        await self.start_blocker(cost=60)
+        self.queue.submit("first", {}, cost=1)
+
+        plan = self.queue.schedule()
+        self.assertIs(self.queue.schedule(), plan)
+
+        self.queue.submit("second", {}, cost=1)
+        new_plan = self.queue.schedule()
+        self.assertIsNot(new_plan, plan)
+        self.assertEqual(new_plan["second"]["queue_position"], 2)
+        self.assertIs(self.queue.schedule(), new_plan)
+
+        self.queue.cancel("first")
+        self.assertEqual(self.queue.schedule()["second"]["queue_position"], 1)
+
+    async def test_schedule_follows_overdue_running_job(self):
+        """예상 처리 시간을 넘긴 작업이 있으면 현재 시각으로 다시 계산하는지 테스트"""
+        self.queue = JobQueue(self._handler, max_size=5, worker_count=1)
+        await self.start_blocker(cost=0)
+        self.queue.submit("next", {}, cost=1)
+
+        first = self.queue.schedule()
+        await asyncio.sleep(0.01)
+        second = self.queue.schedule()
+        self.assertIsNot(second, first)
+        self.assertGreater(
+            second["next"]["expected_start"], first["next"]["expected_start"]
+        )
+
+if __name__ == "__main__":
+    unittest.main()
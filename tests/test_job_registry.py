@@ -0,0 +1,106 @@
+"""
+작업 목록 API 테스트
+
+이 테스트는 /jobs 필터와 페이지 조회, /jobs/status 일괄 조회,
+/status 집계 값을 검증합니다.
+"""
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.job_store import InMemoryJobStore
+
+
+class TestJobRegistryEndpoints(unittest.IsolatedAsyncioTestCase):
+    """작업 목록 엔드포인트 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.store = InMemoryJobStore()
+        self.patches = [
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+        ]
+        for p in self.patches:
+            p.start()
+
+        for i in range(5):
+            await self.store.create({
+                "job_id": f"job{i}",
+                "status": "completed" if i < 2 else "pending",
+                "progress": 0,
+                "message": "",
+                "artifacts": [],
+                "app_spec": {"app_name": "shop" if i % 2 else "blog"},
+                "start_time": 100.0 + i,
+            })
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        for p in self.patches:
+            p.stop()
+
+    async def test_jobs_pages_with_cursor_header(self):
+        """X-Next-Cursor 헤더로 다음 페이지를 조회하는지 테스트"""
+        response = await self.client.get("/jobs", params={"limit": 3})
+        self.assertEqual(list(response.json()), ["job0", "job1", "job2"])
+        self.assertIn('rel="next"', response.headers["Link"])
+
+        response = await self.client.get(
+            "/jobs",
+            params={"limit": 3, "cursor": response.headers["X-Next-Cursor"]}
+        )
+        self.assertEqual(list(response.json()), ["job3", "job4"])
+        self.assertNotIn("X-Next-Cursor", response.headers)
+
+    async def test_jobs_filters(self):
+        """status, app_name, since 필터 테스트"""
+        response = await self.client.get(
+            "/jobs", params={"status": "pending", "app_name": "shop"}
+        )
+        self.assertEqual(list(response.json()), ["job3"])
+        self.assertEqual(response.json()["job3"]["status"], "pending")
+
+        response = await self.client.get("/jobs", params={"since": 103})
+        self.assertEqual(list(response.json()), ["job3", "job4"])
+
+    async def test_invalid_cursor_returns_400(self):
+        """잘못된 커서는 400을 반환하는지 테스트"""
+        response = await self.client.get("/jobs", params={"cursor": "bad"})
+        self.assertEqual(response.status_code, 400)
+
+    async def test_bulk_status(self):
+        """여러 작업 상태 일괄 조회 테스트"""
+        response = await self.client.post(
+            "/jobs/status", json={"job_ids": ["job4", "missing", "job0"]}
+        )
+        data = response.json()
+        self.assertEqual(sorted(data["jobs"]), ["job0", "job4"])
+        self.assertEqual(data["jobs"]["job0"]["status"], "completed")
+        self.assertEqual(data["missing"], ["missing"])
+
+        # 작업 ID 배열도 허용
+        response = await self.client.post("/jobs/status", json=["job1"])
+        self.assertEqual(list(response.json()["jobs"]), ["job1"])
+
+    async def test_server_status_counts(self):
+        """서버 상태의 작업 수 집계 테스트"""
+        await self.store.update("job4", status="failed")
+
+        data = (await self.client.get("/status")).json()
+        self.assertEqual(data["active_jobs"], 2)
+        self.assertEqual(data["completed_jobs"], 2)
+        self.assertEqual(data["failed_jobs"], 1)
+        self.assertEqual(data["total_jobs"], 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
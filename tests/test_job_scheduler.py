@@ -0,0 +1,166 @@
+"""
+작업 비용 추정 및 스케줄링 테스트
+
+이 테스트는 명세 크기와 단계별 처리 시간 기록으로 작업 처리 시간을 추정하는지,
+그리고 작업 상태 조회가 우선순위, 예상 처리 시간, 현재 대기 순번과 예상
+시작/완료 시각을 반환하는지 검증합니다.
+"""
+import asyncio
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.job_costs import CostEstimator, phase_units
+from src.api.job_dedup import JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+
+SMALL_SPEC = {"app_name": "memo", "pages": ["Home"]}
+LARGE_SPEC = {
+    "app_name": "shop",
+    "models": [
+        {"name": "Item", "fields": [{"name": "id"}, {"name": "title"}]},
+        {"name": "Order", "fields": [{"name": "id"}]},
+    ],
+    "pages": ["Home", "Detail", "Cart"],
+    "controllers": ["CartController"],
+    "api_endpoints": [{"path": "/items"}],
+}
+
+
+class TestCostEstimator(unittest.TestCase):
+    """CostEstimator 테스트"""
+
+    def test_phase_units_follow_spec_size(self):
+        """모델, 필드, 페이지, 컨트롤러, 엔드포인트 수로 작업량을 세는지 테스트"""
+        self.assertEqual(
+            phase_units(LARGE_SPEC),
+            {"models": 6, "pages": 4, "main": 1, "project": 1, "android": 1}
+        )
+        self.assertEqual(phase_units({"app_name": "empty"})["models"], 1)
+
+    def test_estimate_learns_from_phase_timings(self):
+        """단계별 처리 시간 기록이 추정에 반영되는지 테스트"""
+        estimator = CostEstimator(default_unit_seconds=0.1, alpha=0.5)
+        self.assertAlmostEqual(estimator.estimate(LARGE_SPEC), 1.3)
+        self.assertLess(estimator.estimate(SMALL_SPEC), estimator.estimate(LARGE_SPEC))
+
+        estimator.record("pages", 4, 4.0)
+        self.assertEqual(estimator.unit_seconds("pages"), 1.0)
+        estimator.record("pages", 2, 0.0)
+        self.assertEqual(estimator.unit_seconds("pages"), 0.5)
+        self.assertAlmostEqual(estimator.estimate(LARGE_SPEC), 2.9)
+        self.assertEqual(estimator.samples, 2)
+
+
+class TestJobScheduleStatus(unittest.IsolatedAsyncioTestCase):
+    """작업 상태의 예상 시작/완료 시각 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.release = asyncio.Event()
+        self.queue = JobQueue(
+            api_app.run_queued_job, max_size=10, worker_count=1,
+            priority_penalties={"interactive": 0.0, "batch": 60.0}
+        )
+
+        async def blocked_app_creation(job_id: str, app_spec: dict):
+            await self.release.wait()
+            await api_app.update_job(job_id, status="completed", progress=100)
+
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_dedup", JobDeduplicator()),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "blob_store", None),
+            patch.object(api_app, "job_costs", CostEstimator(1.0)),
+            patch.object(api_app, "start_app_creation", blocked_app_creation),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        self.release.set()
+        await self.client.aclose()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def submit(self, spec: dict, priority: str = None) -> dict:
+        params = {"priority": priority} if priority else None
+        response = await self.client.post("/generate_app", json=spec, params=params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    async def test_status_reports_priority_and_expected_times(self):
+        """작업 상태가 순서 점수에 따른 대기 순번과 예상 시각을 반환하는지 테스트"""
+        running = await self.submit({"app_name": "first"})
+        await asyncio.sleep(0.01)
+        nightly = await self.submit(SMALL_SPEC, priority="batch")
+        large = await self.submit(LARGE_SPEC)
+        small = await self.submit({"app_name": "memo2", "pages": ["Home"]})
+        self.assertEqual(small["queue_position"], 1)
+
+        body = (await self.client.get(f"/job/{large['job_id']}")).json()
+        self.assertEqual(body["priority"], "interactive")
+        self.assertEqual(body["estimated_cost"], 13.0)
+        self.assertEqual(body["queue_position"], 2)
+
+        response = await self.client.post("/jobs/status", json=[
+            running["job_id"], nightly["job_id"], large["job_id"], small["job_id"]
+        ])
+        jobs = response.json()["jobs"]
+        self.assertEqual(jobs[running["job_id"]]["queue_position"], 0)
+        self.assertEqual(jobs[nightly["job_id"]]["priority"], "batch")
+        self.assertEqual(jobs[nightly["job_id"]]["queue_position"], 3)
+        # 한 워커에서 small -> large -> nightly 순서로 이어서 실행
+        self.assertEqual(
+            jobs[small["job_id"]]["expected_finish"],
+            jobs[large["job_id"]]["expected_start"]
+        )
+        self.assertEqual(
+            jobs[large["job_id"]]["expected_finish"],
+            jobs[nightly["job_id"]]["expected_start"]
+        )
+        self.assertAlmostEqual(
+            jobs[large["job_id"]]["expected_finish"]
+            - jobs[large["job_id"]]["expected_start"], 13.0, places=2
+        )
+
+        response = await self.client.post(
+            "/generate_app", json={"app_name": "x"}, params={"priority": "urgent"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    async def test_finished_job_has_no_expected_times(self):
+        """끝난 작업은 예상 시각을 반환하지 않는지 테스트"""
+        job = await self.submit(SMALL_SPEC)
+        self.release.set()
+        for _ in range(100):
+            if (await self.store.get(job["job_id"]))["status"] == "completed":
+                break
+            await asyncio.sleep(0.01)
+        body = (await self.client.get(f"/job/{job['job_id']}")).json()
+        self.assertEqual(body["status"], "completed")
+        self.assertIsNone(body["expected_start"])
+        self.assertEqual(body["estimated_cost"], 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
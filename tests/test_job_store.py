@@ -0,0 +1,229 @@
+"""
+작업 저장소 테스트
+
+이 테스트는 메모리 및 Redis 작업 저장소가 동일하게 동작하는지 검증합니다.
+Redis 저장소 테스트는 fakeredis가 설치된 경우에만 실행됩니다.
+"""
+import unittest
+
+from src.api.job_store import (
+    InMemoryJobStore, InvalidCursorError, JobStatusConflictError, RedisJobStore
+)
+
+try:
+    import fakeredis
+except ImportError:  # pragma: no cover - 선택적 의존성
+    fakeredis = None
+
+
+def make_record(
+    job_id: str, start_time: float, status: str = "pending",
+    app_name: str = None
+):
+    """테스트용 작업 레코드를 생성합니다."""
+    return {
+        "job_id": job_id,
+        "status": status,
+        "progress": 0,
+        "message": "작업 초기화 중...",
+        "artifacts": [],
+        "app_spec": {"app_name": app_name or f"app_{job_id}"},
+        "start_time": start_time,
+    }
+
+
+class JobStoreContract:
+    """모든 JobStore 구현이 만족해야 하는 동작"""
+
+    def make_store(self):
+        raise NotImplementedError
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.store = self.make_store()
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.store.close()
+
+    async def test_create_and_get(self):
+        """레코드 생성 및 조회 테스트"""
+        await self.store.create(make_record("a", 1.0))
+
+        record = await self.store.get("a")
+        self.assertEqual(record["status"], "pending")
+        self.assertEqual(record["app_spec"], {"app_name": "app_a"})
+        self.assertIsNone(await self.store.get("missing"))
+        self.assertTrue(await self.store.exists("a"))
+        self.assertFalse(await self.store.exists("missing"))
+
+    async def test_update_moves_status_index(self):
+        """상태 갱신 시 상태 인덱스가 이동하는지 테스트"""
+        await self.store.create(make_record("a", 1.0))
+        await self.store.create(make_record("b", 2.0))
+
+        updated = await self.store.update(
+            "a", status="running", progress=50, artifacts=["lib/main.dart"]
+        )
+        self.assertEqual(updated["progress"], 50)
+        self.assertEqual(updated["artifacts"], ["lib/main.dart"])
+
+        self.assertEqual(await self.store.job_ids_by_status("pending"), ["b"])
+        self.assertEqual(await self.store.job_ids_by_status("running"), ["a"])
+        self.assertEqual(
+            await self.store.count_by_status(), {"pending": 1, "running": 1}
+        )
+
+    async def test_update_missing_job_returns_none(self):
+        """존재하지 않는 작업 갱신 시 None을 반환하는지 테스트"""
+        self.assertIsNone(await self.store.update("missing", status="failed"))
+        self.assertEqual(await self.store.count_by_status(), {})
+
+    async def test_cancelled_status_is_sticky(self):
+        """취소된 작업을 다른 상태로 바꾸는 갱신을 거부하는지 테스트"""
+        await self.store.create(make_record("a", 1.0))
+        await self.store.update("a", status="cancelled")
+
+        for status in ("completed", "running"):
+            with self.assertRaises(JobStatusConflictError):
+                await self.store.update("a", status=status, progress=100)
+        record = await self.store.get("a")
+        self.assertEqual(record["status"], "cancelled")
+        self.assertEqual(record["progress"], 0)
+        self.assertEqual(await self.store.count_by_status(), {"cancelled": 1})
+
+        # 같은 상태로 다시 기록하거나 상태 외 필드만 바꾸는 것은 허용
+        await self.store.update("a", status="cancelled", message="취소됨")
+        self.assertEqual((await self.store.get("a"))["message"], "취소됨")
+
+    async def test_list_jobs_in_creation_order(self):
+        """작업 목록이 생성 순으로 반환되는지 테스트"""
+        await self.store.create(make_record("b", 2.0))
+        await self.store.create(make_record("a", 1.0))
+
+        jobs = await self.store.list_jobs()
+        self.assertEqual([job["job_id"] for job in jobs], ["a", "b"])
+
+    async def test_delete(self):
+        """레코드 삭제 테스트"""
+        await self.store.create(make_record("a", 1.0, status="completed"))
+
+        self.assertTrue(await self.store.delete("a"))
+        self.assertFalse(await self.store.delete("a"))
+        self.assertIsNone(await self.store.get("a"))
+        self.assertEqual(await self.store.count_by_status(), {})
+        self.assertEqual(await self.store.list_jobs(), [])
+
+    async def test_get_many_skips_missing_jobs(self):
+        """여러 작업 조회 시 없는 작업은 제외되는지 테스트"""
+        await self.store.create(make_record("a", 1.0))
+        await self.store.create(make_record("b", 2.0))
+
+        records = await self.store.get_many(["b", "missing", "a"])
+        self.assertEqual(sorted(records), ["a", "b"])
+        self.assertEqual(await self.store.get_many([]), {})
+
+    async def test_query_pages_through_jobs_with_cursor(self):
+        """커서로 모든 작업을 빠짐없이 순서대로 조회하는지 테스트"""
+        # 같은 생성 시간을 가진 작업도 작업 ID 순으로 정렬되어야 함
+        for i in range(7):
+            await self.store.create(make_record(f"job{i}", float(i // 2)))
+
+        seen, cursor = [], None
+        while True:
+            page, cursor = await self.store.query_jobs(limit=3, cursor=cursor)
+            seen.extend(job["job_id"] for job in page)
+            if cursor is None:
+                break
+        self.assertEqual(seen, [f"job{i}" for i in range(7)])
+
+    async def test_query_filters(self):
+        """상태, 앱 이름, 생성 시간 필터 테스트"""
+        await self.store.create(make_record("a", 1.0, app_name="shop"))
+        await self.store.create(make_record("b", 2.0, app_name="blog"))
+        await self.store.create(make_record("c", 3.0, app_name="shop"))
+        await self.store.update("c", status="completed")
+
+        async def ids(**filters):
+            page, _ = await self.store.query_jobs(**filters)
+            return [job["job_id"] for job in page]
+
+        self.assertEqual(await ids(status="pending"), ["a", "b"])
+        self.assertEqual(await ids(app_name="shop"), ["a", "c"])
+        self.assertEqual(await ids(app_name="shop", status="pending"), ["a"])
+        self.assertEqual(await ids(since=2.0), ["b", "c"])
+        self.assertEqual(await ids(app_name="none"), [])
+
+        await self.store.delete("a")
+        self.assertEqual(await ids(app_name="shop"), ["c"])
+
+    async def test_update_moves_app_name_index(self):
+        """명세 변경으로 앱 이름이 바뀌면 앱 이름 인덱스가 이동하는지 테스트"""
+        await self.store.create(make_record("a", 1.0, app_name="old"))
+        await self.store.update("a", app_spec={"app_name": "new"})
+
+        async def ids(app_name):
+            page, _ = await self.store.query_jobs(app_name=app_name)
+            return [job["job_id"] for job in page]
+
+        self.assertEqual(await ids("old"), [])
+        self.assertEqual(await ids("new"), ["a"])
+
+        await self.store.delete("a")
+        self.assertEqual(await ids("old"), [])
+        self.assertEqual(await ids("new"), [])
+
+    async def test_query_rejects_invalid_cursor(self):
+        """잘못된 커서는 InvalidCursorError를 발생시키는지 테스트"""
+        with self.assertRaises(InvalidCursorError):
+            await self.store.query_jobs(cursor="not-a-cursor")
+
+    async def test_counters_follow_transitions(self):
+        """상태 전이와 삭제 시 상태별 카운터가 갱신되는지 테스트"""
+        await self.store.create(make_record("a", 1.0))
+        await self.store.create(make_record("b", 2.0))
+        await self.store.update("a", status="running")
+        await self.store.update("a", status="completed")
+        await self.store.delete("b")
+
+        self.assertEqual(await self.store.count_by_status(), {"completed": 1})
+
+
+class TestInMemoryJobStore(JobStoreContract, unittest.IsolatedAsyncioTestCase):
+    """메모리 작업 저장소 테스트"""
+
+    def make_store(self):
+        return InMemoryJobStore()
+
+
+@unittest.skipIf(fakeredis is None, "fakeredis가 설치되어 있지 않습니다.")
+class TestRedisJobStore(JobStoreContract, unittest.IsolatedAsyncioTestCase):
+    """Redis 작업 저장소 테스트"""
+
+    def make_store(self):
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        return RedisJobStore(client, prefix="test")
+
+    async def test_records_are_shared_between_clients(self):
+        """같은 Redis를 사용하는 두 저장소가 레코드를 공유하는지 테스트"""
+        server = fakeredis.FakeServer()
+        first = RedisJobStore(
+            fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        )
+        second = RedisJobStore(
+            fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        )
+
+        await first.create(make_record("a", 1.0))
+        await second.update("a", status="completed")
+
+        record = await first.get("a")
+        self.assertEqual(record["status"], "completed")
+        self.assertEqual(await first.count_by_status(), {"completed": 1})
+
+        await first.close()
+        await second.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+"""
+작업 트레이스 테스트
+
+이 테스트는 스팬 트리의 벽시계/CPU 시간과 임계 경로, Chrome 트레이스 형식,
+ADK 에이전트/도구 스팬 연결, 앱 생성 작업의 I/O 단계 스팬과
+/job/{job_id}/trace 엔드포인트를 검증합니다.
+"""
+import asyncio
+import tempfile
+import unittest
+from typing import AsyncGenerator
+from unittest.mock import patch
+
+import httpx
+from google.adk import Runner
+from google.adk.agents import BaseAgent, SequentialAgent
+from google.adk.events import Event
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from opentelemetry import trace as otel_trace
+
+import src.api.app as api_app
+from src.api.archive import ArchiveCache
+from src.api.app_files import GENERATION_PHASES, io_executor
+from src.api.job_dedup import JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+from src.utils import tracing
+
+SPEC = {"app_name": "shop", "models": [{"name": "Item", "fields": []}], "pages": ["Home"]}
+
+
+def find_span(nodes, name):
+    """스팬 트리에서 이름으로 스팬을 찾습니다."""
+    for node in nodes:
+        if node["name"] == name:
+            return node
+        found = find_span(node["children"], name)
+        if found is not None:
+            return found
+    return None
+
+
+class ToolCallingAgent(BaseAgent):
+    """도구 호출 스팬을 만들고 이벤트 하나를 내는 테스트용 에이전트"""
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        # ADK가 도구를 호출할 때와 같은 이름의 OpenTelemetry 스팬
+        tracer = otel_trace.get_tracer("test")
+        with tracer.start_as_current_span("tool_call [generate_dart_file]"):
+            with tracing.span("render", "io"):
+                sum(range(10000))
+        yield Event(
+            author=self.name, invocation_id=ctx.invocation_id,
+            content=types.Content(role="model", parts=[types.Part(text="완료")])
+        )
+
+
+class TestJobTrace(unittest.IsolatedAsyncioTestCase):
+    """JobTrace 및 ADK 스팬 연결 테스트"""
+
+    async def test_span_tree_and_critical_path(self):
+        """중첩 스팬, CPU 시간 합계, 임계 경로와 Chrome 형식을 테스트"""
+        trace = tracing.JobTrace("job1")
+        with tracing.activate(trace, "job"):
+            with tracing.span("short", "io"):
+                pass
+            with tracing.span("long", "io", measure_cpu=False):
+                await asyncio.sleep(0.01)
+                with tracing.span("inner", "io"):
+                    sum(range(10000))
+
+        # 트레이스 밖에서는 기록하지 않음
+        with tracing.span("outside") as outside:
+            self.assertIsNone(outside)
+
+        body = trace.to_dict()
+        self.assertEqual(body["span_count"], 4)
+        root = body["spans"][0]
+        self.assertEqual([child["name"] for child in root["children"]], ["short", "long"])
+        long_span = root["children"][1]
+        self.assertGreaterEqual(long_span["wall"], 0.01)
+        # 직접 측정하지 않은 스팬의 CPU 시간은 자식 합계
+        self.assertEqual(long_span["cpu"], long_span["children"][0]["cpu"])
+        self.assertEqual(
+            [span["name"] for span in body["critical_path"]], ["job", "long", "inner"]
+        )
+
+        chrome = trace.to_chrome()
+        complete = [e for e in chrome["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual(len(complete), 4)
+        self.assertTrue(all(e["dur"] >= 0 and "cpu_ms" in e["args"] for e in complete))
+
+    async def test_span_limit(self):
+        """작업별 최대 스팬 수를 넘으면 버린 수를 기록하는지 테스트"""
+        trace = tracing.JobTrace("job1", max_spans=2)
+        with tracing.activate(trace, "job"):
+            for index in range(3):
+                with tracing.span(f"step{index}"):
+                    pass
+        self.assertEqual(trace.to_dict()["span_count"], 2)
+        self.assertEqual(trace.dropped, 2)
+
+    async def test_adk_agent_and_tool_spans(self):
+        """ADK 에이전트 실행과 도구 호출이 계층형 스팬으로 기록되는지 테스트"""
+        self.assertTrue(tracing.install_adk_bridge())
+        agent = SequentialAgent(
+            name="MainOrchestratorAgent",
+            sub_agents=[SequentialAgent(
+                name="ModelGroupAgent",
+                sub_agents=[ToolCallingAgent(name="UserModelAgent")]
+            )]
+        )
+        session_service = InMemorySessionService()
+        runner = Runner(
+            app_name="test", agent=agent, session_service=session_service
+        )
+        session = session_service.create_session(app_name="test", user_id="user")
+
+        trace = tracing.JobTrace("job1")
+        with tracing.activate(trace, "job"):
+            async for _ in runner.run_async(
+                user_id="user", session_id=session.id,
+                new_message=types.Content(role="user", parts=[types.Part(text="앱")])
+            ):
+                pass
+
+        path = [span["name"] for span in trace.to_dict()["critical_path"]]
+        self.assertEqual(path, [
+            "job", "MainOrchestratorAgent", "ModelGroupAgent", "UserModelAgent",
+            "generate_dart_file", "render"
+        ])
+        tool = find_span(trace.to_dict()["spans"], "generate_dart_file")
+        self.assertEqual(tool["kind"], "tool")
+        self.assertGreater(tool["cpu"], 0)
+
+
+class TestJobTraceEndpoint(unittest.IsolatedAsyncioTestCase):
+    """/job/{job_id}/trace 엔드포인트 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.queue = JobQueue(api_app.run_queued_job, max_size=10, worker_count=1)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_dedup", JobDeduplicator()),
+            patch.object(api_app, "job_traces", tracing.TraceStore()),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "blob_store", None),
+            patch.object(
+                api_app, "archive_cache",
+                ArchiveCache(f"{self.temp_dir.name}/.archives", io_executor=io_executor)
+            ),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def test_generation_trace(self):
+        """생성 단계와 아카이브 스팬이 작업 트레이스에 기록되는지 테스트"""
+        job_id = (await self.client.post("/generate_app", json=SPEC)).json()["job_id"]
+        for _ in range(500):
+            job_info = await self.store.get(job_id)
+            if job_info["status"] == "completed":
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(job_info["status"], "completed")
+        response = await self.client.get(f"/download_zip/{job_id}")
+        self.assertEqual(response.status_code, 200)
+
+        body = (await self.client.get(f"/job/{job_id}/trace")).json()
+        root = body["spans"][0]
+        self.assertEqual(root["name"], "job")
+        self.assertEqual(
+            [child["name"] for child in root["children"]],
+            ["queue_wait", "prepare_output_dir", "generation"]
+        )
+        generation = root["children"][2]
+        self.assertEqual(
+            [child["name"] for child in generation["children"]],
+            [f"phase:{phase}" for phase in GENERATION_PHASES]
+        )
+        models = generation["children"][0]
+        self.assertEqual(models["attrs"]["files"], 1)
+        self.assertIsNotNone(models["cpu"])
+        self.assertEqual(
+            [span["name"] for span in body["spans"][1:]], ["archive_digest", "archive"]
+        )
+
+        chrome = (await self.client.get(
+            f"/job/{job_id}/trace", params={"format": "chrome"}
+        )).json()
+        names = {e["name"] for e in chrome["traceEvents"] if e["ph"] == "X"}
+        self.assertIn("phase:android", names)
+
+    async def test_missing_trace(self):
+        """없는 작업과 트레이스가 없는 작업, 잘못된 형식에 대한 응답 테스트"""
+        self.assertEqual(
+            (await self.client.get("/job/unknown/trace")).status_code, 404
+        )
+        await self.store.create({"job_id": "pending", "status": "pending"})
+        self.assertEqual(
+            (await self.client.get("/job/pending/trace")).status_code, 404
+        )
+        self.assertEqual(
+            (await self.client.get(
+                "/job/pending/trace", params={"format": "xml"}
+            )).status_code, 422
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,174 @@
+"""
+메트릭 테스트
+
+이 테스트는 고정 버킷 히스토그램과 카운터의 Prometheus 텍스트 출력,
+앱 생성 시 단계별/템플릿별 시간과 기록 바이트, 큐 대기 시간, HTTP 요청,
+ZIP 압축 메트릭이 기록되고 /metrics로 노출되는지 검증합니다.
+"""
+import asyncio
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.archive import ArchiveCache
+from src.api.app_files import GENERATION_PHASES, io_executor
+from src.api.job_dedup import JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+from src.utils import metrics
+from src.utils.metrics import MetricsRegistry
+
+SPEC = {
+    "app_name": "shop",
+    "models": [{"name": "Item", "fields": [{"name": "price", "type": "double"}]}],
+    "pages": ["Home", "Cart"],
+}
+
+
+def sample_count(histogram, *labels):
+    """히스토그램의 현재 기록 개수를 반환합니다."""
+    return histogram.labels(*labels).snapshot()[2]
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """MetricsRegistry 출력 형식 테스트"""
+
+    def test_histogram_buckets_are_cumulative(self):
+        """버킷 경계 값은 해당 버킷에 포함되고 출력은 누적 개수인지 테스트"""
+        registry = MetricsRegistry(prefix="test_")
+        histogram = registry.histogram(
+            "latency_seconds", "지연 시간", ("route",), buckets=(0.1, 1.0)
+        )
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.labels("/a").observe(value)
+
+        text = registry.render()
+        self.assertIn("# TYPE test_latency_seconds histogram", text)
+        self.assertIn('test_latency_seconds_bucket{route="/a",le="0.1"} 2', text)
+        self.assertIn('test_latency_seconds_bucket{route="/a",le="1"} 3', text)
+        self.assertIn('test_latency_seconds_bucket{route="/a",le="+Inf"} 4', text)
+        self.assertIn('test_latency_seconds_count{route="/a"} 4', text)
+        self.assertIn('test_latency_seconds_sum{route="/a"} 2.65', text)
+
+    def test_counter_labels_are_escaped(self):
+        """카운터 레이블 값이 이스케이프되고 레이블 수가 검사되는지 테스트"""
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "요청 수", ("path",))
+        counter.labels('a"b').inc()
+        counter.labels('a"b').inc(2)
+
+        self.assertIn('requests_total{path="a\\"b"} 3', registry.render())
+        with self.assertRaises(ValueError):
+            counter.labels("a", "b")
+        with self.assertRaises(ValueError):
+            registry.counter("requests_total", "중복")
+
+
+class TestMetricsEndpoint(unittest.IsolatedAsyncioTestCase):
+    """생성 파이프라인 메트릭 기록 및 /metrics 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.queue = JobQueue(api_app.run_queued_job, max_size=10, worker_count=1)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_dedup", JobDeduplicator()),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "blob_store", None),
+            patch.object(
+                api_app, "archive_cache",
+                ArchiveCache(f"{self.temp_dir.name}/.archives", io_executor=io_executor)
+            ),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await self.queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def test_generation_pipeline_is_measured(self):
+        """앱 생성과 다운로드 후 파이프라인 메트릭이 늘어나는지 테스트"""
+        before = {
+            "queue": sample_count(metrics.queue_wait_seconds),
+            "phases": [
+                sample_count(metrics.phase_seconds, phase)
+                for phase in GENERATION_PHASES
+            ],
+            "model": sample_count(metrics.template_render_seconds, "model"),
+            "page": sample_count(metrics.template_render_seconds, "page"),
+            "bytes": metrics.bytes_written.labels("main").value,
+            "archive": sample_count(metrics.archive_size_bytes),
+            "http": sample_count(
+                metrics.http_request_seconds, "GET", "/job/{job_id}"
+            ),
+        }
+
+        job_id = (await self.client.post("/generate_app", json=SPEC)).json()["job_id"]
+        for _ in range(500):
+            job_info = (await self.client.get(f"/job/{job_id}")).json()
+            if job_info["status"] == "completed":
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(job_info["status"], "completed")
+        response = await self.client.get(f"/download_zip/{job_id}")
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(sample_count(metrics.queue_wait_seconds), before["queue"] + 1)
+        for phase, count in zip(GENERATION_PHASES, before["phases"]):
+            self.assertEqual(sample_count(metrics.phase_seconds, phase), count + 1)
+        self.assertEqual(
+            sample_count(metrics.template_render_seconds, "model"), before["model"] + 1
+        )
+        self.assertEqual(
+            sample_count(metrics.template_render_seconds, "page"), before["page"] + 2
+        )
+        job = await self.store.get(job_id)
+        self.assertEqual(
+            metrics.bytes_written.labels("main").value - before["bytes"],
+            job["manifest"]["lib/main.dart"]["size"]
+        )
+        self.assertEqual(sample_count(metrics.archive_size_bytes), before["archive"] + 1)
+        self.assertGreater(
+            sample_count(metrics.http_request_seconds, "GET", "/job/{job_id}"),
+            before["http"]
+        )
+
+        response = await self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertIn("version=0.0.4", response.headers["content-type"])
+        text = response.text
+        self.assertIn(
+            'agentofflutter_http_requests_total{method="POST",'
+            'route="/generate_app",status="200"}', text
+        )
+        self.assertIn(
+            'agentofflutter_generation_phase_duration_seconds_bucket'
+            '{phase="models",le="+Inf"}', text
+        )
+        self.assertIn('agentofflutter_jobs_finished_total{status="completed"}', text)
+        # 요청 경로 대신 라우트 템플릿을 레이블로 사용
+        self.assertNotIn(job_id, text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,226 @@
+"""
+워커 프로세스 풀 테스트
+
+이 테스트는 워커 프로세스에서 생성한 결과와 진행 메시지, 압축한 아카이브가
+서버 프로세스로 전달되는지, CPU 시간 한도와 워커 비정상 종료, 워커 교체, 실행 중인 작업 취소가 동작하는지,
+GENERATION_MODE=process에서 앱 생성이 완료되는지 검증합니다.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from src.api.app_files import GENERATION_PHASES, generate_app_output
+from src.api.archive import ArchiveCache
+from src.api.job_dedup import JobDeduplicator
+from src.api.job_queue import JobQueue
+from src.api.job_store import InMemoryJobStore
+from src.api.process_pool import (
+    CpuLimitExceededError, ProcessWorkerPool, WorkerCrashedError
+)
+
+SPEC = {"app_name": "shop", "models": [{"name": "Item", "fields": []}], "pages": ["Home"]}
+
+
+def worker_pid(report):
+    """워커 프로세스 ID를 반환합니다."""
+    report("pid", os.getpid())
+    return os.getpid()
+
+
+def crash_worker(report):
+    """워커 프로세스를 비정상 종료시킵니다."""
+    os._exit(1)
+
+
+def spin_forever(report):
+    """CPU 시간을 계속 사용합니다."""
+    while True:
+        pass
+
+
+def write_forever(directory, report):
+    """진행 메시지를 보내며 파일을 계속 기록합니다."""
+    index = 0
+    while True:
+        with open(os.path.join(directory, f"{index}.txt"), "w") as f:
+            f.write("x")
+        report("artifact", index)
+        index += 1
+        time.sleep(0.01)
+
+
+class TestProcessWorkerPool(unittest.IsolatedAsyncioTestCase):
+    """ProcessWorkerPool 기능 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.pools = []
+
+    def make_pool(self, **kwargs):
+        pool = ProcessWorkerPool(**{"max_workers": 1, **kwargs})
+        self.pools.append(pool)
+        return pool
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        loop = asyncio.get_running_loop()
+        for pool in self.pools:
+            await loop.run_in_executor(None, pool.shutdown)
+        self.temp_dir.cleanup()
+
+    async def test_generation_result_and_progress_cross_process(self):
+        """워커에서 생성한 파일과 진행 메시지가 순서대로 전달되는지 테스트"""
+        pool = self.make_pool()
+        events = []
+        output_dir = os.path.join(self.temp_dir.name, "app")
+
+        written, manifest = await pool.run(
+            "job1", generate_app_output, output_dir, SPEC, None,
+            on_progress=lambda event, payload: events.append((event, payload))
+        )
+
+        phases = [payload["phase"] for event, payload in events if event == "phase"]
+        self.assertEqual(phases, list(GENERATION_PHASES))
+        self.assertEqual(events[-1][0], "phase_done")
+        artifacts = [payload["path"] for event, payload in events if event == "artifact"]
+        self.assertEqual(sorted(artifacts), sorted(manifest))
+        self.assertIn("lib/models/item.dart", written["models"])
+        self.assertTrue(os.path.isfile(os.path.join(output_dir, "lib/main.dart")))
+
+    async def test_archive_compressed_in_worker(self):
+        """워커 프로세스에서 압축한 아카이브가 스레드 압축과 같은 바이트인지 테스트"""
+        output_dir = os.path.join(self.temp_dir.name, "app")
+        await self.make_pool().run(
+            "job1", generate_app_output, output_dir, SPEC, None
+        )
+        thread_cache = ArchiveCache(os.path.join(self.temp_dir.name, "thread"))
+        process_cache = ArchiveCache(
+            os.path.join(self.temp_dir.name, "process"),
+            chunk_size=256, process_pool=self.make_pool()
+        )
+
+        digest, signature = await thread_cache.digest(output_dir)
+        chunks = []
+        async for chunk in process_cache.stream(output_dir, digest, signature):
+            chunks.append(chunk)
+
+        with open(await thread_cache.build(output_dir, digest, signature), "rb") as f:
+            self.assertEqual(b"".join(chunks), f.read())
+        self.assertIsNotNone(process_cache.cached(digest))
+
+    async def test_crashed_worker_is_replaced(self):
+        """워커가 비정상 종료되면 오류가 나고 다음 작업은 새 워커에서 실행되는지 테스트"""
+        pool = self.make_pool()
+        with self.assertRaises(WorkerCrashedError):
+            await pool.run("crash", crash_worker)
+        self.assertEqual(pool.crashes, 1)
+        self.assertNotEqual(await pool.run("after", worker_pid), os.getpid())
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "RLIMIT_CPU 필요")
+    async def test_cpu_limit_fails_only_the_task(self):
+        """CPU 시간 한도를 넘은 작업만 실패하고 워커는 계속 사용되는지 테스트"""
+        pool = self.make_pool(cpu_limit=1)
+        first_pid = await pool.run("warmup", worker_pid)
+
+        started = time.monotonic()
+        with self.assertRaises(CpuLimitExceededError):
+            await pool.run("spin", spin_forever)
+        self.assertLess(time.monotonic() - started, 10)
+        self.assertEqual(await pool.run("after", worker_pid), first_pid)
+
+    async def test_cancel_stops_running_task(self):
+        """취소하면 작업 함수가 중단된 뒤에 취소가 전파되고 워커는 재사용되는지 테스트"""
+        pool = self.make_pool()
+        first_pid = await pool.run("warmup", worker_pid)
+        written = []
+        task = asyncio.create_task(pool.run(
+            "write", write_forever, self.temp_dir.name,
+            on_progress=lambda event, payload: written.append(payload)
+        ))
+        while len(written) < 3:
+            await asyncio.sleep(0.01)
+
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        # 취소가 전파된 뒤에는 파일이 더 생기지 않음
+        count = len(os.listdir(self.temp_dir.name))
+        await asyncio.sleep(0.1)
+        self.assertEqual(len(os.listdir(self.temp_dir.name)), count)
+        self.assertEqual(await pool.run("after", worker_pid), first_pid)
+
+    async def test_workers_are_recycled(self):
+        """정해진 수의 작업을 처리한 워커가 교체되는지 테스트"""
+        pool = self.make_pool(max_tasks_per_worker=1)
+        first = await pool.run("first", worker_pid)
+        second = await pool.run("second", worker_pid)
+        self.assertNotEqual(first, second)
+
+
+class TestProcessGenerationMode(unittest.IsolatedAsyncioTestCase):
+    """GENERATION_MODE=process 앱 생성 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        # 워커 프로세스가 이 모듈의 작업 함수를 가져올 때 API 서버 전체를
+        # 가져오지 않도록 여기서 가져옴
+        import src.api.app as api_app
+        self.api_app = api_app
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.pool = ProcessWorkerPool(max_workers=1)
+        self.queue = JobQueue(api_app.run_queued_job, max_size=10, worker_count=1)
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "job_queue", self.queue),
+            patch.object(api_app, "job_dedup", JobDeduplicator()),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "blob_store", None),
+            patch.object(api_app, "generation_pool", self.pool),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=self.api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await self.queue.stop()
+        await asyncio.get_running_loop().run_in_executor(None, self.pool.shutdown)
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def test_job_completes_in_worker_process(self):
+        """워커 프로세스에서 생성한 작업이 매니페스트와 함께 완료되는지 테스트"""
+        job_id = (await self.client.post("/generate_app", json=SPEC)).json()["job_id"]
+        for _ in range(1000):
+            job_info = await self.store.get(job_id)
+            if job_info["status"] not in ("pending", "running"):
+                break
+            await asyncio.sleep(0.01)
+
+        self.assertEqual(job_info["status"], "completed")
+        self.assertEqual(sorted(job_info["artifacts"]), sorted(job_info["manifest"]))
+        self.assertIn("lib/models/item.dart", job_info["artifacts"])
+
+        status = (await self.client.get("/status")).json()
+        self.assertEqual(status["generation_mode"], "process")
+
+
+if __name__ == "__main__":
+    unittest.main()
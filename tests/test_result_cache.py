@@ -0,0 +1,154 @@
+"""
+결과 캐시 테스트
+
+이 테스트는 앱 명세 정규화와 캐시 키, 생성기 지문 무효화, 같은 명세가
+다시 제출될 때 이전 출력 트리를 재사용하여 즉시 완료하는지 검증합니다.
+"""
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+import src.api.app as api_app
+from src.api.blob_store import BlobStore
+from src.api.job_store import InMemoryJobStore
+from src.api.result_cache import (
+    ResultCache, generator_fingerprint, normalize_app_spec
+)
+
+SPEC = {
+    "app_name": "shop",
+    "description": "쇼핑 앱",
+    "models": [{"name": "Product", "fields": [{"name": "price", "type": "double"}]}],
+    "pages": ["Home", "Cart"],
+}
+
+
+class TestResultCacheKey(unittest.TestCase):
+    """캐시 키와 지문 테스트"""
+
+    def test_equivalent_specs_share_key(self):
+        """키 순서, 이름 공백, 빈 항목만 다른 명세는 같은 키를 갖는지 테스트"""
+        cache = ResultCache("fp")
+        variant = {
+            "pages": [" Home", "Cart "],
+            "models": [{"fields": [{"type": "double", "name": "price"}], "name": "Product"}],
+            "description": "쇼핑 앱",
+            "app_name": "shop ",
+            "controllers": [],
+            "tests": None,
+        }
+        self.assertEqual(
+            cache.key(normalize_app_spec(SPEC)), cache.key(normalize_app_spec(variant))
+        )
+        self.assertNotEqual(
+            cache.key(normalize_app_spec(SPEC)),
+            cache.key(normalize_app_spec({**SPEC, "pages": ["Cart", "Home"]}))
+        )
+        self.assertNotEqual(
+            cache.key(normalize_app_spec(SPEC)),
+            ResultCache("other").key(normalize_app_spec(SPEC))
+        )
+
+    def test_fingerprint_tracks_templates_and_version(self):
+        """템플릿 내용이나 생성기 버전이 바뀌면 지문이 바뀌는지 테스트"""
+        with tempfile.TemporaryDirectory() as template_dir:
+            template = os.path.join(template_dir, "dart", "model.dart.j2")
+            os.makedirs(os.path.dirname(template))
+            with open(template, "w") as f:
+                f.write("class {{ name }} {}")
+
+            original = generator_fingerprint(template_dir, version="1")
+            self.assertEqual(generator_fingerprint(template_dir, version="1"), original)
+            self.assertNotEqual(generator_fingerprint(template_dir, version="2"), original)
+
+            with open(template, "w") as f:
+                f.write("class {{ name }} { }")
+            self.assertNotEqual(generator_fingerprint(template_dir, version="1"), original)
+
+
+class TestResultCacheEndpoint(unittest.IsolatedAsyncioTestCase):
+    """같은 명세 재제출 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.cache = ResultCache("test")
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "result_cache", self.cache),
+            patch.object(
+                api_app, "blob_store",
+                BlobStore(os.path.join(self.temp_dir.name, ".blobs"))
+            ),
+        ]
+        for p in self.patches:
+            p.start()
+
+        transport = httpx.ASGITransport(app=api_app.app)
+        self.client = httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        )
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        await self.client.aclose()
+        await api_app.job_queue.stop()
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def _wait_completed(self, job_id):
+        for _ in range(500):
+            job_info = await self.store.get(job_id)
+            if job_info["status"] == "completed":
+                return job_info
+            await asyncio.sleep(0.01)
+        self.fail("앱 생성이 완료되지 않았습니다.")
+
+    async def test_resubmitted_spec_completes_immediately(self):
+        """같은 명세를 다시 제출하면 즉시 완료되고 같은 파일을 갖는지 테스트"""
+        first = (await self.client.post("/generate_app", json=SPEC)).json()
+        source = await self._wait_completed(first["job_id"])
+
+        second = (await self.client.post(
+            "/generate_app", json=dict(reversed(list(SPEC.items())))
+        )).json()
+
+        self.assertEqual(second["status"], "completed")
+        self.assertEqual(second["artifacts"], source["artifacts"])
+        reused = await self.store.get(second["job_id"])
+        self.assertEqual(reused["cached_from"], first["job_id"])
+        self.assertNotEqual(reused["folder_name"], source["folder_name"])
+
+        for relative_path in source["artifacts"]:
+            with open(os.path.join(self.temp_dir.name, source["folder_name"], relative_path), "rb") as f:
+                expected = f.read()
+            with open(os.path.join(self.temp_dir.name, reused["folder_name"], relative_path), "rb") as f:
+                self.assertEqual(f.read(), expected)
+
+        status = (await self.client.get("/status")).json()
+        self.assertEqual(status["result_cache_hits"], 1)
+        self.assertEqual(status["result_cache_misses"], 1)
+
+    async def test_evicted_source_is_a_miss(self):
+        """원본 작업이 정리되면 다시 생성하는지 테스트"""
+        first = (await self.client.post("/generate_app", json=SPEC)).json()
+        await self._wait_completed(first["job_id"])
+        await api_app.delete_job(first["job_id"])
+
+        second = (await self.client.post("/generate_app", json=SPEC)).json()
+        self.assertEqual(second["status"], "pending")
+        await self._wait_completed(second["job_id"])
+        self.assertEqual(self.cache.stats(), {"entries": 1, "hits": 0, "misses": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+작업 보존 정책 테스트
+
+이 테스트는 JobReaper가 보존 기간, 작업 수, 디스크 용량 제한에 따라
+끝난 작업과 그 파일을 정리하는지 검증합니다.
+"""
+import os
+import tempfile
+import time
+import unittest
+
+from src.api.app_files import reservation_marker, reserve_output_dir
+from src.api.blob_store import BlobStore
+from src.api.job_store import InMemoryJobStore
+from src.api.retention import JobReaper, RetentionPolicy
+
+
+class TestJobReaper(unittest.IsolatedAsyncioTestCase):
+    """JobReaper 기능 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_root = os.path.join(self.temp_dir.name, "apps")
+        self.archives_dir = os.path.join(self.temp_dir.name, "archives")
+        os.makedirs(self.output_root)
+        os.makedirs(self.archives_dir)
+        self.store = InMemoryJobStore()
+        self.now = time.time()
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        self.temp_dir.cleanup()
+
+    def make_reaper(self, blob_store=None, **policy):
+        async def update_job(job_id, **fields):
+            return await self.store.update(job_id, **fields)
+
+        def job_paths(job_info):
+            return {
+                "output": os.path.join(self.output_root, job_info["folder_name"]),
+                "archive": job_info.get("archive_path"),
+            }
+
+        return JobReaper(
+            store=self.store,
+            policy=RetentionPolicy(**policy),
+            job_paths=job_paths,
+            delete_job=self.store.delete,
+            update_job=update_job,
+                orphan_dirs=lambda: [self.output_root, self.archives_dir],
+            blob_store=blob_store,
+            blob_grace=0,
+        )
+
+    async def add_job(
+        self, job_id, age, status="completed", size=100, **fields
+    ):
+        """출력 디렉토리와 함께 작업을 추가합니다."""
+        folder_name = f"App_{job_id}"
+        output_dir = os.path.join(self.output_root, folder_name)
+        os.makedirs(output_dir)
+        with open(os.path.join(output_dir, "main.dart"), "w") as f:
+            f.write("x" * size)
+
+        record = {
+            "job_id": job_id,
+            "status": status,
+            "folder_name": folder_name,
+            "app_spec": {"app_name": job_id},
+            "start_time": self.now - age - 1,
+            "end_time": self.now - age,
+        }
+        record.update(fields)
+        await self.store.create(record)
+        return output_dir
+
+    async def test_max_age_evicts_only_finished_jobs(self):
+        """보존 기간이 지난 끝난 작업만 정리하는지 테스트"""
+        old_dir = await self.add_job("old", age=1000)
+        running_dir = await self.add_job("busy", age=1000, status="running")
+        await self.add_job("new", age=10)
+
+        reaper = self.make_reaper(max_age=500)
+        report = await reaper.collect()
+
+        self.assertEqual(report["evicted_by_age"], 1)
+        self.assertFalse(os.path.exists(old_dir))
+        self.assertIsNone(await self.store.get("old"))
+        self.assertTrue(os.path.exists(running_dir))
+        self.assertIsNotNone(await self.store.get("new"))
+        self.assertEqual(reaper.stats["reclaimed_bytes"], 100)
+
+    async def test_max_jobs_evicts_least_recently_downloaded(self):
+        """작업 수 초과 시 가장 오래 사용되지 않은 작업부터 정리하는지 테스트"""
+        await self.add_job("a", age=300, last_download=self.now - 1)
+        await self.add_job("b", age=200)
+        await self.add_job("c", age=100)
+
+        report = await self.make_reaper(max_jobs=2).collect()
+
+        self.assertEqual(report["evicted_by_count"], 1)
+        self.assertIsNone(await self.store.get("b"))
+        self.assertIsNotNone(await self.store.get("a"))
+
+    async def test_max_disk_bytes_evicts_until_under_budget(self):
+        """디스크 사용량이 제한 이하가 될 때까지 정리하는지 테스트"""
+        archive_path = os.path.join(self.archives_dir, "App_a.zip")
+        with open(archive_path, "wb") as f:
+            f.write(b"z" * 50)
+        await self.add_job("a", age=300, archive_path=archive_path)
+        await self.add_job("b", age=200)
+        await self.add_job("c", age=100)
+
+        report = await self.make_reaper(max_disk_bytes=250).collect()
+
+        self.assertEqual(report["evicted_by_disk"], 1)
+        self.assertEqual(report["reclaimed_bytes"], 150)
+        self.assertFalse(os.path.exists(archive_path))
+        self.assertEqual((await self.store.get("b"))["output_bytes"], 100)
+
+    async def test_orphans_removed_after_grace(self):
+        """작업 레코드가 없는 오래된 디렉토리와 아카이브를 정리하는지 테스트"""
+        await self.add_job("kept", age=0)
+        stale_name = reserve_output_dir(self.output_root, "App_stale")
+        stale_dir = os.path.join(self.output_root, stale_name)
+        marker = reservation_marker(self.output_root, stale_name)
+        stale_zip = os.path.join(self.archives_dir, "a" * 64 + ".zip")
+        fresh_zip = os.path.join(self.archives_dir, "b" * 64 + ".zip")
+        for path in (stale_zip, fresh_zip):
+            open(path, "wb").close()
+        for path in (stale_dir, marker, stale_zip):
+            os.utime(path, (self.now - 7200, self.now - 7200))
+
+        report = await self.make_reaper(orphan_grace=3600).collect()
+
+        self.assertEqual(report["orphans_removed"], 2)
+        self.assertFalse(os.path.exists(stale_dir))
+        self.assertFalse(os.path.exists(marker))
+        self.assertFalse(os.path.exists(stale_zip))
+        self.assertTrue(os.path.exists(fresh_zip))
+        self.assertTrue(os.path.exists(os.path.join(self.output_root, "App_kept")))
+
+    async def test_unreserved_paths_are_kept(self):
+        """서버가 만들지 않은 디렉토리와 아카이브는 오래되어도 남기는지 테스트"""
+        user_dir = os.path.join(self.output_root, "App_legacy_v1")
+        os.makedirs(user_dir)
+        user_zip = os.path.join(self.archives_dir, "App_legacy_v1.zip")
+        open(user_zip, "wb").close()
+        for path in (user_dir, user_zip):
+            os.utime(path, (self.now - 7200, self.now - 7200))
+
+        report = await self.make_reaper(orphan_grace=0).collect()
+
+        self.assertEqual(report["orphans_removed"], 0)
+        self.assertTrue(os.path.exists(user_dir))
+        self.assertTrue(os.path.exists(user_zip))
+
+    async def test_evicted_job_blobs_collected(self):
+        """정리된 작업만 참조하던 블롭을 삭제하는지 테스트"""
+        blob_store = BlobStore(os.path.join(self.temp_dir.name, "blobs"))
+        old_dir = await self.add_job("old", age=1000)
+        new_dir = await self.add_job("new", age=10)
+        shared = blob_store.store(b"shared", os.path.join(old_dir, "a"))
+        blob_store.store(b"shared", os.path.join(new_dir, "a"))
+        only_old = blob_store.store(b"only old", os.path.join(old_dir, "b"))
+
+        reaper = self.make_reaper(blob_store=blob_store, max_age=500)
+        report = await reaper.collect()
+
+        self.assertEqual(report["blobs_removed"], 1)
+        self.assertFalse(blob_store.exists(only_old))
+        self.assertTrue(blob_store.exists(shared))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+에이전트 세션 수명 관리 테스트
+
+이 테스트는 에이전트 작업이 끝나면 다운로드 유예 시간이 지난 뒤 ADK 세션과
+세션 아티팩트가 삭제되는지, 재시작 전에 만든 세션도 작업 레코드로 정리할 수
+있는지, 그리고 SQLite 세션 저장소가 상태와 이벤트 기록을 파일에 보존하는지
+검증합니다.
+"""
+import asyncio
+import os
+import tempfile
+import unittest
+from typing import AsyncGenerator
+from unittest.mock import patch
+
+from google.adk.agents import BaseAgent
+from google.adk.artifacts import InMemoryArtifactService
+from google.adk.events import Event, EventActions
+from google.adk.sessions import DatabaseSessionService, InMemorySessionService
+from google.genai import types
+
+import src.api.app as api_app
+from src.api.agent_sessions import AgentSessions
+from src.api.job_store import InMemoryJobStore
+
+APP_NAME = "AgentOfFlutter"
+
+
+class SavingAgent(BaseAgent):
+    """세션 상태의 앱 이름으로 파일 하나를 저장하는 테스트용 에이전트"""
+
+    async def _run_async_impl(self, ctx) -> AsyncGenerator[Event, None]:
+        app_name = ctx.session.state["app_name"]
+        await ctx.artifact_service.save_artifact(
+            app_name=ctx.app_name, user_id=ctx.user_id, session_id=ctx.session.id,
+            filename="README.md",
+            artifact=types.Part.from_bytes(
+                data=f"# {app_name}".encode("utf-8"), mime_type="text/markdown"
+            )
+        )
+        yield Event(
+            author=self.name, invocation_id=ctx.invocation_id,
+            actions=EventActions(state_delta={"saved": True})
+        )
+
+
+class TestAgentSessions(unittest.IsolatedAsyncioTestCase):
+    """AgentSessions 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.session_service = InMemorySessionService()
+        self.artifact_service = InMemoryArtifactService()
+        self.sessions = AgentSessions(
+            APP_NAME, lambda: self.session_service, lambda: self.artifact_service,
+            grace=60
+        )
+
+    async def create_session(self, user_id: str) -> str:
+        session = self.session_service.create_session(
+            app_name=APP_NAME, user_id=user_id, state={"app_name": "shop"}
+        )
+        await self.artifact_service.save_artifact(
+            app_name=APP_NAME, user_id=user_id, session_id=session.id,
+            filename="lib/main.dart", artifact=types.Part(text="void main() {}")
+        )
+        return session.id
+
+    async def test_closed_session_is_evicted_after_grace(self):
+        """작업이 끝나고 유예 시간이 지나면 세션과 아티팩트를 삭제하는지 테스트"""
+        session_id = await self.create_session("u1")
+        self.sessions.open("job1", "u1", session_id)
+        self.assertEqual(self.sessions.stats()["open_sessions"], 1)
+
+        closed = await self.sessions.close({"job_id": "job1"}, closed_at=1000)
+        self.assertEqual(closed, 1)
+        self.assertEqual(await self.sessions.collect(now=1059), 0)
+        self.assertIsNotNone(self.session_service.get_session(
+            app_name=APP_NAME, user_id="u1", session_id=session_id
+        ))
+
+        self.assertEqual(await self.sessions.collect(now=1060), 1)
+        self.assertIsNone(self.session_service.get_session(
+            app_name=APP_NAME, user_id="u1", session_id=session_id
+        ))
+        self.assertEqual(await self.artifact_service.list_artifact_keys(
+            app_name=APP_NAME, user_id="u1", session_id=session_id
+        ), [])
+        self.assertNotIn("u1", self.session_service.sessions[APP_NAME])
+        self.assertEqual(
+            self.sessions.stats(),
+            {"open_sessions": 0, "closing_sessions": 0, "evicted_sessions": 1}
+        )
+
+    async def test_close_from_job_record(self):
+        """등록되지 않은 세션도 작업 레코드로 닫고, 세션이 없는 작업은 무시하는지 테스트"""
+        session_id = await self.create_session("u2")
+        self.sessions.grace = 0
+
+        self.assertEqual(await self.sessions.close({"job_id": "template"}), 0)
+        closed = await self.sessions.close(
+            {"job_id": "old", "user_id": "u2", "session_id": session_id}
+        )
+        self.assertEqual(closed, 1)
+        self.assertIsNone(self.session_service.get_session(
+            app_name=APP_NAME, user_id="u2", session_id=session_id
+        ))
+        self.assertEqual(self.sessions.evicted, 1)
+
+
+class TestAgentJobSessions(unittest.IsolatedAsyncioTestCase):
+    """에이전트 작업의 세션 생성과 정리 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = InMemoryJobStore()
+        self.session_service = InMemorySessionService()
+        self.artifact_service = InMemoryArtifactService()
+        self.sessions = AgentSessions(
+            APP_NAME, api_app.get_session_service, api_app.get_artifact_service,
+            grace=0
+        )
+        self.patches = [
+            patch.object(api_app, "FLUTTER_OUTPUT_DIR", self.temp_dir.name),
+            patch.object(api_app, "job_store", self.store),
+            patch.object(api_app, "job_journal", None),
+            patch.object(api_app, "client_quotas", None),
+            patch.object(api_app, "result_cache", None),
+            patch.object(api_app, "blob_store", None),
+            patch.object(api_app, "session_service", self.session_service),
+            patch.object(api_app, "artifact_service", self.artifact_service),
+            patch.object(api_app, "agent_sessions", self.sessions),
+            patch.object(
+                api_app, "register_agents", lambda spec: SavingAgent(name="Saver")
+            ),
+        ]
+        for p in self.patches:
+            p.start()
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        for p in self.patches:
+            p.stop()
+        self.temp_dir.cleanup()
+
+    async def test_job_session_released_on_completion(self):
+        """작업 데이터를 세션 상태로 전달하고, 작업이 끝나면 세션을 정리하는지 테스트"""
+        await self.store.create({"job_id": "job1", "status": "running"})
+        await asyncio.wait_for(
+            api_app.handle_app_generation("job1", {"app_name": "shop"}), 10
+        )
+
+        job_info = await self.store.get("job1")
+        self.assertEqual(job_info["status"], "completed")
+        path = os.path.join(self.temp_dir.name, "job1", "README.md")
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "# shop")
+
+        self.assertIsNone(self.session_service.get_session(
+            app_name=APP_NAME, user_id=job_info["user_id"],
+            session_id=job_info["session_id"]
+        ))
+        self.assertEqual(self.artifact_service.artifacts, {})
+        self.assertEqual(self.sessions.stats()["evicted_sessions"], 1)
+
+
+class TestSqliteSessionService(unittest.TestCase):
+    """SQLite 세션 저장소 테스트"""
+
+    def test_sqlite_backend_persists_sessions(self):
+        """SESSION_BACKEND=sqlite이면 세션 상태와 이벤트를 파일에 저장하는지 테스트"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, "sessions", "sessions.db")
+            with patch.object(api_app, "SESSION_BACKEND", "sqlite"), \
+                    patch.object(api_app, "SESSION_DB_PATH", db_path), \
+                    patch.object(api_app, "session_service", None):
+                service = api_app.get_session_service()
+                self.assertIsInstance(service, DatabaseSessionService)
+                session = service.create_session(
+                    app_name=APP_NAME, user_id="u", state={"app_spec": {"pages": ["Home"]}}
+                )
+                service.append_event(session, Event(
+                    author="Saver", invocation_id="i1",
+                    actions=EventActions(state_delta={"saved": True})
+                ))
+
+            # 다른 서비스 인스턴스(재시작 후)에서도 읽을 수 있음
+            reopened = DatabaseSessionService(f"sqlite:///{db_path}")
+            loaded = reopened.get_session(
+                app_name=APP_NAME, user_id="u", session_id=session.id
+            )
+            self.assertEqual(loaded.state["app_spec"], {"pages": ["Home"]})
+            self.assertTrue(loaded.state["saved"])
+            self.assertEqual(len(loaded.events), 1)
+
+            reopened.delete_session(app_name=APP_NAME, user_id="u", session_id=session.id)
+            self.assertIsNone(reopened.get_session(
+                app_name=APP_NAME, user_id="u", session_id=session.id
+            ))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+SQLite 아티팩트 서비스 테스트
+
+이 테스트는 SqliteArtifactService가 InMemoryArtifactService와 같은 방식으로
+아티팩트 버전과 사용자 네임스페이스를 다루는지, 파일 이름별로 최근 버전만
+보관하고 참조가 없어진 블롭을 삭제하는지, 서비스를 다시 만들어도 아티팩트가
+보존되는지, 그리고 세션 정리 시 세션 아티팩트가 함께 삭제되는지 검증합니다.
+"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from google.genai import types
+
+import src.api.app as api_app
+from src.api.agent_sessions import AgentSessions
+from src.api.sqlite_artifacts import SqliteArtifactService
+
+APP_NAME = "AgentOfFlutter"
+
+
+def dart_part(source: str) -> types.Part:
+    """Dart 소스 아티팩트를 만듭니다."""
+    return types.Part.from_bytes(data=source.encode("utf-8"), mime_type="text/x-dart")
+
+
+class TestSqliteArtifactService(unittest.IsolatedAsyncioTestCase):
+    """SqliteArtifactService 테스트"""
+
+    async def asyncSetUp(self):
+        """테스트 설정"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "artifacts.db")
+        self.blob_dir = os.path.join(self.temp_dir.name, "blobs")
+        self.service = SqliteArtifactService(self.db_path, self.blob_dir, max_versions=2)
+        self.scope = {"app_name": APP_NAME, "user_id": "u1", "session_id": "s1"}
+
+    async def asyncTearDown(self):
+        """테스트 정리"""
+        self.service.close()
+        self.temp_dir.cleanup()
+
+    def blob_count(self) -> int:
+        return sum(len(files) for _, _, files in os.walk(self.blob_dir))
+
+    async def test_save_and_load_versions(self):
+        """버전 번호를 0부터 매기고 최신 또는 지정 버전을 읽는지 테스트"""
+        for source in ("v0", "v1"):
+            await self.service.save_artifact(
+                **self.scope, filename="main.dart", artifact=dart_part(source)
+            )
+        version = await self.service.save_artifact(
+            **self.scope, filename="notes.txt", artifact=types.Part(text="메모")
+        )
+        self.assertEqual(version, 0)
+
+        latest = await self.service.load_artifact(**self.scope, filename="main.dart")
+        self.assertEqual(latest.inline_data.data, b"v1")
+        self.assertEqual(latest.inline_data.mime_type, "text/x-dart")
+        first = await self.service.load_artifact(
+            **self.scope, filename="main.dart", version=0
+        )
+        self.assertEqual(first.inline_data.data, b"v0")
+        notes = await self.service.load_artifact(**self.scope, filename="notes.txt")
+        self.assertEqual(notes.text, "메모")
+
+        self.assertEqual(
+            await self.service.list_versions(**self.scope, filename="main.dart"), [0, 1]
+        )
+        self.assertIsNone(
+            await self.service.load_artifact(**self.scope, filename="missing.dart")
+        )
+
+    async def test_old_versions_and_blobs_are_pruned(self):
+        """최근 max_versions개 버전만 보관하고 참조가 없는 블롭을 삭제하는지 테스트"""
+        for source in ("v0", "v1", "v2", "v3"):
+            await self.service.save_artifact(
+                **self.scope, filename="main.dart", artifact=dart_part(source)
+            )
+        self.assertEqual(
+            await self.service.list_versions(**self.scope, filename="main.dart"), [2, 3]
+        )
+        self.assertIsNone(await self.service.load_artifact(
+            **self.scope, filename="main.dart", version=0
+        ))
+        self.assertEqual(self.blob_count(), 2)
+
+        # 같은 내용은 블롭 하나를 공유하고, 참조가 남아 있으면 삭제하지 않음
+        other = {**self.scope, "session_id": "s2"}
+        await self.service.save_artifact(
+            **other, filename="main.dart", artifact=dart_part("v3")
+        )
+        await self.service.delete_artifact(**self.scope, filename="main.dart")
+        self.assertEqual(self.blob_count(), 1)
+        loaded = await self.service.load_artifact(**other, filename="main.dart")
+        self.assertEqual(loaded.inline_data.data, b"v3")
+
+        self.assertEqual(
+            self.service.stats(), {"versions": 1, "bytes": 2, "pruned_versions": 2}
+        )
+
+    async def test_user_namespace_and_persistence(self):
+        """사용자 네임스페이스가 세션 간에 공유되고 재시작 후에도 보존되는지 테스트"""
+        await self.service.save_artifact(
+            **self.scope, filename="user:profile.json",
+            artifact=types.Part.from_bytes(data=b"{}", mime_type="application/json")
+        )
+        await self.service.save_artifact(
+            **self.scope, filename="main.dart", artifact=dart_part("void main() {}")
+        )
+        self.service.close()
+
+        self.service = SqliteArtifactService(self.db_path, self.blob_dir, max_versions=2)
+        other = {**self.scope, "session_id": "s2"}
+        self.assertEqual(
+            await self.service.list_artifact_keys(**self.scope),
+            ["main.dart", "user:profile.json"]
+        )
+        self.assertEqual(
+            await self.service.list_artifact_keys(**other), ["user:profile.json"]
+        )
+        profile = await self.service.load_artifact(**other, filename="user:profile.json")
+        self.assertEqual(profile.inline_data.data, b"{}")
+
+    async def test_inline_storage_without_blob_dir(self):
+        """블롭 디렉토리 없이 내용을 SQLite 파일에 저장하는지 테스트"""
+        inline = SqliteArtifactService(
+            os.path.join(self.temp_dir.name, "inline.db"), max_versions=0
+        )
+        try:
+            for source in ("v0", "v1", "v2"):
+                await inline.save_artifact(
+                    **self.scope, filename="main.dart", artifact=dart_part(source)
+                )
+            self.assertEqual(
+                await inline.list_versions(**self.scope, filename="main.dart"), [0, 1, 2]
+            )
+            loaded = await inline.load_artifact(
+                **self.scope, filename="main.dart", version=1
+            )
+            self.assertEqual(loaded.inline_data.data, b"v1")
+        finally:
+            inline.close()
+        self.assertFalse(os.path.exists(self.blob_dir))
+
+    async def test_session_eviction_deletes_artifacts(self):
+        """세션 정리가 세션 아티팩트와 블롭을 삭제하는지 테스트"""
+        await self.service.save_artifact(
+            **self.scope, filename="main.dart", artifact=dart_part("void main() {}")
+        )
+        with patch.object(api_app, "session_service", None), \
+                patch.object(api_app, "SESSION_BACKEND", "memory"):
+            sessions = AgentSessions(
+                APP_NAME, api_app.get_session_service, lambda: self.service, grace=0
+            )
+            sessions.open("job1", "u1", "s1")
+            closed = await sessions.close({"job_id": "job1"})
+
+        self.assertEqual(closed, 1)
+        self.assertEqual(await self.service.list_artifact_keys(**self.scope), [])
+        self.assertEqual(self.blob_count(), 0)
+
+    async def test_backend_setting_selects_service(self):
+        """ARTIFACT_BACKEND=sqlite이면 서버가 SQLite 아티팩트 서비스를 사용하는지 테스트"""
+        with patch.object(api_app, "artifact_service", None), \
+                patch.object(api_app, "ARTIFACT_BACKEND", "sqlite"), \
+                patch.object(api_app, "ARTIFACT_DB_PATH", self.db_path), \
+                patch.object(api_app, "ARTIFACT_BLOB_DIR", ""), \
+                patch.object(api_app, "ARTIFACT_MAX_VERSIONS", 5):
+            service = api_app.get_artifact_service()
+            try:
+                self.assertIsInstance(service, SqliteArtifactService)
+                self.assertIsNone(service.blobs)
+                self.assertEqual(service.max_versions, 5)
+                self.assertIs(api_app.get_artifact_service(), service)
+            finally:
+                service.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
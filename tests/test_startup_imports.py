@@ -0,0 +1,84 @@
+"""
+시작 시간(모듈 import 시간) 테스트
+
+이 테스트는 `python -X importtime`으로 새 인터프리터의 모듈 import 시간을 측정하여,
+CLI 명령이 서버와 ADK 모듈을 가져오지 않는지, 서버 모듈이 google.adk와 에이전트
+트리를 첫 작업 전까지 가져오지 않는지, 그리고 각 시작 경로가 시간 예산 안에
+끝나는지 검증합니다.
+"""
+import os
+import subprocess
+import sys
+import unittest
+from typing import Dict
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 경로별 import 시간 예산(초). 측정값(CLI 약 0.1초, 서버 약 0.5초)에
+# 느린 CI 환경을 고려한 여유를 두었습니다. google.adk를 다시 가져오면 수 초가
+# 걸리므로 예산을 넘습니다.
+CLI_IMPORT_BUDGET = 1.0
+SERVER_IMPORT_BUDGET = 2.5
+
+
+def measure_imports(statement: str) -> Dict[str, float]:
+    """
+    새 인터프리터에서 문장을 실행하고 가져온 모듈별 누적 import 시간을 반환합니다.
+
+    Args:
+        statement: 실행할 파이썬 문장
+
+    Returns:
+        모듈 이름별 누적 import 시간(초)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"}
+    )
+    if result.returncode != 0:
+        raise AssertionError(result.stderr)
+
+    modules: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # 머리글 행
+        modules[fields[2].strip()] = int(fields[1]) / 1_000_000
+    return modules
+
+
+class TestStartupImports(unittest.TestCase):
+    """시작 경로별 import 테스트"""
+
+    def assert_not_imported(self, modules: Dict[str, float], *prefixes: str):
+        heavy = sorted(
+            name for name in modules
+            if any(name == p or name.startswith(p + ".") for p in prefixes)
+        )
+        self.assertEqual(heavy, [])
+
+    def test_cli_imports_only_client(self):
+        """main.py와 CLI 클라이언트가 서버와 ADK 모듈 없이 예산 안에 로드되는지 테스트"""
+        modules = measure_imports("import main, src.cli.client")
+        self.assertIn("httpx", modules)
+        self.assert_not_imported(
+            modules, "src.api", "src.agents", "google.adk", "google.genai",
+            "fastapi", "uvicorn"
+        )
+        self.assertLess(modules["main"] + modules["src.cli.client"], CLI_IMPORT_BUDGET)
+
+    def test_server_defers_adk(self):
+        """서버 모듈이 google.adk와 에이전트 트리를 가져오지 않고 예산 안에 로드되는지 테스트"""
+        modules = measure_imports(
+            "import src.api.app as app; assert app.runner is None"
+        )
+        self.assertIn("fastapi", modules)
+        self.assert_not_imported(modules, "src.agents", "google.adk", "google.genai")
+        self.assertLess(modules["src.api.app"], SERVER_IMPORT_BUDGET)
+
+
+if __name__ == "__main__":
+    unittest.main()